@@ -0,0 +1,119 @@
+"""住所の検出のベンチマーク
+
+従来の方法（都道府県の正規表現で最初の出現を検索し、ページごとに市区町村・番地の
+正規表現を作成）と、地名辞書（AddressGazetteer）による検出について、
+1ページあたりの時間と、郵便番号に対応する住所を選べたかを比較します。
+legacy-allは、従来の方法をすべての都道府県名の出現について繰り返した場合です
+（地名辞書と同じく、すべての候補を検出する場合の比較）。
+いずれも郵便番号の検索（従来の方法は最初の1件、それ以外はすべて）を含めて計測します。
+
+使い方:
+    python benchmarks/bench_address.py [--repeat N] [--size KB]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.constants import PREFECTURES
+from core.gazetteer import get_default_gazetteer
+from core.scanner import KIND_POSTAL_CODE, get_default_scanner
+
+LEGACY_PREFECTURE_PATTERN = re.compile(f"({'|'.join(PREFECTURES)})")
+
+# 地名をほとんど含まない本文と、地名を多く含む本文（店舗一覧など）
+FILLERS = {
+    "plain": "当社のサービスについてのお知らせです。営業時間は平日のみです。最新情報は各ページをご覧ください。",
+    "dense": "東京都内の店舗や大阪府の支店からのお知らせです。横浜市と名古屋市でも営業しています。",
+}
+# 住所とは無関係な都道府県名（ページの先頭に置く）
+HEADLINE = "東京都の最新情報 "
+ADDRESS = "本社 〒530-0001 大阪府大阪市北区梅田1-2-3 梅田ビル5階 TEL 06-1234-5678"
+
+
+def legacy_address(text: str) -> tuple:
+    """従来の方法で住所を検出（都道府県, 市区町村, 番地までの住所）"""
+    get_default_scanner().scan(text).first(KIND_POSTAL_CODE)
+    match = LEGACY_PREFECTURE_PATTERN.search(text)
+    if not match:
+        return None, None, None
+    prefecture = match.group(0)
+    city_match = re.search(rf'{re.escape(prefecture)}([^\s]+?[市区町村])', text)
+    address_match = re.search(
+        rf'{re.escape(prefecture)}[^\s。、]{{5,50}}?(?:\d+[-ー\s]?\d+[-ー\s]?\d+|[0-9０-９]+[-ー\s]?[0-9０-９]+)', text
+    )
+    return (prefecture, city_match.group(1) if city_match else None,
+            address_match.group(0) if address_match else None)
+
+
+def legacy_all_addresses(text: str) -> list[tuple]:
+    """従来の方法を、すべての都道府県名の出現について繰り返した場合"""
+    get_default_scanner().scan(text).get(KIND_POSTAL_CODE)
+    results = []
+    for match in LEGACY_PREFECTURE_PATTERN.finditer(text):
+        prefecture = match.group(0)
+        city_match = re.compile(rf'{re.escape(prefecture)}([^\s]+?[市区町村])').match(text, match.start())
+        address_match = re.compile(
+            rf'{re.escape(prefecture)}[^\s。、]{{5,50}}?(?:\d+[-ー\s]?\d+[-ー\s]?\d+|[0-9０-９]+[-ー\s]?[0-9０-９]+)'
+        ).match(text, match.start())
+        results.append((prefecture, city_match.group(1) if city_match else None,
+                        address_match.group(0) if address_match else None))
+    return results
+
+
+def gazetteer_address(text: str) -> tuple:
+    """地名辞書で住所を検出（都道府県, 市区町村, 番地までの住所）"""
+    postal_matches = get_default_scanner().scan(text).get(KIND_POSTAL_CODE)
+    candidates = get_default_gazetteer().find_candidates(text, postal_matches)
+    if not candidates:
+        return None, None, None
+    return candidates[0].prefecture, candidates[0].city, candidates[0].address
+
+
+def build_text(size_kb: int, address_at: float, filler: str) -> str:
+    """住所を含むテキストを作成（address_atはテキスト中の住所の位置の割合）"""
+    count = max(1, size_kb * 1024 // len(filler.encode("utf-8")))
+    fillers = [filler] * count
+    fillers.insert(int(count * address_at), ADDRESS)
+    return HEADLINE + " ".join(fillers)
+
+
+def measure(func, repeat: int) -> float:
+    """平均時間（ミリ秒）を計測"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="住所の検出のベンチマーク")
+    parser.add_argument("--repeat", type=int, default=20, help="1ケースあたりの繰り返し回数")
+    parser.add_argument("--size", type=int, default=100, help="最大のテキストサイズ（KB）")
+    args = parser.parse_args()
+
+    get_default_gazetteer()  # 辞書の作成時間は計測に含めない
+
+    print(f"{'text':<8}{'size (KB)':<12}{'address at':<12}{'legacy (ms)':>12}{'legacy-all (ms)':>17}"
+          f"{'gazetteer (ms)':>16}{'vs all':>8}  legacy found  gazetteer found")
+    sizes = sorted({1, max(1, args.size // 10), args.size})
+    for filler_name, filler in FILLERS.items():
+        for size_kb in sizes:
+            for address_at in (0.0, 0.5, 1.0):
+                text = build_text(size_kb, address_at, filler)
+                legacy_ms = measure(lambda: legacy_address(text), args.repeat)
+                legacy_all_ms = measure(lambda: legacy_all_addresses(text), args.repeat)
+                gazetteer_ms = measure(lambda: gazetteer_address(text), args.repeat)
+                legacy_found = legacy_address(text)[0] == "大阪府"
+                gazetteer_found = gazetteer_address(text)[0] == "大阪府"
+                print(f"{filler_name:<8}{size_kb:<12}{address_at:<12.1f}{legacy_ms:>12.3f}{legacy_all_ms:>17.3f}"
+                      f"{gazetteer_ms:>16.3f}{legacy_all_ms / gazetteer_ms:>7.1f}x  {'yes' if legacy_found else 'no':<14}"
+                      f"{'yes' if gazetteer_found else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
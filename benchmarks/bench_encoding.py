@@ -0,0 +1,103 @@
+"""文字コード判定のベンチマーク
+
+これまでの経路（requestsのResponse.text）と、core.encodingのdecode_htmlについて、
+1ページあたりのデコード時間と判定結果を比較します。
+
+使い方:
+    python benchmarks/bench_encoding.py [--repeat N] [--size KB]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests
+
+from core.encoding import decode_html
+
+SAMPLE_TEXT = (
+    "株式会社サンプル商事は、東京都千代田区に本社を置く中小企業です。"
+    "お問い合わせは電話またはメールでお気軽にどうぞ。営業時間は平日9時から18時までです。"
+)
+
+
+def build_page(encoding: str, size_kb: int, meta: bool) -> bytes:
+    """テスト用のHTMLページを作成
+
+    Args:
+        encoding: ページの文字コード
+        size_kb: おおよそのページサイズ（KB）
+        meta: <meta charset>を含めるかどうか
+
+    Returns:
+        エンコード済みのHTML
+    """
+    head = f'<meta charset="{encoding}">' if meta else ""
+    # 日本語本文の前に大きなスクリプトを置き、先頭付近がASCIIのみになる実際のページに近づける
+    script = "<script>" + "var x = 1;\n" * 200 + "</script>"
+    paragraph = f"<p>{SAMPLE_TEXT}</p>\n"
+    count = max(1, size_kb * 1024 // len(paragraph.encode(encoding)))
+    html = f"<html><head>{head}<title>会社概要</title>{script}</head><body>{paragraph * count}</body></html>"
+    return html.encode(encoding)
+
+
+def decode_with_requests(body: bytes, content_type: str) -> tuple[str, str]:
+    """これまでの経路（Response.text）でデコード"""
+    response = requests.Response()
+    response._content = body
+    response.headers["Content-Type"] = content_type
+    # HTTPAdapterと同様に、ヘッダーから文字コードを設定する（text/*でcharsetがなければISO-8859-1）
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response.text, response.encoding or response.apparent_encoding
+
+
+def decode_with_detector(body: bytes, content_type: str) -> tuple[str, str]:
+    """新しい経路（decode_html）でデコード"""
+    html, result = decode_html(body, content_type)
+    return html, result.encoding
+
+
+def measure(func, body: bytes, content_type: str, repeat: int) -> tuple[float, str, str]:
+    """平均デコード時間（ミリ秒）と判定結果を計測"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        html, encoding = func(body, content_type)
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    return elapsed, str(encoding), html
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="文字コード判定のベンチマーク")
+    parser.add_argument("--repeat", type=int, default=5, help="1ケースあたりの繰り返し回数")
+    parser.add_argument("--size", type=int, default=100, help="ページサイズ（KB）")
+    args = parser.parse_args()
+
+    cases = [
+        ("utf-8 / header", "utf-8", "text/html; charset=utf-8", False),
+        ("utf-8 / no charset", "utf-8", "", False),
+        ("shift_jis / meta", "shift_jis", "text/html", True),
+        ("shift_jis / no charset", "shift_jis", "", False),
+        ("euc_jp / no charset", "euc_jp", "", False),
+    ]
+
+    print(f"{'case':<24}{'current (ms)':>14}{'new (ms)':>10}{'speedup':>9}  {'encoding (current/new)':<22}  correct")
+    for label, encoding, content_type, meta in cases:
+        body = build_page(encoding, args.size, meta)
+        expected = body.decode(encoding)
+
+        old_ms, old_encoding, old_html = measure(decode_with_requests, body, content_type, args.repeat)
+        new_ms, new_encoding, new_html = measure(decode_with_detector, body, content_type, args.repeat)
+
+        correct = f"{'ok' if old_html == expected else 'NG'}/{'ok' if new_html == expected else 'NG'}"
+        speedup = old_ms / new_ms if new_ms else float("inf")
+        print(
+            f"{label:<24}{old_ms:>14.2f}{new_ms:>10.2f}{speedup:>8.1f}x  "
+            f"{old_encoding + '/' + new_encoding:<22}  {correct}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""マルチプロセス抽出のベンチマーク
+
+呼び出し元のプロセスでの抽出（従来の方法）と、ExtractionExecutorの
+ワーカー数ごとの抽出について、処理ページ数/秒と速度比を比較します。
+プロセスの起動時間を含めた計測と、起動済みのプールでの計測の両方を表示します。
+
+使い方:
+    python benchmarks/bench_extraction_pool.py [--pages N] [--size KB] [--workers 1,2,4]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_parser import build_page
+from core.extraction_pool import ExtractionExecutor
+
+
+def measure(executor: ExtractionExecutor, htmls: list[str]) -> tuple[float, list]:
+    """抽出の時間（秒）と結果を計測"""
+    start = time.perf_counter()
+    results = executor.extract_many(htmls)
+    return time.perf_counter() - start, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="マルチプロセス抽出のベンチマーク")
+    parser.add_argument("--pages", type=int, default=200, help="抽出するページ数")
+    parser.add_argument("--size", type=int, default=50, help="1ページのサイズ（KB）")
+    parser.add_argument("--workers", default=None, help="ワーカー数のリスト（カンマ区切り、デフォルトはCPUコア数まで倍々）")
+    parser.add_argument("--chunk-size", type=int, default=None, help="1回の送信でワーカーに渡すページ数")
+    args = parser.parse_args()
+
+    if args.workers:
+        worker_counts = [int(value) for value in args.workers.split(",")]
+    else:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cpu_count:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != cpu_count:
+            worker_counts.append(cpu_count)
+
+    # ページごとに内容を変える（同一文字列の使い回しを避ける）
+    base = build_page(args.size)
+    htmls = [base.replace("店舗一覧", f"店舗一覧{index}") for index in range(args.pages)]
+
+    with ExtractionExecutor(max_workers=0) as executor:
+        baseline, expected = measure(executor, htmls)
+
+    print(f"CPU cores: {os.cpu_count()}, pages: {args.pages}, size: {args.size} KB")
+    print(f"{'workers':<10}{'pages/s (cold)':>16}{'pages/s (warm)':>16}{'speedup':>9}  same results")
+    print(f"{'in-process':<10}{args.pages / baseline:>16.1f}{args.pages / baseline:>16.1f}{1.0:>8.1f}x  yes")
+
+    for workers in worker_counts:
+        with ExtractionExecutor(max_workers=workers, chunk_size=args.chunk_size,
+                                max_pages_per_worker=args.pages * 2) as executor:
+            cold, results = measure(executor, htmls)
+            warm, _ = measure(executor, htmls)
+        same = results == expected
+        print(f"{workers:<10}{args.pages / cold:>16.1f}{args.pages / warm:>16.1f}{baseline / warm:>8.1f}x  "
+              f"{'yes' if same else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
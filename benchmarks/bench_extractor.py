@@ -0,0 +1,221 @@
+"""InfoExtractorのマイクロベンチマーク
+
+benchmarks/corpus.pyで作成した企業サイトのページ（10KB〜5MB）について、次の時間を計測します。
+ネットワークには接続せず、抽出結果キャッシュは使用しません。
+
+- extract_*の各メソッド: 解析済みドキュメントを毎回作り直して渡した1回あたりの時間（解析時間を除く）
+- parse: HTMLからParsedDocumentを作成する時間
+- extract_all: HTML文字列からの1ページあたりの時間と、1秒あたりのページ数（JSON-LDあり・なし）
+
+計測結果は基準値ファイル（benchmarks/baseline.json）と比較し、基準値×許容倍率を超えた項目があれば
+終了コード1で終了します。実行環境の速度の違いは、固定の処理（較正）の時間の比で補正します。
+
+使い方:
+    python benchmarks/bench_extractor.py [--sizes 10,100,1000,5000] [--repeat N] [--seed N]
+    python benchmarks/bench_extractor.py --update-baseline  # 基準値ファイルを作り直す
+"""
+
+import argparse
+import json
+import logging
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import DEFAULT_SEED, SIZES_KB, CorpusPage, generate_corpus
+from core.document import ParsedDocument
+from core.extraction_cache import ExtractionCache
+from core.extractor import InfoExtractor
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+# 基準値ファイルに許容倍率がない場合の値
+DEFAULT_TOLERANCE = 2.0
+# 上限の下限（ミリ秒）。計測誤差の大きい短時間の項目を誤って劣化と判定しないようにする
+DEFAULT_MIN_LIMIT_MS = 1.0
+# 1項目あたりに計測するページの合計サイズの目安（KB）。大きなページは繰り返し回数を減らす
+REPEAT_BUDGET_KB = 20_000
+
+# 各メソッドの計測対象（extract_allの呼び出し順）
+METHODS = (
+    "extract_phone", "extract_email", "extract_address", "extract_fax", "extract_company_name",
+    "extract_sns_links", "extract_business_hours", "extract_closed_days",
+)
+
+
+def calibrate(repeat: int = 9) -> float:
+    """実行環境の速度を表す固定の処理の時間（ミリ秒、最小値）
+
+    正規表現による走査と文字列処理を行います。抽出処理の大部分と同じ種類の処理です。
+    """
+    text = "お問い合わせ TEL 03-1234-5678 〒100-0001 東京都千代田区 info@example.co.jp " * 2000
+    pattern = re.compile(r"0\d{1,4}-\d{1,4}-\d{4}|〒?\d{3}-\d{4}|[\w.+-]+@[\w-]+\.[\w.]+")
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        matches = pattern.findall(text)
+        "".join(sorted(set(matches))).split("-")
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def repeat_for(size_bytes: int, repeat: int) -> int:
+    """ページサイズに応じた繰り返し回数（1以上repeat以下）"""
+    return max(1, min(repeat, REPEAT_BUDGET_KB * 1024 // max(1, size_bytes)))
+
+
+def measure(func: Callable[[], object], repeat: int, setup: Optional[Callable[[], object]] = None) -> float:
+    """中央値の時間（ミリ秒）を計測
+
+    Args:
+        func: 計測する処理（setupがある場合はその戻り値を引数に取る）
+        repeat: 繰り返し回数
+        setup: 計測の対象外とする準備処理
+    """
+    timings = []
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        func(argument) if setup else func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run(pages: list[CorpusPage], repeat: int) -> dict[str, float]:
+    """すべての項目を計測
+
+    Returns:
+        項目名（"<ページ名>/<処理名>"）→ 時間（ミリ秒）の辞書
+    """
+    extractor = InfoExtractor(cache=ExtractionCache(max_entries=0))
+    backend = extractor.parser_backend
+    results = {}
+    for page in pages:
+        count = repeat_for(page.size_bytes, repeat)
+        html = page.html
+        # 各メソッドと解析の時間はJSON-LDによらないため、JSON-LDなしのページのみ計測する
+        if not page.structured:
+            results[f"{page.name}/parse"] = measure(lambda: ParsedDocument.from_html(html, backend), count)
+            for method_name in METHODS:
+                method = getattr(extractor, method_name)
+                # 走査結果を再利用させないよう、解析済みドキュメントを毎回作り直す
+                results[f"{page.name}/{method_name}"] = measure(
+                    method, count, setup=lambda: ParsedDocument.from_html(html, backend)
+                )
+        results[f"{page.name}/extract_all"] = measure(lambda: extractor.extract_all(html), count)
+    return results
+
+
+def load_baseline(path: Path) -> Optional[dict]:
+    """基準値ファイルを読み込む（ない場合はNone）"""
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results: dict[str, float], baseline: dict, calibration_ms: float) -> list[dict]:
+    """計測結果を基準値と比較
+
+    基準値は、較正の時間の比（今回÷基準値の作成時）で実行環境の速度に合わせてから
+    許容倍率（項目ごとのtolerancesまたは全体のtolerance）を掛けて上限とします。
+    上限がmin_limit_msより小さい場合はmin_limit_msを上限とします。
+
+    Args:
+        results: 項目名 → 時間（ミリ秒）
+        baseline: 基準値ファイルの内容
+        calibration_ms: 今回の較正の時間（ミリ秒）
+
+    Returns:
+        項目ごとの比較結果（name, ms, limit_ms, statusを持つ辞書、statusは"ok"・"regression"・"new"）
+    """
+    base_calibration = baseline.get("calibration_ms") or calibration_ms
+    scale = calibration_ms / base_calibration if base_calibration > 0 else 1.0
+    tolerance = baseline.get("tolerance", DEFAULT_TOLERANCE)
+    tolerances = baseline.get("tolerances", {})
+    min_limit = baseline.get("min_limit_ms", DEFAULT_MIN_LIMIT_MS)
+    cases = baseline.get("cases", {})
+
+    rows = []
+    for name, ms in results.items():
+        if name not in cases:
+            rows.append({"name": name, "ms": ms, "limit_ms": None, "status": "new"})
+            continue
+        limit = max(cases[name] * scale * tolerances.get(name, tolerance), min_limit)
+        rows.append({"name": name, "ms": ms, "limit_ms": limit, "status": "regression" if ms > limit else "ok"})
+    return rows
+
+
+def write_baseline(path: Path, results: dict[str, float], calibration_ms: float, seed: int,
+                   previous: Optional[dict]) -> None:
+    """基準値ファイルを作成（許容倍率は前回の値を引き継ぐ）"""
+    previous = previous or {}
+    cases = dict(previous.get("cases", {}))
+    cases.update({name: round(ms, 3) for name, ms in results.items()})
+    data = {
+        "seed": seed,
+        "calibration_ms": round(calibration_ms, 3),
+        "tolerance": previous.get("tolerance", DEFAULT_TOLERANCE),
+        "tolerances": previous.get("tolerances", {}),
+        "min_limit_ms": previous.get("min_limit_ms", DEFAULT_MIN_LIMIT_MS),
+        "cases": cases,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="InfoExtractorのマイクロベンチマーク")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in SIZES_KB),
+                        help="ページサイズ（KB、カンマ区切り）")
+    parser.add_argument("--repeat", type=int, default=5, help="1項目あたりの最大計測回数")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="ページ生成の乱数のシード")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="基準値ファイル")
+    parser.add_argument("--update-baseline", action="store_true", help="計測結果で基準値ファイルを更新する")
+    args = parser.parse_args()
+    # ログ出力の時間を計測に含めない
+    logging.disable(logging.INFO)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    pages = generate_corpus(sizes, args.seed)
+    calibration_ms = calibrate()
+    results = run(pages, args.repeat)
+    sizes_by_name = {page.name: page.size_bytes for page in pages}
+
+    baseline = load_baseline(args.baseline)
+    if baseline is not None and baseline.get("seed") != args.seed:
+        print(f"warning: baseline was recorded with seed {baseline.get('seed')}, not {args.seed}")
+    rows = compare(results, baseline or {}, calibration_ms)
+
+    print(f"calibration {calibration_ms:.3f} ms")
+    for row in rows:
+        page_name, operation = row["name"].split("/", 1)
+        line = f"{page_name:<14}{operation:<24}{row['ms']:>10.3f} ms"
+        if operation == "extract_all":
+            pages_per_sec = 1000 / row["ms"] if row["ms"] > 0 else float("inf")
+            mb_per_sec = sizes_by_name[page_name] / 1024 / 1024 * pages_per_sec
+            line += f"{pages_per_sec:>10.1f} pages/s{mb_per_sec:>8.1f} MB/s"
+        else:
+            line += " " * 26
+        if row["limit_ms"] is not None:
+            line += f"  limit {row['limit_ms']:>10.3f} ms  {row['status']}"
+        print(line)
+
+    if args.update_baseline:
+        write_baseline(args.baseline, results, calibration_ms, args.seed, baseline)
+        print(f"baseline written to {args.baseline}")
+        return
+
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
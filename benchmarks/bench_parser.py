@@ -0,0 +1,89 @@
+"""HTMLパーサーのバックエンドのベンチマーク
+
+BeautifulSoupバックエンド（従来の方法）とlxmlバックエンドについて、
+1ページあたりのParsedDocumentの作成時間と、extract_all全体の時間を比較します。
+
+使い方:
+    python benchmarks/bench_parser.py [--repeat N] [--size KB]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.extractor import InfoExtractor
+from core.html_backend import get_parser_backend
+
+BLOCK = """
+<div class="item">
+    <h2>店舗{index}</h2>
+    <p>〒100-0001 東京都千代田区千代田1-1-{index} TEL: 03-1234-{number:04d}</p>
+    <p>営業時間: 9:00〜18:00 定休日: 日曜日</p>
+    <a href="/shop/{index}/"><img src="shop{index}.png" alt="店舗{index}の詳細"></a>
+    <script>window.dataLayer.push({{"shop": {index}}});</script>
+    <svg viewBox="0 0 10 10"><path d="M0 0L10 10"/></svg>
+</div>
+"""
+
+
+def build_page(size_kb: int) -> str:
+    """テスト用のHTMLページを作成
+
+    Args:
+        size_kb: おおよそのページサイズ（KB）
+
+    Returns:
+        HTML文字列
+    """
+    blocks = []
+    total = 0
+    index = 0
+    while total < size_kb * 1024:
+        block = BLOCK.format(index=index, number=index % 10000)
+        blocks.append(block)
+        total += len(block.encode("utf-8"))
+        index += 1
+    return f"<html><head><title>店舗一覧</title></head><body>{''.join(blocks)}</body></html>"
+
+
+def measure(func, repeat: int) -> float:
+    """平均時間（ミリ秒）を計測"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTMLパーサーのバックエンドのベンチマーク")
+    parser.add_argument("--repeat", type=int, default=5, help="1ケースあたりの繰り返し回数")
+    parser.add_argument("--size", type=int, default=200, help="最大のページサイズ（KB）")
+    args = parser.parse_args()
+
+    soup_backend = get_parser_backend("beautifulsoup")
+    lxml_backend = get_parser_backend("lxml")
+    soup_extractor = InfoExtractor(parser_backend=soup_backend)
+    lxml_extractor = InfoExtractor(parser_backend=lxml_backend)
+
+    print(f"{'size (KB)':<12}{'step':<14}{'beautifulsoup (ms)':>20}{'lxml (ms)':>12}{'speedup':>9}  same results")
+    for size_kb in sorted({max(1, args.size // 10), args.size}):
+        html = build_page(size_kb)
+
+        soup_ms = measure(lambda: soup_backend.parse_document(html), args.repeat)
+        lxml_ms = measure(lambda: lxml_backend.parse_document(html), args.repeat)
+        same = soup_backend.parse_document(html).text == lxml_backend.parse_document(html).text
+        print(f"{size_kb:<12}{'parse':<14}{soup_ms:>20.2f}{lxml_ms:>12.2f}{soup_ms / lxml_ms:>8.1f}x  "
+              f"{'yes' if same else 'no'}")
+
+        soup_ms = measure(lambda: soup_extractor.extract_all(html), args.repeat)
+        lxml_ms = measure(lambda: lxml_extractor.extract_all(html), args.repeat)
+        same = soup_extractor.extract_all(html) == lxml_extractor.extract_all(html)
+        print(f"{size_kb:<12}{'extract_all':<14}{soup_ms:>20.2f}{lxml_ms:>12.2f}{soup_ms / lxml_ms:>8.1f}x  "
+              f"{'yes' if same else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
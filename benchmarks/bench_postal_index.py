@@ -0,0 +1,52 @@
+"""郵便番号索引のベンチマーク
+
+索引ファイルのオープン時間（メモリマップ）と、1件あたりの検索時間を計測します。
+索引ファイルは scripts/build_postal_index.py で事前に作成してください。
+
+使い方:
+    python benchmarks/bench_postal_index.py [--index PATH] [--count N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.settings import Settings
+from core.postal_index import PostalIndex
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="郵便番号索引のベンチマーク")
+    parser.add_argument("--index", type=Path, default=Settings.POSTAL_INDEX_PATH, help="索引ファイルのパス")
+    parser.add_argument("--count", type=int, default=200000, help="検索回数")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = PostalIndex(args.index)
+    open_ms = (time.perf_counter() - start) * 1000
+
+    # 登録されている郵便番号と、登録されていない郵便番号を半分ずつ検索する
+    random.seed(0)
+    codes = [f"{random.randrange(10000000):07d}" for _ in range(1000)]
+    hits = [index.lookup(code) for code in codes]
+    print(f"index: {args.index} ({len(index)} codes, {args.index.stat().st_size / 1024:.0f} KB)")
+    print(f"open: {open_ms:.3f} ms, random codes found: {sum(hit is not None for hit in hits)}/{len(codes)}")
+
+    known = [f"{random.randrange(1000):03d}-0000" for _ in range(1000)]
+    for name, method in (("lookup", index.lookup), ("lookup_city", index.lookup_city)):
+        for label, sample in (("random", codes), ("hyphenated", known)):
+            start = time.perf_counter()
+            for i in range(args.count):
+                method(sample[i % len(sample)])
+            per_lookup = (time.perf_counter() - start) / args.count * 1e6
+            print(f"{name:<12}{label:<12}{per_lookup:>8.3f} us/lookup")
+
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""複数パターン照合のベンチマーク
+
+これまでの経路（パターンごとのre.findall/re.searchのループ）と、
+core.scannerのPatternScanner（1回の走査）について、
+1ページあたりの照合時間と抽出結果を比較します。
+
+使い方:
+    python benchmarks/bench_scanner.py [--repeat N] [--size KB] [--stats]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.pattern_registry import get_pattern_registry
+from core.scanner import PatternScanner
+
+# 会社概要ページに近い段落（電話番号・住所・営業時間などを少しだけ含む）
+CONTACT_TEXT = (
+    "株式会社サンプル商事 〒100-0001 東京都千代田区千代田1-1-1 "
+    "TEL: 03-1234-5678 FAX: 03-1234-5679 フリーダイヤル 0120-123-456 "
+    "メール info@sample-shoji.co.jp 営業時間: 9:00〜18:00 定休日: 土日祝 "
+)
+FILLER_TEXT = (
+    "当社は創業以来、お客様の課題に寄り添い、品質の高いサービスを提供してまいりました。"
+    "2024年度の売上高は前年比12%増となり、新たに3拠点を開設しました。"
+    "Our mission is to deliver reliable products to customers across Japan. "
+)
+
+
+def build_text(size_kb: int) -> str:
+    """テスト用のページテキストを作成
+
+    Args:
+        size_kb: おおよそのテキストサイズ（KB）
+
+    Returns:
+        タグを除去した後のページテキスト
+    """
+    block = FILLER_TEXT * 20 + CONTACT_TEXT
+    count = max(1, size_kb * 1024 // len(block.encode("utf-8")))
+    return block * count
+
+
+def scan_with_loops(patterns: dict[str, list[str]], text: str) -> dict[str, object]:
+    """これまでの経路（パターンごとのループ）で照合"""
+    results: dict[str, object] = {}
+    for kind in ("phone", "email", "fax"):
+        values = set()
+        for pattern in patterns[kind]:
+            values.update(re.findall(pattern, text))
+        results[kind] = values
+
+    for kind in ("postal_code", "business_hours", "closed_days"):
+        results[kind] = None
+        for pattern in patterns[kind]:
+            match = re.search(pattern, text)
+            if match:
+                results[kind] = match.group(1) if len(match.groups()) == 1 else match.group(0)
+                break
+    return results
+
+
+def scan_with_scanner(scanner: PatternScanner, text: str) -> dict[str, object]:
+    """新しい経路（PatternScanner）で照合"""
+    result = scanner.scan(text)
+    results: dict[str, object] = {kind: set(result.values(kind)) for kind in ("phone", "email", "fax")}
+    for kind in ("postal_code", "business_hours", "closed_days"):
+        match = result.first(kind)
+        results[kind] = match.value if match else None
+    return results
+
+
+def measure(func, repeat: int) -> tuple[float, dict[str, object]]:
+    """平均照合時間（ミリ秒）と結果を計測"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = func()
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    return elapsed, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="複数パターン照合のベンチマーク")
+    parser.add_argument("--repeat", type=int, default=5, help="1ケースあたりの繰り返し回数")
+    parser.add_argument("--size", type=int, default=500, help="最大のページサイズ（KB）")
+    parser.add_argument("--stats", action="store_true", help="パターンごとのコンパイル時間・一致件数を表示")
+    args = parser.parse_args()
+
+    scanner = PatternScanner(get_pattern_registry().patterns())
+
+    print(f"{'size (KB)':<12}{'loops (ms)':>12}{'scanner (ms)':>14}{'speedup':>9}  same results")
+    for size_kb in sorted({max(1, args.size // 10), max(1, args.size // 2), args.size}):
+        text = build_text(size_kb)
+
+        old_ms, old_results = measure(lambda: scan_with_loops(scanner.patterns, text), args.repeat)
+        new_ms, new_results = measure(lambda: scan_with_scanner(scanner, text), args.repeat)
+
+        differences = [kind for kind in old_results if old_results[kind] != new_results[kind]]
+        speedup = old_ms / new_ms if new_ms else float("inf")
+        print(
+            f"{size_kb:<12}{old_ms:>12.2f}{new_ms:>14.2f}{speedup:>8.1f}x  "
+            f"{'yes' if not differences else 'no (' + ', '.join(differences) + ')'}"
+        )
+
+    if args.stats:
+        print_statistics(scanner)
+
+
+def print_statistics(scanner: PatternScanner) -> None:
+    """種類ごとの走査時間と、パターンごとのコンパイル時間・一致件数を表示"""
+    print()
+    print(f"{'kind / pattern':<40}{'compile (ms)':>14}{'matches':>10}{'scans':>8}{'scan (ms)':>12}")
+    for kind, stats in scanner.statistics().items():
+        combined_ms = f"{stats.combined_compile_ms:.3f}" if stats.combined_compile_ms is not None else "-"
+        print(f"{kind:<40}{combined_ms:>14}{'':>10}{stats.scans:>8}{stats.scan_ms:>12.2f}")
+        for pattern in stats.patterns:
+            name = f"  {pattern.pack}/{pattern.label or pattern.pattern}"
+            print(f"{name:<40}{pattern.compile_ms:>14.3f}{pattern.matches:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""ストリーミング抽出のベンチマーク
+
+ページのサイズごとに、ページ全体を文字列として解析する従来の抽出（extract_all）と、
+バイト列を受信した順に渡すストリーミング抽出（extract_stream）の処理時間と
+ピークメモリ（tracemallocで計測、受信したバイト列自体を除く）を比較します。
+抽出結果キャッシュは使用しません。
+
+使い方:
+    python benchmarks/bench_streaming.py [--sizes 1,4,16] [--chunk KB]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.extraction_cache import ExtractionCache
+from core.extractor import InfoExtractor
+
+CONTACT = "<p>〒100-0001 東京都千代田区千代田1-1 TEL 03-1234-5678 info@sample.example.jp</p>"
+PARAGRAPH = "<p>当社は東京都内を中心に事業を展開しています。お問い合わせはフォームからどうぞ。</p>\n"
+
+
+def build_page(size_mb: int) -> bytes:
+    """本文がsize_mb程度で、末尾に連絡先を持つページのバイト列を作成"""
+    count = max(1, size_mb * 1024 * 1024 // len(PARAGRAPH.encode("utf-8")))
+    return f"<html><head><title>サンプル</title></head><body>{PARAGRAPH * count}{CONTACT}</body></html>".encode("utf-8")
+
+
+def measure(function) -> tuple[float, float, object]:
+    """(処理時間（秒）, ピークメモリ（MB）, 戻り値)を計測"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ストリーミング抽出のベンチマーク")
+    parser.add_argument("--sizes", default="1,4,16", help="ページのサイズ（MB、カンマ区切り）")
+    parser.add_argument("--chunk", type=int, default=16, help="1回に渡すバイト数（KB）")
+    args = parser.parse_args()
+
+    extractor = InfoExtractor(cache=ExtractionCache(max_entries=0))
+    chunk_size = args.chunk * 1024
+    content_type = "text/html; charset=utf-8"
+
+    for size_mb in (int(size) for size in args.sizes.split(",")):
+        body = build_page(size_mb)
+        whole_time, whole_peak, whole = measure(lambda: extractor.extract_all(body.decode("utf-8")))
+        stream_time, stream_peak, streamed = measure(lambda: extractor.extract_stream(
+            (body[start:start + chunk_size] for start in range(0, len(body), chunk_size)), content_type
+        ))
+        same = "same" if streamed == whole else "DIFFERENT"
+        print(f"{size_mb:>4} MB  extract_all {whole_time:>6.2f} s {whole_peak:>8.1f} MB peak  "
+              f"extract_stream {stream_time:>6.2f} s {stream_peak:>8.1f} MB peak  ({same})")
+
+
+if __name__ == "__main__":
+    main()
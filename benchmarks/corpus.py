@@ -0,0 +1,270 @@
+"""ベンチマーク用の企業サイトのページ生成モジュール
+
+シード付きの乱数で、日本の企業サイトによくある構成のHTMLページを作成します。
+同じシード・サイズからは常に同じページが作成されるため、ネットワークに接続せずに
+計測結果を比較できます。
+
+- ヘッダー（インラインのCSS・計測用スクリプト・ナビゲーション・パンくずリスト）
+- 本文（お知らせ一覧・事業紹介・製品の価格表・スタッフブログ）をサイズに達するまで繰り返す
+- 会社概要の表（会社名・所在地・電話番号・FAX・メールアドレス・営業時間・定休日）
+- フッター（所在地・連絡先・SNSリンク・サイトマップ・著作権表示）
+- JSON-LD（Organization）は構造化データありのページのみ
+
+本文には、日付・価格・受付番号・フリーダイヤルなど、電話番号や郵便番号に似た数字も含めます。
+"""
+
+from dataclasses import dataclass, field
+import json
+import random
+
+DEFAULT_SEED = 20240401
+# ベンチマークの既定のページサイズ（KB）
+SIZES_KB = (10, 100, 1000, 5000)
+
+# 郵便番号・都道府県・市区町村と町域・番地・市外局番
+_LOCATIONS = (
+    ("100-0005", "東京都", "千代田区丸の内", "1-9-1", "03"),
+    ("530-0001", "大阪府", "大阪市北区梅田", "3-1-1", "06"),
+    ("460-0008", "愛知県", "名古屋市中区栄", "3-5-1", "052"),
+    ("812-0011", "福岡県", "福岡市博多区博多駅前", "2-1-1", "092"),
+    ("060-0005", "北海道", "札幌市中央区北五条西", "2-5", "011"),
+    ("980-0021", "宮城県", "仙台市青葉区中央", "1-1-1", "022"),
+    ("730-0011", "広島県", "広島市中区基町", "6-78", "082"),
+    ("650-0021", "兵庫県", "神戸市中央区三宮町", "1-4-9", "078"),
+)
+
+# 会社名の本体とドメイン
+_COMPANIES = (
+    ("さくら工業", "sakura-kogyo"),
+    ("ミライ商事", "mirai-shoji"),
+    ("東和精機", "towa-seiki"),
+    ("青葉システム", "aoba-system"),
+    ("大和フーズ", "yamato-foods"),
+    ("ひかり設計", "hikari-sekkei"),
+    ("北斗物流", "hokuto-logi"),
+    ("みなと建設", "minato-kensetsu"),
+)
+
+_BUSINESS_HOURS = ("9:00〜18:00", "10:00〜19:00", "8:30〜17:30")
+_CLOSED_DAYS = ("土日祝", "日曜日・祝日", "水曜日")
+
+_NAV_ITEMS = ("ホーム", "事業内容", "製品情報", "導入事例", "会社概要", "採用情報", "お知らせ", "お問い合わせ")
+_NEWS_TOPICS = (
+    "夏季休業のお知らせ", "新製品の販売を開始しました", "展示会に出展します", "ホームページをリニューアルしました",
+    "年末年始の営業について", "採用説明会を開催します", "価格改定のお知らせ", "システムメンテナンスのお知らせ",
+)
+_SENTENCES = (
+    "当社は創業以来、お客様の課題に寄り添った製品とサービスを提供してまいりました。",
+    "品質管理体制を強化し、安心してお使いいただける製品づくりに取り組んでいます。",
+    "地域の皆様とともに成長する企業を目指し、環境保全活動にも力を入れています。",
+    "専門のスタッフが導入から運用まで丁寧にサポートいたします。",
+    "全国の販売代理店を通じて、迅速な納品体制を整えております。",
+    "お見積もりは無料です。お気軽にお問い合わせフォームからご相談ください。",
+    "社員一同、より良いサービスの提供に努めてまいります。",
+    "詳しくは製品カタログをご覧いただくか、担当営業までお問い合わせください。",
+)
+_PRODUCTS = ("スタンダードモデル", "プロフェッショナルモデル", "コンパクトモデル", "保守パック", "導入支援サービス")
+_STAFF = ("営業部 田中", "技術部 鈴木", "総務部 佐藤", "製造部 高橋", "企画部 伊藤")
+
+_STYLE = """<style>
+body{margin:0;font-family:"Hiragino Kaku Gothic ProN",Meiryo,sans-serif;color:#333}
+.header{display:flex;justify-content:space-between;padding:16px 24px}
+.nav ul{list-style:none;display:flex;gap:24px}.nav a{color:#1a4b8c;text-decoration:none}
+.company-profile th{width:30%;background:#f4f6f8;text-align:left}.company-profile td{padding:8px}
+.footer{background:#1a2a3a;color:#fff;padding:32px 24px}
+</style>"""
+_ANALYTICS = """<script async src="/js/gtag.js"></script>
+<script>window.dataLayer=window.dataLayer||[];function gtag(){dataLayer.push(arguments);}
+gtag('js',new Date());gtag('config','G-XXXXXXXXXX');</script>"""
+
+
+@dataclass
+class CorpusPage:
+    """生成したページと正解データ"""
+    name: str
+    html: str
+    structured: bool
+    expected: dict[str, str] = field(default_factory=dict)  # phone, fax, email, postal_code, prefecture, company_name
+
+    @property
+    def size_bytes(self) -> int:
+        """ページのバイト数（UTF-8）"""
+        return len(self.html.encode("utf-8"))
+
+
+def generate_page(size_kb: int, seed: int = DEFAULT_SEED, structured: bool = True) -> CorpusPage:
+    """企業サイトのページを作成
+
+    Args:
+        size_kb: おおよそのページサイズ（KB、本文の繰り返しで調整する）
+        seed: 乱数のシード
+        structured: JSON-LDを含めるか
+
+    Returns:
+        生成したページ
+    """
+    rng = random.Random(f"{seed}:{size_kb}:{structured}")
+    postal_code, prefecture, city, street, area_code = rng.choice(_LOCATIONS)
+    company_base, domain = rng.choice(_COMPANIES)
+    company_name = f"株式会社{company_base}"
+    local = _phone_local(rng, area_code)
+    phone = f"{area_code}-{local}"
+    fax = f"{area_code}-{local[:-1]}{(int(local[-1]) + 1) % 10}"
+    email = f"info@{domain}.co.jp"
+    address = f"{prefecture}{city}{street}"
+    hours = rng.choice(_BUSINESS_HOURS)
+    closed = rng.choice(_CLOSED_DAYS)
+    expected = {
+        "phone": phone, "fax": fax, "email": email,
+        "postal_code": postal_code, "prefecture": prefecture, "company_name": company_name,
+    }
+
+    head = [
+        "<!DOCTYPE html>",
+        '<html lang="ja"><head><meta charset="utf-8">',
+        f"<title>会社概要 | {company_name}</title>",
+        f'<meta name="description" content="{company_name}の会社概要です。">',
+        f'<meta property="og:site_name" content="{company_name}">',
+        f'<link rel="canonical" href="https://www.{domain}.co.jp/company/">',
+        _STYLE,
+        _ANALYTICS,
+    ]
+    if structured:
+        head.append(_json_ld(company_name, domain, phone, fax, email, postal_code, prefecture, city, street))
+    head.append("</head>")
+
+    header = _header(company_name)
+    profile = _profile_table(company_name, postal_code, address, phone, fax, email, hours, closed)
+    footer = _footer(company_name, domain, postal_code, address, phone, fax)
+
+    # 会社概要の表が本文の中ほどに来るよう、前後に本文を配置する
+    fixed = sum(len(part.encode("utf-8")) for part in (*head, header, profile, footer))
+    filler_bytes = max(0, size_kb * 1024 - fixed)
+    before = _filler(rng, filler_bytes // 2)
+    after = _filler(rng, filler_bytes - filler_bytes // 2)
+
+    html = "\n".join([
+        *head, "<body>", header, '<main class="content">', before, profile, after, "</main>", footer,
+        "</body></html>",
+    ])
+    name = f"{size_kb}KB-{'jsonld' if structured else 'plain'}"
+    return CorpusPage(name=name, html=html, structured=structured, expected=expected)
+
+
+def generate_corpus(sizes_kb=SIZES_KB, seed: int = DEFAULT_SEED) -> list[CorpusPage]:
+    """各サイズについて、JSON-LDありとなしのページを作成
+
+    Args:
+        sizes_kb: ページサイズ（KB）のリスト
+        seed: 乱数のシード
+
+    Returns:
+        生成したページのリスト（サイズ順、各サイズはJSON-LDあり・なしの順）
+    """
+    return [generate_page(size_kb, seed, structured) for size_kb in sizes_kb for structured in (True, False)]
+
+
+def _phone_local(rng: random.Random, area_code: str) -> str:
+    """市外局番に続く番号（市外局番と合わせて10桁）"""
+    exchange_digits = 6 - len(area_code)
+    exchange = rng.randint(10 ** (exchange_digits - 1), 10 ** exchange_digits - 1)
+    return f"{exchange}-{rng.randint(1000, 9999)}"
+
+
+def _json_ld(company_name, domain, phone, fax, email, postal_code, prefecture, city, street) -> str:
+    data = {
+        "@context": "https://schema.org",
+        "@type": "Organization",
+        "name": company_name,
+        "url": f"https://www.{domain}.co.jp/",
+        "telephone": phone,
+        "faxNumber": fax,
+        "email": email,
+        "address": {
+            "@type": "PostalAddress", "postalCode": postal_code, "addressRegion": prefecture,
+            "addressLocality": city, "streetAddress": street,
+        },
+        "sameAs": [f"https://twitter.com/{domain}", f"https://www.facebook.com/{domain}"],
+    }
+    return f'<script type="application/ld+json">{json.dumps(data, ensure_ascii=False)}</script>'
+
+
+def _header(company_name: str) -> str:
+    items = "".join(f'<li><a href="/{index}/">{label}</a></li>' for index, label in enumerate(_NAV_ITEMS))
+    return (f'<header class="header"><a class="logo" href="/"><img src="/img/logo.svg" alt="{company_name}"></a>'
+            f'<nav class="nav"><ul>{items}</ul></nav></header>'
+            '<ol class="breadcrumb"><li><a href="/">ホーム</a></li><li>会社概要</li></ol>')
+
+
+def _profile_table(company_name, postal_code, address, phone, fax, email, hours, closed) -> str:
+    rows = (
+        ("会社名", company_name),
+        ("所在地", f"〒{postal_code} {address}"),
+        ("電話番号", phone),
+        ("FAX", fax),
+        ("メールアドレス", f'<a href="mailto:{email}">{email}</a>'),
+        ("営業時間", hours),
+        ("定休日", closed),
+        ("設立", "1987年4月"),
+        ("資本金", "3,000万円"),
+        ("従業員数", "128名（2024年4月現在）"),
+    )
+    body = "".join(f"<tr><th>{label}</th><td>{value}</td></tr>" for label, value in rows)
+    return f'<section id="profile"><h2>会社概要</h2><table class="company-profile">{body}</table></section>'
+
+
+def _footer(company_name, domain, postal_code, address, phone, fax) -> str:
+    sitemap = "".join(f'<li><a href="/{index}/">{label}</a></li>' for index, label in enumerate(_NAV_ITEMS))
+    return (
+        '<footer class="footer">'
+        f"<p>{company_name}</p><p>〒{postal_code} {address}</p>"
+        f"<p>TEL：{phone} / FAX：{fax}</p>"
+        f'<ul class="sns"><li><a href="https://twitter.com/{domain}">X（旧Twitter）</a></li>'
+        f'<li><a href="https://www.instagram.com/{domain}/">Instagram</a></li></ul>'
+        f'<ul class="sitemap">{sitemap}<li><a href="/privacy/">プライバシーポリシー</a></li></ul>'
+        f"<small>Copyright © {company_name} All Rights Reserved.</small></footer>"
+    )
+
+
+def _filler(rng: random.Random, size_bytes: int) -> str:
+    """サイズに達するまで本文のブロックを繰り返す"""
+    blocks = []
+    total = 0
+    builders = (_news_block, _service_block, _price_block, _blog_block)
+    while total < size_bytes:
+        block = rng.choice(builders)(rng)
+        blocks.append(block)
+        total += len(block.encode("utf-8"))
+    return "\n".join(blocks)
+
+
+def _news_block(rng: random.Random) -> str:
+    items = []
+    for _ in range(rng.randint(3, 6)):
+        date = f"{rng.randint(2019, 2024)}.{rng.randint(1, 12):02d}.{rng.randint(1, 28):02d}"
+        items.append(f'<li><time>{date}</time><a href="/news/{rng.randint(1, 9999)}/">{rng.choice(_NEWS_TOPICS)}</a></li>')
+    return f'<section class="news"><h2>お知らせ</h2><ul>{"".join(items)}</ul></section>'
+
+
+def _service_block(rng: random.Random) -> str:
+    sentences = "".join(rng.choice(_SENTENCES) for _ in range(rng.randint(2, 5)))
+    return (f'<section class="service"><h3>{rng.choice(_PRODUCTS)}</h3>'
+            f'<img src="/img/service{rng.randint(1, 20)}.jpg" alt="" loading="lazy"><p>{sentences}</p>'
+            f'<p>フリーダイヤル 0120-{rng.randint(100, 999)}-{rng.randint(100, 999)}（受付 9:00〜17:00）</p></section>')
+
+
+def _price_block(rng: random.Random) -> str:
+    rows = "".join(
+        f"<tr><td>{product}</td><td>{rng.randint(1, 99) * 1000:,}円（税込）</td>"
+        f"<td>型番 {rng.choice('ABCDEFG')}{rng.randint(1000, 9999)}-{rng.randint(10, 99)}</td></tr>"
+        for product in rng.sample(_PRODUCTS, 3)
+    )
+    return f'<table class="price"><tr><th>製品</th><th>価格</th><th>型番</th></tr>{rows}</table>'
+
+
+def _blog_block(rng: random.Random) -> str:
+    sentences = "".join(rng.choice(_SENTENCES) for _ in range(rng.randint(3, 8)))
+    number = f"{rng.randint(2019, 2024)}-{rng.randint(1000, 9999)}-{rng.randint(100, 999)}"
+    return (f'<article class="blog"><h3>スタッフブログ（{rng.choice(_STAFF)}）</h3><p>{sentences}</p>'
+            f"<p>受付番号：{number}</p>"
+            f'<script>window.dataLayer.push({{"event":"view","id":{rng.randint(1, 99999)}}});</script></article>')
@@ -41,47 +41,36 @@ EXTRACTION_FIELDS = {
     "fax": "FAX番号",
     "company_name": "会社名・店舗名",
     "sns_links": "SNSリンク",
+    "business_hours": "営業時間",
+    "closed_days": "定休日",
 }
 
-# 正規表現パターン
-REGEX_PATTERNS = {
-    # 電話番号（複数パターン）- Phase 2で拡充
-    "phone": [
-        r"0\d{1,4}-\d{1,4}-\d{4}",  # ハイフン区切り（基本）
-        r"0\d{9,10}",  # ハイフンなし
-        r"\(\d{2,4}\)\s?\d{1,4}-\d{4}",  # 括弧付き
-        # フリーダイヤル
-        r"0120-\d{3}-\d{3}",  # 0120
-        r"0120\d{6}",  # 0120（ハイフンなし）
-        r"0800-\d{3}-\d{4}",  # 0800
-        r"0800\d{7}",  # 0800（ハイフンなし）
-        # ナビダイヤル
-        r"0570-\d{3}-\d{3}",
-        r"0570\d{6}",
-        # IP電話
-        r"050-\d{4}-\d{4}",
-        r"050\d{8}",
-        # 携帯電話（特定パターン）
-        r"0[789]0-\d{4}-\d{4}",
-        r"0[789]0\d{8}",
-    ],
-    # メールアドレス
-    "email": [
-        r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
-    ],
-    # 郵便番号
-    "postal_code": [
-        r"〒\s?\d{3}-?\d{4}",  # 〒記号付き
-        r"\d{3}-\d{4}",  # ハイフン付き
-    ],
-    # FAX番号
-    "fax": [
-        r"FAX[：:\s]*0\d{1,4}-\d{1,4}-\d{4}",
-        r"ファックス[：:\s]*0\d{1,4}-\d{1,4}-\d{4}",
-        r"fax[：:\s]*0\d{1,4}-\d{1,4}-\d{4}",
-        r"Fax[：:\s]*0\d{1,4}-\d{1,4}-\d{4}",
-    ],
+# 電話番号の種類（先頭の番号）ごとの桁数（ハイフンを除く、長い番号から順に判定）
+PHONE_PREFIX_LENGTHS = {
+    "0120": (10,),  # フリーダイヤル
+    "0800": (10,),  # フリーダイヤル
+    "0570": (10,),  # ナビダイヤル
+    "050": (11,),  # IP電話
+    "070": (11,),  # 携帯電話
+    "080": (11,),  # 携帯電話
+    "090": (11,),  # 携帯電話
 }
+# 上記以外の0で始まる番号（固定電話、市外局番により桁数が異なる）
+PHONE_FIXED_LINE_LENGTHS = (10, 11)
+
+# メールアドレスとみなさない末尾（画像ファイル名など）
+EMAIL_INVALID_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".svg")
+
+# 都道府県（全国地方公共団体コード順）
+PREFECTURES = (
+    "北海道", "青森県", "岩手県", "宮城県", "秋田県", "山形県", "福島県",
+    "茨城県", "栃木県", "群馬県", "埼玉県", "千葉県", "東京都", "神奈川県",
+    "新潟県", "富山県", "石川県", "福井県", "山梨県", "長野県", "岐阜県", "静岡県", "愛知県",
+    "三重県", "滋賀県", "京都府", "大阪府", "兵庫県", "奈良県", "和歌山県",
+    "鳥取県", "島根県", "岡山県", "広島県", "山口県",
+    "徳島県", "香川県", "愛媛県", "高知県",
+    "福岡県", "佐賀県", "長崎県", "熊本県", "大分県", "宮崎県", "鹿児島県", "沖縄県",
+)
 
 # SNSドメイン
 SNS_DOMAINS = {
@@ -91,6 +80,69 @@ SNS_DOMAINS = {
     "line": ["line.me"],
     "youtube": ["youtube.com"],
 }
+# SNSの共有ボタンなどのパス（先頭のパスセグメント、小文字）。アカウントのリンクとみなさない
+SNS_SHARE_PATHS = (
+    "intent", "share", "share.php", "sharer", "sharer.php", "dialog", "plugins", "lineit", "r/msg",
+)
+
+# 会社・店舗とみなすschema.orgの型（JSON-LD・microdataの構造化データの抽出に使用）
+# これ以外の型も、名前が「Business」「Organization」「Store」で終わる型は会社・店舗とみなす
+SCHEMA_ORG_BUSINESS_TYPES = (
+    "Organization", "Corporation", "LocalBusiness", "OnlineBusiness",
+    "Restaurant", "FoodEstablishment", "CafeOrCoffeeShop", "BarOrPub", "Bakery",
+    "ProfessionalService", "LegalService", "Attorney", "Notary", "AccountingService", "FinancialService",
+    "MedicalOrganization", "MedicalClinic", "Hospital", "Dentist", "Physician", "Pharmacy", "VeterinaryCare",
+    "LodgingBusiness", "Hotel", "HealthAndBeautyBusiness", "BeautySalon", "HairSalon", "DaySpa",
+    "HomeAndConstructionBusiness", "GeneralContractor", "Electrician", "Plumber", "RealEstateAgent",
+    "AutomotiveBusiness", "AutoRepair", "AutoDealer", "EducationalOrganization", "School",
+    "SportsActivityLocation", "ExerciseGym", "TravelAgency", "EmploymentAgency", "InsuranceAgency",
+)
+
+# 問い合わせページ巡回のリンクスコア（アンカーテキストに含まれる語）
+CRAWL_ANCHOR_KEYWORDS = {
+    "会社概要": 10,
+    "お問い合わせ": 10,
+    "お問合せ": 10,
+    "問い合わせ": 9,
+    "アクセス": 9,
+    "所在地": 8,
+    "連絡先": 8,
+    "会社案内": 8,
+    "会社情報": 8,
+    "企業情報": 8,
+    "店舗情報": 8,
+    "運営会社": 7,
+    "特定商取引法": 7,
+    "地図": 5,
+    "contact": 8,
+    "access": 8,
+    "company": 7,
+    "about": 6,
+    "profile": 5,
+}
+
+# 問い合わせページ巡回のリンクスコア（URLのパスに含まれる語）
+CRAWL_PATH_KEYWORDS = {
+    "contact": 8,
+    "inquiry": 8,
+    "access": 8,
+    "company": 7,
+    "about": 6,
+    "gaiyou": 6,
+    "gaiyo": 6,
+    "profile": 5,
+    "corporate": 5,
+    "tokusho": 5,
+    "map": 4,
+    "info": 3,
+    "shop": 3,
+}
+
+# 巡回対象外とするファイル拡張子
+CRAWL_SKIP_EXTENSIONS = (
+    ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".zip",
+    ".doc", ".docx", ".xls", ".xlsx", ".mp4", ".mp3",
+)
 
 # エラーメッセージ
 ERROR_MESSAGES = {
@@ -19,6 +19,8 @@ class Settings:
     LOGS_DIR = BASE_DIR / "logs"
     OUTPUT_DIR = BASE_DIR / "output"
     PRESETS_DIR = CONFIG_DIR / "presets"
+    DATA_DIR = CONFIG_DIR / "data"
+    PATTERN_PACKS_DIR = CONFIG_DIR / "patterns"
 
     # 検索API設定
     SEARCH_API_PROVIDER = os.getenv("SEARCH_API_PROVIDER", "tavily")  # "tavily" or "google"
@@ -35,6 +37,46 @@ class Settings:
     # スクレイピング設定
     REQUEST_TIMEOUT = 30  # 秒
     MAX_RETRIES = 3
+    MAX_WORKERS = 8  # 詳細情報取得の並列数
+    MAX_PAGE_BYTES = 5 * 1024 * 1024  # 1ページあたりの最大受信バイト数
+    STOP_AT_BODY_END = False  # </body>を受信した時点で受信を打ち切るか
+    HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")  # 本文を受信するContent-Type
+    HTTP_POOL_CONNECTIONS = 32  # コネクションプールを保持するホスト数
+    HTTP_POOL_MAXSIZE = 8  # ホストごとの最大コネクション数
+    HTTP_HOST_POOL_SIZES: dict[str, int] = {}  # ホストごとの最大コネクション数の上書き
+    # robots.txt設定
+    ROBOTS_TIMEOUT = 10  # robots.txt取得のタイムアウト（秒）
+    ROBOTS_CACHE_TTL = 24 * 60 * 60  # 取得成功時の有効期間（秒）
+    ROBOTS_NEGATIVE_TTL = 60 * 60  # 取得失敗時の有効期間（秒）
+    ROBOTS_CACHE_PERSIST = True  # robots.txtキャッシュをファイルに保存するか
+    ROBOTS_CACHE_PATH = BASE_DIR / "cache" / "robots_cache.json"
+    ROBOTS_CACHE_SAVE_INTERVAL = 5.0  # 取得した結果をファイルに保存する最短の間隔（秒）
+
+    # HTTPレスポンスキャッシュ設定
+    HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "false").lower() == "true"
+    HTTP_CACHE_PATH = BASE_DIR / "cache" / "http_cache.sqlite3"
+    HTTP_CACHE_MAX_BYTES = 500 * 1024 * 1024  # 500MB
+    HTTP_CACHE_DEFAULT_TTL = 24 * 60 * 60  # Cache-Control等がない場合の有効期間（秒）
+    # 適応型レート制限設定（ドメイン単位、初期レートはDEFAULT_WAIT_TIMEから決定）
+    RATE_LIMIT_MIN_RATE = 1 / 60  # レートの下限（リクエスト/秒）
+    RATE_LIMIT_MAX_RATE = 1.0  # レートの上限（リクエスト/秒）
+    RATE_LIMIT_BURST = 1  # 連続して送信できる最大数
+    RATE_LIMIT_INCREASE_STEP = 0.05  # 正常な応答ごとに加算するレート
+    RATE_LIMIT_DECREASE_FACTOR = 0.5  # 429/503・応答時間の急増時にレートに掛ける係数
+    RATE_LIMIT_LATENCY_FACTOR = 3.0  # 平均の何倍の応答時間を急増とみなすか
+    RATE_LIMIT_MIN_SLOW_LATENCY = 2.0  # 急増とみなす応答時間の下限（秒）
+    RATE_LIMIT_MAX_RETRY_AFTER = 300  # Retry-Afterで待機する最大秒数
+    # サーキットブレーカー・遅延リトライ設定
+    CIRCUIT_FAILURE_THRESHOLD = 3  # サーキットを開く連続失敗回数（ホスト単位）
+    CIRCUIT_RESET_TIMEOUT = 30  # サーキットを開いてから試行を再開するまでの秒数
+    DEFERRED_RETRY_ENABLED = True  # 一括取得で失敗したURLをジョブの最後にまとめてリトライするか
+    DEFERRED_RETRY_ROUNDS = 2  # 遅延リトライの最大回数
+    # 問い合わせページ巡回設定
+    CRAWL_MAX_PAGES = 3  # 1ドメインあたりの追加取得ページ数の上限
+    CRAWL_MIN_LINK_SCORE = 5  # 巡回対象とするリンクの最低スコア
+    CRAWL_REQUIRED_FIELDS = ("phone", "email", "address")  # すべて埋まったら巡回を打ち切る項目
+    ASYNC_MAX_CONCURRENCY = 100  # 非同期版の最大同時リクエスト数
+    ASYNC_MAX_PER_HOST = 4  # 非同期版のドメインごとの最大同時リクエスト数
     USER_AGENT = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -59,6 +101,41 @@ class Settings:
     EXTRACT_PHONE = True
     EXTRACT_EMAIL = True
     EXTRACT_ADDRESS = True
+    HTML_PARSER_BACKEND = "lxml"  # HTMLパーサーのバックエンド（"lxml"または"beautifulsoup"）
+    MUNICIPALITIES_PATH = DATA_DIR / "municipalities.tsv"  # 住所の検出に使用する市区町村データ
+    POSTAL_INDEX_ENABLED = True  # 郵便番号索引で住所を補完・照合するか（索引ファイルがある場合のみ）
+    POSTAL_INDEX_PATH = DATA_DIR / "postal_index.bin"  # scripts/build_postal_index.pyで作成
+    # 本文の走査に使うパターンパック（PATTERN_PACKS_DIRのファイル名、先に書いたパックのパターンを優先）
+    # 業種別のパック（"medical"など）は、ここに追加するか環境変数PATTERN_PACKS（カンマ区切り）で指定する
+    PATTERN_PACKS = tuple(
+        name.strip()
+        for name in os.getenv("PATTERN_PACKS", "jp_phone,email,jp_address,business_hours").split(",")
+        if name.strip()
+    )
+    # 構造化データ（JSON-LD・microdata・OpenGraph・tel:/mailto:リンク）を本文より優先して使用するか
+    EXTRACTION_USE_STRUCTURED_DATA = True
+    # 電話番号・FAX番号・メールアドレスの正規化と検証を、抽出時に行わず出力の整形時
+    # （output.columnar.build_detail_columns）にバッチ全体でまとめて行うか（CLI/GUIは常に有効）
+    EXTRACTION_BATCH_VALIDATION = False
+    EXTRACTION_PRESET: Optional[str] = None  # 抽出する項目のプリセット名（Noneはすべての項目、CLI/GUIの初期値）
+    # マルチプロセス抽出設定
+    EXTRACTION_USE_PROCESS_POOL = False  # 詳細情報の抽出をプロセスプールで行うか（CLI/GUIの初期値）
+    EXTRACTION_PROCESS_WORKERS: Optional[int] = None  # ワーカープロセス数（NoneはCPUコア数）
+    EXTRACTION_CHUNK_SIZE = 4  # 1回の送信でワーカーに渡すページ数
+    EXTRACTION_MAX_PAGES_PER_WORKER = 200  # プールを作り直すまでの1ワーカーあたりのページ数
+    # 抽出結果キャッシュ設定（HTMLの内容が同じページは解析を省略する）
+    EXTRACTION_CACHE_ENABLED = True
+    EXTRACTION_CACHE_MAX_ENTRIES = 1000  # メモリに保持する件数
+    EXTRACTION_CACHE_PERSIST = os.getenv("EXTRACTION_CACHE_PERSIST", "false").lower() == "true"
+    EXTRACTION_CACHE_PATH = BASE_DIR / "cache" / "extraction_cache.sqlite3"
+    EXTRACTION_CACHE_MAX_DISK_ENTRIES = 100_000  # ファイルに保存する件数
+    # ストリーミング抽出設定（大きなページは本文を保持せず、受信しながら抽出する）
+    STREAMING_EXTRACTION_ENABLED = False  # WebScraperでストリーミング抽出を使うか（CLI/GUI）
+    STREAMING_THRESHOLD_BYTES = 1024 * 1024  # 受信量がこの値を超えたページをストリーミング抽出に切り替える
+    STREAMING_MAX_PAGE_BYTES = 64 * 1024 * 1024  # ストリーミング抽出時の1ページあたりの最大受信バイト数
+    STREAMING_WINDOW_CHARS = 64 * 1024  # 1回に走査するテキストの文字数
+    STREAMING_OVERLAP_CHARS = 1024  # 次の走査に持ち越す文字数（1つの一致の最大長より大きくする）
+    STREAMING_MAX_EXCERPT_CHARS = 256 * 1024  # 一致の前後の抜粋として保持する最大文字数
 
     @classmethod
     def ensure_directories(cls):
@@ -0,0 +1,294 @@
+"""Webページを非同期にスクレイピングするモジュール
+
+このモジュールは、asyncioとaiohttpを使用してWebページを取得する機能を提供します。
+WebScraperと同じPageContent、リトライ方針、robots.txtの扱いを共有し、
+1スレッドで多数のリクエストを同時に処理できます。
+"""
+
+from typing import Optional
+import asyncio
+import time
+import aiohttp
+from urllib.parse import urlparse, urljoin
+
+from config.settings import Settings
+from config.constants import ERROR_MESSAGES
+from core.robots import RobotsCache, get_robots_domain
+from core.encoding import decode_html
+from core.rate_limiter import RateLimiter, get_shared_rate_limiter
+from core.scraper import PageContent, build_request_headers, is_transient_status
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncWebScraper:
+    """Webページを非同期にスクレイピングするクラス
+
+    aiohttpのセッションを使用してページを取得します。
+    同時実行数は全体とドメインごとのセマフォで制限され、
+    アクセス間隔はドメインごとに制御されます。
+
+    Example:
+        async with AsyncWebScraper() as scraper:
+            pages = await scraper.fetch_many(urls)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        robots: Optional[RobotsCache] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        """初期化
+
+        Args:
+            max_concurrency: 全体の最大同時リクエスト数（Noneの場合は設定値）
+            max_per_host: ドメインごとの最大同時リクエスト数（Noneの場合は設定値）
+            robots: robots.txtキャッシュ（Noneの場合は新たに作成。WebScraperと共有可能）
+            rate_limiter: ドメイン単位のレート制限（Noneの場合は共有のRateLimiter）
+        """
+        self.timeout = Settings.REQUEST_TIMEOUT
+        self.max_retries = Settings.MAX_RETRIES
+        self.user_agent = Settings.USER_AGENT
+        self.wait_time = Settings.DEFAULT_WAIT_TIME
+        self.max_concurrency = max_concurrency or Settings.ASYNC_MAX_CONCURRENCY
+        self.max_per_host = max_per_host or Settings.ASYNC_MAX_PER_HOST
+        self.robots = robots or RobotsCache(user_agent=self.user_agent)
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.BoundedSemaphore(self.max_concurrency)
+        self._host_semaphores: dict[str, asyncio.BoundedSemaphore] = {}
+        self._robots_locks: dict[str, asyncio.Lock] = {}
+        logger.info(f"AsyncWebScraper initialized (max_concurrency={self.max_concurrency})")
+
+    async def __aenter__(self) -> "AsyncWebScraper":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """セッションを閉じ、取得したrobots.txtのキャッシュを保存"""
+        self.robots.save()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def fetch_page(self, url: str, respect_robots: bool = True) -> Optional[PageContent]:
+        """ページコンテンツを取得
+
+        Args:
+            url: 取得するページのURL
+            respect_robots: robots.txtを遵守するかどうか（デフォルト: True）
+
+        Returns:
+            ページコンテンツ。取得に失敗した場合はNone
+
+        Raises:
+            ValueError: URLが不正な場合
+            RuntimeError: robots.txtでアクセスが禁止されている場合
+        """
+        if not url or not url.strip():
+            logger.error("URL is empty")
+            raise ValueError(ERROR_MESSAGES["invalid_url"])
+
+        parsed = urlparse(url)
+        if not parsed.scheme or not parsed.netloc:
+            logger.error(f"Invalid URL format: {url}")
+            raise ValueError(ERROR_MESSAGES["invalid_url"])
+
+        if respect_robots and not await self.check_robots_txt(url):
+            logger.warning(f"Access denied by robots.txt: {url}")
+            raise RuntimeError(ERROR_MESSAGES["robots_denied"])
+
+        host_semaphore = self._get_host_semaphore(parsed.netloc.lower())
+
+        # 待機中に同時実行枠を占有しないよう、送信時刻の予約を先に行う
+        await self._wait_for_rate_limit(url)
+
+        async with self._semaphore, host_semaphore:
+            page_content = await self._fetch_content(url)
+
+        if page_content is None:
+            logger.error(f"Failed to fetch page: {url}")
+        return page_content
+
+    async def fetch_many(
+        self,
+        urls: list[str],
+        respect_robots: bool = True
+    ) -> list[Optional[PageContent]]:
+        """複数ページを同時に取得
+
+        Args:
+            urls: 取得するページのURLリスト
+            respect_robots: robots.txtを遵守するかどうか（デフォルト: True）
+
+        Returns:
+            入力と同じ順序のページコンテンツのリスト。失敗した位置にはNone
+        """
+        results = await asyncio.gather(
+            *(self._fetch_page_safely(url, respect_robots) for url in urls)
+        )
+        self.robots.save()
+        return list(results)
+
+    async def check_robots_txt(self, url: str) -> bool:
+        """robots.txtをチェック
+
+        Args:
+            url: チェックするURL
+
+        Returns:
+            アクセスが許可されている場合True
+        """
+        domain = get_robots_domain(url)
+
+        lock = self._robots_locks.setdefault(domain, asyncio.Lock())
+        async with lock:
+            entry = self.robots.lookup(domain)
+
+            if entry is None:
+                robots_url = urljoin(domain, "/robots.txt")
+                logger.debug(f"Loading robots.txt for domain: {domain}")
+
+                try:
+                    session = self._get_session()
+                    timeout = aiohttp.ClientTimeout(total=self.robots.timeout)
+                    async with session.get(robots_url, timeout=timeout) as response:
+                        body = await response.text(errors="replace")
+                        entry = self.robots.store(domain, response.status, body)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.warning(f"Failed to load robots.txt for {domain}: {e}")
+                    entry = self.robots.store_failure(domain)
+
+        # robots.txtが取得できない場合はアクセスを許可
+        if entry.parser is None:
+            return True
+        return entry.parser.can_fetch(self.user_agent, url)
+
+    async def _fetch_page_safely(self, url: str, respect_robots: bool) -> Optional[PageContent]:
+        """例外を送出せずにページを取得（fetch_many用）"""
+        try:
+            return await self.fetch_page(url, respect_robots=respect_robots)
+        except Exception as e:
+            logger.warning(f"Failed to fetch page {url}: {e}")
+            return None
+
+    async def _fetch_content(self, url: str) -> Optional[PageContent]:
+        """ページを取得（リトライ機能付き）
+
+        WebScraper._fetch_contentと同じリトライ方針（is_transient_status）・文字コード判定を使用します。
+        タイムアウト・接続エラー・5xx・429はリトライし、その他の4xxはリトライしません。
+
+        Args:
+            url: 取得するURL
+
+        Returns:
+            ページコンテンツ（ステータスコードとContent-Typeは実際のレスポンスの値）。
+            失敗した場合はNone
+        """
+        session = self._get_session()
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                logger.debug(f"Fetching HTML (attempt {attempt}/{self.max_retries})")
+
+                start_time = time.monotonic()
+                async with session.get(url, allow_redirects=True) as response:
+                    self.rate_limiter.on_response(
+                        url, response.status, response.headers, time.monotonic() - start_time
+                    )
+
+                    if is_transient_status(response.status):
+                        logger.warning(f"Server error {response.status} "
+                                       f"(attempt {attempt}/{self.max_retries}): {url}")
+                        if attempt == self.max_retries:
+                            logger.error(f"Max retries exceeded: {url}")
+                            return None
+                    elif response.status == 200:
+                        content_type = response.headers.get("Content-Type", "")
+                        body = await response.read()
+                        html, detected = decode_html(body, content_type)
+                        return PageContent(
+                            url=url,
+                            html=html,
+                            status_code=response.status,
+                            content_type=content_type,
+                            encoding=detected.encoding,
+                            encoding_source=detected.source,
+                            final_url=str(response.url)
+                        )
+                    elif response.status == 404:
+                        logger.warning(f"Page not found (404): {url}")
+                        return None
+                    elif response.status == 403:
+                        logger.warning(f"Access forbidden (403): {url}")
+                        return None
+                    else:
+                        # その他の4xxはリトライしても結果が変わらない
+                        logger.warning(f"Unexpected status code {response.status}: {url}")
+                        return None
+
+            except asyncio.TimeoutError as e:
+                logger.warning(f"Request timeout (attempt {attempt}/{self.max_retries}): {e}")
+
+                if attempt == self.max_retries:
+                    logger.error(f"Max retries exceeded due to timeout: {url}")
+                    return None
+
+            except aiohttp.ClientError as e:
+                logger.warning(f"Request failed (attempt {attempt}/{self.max_retries}): {e}")
+
+                if attempt == self.max_retries:
+                    logger.error(f"Max retries exceeded: {url}")
+                    return None
+
+            if attempt < self.max_retries:
+                wait_time = self.rate_limiter.retry_delay(url, attempt, self.wait_time)
+                logger.debug(f"Waiting {wait_time} seconds before retry")
+                await asyncio.sleep(wait_time)
+
+        return None
+
+    async def _wait_for_rate_limit(self, url: str) -> None:
+        """レート制限のための待機（ドメイン単位）
+
+        WebScraperと同じRateLimiterで送信時刻を予約し、イベントループを止めずに待機します。
+
+        Args:
+            url: これからアクセスするURL
+        """
+        crawl_delay = self.robots.crawl_delay(url, self.user_agent)
+        wait_duration = self.rate_limiter.reserve(url, self.wait_time, crawl_delay)
+        if wait_duration > 0:
+            logger.debug(f"Rate limiting ({urlparse(url).netloc}): waiting {wait_duration:.2f} seconds")
+            await asyncio.sleep(wait_duration)
+
+        # 待機中にRetry-Afterで送信停止が指定された場合は延長
+        blocked = self.rate_limiter.blocked_for(url)
+        if blocked > 0:
+            await asyncio.sleep(blocked)
+
+    def _get_host_semaphore(self, host: str) -> asyncio.BoundedSemaphore:
+        """ドメインごとのセマフォを取得"""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.BoundedSemaphore(self.max_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """aiohttpセッションを取得（初回呼び出し時に作成）"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=build_request_headers(self.user_agent),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_concurrency,
+                    limit_per_host=self.max_per_host
+                )
+            )
+        return self._session
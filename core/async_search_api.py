@@ -0,0 +1,155 @@
+"""非同期検索API統合モジュール
+
+SearchAPIClientの非同期版。aiohttpでTavily/Google Custom Search APIを呼び出し、
+同じSearchItemを返します。
+"""
+
+from typing import Optional
+import asyncio
+import time
+import aiohttp
+
+from config.settings import Settings
+from config.constants import ERROR_MESSAGES
+from core.search_api import SearchAPIClient
+from core.searcher import SearchItem, SearchOptions
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncSearchAPIClient(SearchAPIClient):
+    """非同期検索APIクライアント（Tavily/Google対応）
+
+    APIキーの検証、リクエストの組み立て、レスポンスの変換は
+    SearchAPIClientと共通です。
+
+    Example:
+        async with AsyncSearchAPIClient() as client:
+            items = await client.search("東京 歯科医院")
+    """
+
+    def __init__(self, provider: Optional[str] = None, max_concurrency: Optional[int] = None):
+        """初期化
+
+        Args:
+            provider: 使用するAPI（"tavily" or "google"）。Noneの場合は設定ファイルから取得
+            max_concurrency: 最大同時リクエスト数（Noneの場合は設定値）
+        """
+        super().__init__(provider)
+        self.max_concurrency = max_concurrency or Settings.ASYNC_MAX_PER_HOST
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.BoundedSemaphore(self.max_concurrency)
+
+    async def __aenter__(self) -> "AsyncSearchAPIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """セッションを閉じる"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def search(self, keyword: str, options: Optional[SearchOptions] = None) -> list[SearchItem]:
+        """検索を実行
+
+        Args:
+            keyword: 検索キーワード
+            options: 検索オプション
+
+        Returns:
+            検索結果のリスト
+
+        Raises:
+            ValueError: キーワードが空の場合
+            RuntimeError: API呼び出しに失敗した場合
+        """
+        if not keyword or not keyword.strip():
+            logger.error("Search keyword is empty")
+            raise ValueError(ERROR_MESSAGES["empty_keyword"])
+
+        if options is None:
+            options = SearchOptions()
+
+        logger.info(f"Starting async {self.provider} search for keyword: {keyword}")
+
+        async with self._semaphore:
+            if self.provider == "tavily":
+                return await self._search_tavily_async(keyword, options)
+            return await self._search_google_async(keyword, options)
+
+    async def _search_tavily_async(self, keyword: str, options: SearchOptions) -> list[SearchItem]:
+        """Tavily APIで検索
+
+        Args:
+            keyword: 検索キーワード
+            options: 検索オプション
+
+        Returns:
+            検索結果のリスト
+        """
+        payload = self._build_tavily_payload(keyword, options)
+
+        try:
+            logger.debug(f"Calling Tavily API: {self.TAVILY_API_URL}")
+            await self._wait_for_rate_limit(self.TAVILY_API_URL)
+            start_time = time.monotonic()
+            async with self._get_session().post(self.TAVILY_API_URL, json=payload) as response:
+                self.rate_limiter.on_response(
+                    self.TAVILY_API_URL, response.status, response.headers, time.monotonic() - start_time
+                )
+                response.raise_for_status()
+                data = await response.json()
+
+            return self._parse_tavily_response(data)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Tavily API request failed: {e}", exc_info=True)
+            raise RuntimeError(f"Tavily API呼び出しに失敗しました: {e}")
+
+    async def _search_google_async(self, keyword: str, options: SearchOptions) -> list[SearchItem]:
+        """Google Custom Search APIで検索
+
+        Args:
+            keyword: 検索キーワード
+            options: 検索オプション
+
+        Returns:
+            検索結果のリスト
+        """
+        params = self._build_google_params(keyword, options)
+
+        try:
+            logger.debug(f"Calling Google Custom Search API: {self.GOOGLE_API_URL}")
+            await self._wait_for_rate_limit(self.GOOGLE_API_URL)
+            start_time = time.monotonic()
+            async with self._get_session().get(self.GOOGLE_API_URL, params=params) as response:
+                self.rate_limiter.on_response(
+                    self.GOOGLE_API_URL, response.status, response.headers, time.monotonic() - start_time
+                )
+                response.raise_for_status()
+                data = await response.json()
+
+            return self._parse_google_response(data)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Google API request failed: {e}", exc_info=True)
+            raise RuntimeError(f"Google API呼び出しに失敗しました: {e}")
+
+    async def _wait_for_rate_limit(self, url: str) -> None:
+        """レート制限のための待機（SearchAPIClientと同じRateLimiterを使用）"""
+        wait_duration = max(self.rate_limiter.reserve(url, self.API_INTERVAL), self.rate_limiter.blocked_for(url))
+        if wait_duration > 0:
+            logger.debug(f"Rate limiting API call: waiting {wait_duration:.2f} seconds")
+            await asyncio.sleep(wait_duration)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """aiohttpセッションを取得（初回呼び出し時に作成）"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.API_TIMEOUT)
+            )
+        return self._session
@@ -0,0 +1,159 @@
+"""ホスト単位のサーキットブレーカーモジュール
+
+このモジュールは、応答しないホストへのリクエストを早期に打ち切るための
+CircuitBreakerを提供します。
+
+- 連続してfailure_threshold回失敗したホストは「開」状態になり、
+  reset_timeout秒の間はリクエストを送らずに即座に失敗します。
+- reset_timeout秒が経過すると「半開」状態になり、1件だけ試行を許可します。
+  成功すれば「閉」状態に戻り、失敗すれば再び「開」状態になります。
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlparse
+import threading
+import time
+
+from config.settings import Settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """サーキットブレーカーが開いているためリクエストを送らなかった場合の例外"""
+
+    def __init__(self, host: str):
+        super().__init__(f"Circuit open for host: {host}")
+        self.host = host
+
+
+@dataclass
+class HostCircuit:
+    """ホストごとのサーキットの状態"""
+    state: str = STATE_CLOSED
+    failures: int = 0  # 連続した失敗回数
+    opened_at: float = 0.0
+
+
+@dataclass
+class BreakerTrip:
+    """サーキットが開いた記録"""
+    host: str
+    tripped_at: float
+    failures: int
+
+
+class CircuitBreaker:
+    """ホスト単位のサーキットブレーカー
+
+    複数スレッドから利用できます。
+    """
+
+    def __init__(self, failure_threshold: Optional[int] = None, reset_timeout: Optional[float] = None):
+        """初期化
+
+        Args:
+            failure_threshold: サーキットを開く連続失敗回数（Noneの場合は設定値）
+            reset_timeout: 開いてから試行を再開するまでの秒数（Noneの場合は設定値）
+        """
+        self.failure_threshold = failure_threshold or Settings.CIRCUIT_FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout if reset_timeout is not None else Settings.CIRCUIT_RESET_TIMEOUT
+        self.circuits: dict[str, HostCircuit] = {}
+        self.trips: list[BreakerTrip] = []
+        self._lock = threading.Lock()
+
+    def allow(self, url: str) -> bool:
+        """リクエストを送ってよいかを判定
+
+        開いているサーキットでreset_timeoutが経過している場合は半開状態にして、
+        この呼び出しだけ試行を許可します。
+
+        Args:
+            url: これからアクセスするURL
+
+        Returns:
+            リクエストを送ってよい場合True
+        """
+        host = self._get_host(url)
+
+        with self._lock:
+            circuit = self.circuits.get(host)
+            if circuit is None or circuit.state == STATE_CLOSED:
+                return True
+
+            if circuit.state == STATE_OPEN and time.time() - circuit.opened_at >= self.reset_timeout:
+                circuit.state = STATE_HALF_OPEN
+                logger.info(f"Circuit half-open, probing host: {host}")
+                return True
+
+            # 開いている、または半開で試行中
+            return False
+
+    def record_success(self, url: str) -> None:
+        """成功を記録（サーキットを閉じる）
+
+        Args:
+            url: アクセスしたURL
+        """
+        host = self._get_host(url)
+
+        with self._lock:
+            circuit = self.circuits.get(host)
+            if circuit is None:
+                return
+            if circuit.state != STATE_CLOSED:
+                logger.info(f"Circuit closed for host: {host}")
+            circuit.state = STATE_CLOSED
+            circuit.failures = 0
+
+    def record_failure(self, url: str) -> bool:
+        """失敗を記録
+
+        Args:
+            url: アクセスしたURL
+
+        Returns:
+            サーキットが開いている場合True
+        """
+        host = self._get_host(url)
+
+        with self._lock:
+            circuit = self.circuits.setdefault(host, HostCircuit())
+            circuit.failures += 1
+
+            if circuit.state == STATE_HALF_OPEN or (
+                circuit.state == STATE_CLOSED and circuit.failures >= self.failure_threshold
+            ):
+                circuit.state = STATE_OPEN
+                circuit.opened_at = time.time()
+                self.trips.append(BreakerTrip(host=host, tripped_at=circuit.opened_at, failures=circuit.failures))
+                logger.warning(f"Circuit opened for host {host} after {circuit.failures} consecutive failures")
+
+            return circuit.state == STATE_OPEN
+
+    def get_state(self, url: str) -> str:
+        """ホストのサーキットの状態を取得"""
+        circuit = self.circuits.get(self._get_host(url))
+        return circuit.state if circuit else STATE_CLOSED
+
+    def time_until_probe(self, url: str) -> float:
+        """半開状態（試行の再開）になるまでの秒数（開いていない場合は0）"""
+        circuit = self.circuits.get(self._get_host(url))
+        if circuit is None or circuit.state != STATE_OPEN:
+            return 0.0
+        return max(0.0, circuit.opened_at + self.reset_timeout - time.time())
+
+    def reset(self) -> None:
+        """すべてのホストの状態と記録をクリア"""
+        with self._lock:
+            self.circuits.clear()
+            self.trips.clear()
+
+    def _get_host(self, url: str) -> str:
+        return urlparse(url).netloc.lower()
@@ -0,0 +1,287 @@
+"""問い合わせページを巡回して詳細情報を補完するモジュール
+
+このモジュールは、検索結果のページから同一サイト内の会社概要・アクセス・
+お問い合わせなどのページへのリンクを探し、上位の数ページだけを取得して
+詳細情報を補完する機能を提供します。
+必要な項目がすべて埋まった時点で巡回を打ち切ります。
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+from urllib.parse import urljoin, urlparse, urldefrag
+
+from config.settings import Settings
+from config.constants import CRAWL_ANCHOR_KEYWORDS, CRAWL_PATH_KEYWORDS, CRAWL_SKIP_EXTENSIONS
+from core.document import HtmlSource, as_document
+from core.scraper import WebScraper, PageContent
+from core.extraction_plan import ExtractionPlan
+from core.extractor import InfoExtractor, DetailedInfo
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CrawlLink:
+    """巡回候補のリンク"""
+    url: str
+    score: int
+    anchor_text: str
+
+
+@dataclass
+class CrawlResult:
+    """1サイトの巡回結果"""
+    detail: DetailedInfo
+    fetched_urls: list[str] = field(default_factory=list)
+    complete: bool = False  # 必要な項目がすべて埋まった場合True
+
+
+class ContactPageCrawler:
+    """問い合わせページを巡回するクラス
+
+    検索結果のページ内リンクをアンカーテキストとパスでスコア付けし、
+    スコアの高い順に最大max_pagesページを取得して詳細情報を統合します。
+    サイト内の取得は順番に行い（アクセス間隔はWebScraperがドメイン単位で制御）、
+    複数サイトの巡回は並列に実行します。
+    """
+
+    def __init__(
+        self,
+        scraper: Optional[WebScraper] = None,
+        extractor: Optional[InfoExtractor] = None,
+        max_pages: Optional[int] = None,
+        required_fields: Optional[tuple[str, ...]] = None,
+        min_score: Optional[int] = None
+    ):
+        """初期化
+
+        Args:
+            scraper: ページの取得に使用するWebScraper（Noneの場合は新規作成）
+            extractor: 情報の抽出に使用するInfoExtractor（Noneの場合は新規作成）
+            max_pages: 1ドメインあたりの追加取得ページ数の上限（Noneの場合は設定値）
+            required_fields: すべて埋まったら巡回を打ち切る項目（Noneの場合は設定値）
+            min_score: 巡回対象とするリンクの最低スコア（Noneの場合は設定値）
+        """
+        self.scraper = scraper or WebScraper()
+        self.extractor = extractor or InfoExtractor()
+        self.max_pages = max_pages if max_pages is not None else Settings.CRAWL_MAX_PAGES
+        self.required_fields = tuple(required_fields or Settings.CRAWL_REQUIRED_FIELDS)
+        self.min_score = min_score if min_score is not None else Settings.CRAWL_MIN_LINK_SCORE
+        logger.info(f"ContactPageCrawler initialized (max_pages={self.max_pages}, "
+                    f"required_fields={self.required_fields})")
+
+    def find_links(self, page_url: str, html: HtmlSource) -> list[CrawlLink]:
+        """巡回候補のリンクをスコアの高い順に取得
+
+        同一サイト内のリンクのみを対象とし、スコアが最低スコア未満のものは除外します。
+
+        Args:
+            page_url: HTMLを取得したページのURL（リダイレクトされた場合はリダイレクト後のURL）
+            html: ページのHTMLまたは解析済みドキュメント
+
+        Returns:
+            巡回候補のリンクのリスト（スコアの降順）
+        """
+        document = as_document(html, self.extractor.parser_backend)
+        if document is None:
+            return []
+
+        site = self._get_site(page_url)
+        current_url = self._normalize_url(page_url)
+        # <base href>があれば、相対URLはその値（ページのURLからの相対）を基準に解決する
+        base_url = urljoin(page_url, document.base_href) if document.base_href else page_url
+
+        links: dict[str, CrawlLink] = {}
+        # tel:・mailto:・javascript:などを除いた、ページへのリンクのみを対象とする
+        for link in document.anchors.pages:
+            url = self._normalize_url(urljoin(base_url, link.href))
+            parsed = urlparse(url)
+
+            if parsed.scheme not in ("http", "https") or url == current_url:
+                continue
+            if self._get_site(url) != site:
+                continue
+            if parsed.path.lower().endswith(CRAWL_SKIP_EXTENSIONS):
+                continue
+
+            anchor_text = link.text
+            score = self.score_link(url, anchor_text)
+            if score < self.min_score:
+                continue
+
+            # 同じURLへの複数のリンクは最もスコアの高いものを採用
+            if url not in links or links[url].score < score:
+                links[url] = CrawlLink(url=url, score=score, anchor_text=anchor_text)
+
+        return sorted(links.values(), key=lambda link: link.score, reverse=True)
+
+    def score_link(self, url: str, anchor_text: str) -> int:
+        """リンクのスコアを計算
+
+        アンカーテキストとパスそれぞれで一致したキーワードの最大スコアを合計します。
+
+        Args:
+            url: リンク先のURL
+            anchor_text: アンカーテキスト
+
+        Returns:
+            スコア
+        """
+        text = anchor_text.lower()
+        path = urlparse(url).path.lower()
+
+        anchor_score = max(
+            (score for keyword, score in CRAWL_ANCHOR_KEYWORDS.items() if keyword in text),
+            default=0
+        )
+        path_score = max(
+            (score for keyword, score in CRAWL_PATH_KEYWORDS.items() if keyword in path),
+            default=0
+        )
+        return anchor_score + path_score
+
+    def is_complete(self, detail: DetailedInfo, required_fields: Optional[tuple[str, ...]] = None) -> bool:
+        """必要な項目がすべて埋まっているか
+
+        Args:
+            detail: 詳細情報
+            required_fields: 必要な項目（Noneの場合は初期化時の項目）
+
+        Returns:
+            すべて埋まっている場合True
+        """
+        for field_name in required_fields or self.required_fields:
+            value = getattr(detail, field_name, None)
+            if field_name == "address":
+                # 郵便番号か番地までの住所があれば埋まっているとみなす
+                if not value or not (value.get("postal_code") or value.get("address")):
+                    return False
+            elif not value:
+                return False
+        return True
+
+    def crawl(
+        self,
+        page: PageContent,
+        detail: DetailedInfo,
+        respect_robots: bool = True,
+        plan: Optional[ExtractionPlan] = None
+    ) -> CrawlResult:
+        """1サイトを巡回して詳細情報を補完
+
+        Args:
+            page: 検索結果のページ
+            detail: 検索結果のページから抽出した詳細情報
+            respect_robots: robots.txtを遵守するかどうか（デフォルト: True）
+            plan: 抽出する項目の計画（Noneの場合はInfoExtractorの計画）。
+                必要な項目は計画にある項目に限定します
+
+        Returns:
+            巡回結果
+        """
+        required_fields = plan.required_fields(self.required_fields) if plan else self.required_fields
+        result = CrawlResult(detail=detail, complete=self.is_complete(detail, required_fields))
+        if result.complete or self.max_pages <= 0:
+            return result
+
+        links = self.find_links(page.base_url, page.document if page.streamed else page.html)[:self.max_pages]
+        logger.debug(f"Crawl candidates for {page.url}: {[link.url for link in links]}")
+
+        for link in links:
+            try:
+                linked_page = self.scraper.fetch_page(link.url, respect_robots=respect_robots)
+            except (ValueError, RuntimeError) as e:
+                logger.debug(f"Skipped crawl link {link.url}: {e}")
+                continue
+
+            result.fetched_urls.append(link.url)
+            if not linked_page or not linked_page.has_content:
+                continue
+
+            try:
+                if linked_page.streamed:
+                    linked_detail = linked_page.detail
+                else:
+                    linked_detail = self.extractor.extract_all(linked_page.html, plan)
+                result.detail = result.detail.merge(linked_detail)
+            except Exception as e:
+                logger.warning(f"Failed to extract details from {link.url}: {e}")
+                continue
+
+            if self.is_complete(result.detail, required_fields):
+                result.complete = True
+                break
+
+        logger.info(f"Crawled {len(result.fetched_urls)} pages for {page.url} (complete: {result.complete})")
+        return result
+
+    def crawl_many(
+        self,
+        pages: list[Optional[PageContent]],
+        details: list[Optional[DetailedInfo]],
+        max_workers: Optional[int] = None,
+        respect_robots: bool = True,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        plan: Optional[ExtractionPlan] = None
+    ) -> list[Optional[DetailedInfo]]:
+        """複数サイトを並列に巡回して詳細情報を補完
+
+        ページまたは詳細情報がNoneの位置は巡回せず、そのまま返します。
+
+        Args:
+            pages: 検索結果のページのリスト
+            details: 各ページから抽出した詳細情報のリスト
+            max_workers: 並列数（Noneの場合はWebScraperの設定値）
+            respect_robots: robots.txtを遵守するかどうか（デフォルト: True）
+            progress_callback: 1サイト完了するごとに呼ばれるコールバック
+                （完了件数, 全件数, URL）
+            plan: 抽出する項目の計画（Noneの場合はInfoExtractorの計画）
+
+        Returns:
+            入力と同じ順序の補完済み詳細情報のリスト
+        """
+        results = list(details)
+        targets = [
+            index for index, (page, detail) in enumerate(zip(pages, details))
+            if page is not None and page.has_content and detail is not None
+        ]
+        if not targets:
+            return results
+
+        workers = max(1, min(max_workers or self.scraper.max_workers, len(targets)))
+        logger.info(f"Crawling {len(targets)} sites with {workers} workers")
+
+        completed = 0
+        fetched = 0
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawler") as executor:
+            futures = {
+                executor.submit(self.crawl, pages[index], details[index], respect_robots, plan): index
+                for index in targets
+            }
+
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    crawl_result = future.result()
+                    results[index] = crawl_result.detail
+                    fetched += len(crawl_result.fetched_urls)
+                except Exception as e:
+                    logger.warning(f"Failed to crawl {pages[index].url}: {e}")
+                completed += 1
+
+                if progress_callback:
+                    progress_callback(completed, len(targets), pages[index].url)
+
+        logger.info(f"Crawl completed: {fetched} extra pages fetched for {len(targets)} sites")
+        return results
+
+    def _get_site(self, url: str) -> str:
+        """サイトの識別子（www.を除いたホスト名）"""
+        host = (urlparse(url).hostname or "").lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def _normalize_url(self, url: str) -> str:
+        """フラグメントを除去したURL"""
+        return urldefrag(url)[0]
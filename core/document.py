@@ -0,0 +1,145 @@
+"""解析済みHTMLドキュメントモジュール
+
+このモジュールは、1ページのHTMLを一度だけ解析して、抽出処理で共通に使う
+解析ツリー・テキスト（とその正規化）・リンク（とその索引）・head内のメタデータをまとめた
+ParsedDocumentを提供します。
+InfoExtractorの各抽出メソッドとContactPageCrawlerは、HTML文字列の代わりに
+ParsedDocumentを受け取ることで、同じページを何度も解析せずに済みます。
+解析にはcore.html_backendのバックエンドを使用します。
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional, Union
+import re
+
+if TYPE_CHECKING:
+    from core.html_backend import HtmlBackend
+    from core.link_index import AnchorIndex
+    from core.text_normalizer import NormalizedText
+
+# 連続する空白を1つにまとめるパターン
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# リンクの位置（DocumentLink.region）
+REGION_HEADER = "header"  # header要素・role="banner"・id/classが"header"の要素の中
+REGION_FOOTER = "footer"  # footer要素・role="contentinfo"・id/classが"footer"の要素の中
+REGION_MAIN = "main"  # それ以外
+
+
+def normalize_whitespace(text: str) -> str:
+    """連続する空白を1つにまとめ、前後の空白を除去"""
+    return _WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+@dataclass
+class DocumentLink:
+    """ページ内のリンク"""
+    href: str  # href属性の値（前後の空白を除去済み、相対URLのまま）
+    text: str  # アンカーテキスト（画像リンクの場合はalt、title属性を含む）
+    rel: str = ""  # rel属性の値（小文字、空白区切り）
+    region: str = REGION_MAIN  # 最も近いヘッダー・フッターの祖先要素による位置
+
+
+@dataclass
+class MicrodataProperty:
+    """microdata（itemprop属性）のプロパティ"""
+    item_type: str  # 所属するアイテムの型名（itemtypeの末尾、例: "LocalBusiness"。型がない場合は空文字列）
+    name: str  # プロパティ名
+    value: str  # content/href/src/datetime属性の値、なければテキスト
+
+
+@dataclass
+class ParsedDocument:
+    """1ページ分の解析済みHTML
+
+    treeはscript/style/svg/noscript/templateタグの中身を削除した後の解析ツリーで、
+    型はバックエンドによって異なります（BeautifulSoupまたはlxmlの要素）。
+    JSON-LDはscriptタグを削除する前に取り出してjson_ldに保持します。
+    ストリーミング抽出で作成した場合（streamed=True）、treeはNoneです。
+    microdataは、値がアイテムのプロパティ（itemscope属性を持つ要素）を除いて平坦化します。
+    """
+    html: str
+    backend: str = ""  # 解析に使用したバックエンド名
+    tree: Any = field(default=None, repr=False, compare=False)
+    text: str = ""  # タグを除去し、連続する空白をまとめたテキスト
+    links: list[DocumentLink] = field(default_factory=list)
+    title: Optional[str] = None  # titleタグの文字列（子要素を含む場合はNone）
+    meta: dict[str, str] = field(default_factory=dict)  # metaタグのname/property → content
+    base_href: Optional[str] = None  # 最初のbaseタグのhref属性（相対URLの解決に使用）
+    json_ld: list[str] = field(default_factory=list)  # JSON-LDのscriptタグの内容
+    h1: Optional[str] = None  # 最初のh1タグのテキスト
+    microdata: list[MicrodataProperty] = field(default_factory=list)  # 文書順のitemprop属性
+    # 受信しながら解析したドキュメント（core.stream_extractor）の場合True。
+    # htmlとtextはページ全体ではなく、抽出に必要な抜粋のみを持つ
+    streamed: bool = False
+    # PatternScannerごとのテキストの走査結果（InfoExtractorが設定）
+    scans: dict = field(default_factory=dict, repr=False, compare=False)
+    # リンクの索引（anchorsの最初の参照時に作成）
+    anchor_index: Any = field(default=None, repr=False, compare=False)
+    # 正規化したテキスト（normalizedの最初の参照時に作成）
+    normalized_text: Any = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_html(cls, html: str, backend: Optional["HtmlBackend"] = None) -> "ParsedDocument":
+        """HTMLを解析してParsedDocumentを作成
+
+        Args:
+            html: 解析対象のHTML文字列
+            backend: 使用するバックエンド（Noneの場合は設定値のバックエンド）
+
+        Returns:
+            解析済みのドキュメント。解析に失敗した場合は、テキストにHTMLをそのまま持つ
+        """
+        from core.html_backend import get_parser_backend
+
+        return (backend or get_parser_backend()).parse_document(html)
+
+    @property
+    def anchors(self) -> "AnchorIndex":
+        """リンクを種類（tel:・mailto:・SNS・ページ）ごとにまとめた索引
+
+        最初の参照時にlinksから作成し、以降は同じ索引を返します。
+        """
+        if self.anchor_index is None:
+            from core.link_index import AnchorIndex
+
+            self.anchor_index = AnchorIndex.build(self.links)
+        return self.anchor_index
+
+    @property
+    def normalized(self) -> "NormalizedText":
+        """textを正規化（NFKC・数字の間のハイフンの統一）したテキストと、元のtextとの位置の対応
+
+        正規表現による抽出はこのテキストに対して行います。最初の参照時に作成し、
+        以降は同じ結果を返します。
+        """
+        if self.normalized_text is None:
+            from core.text_normalizer import normalize_text
+
+            self.normalized_text = normalize_text(self.text)
+        return self.normalized_text
+
+
+# HTML文字列と解析済みドキュメントのどちらも受け付ける引数の型
+HtmlSource = Union[str, ParsedDocument]
+
+
+def as_document(
+    source: Optional[HtmlSource],
+    backend: Optional["HtmlBackend"] = None
+) -> Optional[ParsedDocument]:
+    """HTML文字列または解析済みドキュメントをParsedDocumentに変換
+
+    Args:
+        source: HTML文字列または解析済みドキュメント
+        backend: HTML文字列の解析に使用するバックエンド（Noneの場合は設定値のバックエンド）
+
+    Returns:
+        解析済みのドキュメント。HTMLが空の場合はNone（ストリーミング抽出のドキュメントはそのまま返す）
+    """
+    if isinstance(source, ParsedDocument):
+        return source if source.html or source.streamed else None
+    if not source:
+        return None
+    return ParsedDocument.from_html(source, backend)
+
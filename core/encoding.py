@@ -0,0 +1,208 @@
+"""HTMLの文字コードを判定するモジュール
+
+このモジュールは、受信したバイト列から文字コードを判定してデコードする機能を提供します。
+判定は次の順に行い、最初に確定したものを採用します。
+
+1. BOM（バイト順マーク）
+2. HTTPヘッダー（Content-Typeのcharset）
+3. HTML先頭部分の<meta charset>・<meta http-equiv>・XML宣言
+4. 最初の非ASCII部分から切り出した一定サイズのサンプルによる推定
+
+日本語サイトで多いShift_JIS/EUC-JPは、統計的な推定より先に
+厳密デコードの成否で判定するため、高速かつ文字化けしにくくなります。
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+import codecs
+import re
+import charset_normalizer
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# <meta>を探す範囲（バイト）
+META_SNIFF_BYTES = 4096
+
+# 推定に使用するサンプルの最大サイズ（バイト）
+DETECT_SAMPLE_BYTES = 32 * 1024
+
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# 別名を、デコードに使う実際のコーデック名にそろえる
+# Shift_JISはWindowsの拡張文字（①や髙など）を含むcp932として扱う
+ENCODING_ALIASES = {
+    "shift_jis": "cp932",
+    "shift-jis": "cp932",
+    "sjis": "cp932",
+    "x-sjis": "cp932",
+    "ms_kanji": "cp932",
+    "windows-31j": "cp932",
+    "csshiftjis": "cp932",
+    "x-euc-jp": "euc_jp",
+    "euc-jp": "euc_jp",
+    "utf8": "utf-8",
+    "us-ascii": "utf-8",
+    "ascii": "utf-8",
+}
+
+HEADER_CHARSET_PATTERN = re.compile(r"charset\s*=\s*[\"']?\s*([\w\-:.]+)", re.IGNORECASE)
+META_CHARSET_PATTERN = re.compile(
+    rb"""<meta[^>]+?charset\s*=\s*["']?\s*([\w\-:.]+)""", re.IGNORECASE
+)
+XML_DECLARATION_PATTERN = re.compile(rb"""^\s*<\?xml[^>]+encoding\s*=\s*["']([\w\-:.]+)""", re.IGNORECASE)
+NON_ASCII_PATTERN = re.compile(rb"[\x80-\xff]")
+KANA_PATTERN = re.compile(r"[぀-ヿ]")
+
+# 厳密デコードで判定する候補（順に試行）
+JAPANESE_CANDIDATES = ("utf-8", "cp932", "euc_jp")
+
+
+@dataclass
+class EncodingResult:
+    """文字コードの判定結果"""
+    encoding: str  # デコードに使うコーデック名
+    source: str  # 判定根拠（"bom", "header", "meta", "detector", "default"）
+
+
+def normalize_encoding(name: Optional[str]) -> Optional[str]:
+    """文字コード名を正規化
+
+    Pythonで扱えない名前の場合はNoneを返します。
+
+    Args:
+        name: 文字コード名
+
+    Returns:
+        正規化されたコーデック名
+    """
+    if not name:
+        return None
+
+    key = name.strip().strip("\"'").lower()
+    key = ENCODING_ALIASES.get(key, key)
+
+    try:
+        codecs.lookup(key)
+    except LookupError:
+        return None
+    return key
+
+
+def detect_encoding(body: bytes, content_type: Optional[str] = None) -> EncodingResult:
+    """バイト列の文字コードを判定
+
+    Args:
+        body: HTMLのバイト列
+        content_type: Content-Typeヘッダーの値
+
+    Returns:
+        判定結果
+    """
+    # 1. BOM
+    for bom, encoding in BOMS:
+        if body.startswith(bom):
+            return EncodingResult(encoding, "bom")
+
+    # 2. HTTPヘッダー
+    if content_type:
+        match = HEADER_CHARSET_PATTERN.search(content_type)
+        encoding = normalize_encoding(match.group(1)) if match else None
+        if encoding:
+            return EncodingResult(encoding, "header")
+
+    # 3. <meta charset> / XML宣言
+    head = body[:META_SNIFF_BYTES]
+    for pattern in (META_CHARSET_PATTERN, XML_DECLARATION_PATTERN):
+        match = pattern.search(head)
+        if match:
+            encoding = normalize_encoding(match.group(1).decode("ascii", errors="ignore"))
+            if encoding:
+                return EncodingResult(encoding, "meta")
+
+    # 4. サンプルによる推定
+    return EncodingResult(_detect_from_sample(body), "detector")
+
+
+def decode_html(body: bytes, content_type: Optional[str] = None) -> tuple[str, EncodingResult]:
+    """バイト列の文字コードを判定してデコード
+
+    Args:
+        body: HTMLのバイト列
+        content_type: Content-Typeヘッダーの値
+
+    Returns:
+        (デコードした文字列, 判定結果)
+    """
+    result = detect_encoding(body, content_type)
+
+    try:
+        return body.decode(result.encoding, errors="replace"), result
+    except LookupError:
+        logger.warning(f"Unknown encoding '{result.encoding}', falling back to utf-8")
+        return body.decode("utf-8", errors="replace"), EncodingResult("utf-8", "default")
+
+
+def _detect_from_sample(body: bytes) -> str:
+    """最初の非ASCII部分から切り出したサンプルで文字コードを推定
+
+    Args:
+        body: HTMLのバイト列
+
+    Returns:
+        コーデック名
+    """
+    match = NON_ASCII_PATTERN.search(body)
+    if match is None:
+        # ASCIIのみの場合はUTF-8として扱う（ASCIIの上位互換）
+        return "utf-8"
+
+    # 非ASCII文字の直前から切り出すので、サンプルの先頭は必ず文字の境界になる
+    sample = body[match.start():match.start() + DETECT_SAMPLE_BYTES]
+
+    decodable = [
+        encoding for encoding in JAPANESE_CANDIDATES
+        if _decodes_strictly(sample, encoding)
+    ]
+
+    if decodable and decodable[0] == "utf-8":
+        # UTF-8として正しく読めるバイト列が偶然現れることはまずない
+        return "utf-8"
+
+    if len(decodable) == 1:
+        return decodable[0]
+
+    if len(decodable) > 1:
+        # cp932とEUC-JPの両方で読める場合は、かなの割合が多い方を採用
+        return max(decodable, key=lambda encoding: _kana_ratio(sample, encoding))
+
+    detected = charset_normalizer.from_bytes(sample).best()
+    if detected is not None:
+        encoding = normalize_encoding(detected.encoding)
+        if encoding:
+            return encoding
+
+    return "utf-8"
+
+
+def _decodes_strictly(sample: bytes, encoding: str) -> bool:
+    """サンプルを厳密にデコードできるか（末尾の切れた文字は許容）"""
+    decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+    try:
+        decoder.decode(sample, final=False)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _kana_ratio(sample: bytes, encoding: str) -> float:
+    """デコード結果に占めるひらがな・カタカナの割合"""
+    text = codecs.getincrementaldecoder(encoding)(errors="ignore").decode(sample, final=False)
+    if not text:
+        return 0.0
+    return len(KANA_PATTERN.findall(text)) / len(text)
@@ -0,0 +1,240 @@
+"""抽出結果キャッシュモジュール
+
+このモジュールは、InfoExtractor.extract_allの結果を、HTMLの内容のハッシュで
+キャッシュする機能を提供します。ミラーサイトやAMP版、前回の実行から変更のない
+ページは、HTMLを解析せずに前回の抽出結果を返します。
+
+- キーは、空白を正規化したHTMLのハッシュと、抽出器のフィンガープリント
+  （パターンとコードのバージョン）の組です。パターンを変更すると、以前のエントリは
+  参照されなくなります（LRUで順次削除されます）。
+- メモリ上のLRUと、オプションでSQLiteファイルの2段構成です。
+- 値はDetailedInfoのフィールドの辞書をJSON文字列で保持し、取得のたびに新しい辞書を返します。
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from config.settings import Settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def content_hash(html: str) -> str:
+    """空白を正規化したHTMLのハッシュを計算
+
+    連続する空白（改行・インデントを含む）を1つの空白にまとめてから
+    ハッシュを計算するため、整形だけが異なるページは同じ値になります。
+
+    Args:
+        html: HTML文字列
+
+    Returns:
+        16進数のハッシュ文字列
+    """
+    normalized = " ".join(html.split())
+    return hashlib.blake2b(normalized.encode("utf-8", errors="replace"), digest_size=16).hexdigest()
+
+
+@dataclass
+class ExtractionCacheStats:
+    """抽出結果キャッシュの利用統計"""
+    memory_hits: int = 0  # メモリのエントリを返した回数
+    disk_hits: int = 0  # ファイルのエントリを返した回数
+    misses: int = 0  # キャッシュになかった回数
+    stores: int = 0  # 保存した回数
+    evictions: int = 0  # LRUで削除した回数
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """解析を省略できた割合（0.0〜1.0）"""
+        return (self.memory_hits + self.disk_hits) / self.lookups if self.lookups else 0.0
+
+    def report(self) -> str:
+        """ログ・画面出力用のレポート文字列"""
+        return (f"memory_hits={self.memory_hits}, disk_hits={self.disk_hits}, misses={self.misses}, "
+                f"hit_rate={self.hit_rate:.1%}, stores={self.stores}, evictions={self.evictions}")
+
+
+class ExtractionCache:
+    """抽出結果のキャッシュ
+
+    複数スレッドから利用できるよう、内部でロックを使用します。
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        persist: Optional[bool] = None,
+        path: Optional[Path] = None,
+        max_disk_entries: Optional[int] = None
+    ):
+        """初期化
+
+        Args:
+            max_entries: メモリに保持する最大件数（Noneの場合は設定値、0の場合はメモリに保持しない）
+            persist: ファイルにも保存するか（Noneの場合は設定値）
+            path: キャッシュファイルのパス（Noneの場合は設定値）
+            max_disk_entries: ファイルに保存する最大件数（Noneの場合は設定値）
+        """
+        self.max_entries = max_entries if max_entries is not None else Settings.EXTRACTION_CACHE_MAX_ENTRIES
+        self.max_disk_entries = (max_disk_entries if max_disk_entries is not None
+                                 else Settings.EXTRACTION_CACHE_MAX_DISK_ENTRIES)
+        self.stats = ExtractionCacheStats()
+        self._memory: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if persist if persist is not None else Settings.EXTRACTION_CACHE_PERSIST:
+            self.path = Path(path or Settings.EXTRACTION_CACHE_PATH)
+            self._open(self.path)
+
+    @property
+    def persistent(self) -> bool:
+        """ファイルにも保存しているかどうか"""
+        return self._conn is not None
+
+    def get(self, fingerprint: str, key: str) -> Optional[dict]:
+        """抽出結果を取得
+
+        Args:
+            fingerprint: 抽出器のフィンガープリント
+            key: HTMLのハッシュ（content_hashの値）
+
+        Returns:
+            DetailedInfoのフィールドの辞書。存在しない場合はNone
+        """
+        memory_key = (fingerprint, key)
+
+        with self._lock:
+            data = self._memory.get(memory_key)
+            if data is not None:
+                self._memory.move_to_end(memory_key)
+                self.stats.memory_hits += 1
+                return json.loads(data)
+
+            data = self._get_disk(fingerprint, key)
+            if data is None:
+                self.stats.misses += 1
+                return None
+
+            # ファイルから取得したエントリはメモリにも載せる
+            self._put_memory(memory_key, data)
+            self.stats.disk_hits += 1
+            return json.loads(data)
+
+    def put(self, fingerprint: str, key: str, result: dict) -> None:
+        """抽出結果を保存
+
+        Args:
+            fingerprint: 抽出器のフィンガープリント
+            key: HTMLのハッシュ（content_hashの値）
+            result: DetailedInfoのフィールドの辞書（JSONに変換できる値）
+        """
+        data = json.dumps(result, ensure_ascii=False)
+
+        with self._lock:
+            self._put_memory((fingerprint, key), data)
+            self._put_disk(fingerprint, key, data)
+            self.stats.stores += 1
+
+    def clear(self) -> None:
+        """すべてのエントリを削除"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM results")
+                self._conn.commit()
+
+    def close(self) -> None:
+        """キャッシュファイルを閉じる"""
+        logger.info(f"Closing extraction cache ({self.stats.report()})")
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _open(self, path: Path) -> None:
+        """キャッシュファイルを開く（開けない場合はメモリのみで動作）"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), timeout=10, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS results (
+                    fingerprint TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (fingerprint, key)
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_last_access ON results(last_access)")
+            self._conn.commit()
+            logger.info(f"ExtractionCache initialized (path={path}, max_disk_entries={self.max_disk_entries})")
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to open extraction cache file {path}: {e}")
+            self._conn = None
+
+    def _put_memory(self, memory_key: tuple[str, str], data: str) -> None:
+        """メモリにエントリを追加（ロック取得済みで呼ぶ）"""
+        if self.max_entries <= 0:
+            return
+        self._memory[memory_key] = data
+        self._memory.move_to_end(memory_key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _get_disk(self, fingerprint: str, key: str) -> Optional[str]:
+        """ファイルからエントリを取得（ロック取得済みで呼ぶ）"""
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT data FROM results WHERE fingerprint = ? AND key = ?", (fingerprint, key)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE results SET last_access = ? WHERE fingerprint = ? AND key = ?",
+                (time.time(), fingerprint, key)
+            )
+            self._conn.commit()
+            return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Extraction cache read failed: {e}")
+            return None
+
+    def _put_disk(self, fingerprint: str, key: str, data: str) -> None:
+        """ファイルにエントリを保存し、上限を超えた分をLRUで削除（ロック取得済みで呼ぶ）"""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (fingerprint, key, data, last_access) VALUES (?, ?, ?, ?)",
+                (fingerprint, key, data, time.time())
+            )
+            excess = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_disk_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM results WHERE rowid IN "
+                    "(SELECT rowid FROM results ORDER BY last_access ASC LIMIT ?)",
+                    (excess,)
+                )
+                self.stats.evictions += excess
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Extraction cache write failed: {e}")
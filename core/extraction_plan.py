@@ -0,0 +1,224 @@
+"""抽出計画モジュール
+
+このモジュールは、抽出・出力する項目を表すExtractionPlanを提供します。
+
+- 項目はconfig.constants.EXTRACTION_FIELDSのキーです。検索結果の項目（順位・タイトル・URL・説明文）と、
+  ページから抽出する詳細情報の項目（電話番号・住所など）があります。
+- 計画は、項目名のリスト、プリセット（config/presets/*.jsonのextraction_fields）、
+  CLIの入力文字列から作成できます。
+- InfoExtractorは計画にない詳細情報の項目の抽出（本文の走査・構造化データの正規化）を行わず、
+  DataFormatter/ExcelWriterは計画にある項目の列のみを出力します。
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Union
+import json
+
+from config.constants import EXTRACTION_FIELDS
+from config.settings import Settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 検索結果の項目（ページを取得しなくても出力できる）
+BASIC_FIELDS = ("rank", "title", "url", "description")
+# ページから抽出する詳細情報の項目（DetailedInfoのフィールド名と同じ順序）
+DETAIL_FIELDS = (
+    "phone", "email", "address", "fax", "company_name", "sns_links", "business_hours", "closed_days"
+)
+
+# 項目と出力データ（OutputData）の列の対応（出力データのフィールド順）
+_OUTPUT_COLUMNS = {
+    "rank": ("rank",),
+    "title": ("title",),
+    "url": ("url",),
+    "description": ("description",),
+    "phone": ("phone",),
+    "email": ("email",),
+    "address": ("postal_code", "prefecture"),
+    "fax": ("fax",),
+    "company_name": ("company_name",),
+    "sns_links": ("sns_twitter", "sns_facebook", "sns_instagram"),
+    "business_hours": ("business_hours",),
+    "closed_days": ("closed_days",),
+}
+
+# CLIの入力ですべての項目を表す文字列
+ALL_FIELDS_KEYWORD = "all"
+
+
+@dataclass(frozen=True)
+class ExtractionPlan:
+    """抽出・出力する項目の計画
+
+    プロセス間で受け渡せるよう、項目名の集合のみを保持します。
+    """
+    fields: frozenset
+
+    def __post_init__(self):
+        unknown = set(self.fields) - set(EXTRACTION_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown extraction fields: {', '.join(sorted(unknown))}")
+
+    @classmethod
+    def all(cls) -> "ExtractionPlan":
+        """すべての項目を抽出・出力する計画"""
+        return cls(frozenset(EXTRACTION_FIELDS))
+
+    @classmethod
+    def from_fields(cls, names: Iterable[str], include_basic: bool = True) -> "ExtractionPlan":
+        """項目名から作成
+
+        Args:
+            names: 項目名（EXTRACTION_FIELDSのキー）
+            include_basic: 検索結果の項目（順位・タイトル・URL・説明文）を加えるか
+
+        Returns:
+            抽出計画
+
+        Raises:
+            ValueError: 不明な項目名がある場合
+        """
+        fields = set(names)
+        if include_basic:
+            fields.update(BASIC_FIELDS)
+        return cls(frozenset(fields))
+
+    @classmethod
+    def from_flags(cls, flags: dict[str, bool]) -> "ExtractionPlan":
+        """項目名→有効かどうかの辞書（プリセットのextraction_fields）から作成
+
+        Raises:
+            ValueError: 不明な項目名がある場合
+        """
+        return cls.from_fields((name for name, enabled in flags.items() if enabled), include_basic=False)
+
+    @classmethod
+    def from_preset(cls, preset: Union[str, Path]) -> "ExtractionPlan":
+        """プリセットファイルから作成
+
+        Args:
+            preset: プリセット名（config/presets内のファイル名から拡張子を除いたもの）またはファイルのパス
+
+        Returns:
+            抽出計画
+
+        Raises:
+            FileNotFoundError: プリセットファイルがない場合
+            ValueError: extraction_fieldsがない場合・不明な項目名がある場合
+        """
+        data = _load_preset(preset_path(preset))
+        flags = data.get("extraction_fields")
+        if not isinstance(flags, dict):
+            raise ValueError(f"Preset has no extraction_fields: {preset}")
+        return cls.from_flags(flags)
+
+    @classmethod
+    def parse(cls, text: Optional[str]) -> "ExtractionPlan":
+        """CLIの入力文字列から作成
+
+        Args:
+            text: "all"、プリセット名、またはカンマ区切りの項目名（空の場合は設定値のプリセット）
+
+        Returns:
+            抽出計画（項目名の場合は検索結果の項目を加える）
+
+        Raises:
+            FileNotFoundError: 該当するプリセットがない場合
+            ValueError: 不明な項目名がある場合
+        """
+        text = (text or "").strip()
+        if not text:
+            return default_plan()
+        if text.lower() == ALL_FIELDS_KEYWORD:
+            return cls.all()
+        if "," not in text and text not in EXTRACTION_FIELDS and preset_path(text).exists():
+            return cls.from_preset(text)
+        return cls.from_fields(name.strip() for name in text.split(",") if name.strip())
+
+    @property
+    def detail_fields(self) -> tuple[str, ...]:
+        """抽出する詳細情報の項目（DetailedInfoのフィールド順）"""
+        return tuple(name for name in DETAIL_FIELDS if name in self.fields)
+
+    @property
+    def has_details(self) -> bool:
+        """ページから抽出する項目があるかどうか"""
+        return any(name in self.fields for name in DETAIL_FIELDS)
+
+    @property
+    def is_full(self) -> bool:
+        """すべての詳細情報の項目を抽出するかどうか"""
+        return all(name in self.fields for name in DETAIL_FIELDS)
+
+    @property
+    def key(self) -> str:
+        """計画を表す文字列（抽出結果キャッシュのキーに使用）"""
+        return ",".join(sorted(self.fields))
+
+    @property
+    def output_columns(self) -> list[str]:
+        """出力する列（OutputDataのフィールド名、出力順）"""
+        return [column for name, columns in _OUTPUT_COLUMNS.items() if name in self.fields for column in columns]
+
+    def wants(self, name: str) -> bool:
+        """項目を抽出・出力するかどうか"""
+        return name in self.fields
+
+    def required_fields(self, defaults: Iterable[str]) -> tuple[str, ...]:
+        """問い合わせページの巡回を打ち切る項目（計画にある項目に限定）
+
+        Args:
+            defaults: 設定値の項目
+
+        Returns:
+            計画にある設定値の項目。1つもない場合は計画のすべての詳細情報の項目
+        """
+        return tuple(name for name in defaults if name in self.fields) or self.detail_fields
+
+    def describe(self) -> str:
+        """画面表示用の項目名の一覧"""
+        return "、".join(EXTRACTION_FIELDS[name] for name in EXTRACTION_FIELDS if name in self.fields)
+
+
+def preset_path(preset: Union[str, Path]) -> Path:
+    """プリセット名をファイルのパスに変換（パスの場合はそのまま）"""
+    path = Path(preset)
+    if path.suffix == ".json" or len(path.parts) > 1:
+        return path
+    return Path(Settings.PRESETS_DIR) / f"{preset}.json"
+
+
+def list_presets() -> dict[str, str]:
+    """利用できるプリセットの一覧
+
+    Returns:
+        プリセット名 → 表示名（プリセットのname）の辞書（プリセット名の順）
+    """
+    presets = {}
+    for path in sorted(Path(Settings.PRESETS_DIR).glob("*.json")):
+        try:
+            presets[path.stem] = _load_preset(path).get("name") or path.stem
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipped invalid preset {path}: {e}")
+    return presets
+
+
+def default_plan() -> ExtractionPlan:
+    """設定値のプリセットの抽出計画（プリセットがない・読み込めない場合はすべての項目）"""
+    if not Settings.EXTRACTION_PRESET:
+        return ExtractionPlan.all()
+    try:
+        return ExtractionPlan.from_preset(Settings.EXTRACTION_PRESET)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to load extraction preset {Settings.EXTRACTION_PRESET}: {e}")
+        return ExtractionPlan.all()
+
+
+def _load_preset(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"Preset is not a JSON object: {path}")
+    return data
@@ -0,0 +1,259 @@
+"""マルチプロセス抽出モジュール
+
+このモジュールは、取得済みのHTMLからの詳細情報の抽出を
+プロセスプールで並列に実行する機能を提供します。
+
+HTMLの解析と正規表現の照合はCPU処理のため、スレッドでは並列化できません（GIL）。
+ExtractionExecutorは、InfoExtractorを持つワーカープロセスにHTMLをチャンク単位で送り、
+抽出結果をDetailedInfoのフィールド値のタプルとして受け取ります。
+
+- 開始方式はspawnです（スレッドやGUIと併用してもfork由来のデッドロックが起きないため）。
+- lxmlのメモリ増加を抑えるため、一定ページ数を処理したプールは作り直します。
+- max_workers=0の場合は、呼び出し元のプロセスで抽出します。
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import fields
+from typing import Callable, Optional
+import multiprocessing
+import os
+
+from config.settings import Settings
+from core.extraction_plan import ExtractionPlan
+from core.extractor import DetailedInfo, InfoExtractor
+from core.html_backend import get_parser_backend
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# DetailedInfoのフィールド名（タプルへの変換・復元の順序）
+_DETAIL_FIELDS = tuple(field.name for field in fields(DetailedInfo))
+
+# ワーカープロセス内のInfoExtractor（_init_workerで作成）
+_worker_extractor: Optional[InfoExtractor] = None
+
+
+def _init_worker(backend_name: str, batch_validation: Optional[bool] = None) -> None:
+    """ワーカープロセスの初期化（InfoExtractorを1つだけ作成）"""
+    global _worker_extractor
+    _worker_extractor = InfoExtractor(parser_backend=get_parser_backend(backend_name),
+                                      batch_validation=batch_validation)
+
+
+def _extract_chunk(htmls: list[str], plan: Optional[ExtractionPlan] = None) -> list[Optional[tuple]]:
+    """ワーカープロセスでチャンク内のHTMLを抽出"""
+    return [_extract_packed(_worker_extractor, html, plan) for html in htmls]
+
+
+def _extract_packed(extractor: InfoExtractor, html: str, plan: Optional[ExtractionPlan] = None) -> Optional[tuple]:
+    """1ページを抽出してフィールド値のタプルに変換（失敗した場合はNone）"""
+    try:
+        return pack_detail(extractor.extract_all(html, plan))
+    except Exception as e:
+        logger.warning(f"Failed to extract details: {e}")
+        return None
+
+
+def pack_detail(info: DetailedInfo) -> tuple:
+    """DetailedInfoをフィールド値のタプルに変換
+
+    プロセス間の受け渡しでは、クラス名や属性名を含まないタプルの方が小さく、
+    直列化も高速なため、この形式で送ります。
+
+    Args:
+        info: 詳細情報
+
+    Returns:
+        DetailedInfoのフィールド定義順の値のタプル
+    """
+    return tuple(getattr(info, name) for name in _DETAIL_FIELDS)
+
+
+def unpack_detail(values: Optional[tuple]) -> Optional[DetailedInfo]:
+    """pack_detailで変換したタプルをDetailedInfoに復元
+
+    Args:
+        values: フィールド値のタプル（Noneの場合はNoneを返す）
+
+    Returns:
+        詳細情報
+    """
+    if values is None:
+        return None
+    return DetailedInfo(*values)
+
+
+class ExtractionExecutor:
+    """プロセスプールで詳細情報を抽出するクラス
+
+    プールは最初の抽出時に作成し、close()まで（またはページ数の上限による
+    作り直しまで）複数回のextract_manyで再利用します。
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        max_pages_per_worker: Optional[int] = None,
+        parser_backend: Optional[str] = None,
+        batch_validation: Optional[bool] = None
+    ):
+        """初期化
+
+        Args:
+            max_workers: ワーカープロセス数（Noneの場合は設定値、設定値もNoneの場合はCPUコア数）。
+                0の場合は呼び出し元のプロセスで抽出します
+            chunk_size: 1回の送信でワーカーに渡すページ数（Noneの場合は設定値）
+            max_pages_per_worker: プールを作り直すまでの1ワーカーあたりのページ数
+                （Noneの場合は設定値）
+            parser_backend: HTMLパーサーのバックエンド名（Noneの場合は設定値）
+            batch_validation: InfoExtractorのbatch_validation（Noneの場合は設定値）
+        """
+        if max_workers is None:
+            max_workers = Settings.EXTRACTION_PROCESS_WORKERS
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max(0, max_workers)
+        self.chunk_size = max(1, chunk_size or Settings.EXTRACTION_CHUNK_SIZE)
+        self.max_pages_per_worker = max(1, max_pages_per_worker or Settings.EXTRACTION_MAX_PAGES_PER_WORKER)
+        self.parser_backend = get_parser_backend(parser_backend).name
+        self.batch_validation = batch_validation
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_pages = 0
+        self._local_extractor: Optional[InfoExtractor] = None
+        self.pools_created = 0
+
+    def __enter__(self) -> "ExtractionExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def in_process(self) -> bool:
+        """呼び出し元のプロセスで抽出するかどうか"""
+        return self.max_workers == 0
+
+    def extract_many(
+        self,
+        htmls: list[Optional[str]],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        plan: Optional[ExtractionPlan] = None
+    ) -> list[Optional[DetailedInfo]]:
+        """複数ページのHTMLから詳細情報を抽出
+
+        Args:
+            htmls: HTML文字列のリスト（取得に失敗したページはNone）
+            progress_callback: 1チャンク完了するごとに呼ばれるコールバック
+                （完了ページ数, 抽出対象のページ数）
+            plan: 抽出する項目の計画（Noneの場合はすべての項目）
+
+        Returns:
+            入力と同じ順序の詳細情報のリスト。
+            HTMLが空のページと抽出に失敗したページの位置にはNoneが入ります
+        """
+        results: list[Optional[DetailedInfo]] = [None] * len(htmls)
+        indexes = [index for index, html in enumerate(htmls) if html]
+        if not indexes:
+            return results
+
+        chunks = [indexes[start:start + self.chunk_size] for start in range(0, len(indexes), self.chunk_size)]
+        total = len(indexes)
+        completed = 0
+
+        def on_chunk_done(chunk: list[int], packed: list[Optional[tuple]]) -> None:
+            nonlocal completed
+            for index, values in zip(chunk, packed):
+                results[index] = unpack_detail(values)
+            completed += len(chunk)
+            if progress_callback:
+                progress_callback(completed, total)
+
+        if self.in_process:
+            for chunk in chunks:
+                on_chunk_done(chunk, self._extract_local([htmls[index] for index in chunk], plan))
+            return results
+
+        logger.info(f"Extracting {total} pages with {self.max_workers} worker processes")
+
+        for generation in self._split_generations(chunks):
+            pool = self._get_pool()
+            futures: dict[Future, list[int]] = {
+                pool.submit(_extract_chunk, [htmls[index] for index in chunk], plan): chunk
+                for chunk in generation
+            }
+            self._pool_pages += sum(len(chunk) for chunk in generation)
+
+            broken = False
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    packed = future.result()
+                except BrokenProcessPool:
+                    # ワーカーが異常終了した場合は、呼び出し元のプロセスで抽出する
+                    if not broken:
+                        logger.warning("Extraction worker process terminated abruptly; extracting in-process")
+                    broken = True
+                    packed = self._extract_local([htmls[index] for index in chunk], plan)
+                on_chunk_done(chunk, packed)
+
+            if broken or self._pool_pages >= self.max_workers * self.max_pages_per_worker:
+                self._shutdown_pool()
+
+        return results
+
+    def close(self) -> None:
+        """ワーカープロセスを終了"""
+        self._shutdown_pool()
+
+    def _split_generations(self, chunks: list[list[int]]) -> list[list[list[int]]]:
+        """チャンクを、プールの作り直しまでに処理するまとまりに分割"""
+        budget = self.max_workers * self.max_pages_per_worker
+        generations: list[list[list[int]]] = []
+        current: list[list[int]] = []
+        pages = self._pool_pages
+
+        for chunk in chunks:
+            if current and pages + len(chunk) > budget:
+                generations.append(current)
+                current = []
+                pages = 0
+            current.append(chunk)
+            pages += len(chunk)
+            if pages >= budget:
+                generations.append(current)
+                current = []
+                pages = 0
+
+        if current:
+            generations.append(current)
+        return generations
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """プロセスプールを取得（なければ作成）"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.parser_backend, self.batch_validation)
+            )
+            self._pool_pages = 0
+            self.pools_created += 1
+            logger.debug(f"Started extraction pool #{self.pools_created}")
+        return self._pool
+
+    def _shutdown_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+            self._pool_pages = 0
+
+    def _extract_local(self, htmls: list[str], plan: Optional[ExtractionPlan] = None) -> list[Optional[tuple]]:
+        """呼び出し元のプロセスでHTMLを抽出"""
+        if self._local_extractor is None:
+            self._local_extractor = InfoExtractor(parser_backend=get_parser_backend(self.parser_backend),
+                                                  batch_validation=self.batch_validation)
+        return [_extract_packed(self._local_extractor, html, plan) for html in htmls]
@@ -2,18 +2,76 @@
 
 このモジュールは、HTMLから電話番号、メールアドレス、住所などの
 情報を正規表現を使って抽出する機能を提供します。
+
+構造化データ（JSON-LD・microdata・OpenGraph・tel:/mailto:リンク）から値を取得できた項目は、
+本文の走査（正規表現・地名辞書）を行いません。各項目の取得元はDetailedInfo.field_sourcesに記録します。
+
+本文の走査は、ページのテキストを一度だけ正規化（core.text_normalizer: NFKC・数字の間のハイフンの統一）した
+テキスト（ParsedDocument.normalized）に対して行います。全角の数字・記号で書かれた電話番号や郵便番号も
+半角のパターンで検出でき、抽出した値は半角の表記になります。
+
+バッチ検証（batch_validation）が有効な場合、電話番号・FAX番号・メールアドレスは一致した値をそのまま返し、
+正規化と検証は出力の整形時（output.columnar.build_detail_columns）にバッチ全体でまとめて行います。
+電話番号の種類ごとの桁数の規則（PHONE_PREFIX_CLASSES）は、どちらの検証でも同じものを使います。
 """
 
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import asdict, dataclass, field, fields, replace
+from typing import Iterable, Optional
+import hashlib
+import json
 import re
-from bs4 import BeautifulSoup
 
-from config.constants import REGEX_PATTERNS
+from config.constants import EMAIL_INVALID_EXTENSIONS, PHONE_FIXED_LINE_LENGTHS, PHONE_PREFIX_LENGTHS
+from config.settings import Settings
+from core.document import HtmlSource, ParsedDocument, as_document
+from core.extraction_cache import ExtractionCache, content_hash
+from core.extraction_plan import DETAIL_FIELDS, ExtractionPlan
+from core.gazetteer import get_default_gazetteer
+from core.postal_index import get_postal_index
+from core.html_backend import HtmlBackend, get_parser_backend
+from core.scanner import (
+    ScanResult, get_default_scanner,
+    KIND_PHONE, KIND_FAX, KIND_EMAIL, KIND_POSTAL_CODE, KIND_BUSINESS_HOURS, KIND_CLOSED_DAYS
+)
+from core.structured_data import STRUCTURED_SOURCES, StructuredAddress, extract_structured_data
+from core.text_normalizer import normalize
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 抽出処理のバージョン（抽出ロジックを変更したら更新し、抽出結果キャッシュを無効にする）
+EXTRACTOR_VERSION = "6"
+
+# 本文（正規表現・地名辞書・見出し）から抽出した値の取得元
+# 構造化データの取得元はcore.structured_dataのSOURCE_JSON_LDなど
+SOURCE_TEXT = "text"
+
+# 本文から抽出する項目と抽出メソッド（抽出計画にあり、構造化データで値が得られなかった項目のみ実行）
+_TEXT_EXTRACTORS = (
+    ("phone", "extract_phone"),
+    ("email", "extract_email"),
+    ("address", "extract_address"),
+    ("fax", "extract_fax"),
+    ("company_name", "extract_company_name"),
+    ("sns_links", "extract_sns_links"),
+    ("business_hours", "extract_business_hours"),
+    ("closed_days", "extract_closed_days"),
+)
+
+# 構造化データから取得できる項目（定休日は本文からのみ抽出）
+_STRUCTURED_FIELDS = frozenset(name for name, _ in _TEXT_EXTRACTORS if name != "closed_days")
+
+# 構造化データの電話番号の表記から番号部分を取り出すパターン
+_STRUCTURED_PHONE_PATTERN = re.compile(r'\+?[(（]?[0-9０-９][0-9０-９()（）\-‐－ー\s]{7,}[0-9０-９]')
+# 国番号（+81）付きの電話番号（括弧と空白を除去した後の表記）
+_COUNTRY_CODE_PATTERN = re.compile(r'^\+81-?0?')
+# 電話番号の種類の先頭の番号のパターン（数字のみの表記に対するもの）と桁数。桁数が同じ種類は1つにまとめる。
+# InfoExtractor._validate_phoneとoutput.columnar.valid_phone_maskで共有する
+PHONE_PREFIX_CLASSES: tuple[tuple[re.Pattern, tuple[int, ...]], ...] = tuple(
+    (re.compile("|".join(prefix for prefix, lengths in PHONE_PREFIX_LENGTHS.items() if lengths == allowed)), allowed)
+    for allowed in dict.fromkeys(PHONE_PREFIX_LENGTHS.values())
+)
+
 
 @dataclass
 class DetailedInfo:
@@ -26,6 +84,103 @@ class DetailedInfo:
     sns_links: dict[str, list[str]] = field(default_factory=dict)
     business_hours: Optional[str] = None  # Phase 2で追加
     closed_days: Optional[str] = None  # Phase 2で追加
+    # 項目名 → 値の取得元（"json_ld"、"microdata"、"open_graph"、"link"、"text"）
+    field_sources: dict[str, str] = field(default_factory=dict)
+
+    def merge(self, other: Optional["DetailedInfo"]) -> "DetailedInfo":
+        """別ページから抽出した詳細情報を統合
+
+        リストは重複を除いて追加し、単一の値は自身の値を優先します。
+        住所は、埋まっている項目が多い方を採用します。
+
+        Args:
+            other: 統合する詳細情報
+
+        Returns:
+            統合した新しい詳細情報
+        """
+        if other is None:
+            return replace(self)
+
+        sns_links = {name: list(links) for name, links in self.sns_links.items()}
+        for name, links in other.sns_links.items():
+            sns_links[name] = _merge_lists(sns_links.get(name, []), links)
+
+        address = max(
+            (self.address, other.address),
+            key=lambda address: sum(1 for value in (address or {}).values() if value)
+        )
+        # 取得元は自身の値を優先し、住所は採用した方の取得元にする
+        field_sources = {**other.field_sources, **self.field_sources}
+        if address is not self.address and "address" in other.field_sources:
+            field_sources["address"] = other.field_sources["address"]
+
+        return DetailedInfo(
+            phone=_merge_lists(self.phone, other.phone),
+            email=_merge_lists(self.email, other.email),
+            address=address,
+            fax=_merge_lists(self.fax, other.fax),
+            company_name=self.company_name or other.company_name,
+            sns_links=sns_links,
+            business_hours=self.business_hours or other.business_hours,
+            closed_days=self.closed_days or other.closed_days,
+            field_sources=field_sources
+        )
+
+
+def _merge_lists(base: list[str], extra: list[str]) -> list[str]:
+    """順序を保ったまま重複を除いてリストを結合"""
+    return list(dict.fromkeys([*base, *extra]))
+
+
+@dataclass
+class FieldSourceStats:
+    """項目ごとの値の取得元の集計"""
+    pages: int = 0  # 集計した詳細情報の件数
+    # 項目名 → 取得元 → 件数
+    counts: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_results(cls, infos: Iterable[Optional[DetailedInfo]]) -> "FieldSourceStats":
+        """詳細情報のリストから集計（Noneは除外）
+
+        プロセスプールや抽出結果キャッシュを使った場合も、返された詳細情報から集計できます。
+
+        Args:
+            infos: 詳細情報のリスト
+
+        Returns:
+            集計結果
+        """
+        stats = cls()
+        for info in infos:
+            if info is not None:
+                stats.add(info)
+        return stats
+
+    def add(self, info: DetailedInfo) -> None:
+        """詳細情報1件の取得元を集計に追加"""
+        self.pages += 1
+        for name, source in info.field_sources.items():
+            sources = self.counts.setdefault(name, {})
+            sources[source] = sources.get(source, 0) + 1
+
+    @property
+    def structured_rate(self) -> float:
+        """値を取得した項目のうち、構造化データから取得した割合（0.0〜1.0）"""
+        total = sum(sum(sources.values()) for sources in self.counts.values())
+        structured = sum(count for sources in self.counts.values()
+                         for source, count in sources.items() if source in STRUCTURED_SOURCES)
+        return structured / total if total else 0.0
+
+    def report(self) -> str:
+        """ログ・画面出力用のレポート文字列（DetailedInfoのフィールド順）"""
+        order = [item.name for item in fields(DetailedInfo)]
+        parts = []
+        for name in sorted(self.counts, key=lambda name: order.index(name) if name in order else len(order)):
+            sources = ", ".join(f"{source}={count}" for source, count in sorted(self.counts[name].items()))
+            parts.append(f"{name}({sources})")
+        return f"pages={self.pages}, structured={self.structured_rate:.1%}; " + "; ".join(parts)
 
 
 class InfoExtractor:
@@ -35,176 +190,244 @@ class InfoExtractor:
     正規表現パターンを使用して、各種情報を検出します。
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        parser_backend: Optional[HtmlBackend] = None,
+        cache: Optional[ExtractionCache] = None,
+        use_structured_data: Optional[bool] = None,
+        plan: Optional[ExtractionPlan] = None,
+        batch_validation: Optional[bool] = None
+    ):
         """初期化
 
         InfoExtractorインスタンスを初期化します。
+
+        Args:
+            parser_backend: HTMLの解析に使用するバックエンド（Noneの場合は設定値のバックエンド）
+            cache: extract_allの結果のキャッシュ（Noneの場合、設定で有効なときのみ作成）
+            use_structured_data: extract_allで構造化データを本文より優先して使用するか（Noneの場合は設定値）
+            plan: extract_allで抽出する項目の計画（Noneの場合はすべての項目）
+            batch_validation: 電話番号・FAX番号・メールアドレスを検証せずに一致した値のまま返すか
+                （output.columnar.build_detail_columnsでまとめて正規化・検証する場合、Noneの場合は設定値）
         """
-        self.phone_patterns = REGEX_PATTERNS["phone"]
-        self.email_patterns = REGEX_PATTERNS["email"]
-        self.postal_code_patterns = REGEX_PATTERNS["postal_code"]
+        self.parser_backend = parser_backend or get_parser_backend()
+        self.use_structured_data = (use_structured_data if use_structured_data is not None
+                                    else Settings.EXTRACTION_USE_STRUCTURED_DATA)
+        self.batch_validation = (batch_validation if batch_validation is not None
+                                 else Settings.EXTRACTION_BATCH_VALIDATION)
+        self.plan = plan or ExtractionPlan.all()
+        # 設定値のパターンパックをまとめた照合器（テキストを種類ごとに1回だけ走査する）
+        self.scanner = get_default_scanner()
+        # 都道府県・市区町村の地名辞書（住所の検出に使用）
+        self.gazetteer = get_default_gazetteer()
+        # 郵便番号索引（索引ファイルがない場合はNone）
+        self.postal_index = get_postal_index()
+        if cache is None and Settings.EXTRACTION_CACHE_ENABLED:
+            cache = ExtractionCache()
+        self.cache = cache
+        self.fingerprint = self._fingerprint()
         logger.info("InfoExtractor initialized")
 
-    def extract_all(self, html: str) -> DetailedInfo:
+    def extract_all(self, html: HtmlSource, plan: Optional[ExtractionPlan] = None) -> DetailedInfo:
         """すべての情報を抽出（Phase 2で拡充）
 
-        HTMLからすべての情報を一度に抽出します。
+        HTMLから抽出計画の項目を一度に抽出します。計画にない項目は抽出しません（値は空のまま）。
+        構造化データから値を取得できた項目は、本文の走査を行いません。
 
         Args:
-            html: 解析対象のHTML文字列
+            html: 解析対象のHTML文字列または解析済みドキュメント
+            plan: 抽出する項目の計画（Noneの場合は初期化時の計画）
 
         Returns:
             抽出された詳細情報
         """
+        plan = plan or self.plan
+        detail_fields = plan.detail_fields
+        if not detail_fields:
+            # 抽出する項目がなければ、HTMLを解析しない
+            return DetailedInfo()
+
         logger.info("Extracting all information from HTML")
 
-        detailed_info = DetailedInfo(
-            phone=self.extract_phone(html),
-            email=self.extract_email(html),
-            address=self.extract_address(html),
-            fax=self.extract_fax(html),
-            company_name=self.extract_company_name(html),
-            sns_links=self.extract_sns_links(html),
-            business_hours=self.extract_business_hours(html),  # Phase 2で追加
-            closed_days=self.extract_closed_days(html)  # Phase 2で追加
-        )
+        # 内容が同じHTMLの抽出結果があれば、解析せずに返す
+        cache_key = None
+        fingerprint = self.fingerprint if detail_fields == DETAIL_FIELDS else f"{self.fingerprint}:{plan.key}"
+        html_text = html.html if isinstance(html, ParsedDocument) else html
+        # ストリーミング抽出のドキュメントはページ全体のHTMLを持たないため、キャッシュしない
+        streamed = isinstance(html, ParsedDocument) and html.streamed
+        if self.cache is not None and html_text and not streamed:
+            cache_key = content_hash(html_text)
+            cached = self.cache.get(fingerprint, cache_key)
+            if cached is not None:
+                logger.info("Serving extraction result from cache")
+                return DetailedInfo(**cached)
+
+        # ページを一度だけ解析し、各抽出処理で共有する
+        document = as_document(html, self.parser_backend)
+        if document is None:
+            logger.warning("HTML is empty")
+            return DetailedInfo()
+
+        sources: dict[str, str] = {}
+        values = self._extract_structured(document, sources, detail_fields) if self.use_structured_data else {}
+
+        # 構造化データで埋まらなかった項目のみ、本文を走査して抽出する
+        for name, method in _TEXT_EXTRACTORS:
+            if name not in detail_fields or values.get(name):
+                continue
+            value = getattr(self, method)(document)
+            values[name] = value
+            if value:
+                sources[name] = SOURCE_TEXT
+
+        detailed_info = DetailedInfo(**values, field_sources=sources)
 
         logger.info(f"Extraction completed: phone={len(detailed_info.phone)}, "
                    f"email={len(detailed_info.email)}, "
                    f"fax={len(detailed_info.fax)}")
 
+        if cache_key is not None:
+            self.cache.put(fingerprint, cache_key, asdict(detailed_info))
+
         return detailed_info
 
-    def extract_phone(self, html: str) -> list[str]:
+    def extract_stream(
+        self,
+        chunks: Iterable[bytes],
+        content_type: Optional[str] = None,
+        plan: Optional[ExtractionPlan] = None
+    ) -> DetailedInfo:
+        """受信したHTMLのバイト列を順に解析しながら抽出（ストリーミング抽出）
+
+        ページ全体を保持しないため、ページのサイズによらずメモリ使用量はほぼ一定です
+        （詳しくはcore.stream_extractorを参照）。
+
+        Args:
+            chunks: HTMLのバイト列（受信した順）
+            content_type: Content-Typeヘッダーの値（文字コードの判定に使用）
+            plan: 抽出する項目の計画（Noneの場合は初期化時の計画）
+
+        Returns:
+            抽出された詳細情報
+        """
+        from core.stream_extractor import StreamingExtraction
+
+        stream = StreamingExtraction(self, plan, content_type)
+        for chunk in chunks:
+            stream.feed(chunk)
+        return stream.close()
+
+    def extract_phone(self, html: HtmlSource) -> list[str]:
         """電話番号を抽出
 
         HTMLから電話番号を抽出します。
 
         Args:
-            html: 解析対象のHTML文字列
+            html: 解析対象のHTML文字列または解析済みドキュメント
 
         Returns:
-            抽出された電話番号のリスト（重複除去済み）
+            抽出された電話番号のリスト（重複除去済み。バッチ検証の場合は一致した値のまま）
         """
-        if not html:
+        document = as_document(html, self.parser_backend)
+        if document is None:
             logger.warning("HTML is empty")
             return []
 
-        # HTMLタグを除去してテキストのみを取得
-        text = self._strip_html_tags(html)
-
-        phone_numbers = set()
-
-        # 各パターンで検索
-        for pattern in self.phone_patterns:
-            try:
-                matches = re.findall(pattern, text)
-                for match in matches:
-                    # 正規化（ハイフンの統一など）
-                    normalized = self._normalize_phone(match)
-                    if normalized and self._validate_phone(normalized):
-                        phone_numbers.add(normalized)
-            except re.error as e:
-                logger.error(f"Regex error in phone pattern '{pattern}': {e}")
+        phone_numbers = self._phone_values(self._scan(document).values(KIND_PHONE))
 
         result = sorted(list(phone_numbers))
         logger.debug(f"Extracted {len(result)} phone numbers")
         return result
 
-    def extract_email(self, html: str) -> list[str]:
+    def extract_email(self, html: HtmlSource) -> list[str]:
         """メールアドレスを抽出
 
         HTMLからメールアドレスを抽出します。
 
         Args:
-            html: 解析対象のHTML文字列
+            html: 解析対象のHTML文字列または解析済みドキュメント
 
         Returns:
-            抽出されたメールアドレスのリスト（重複除去済み）
+            抽出されたメールアドレスのリスト（重複除去済み。バッチ検証の場合は一致した値のまま）
         """
-        if not html:
+        document = as_document(html, self.parser_backend)
+        if document is None:
             logger.warning("HTML is empty")
             return []
 
-        # HTMLタグを除去してテキストのみを取得
-        text = self._strip_html_tags(html)
-
         email_addresses = set()
 
-        # 各パターンで検索
-        for pattern in self.email_patterns:
-            try:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    # 正規化（小文字に統一）
-                    normalized = match.lower().strip()
-                    if self._validate_email(normalized):
-                        email_addresses.add(normalized)
-            except re.error as e:
-                logger.error(f"Regex error in email pattern '{pattern}': {e}")
+        for match in self._scan(document).values(KIND_EMAIL):
+            if self.batch_validation:
+                email_addresses.add(match.strip())
+                continue
+            # 正規化（小文字に統一）
+            normalized = match.lower().strip()
+            if self._validate_email(normalized):
+                email_addresses.add(normalized)
 
         result = sorted(list(email_addresses))
         logger.debug(f"Extracted {len(result)} email addresses")
         return result
 
-    def extract_address(self, html: str) -> Optional[dict]:
+    def extract_address(self, html: HtmlSource) -> Optional[dict]:
         """住所を抽出（Phase 2で拡充）
 
         HTMLから住所を抽出します。
 
         Args:
-            html: 解析対象のHTML文字列
+            html: 解析対象のHTML文字列または解析済みドキュメント
 
         Returns:
             抽出された住所情報の辞書（postal_code, prefecture, city, address）
             見つからない場合はNone
         """
-        if not html:
+        document = as_document(html, self.parser_backend)
+        if document is None:
             logger.warning("HTML is empty")
             return None
 
-        text = self._strip_html_tags(html)
+        return self._address_from_text(document.normalized.text, self._scan(document))
 
-        # 郵便番号の抽出
+    def _address_from_text(self, text: str, scan: ScanResult) -> Optional[dict]:
+        """テキストから住所を抽出
+
+        Args:
+            text: 検索対象のテキスト
+            scan: テキストの走査結果
+
+        Returns:
+            住所情報の辞書（extract_addressと同じ形式）。見つからない場合はNone
+        """
+        # 地名辞書で住所の候補をすべて検出し、郵便番号に近いものなどを優先する
+        candidates = self.gazetteer.find_candidates(text, scan.get(KIND_POSTAL_CODE))
+        best = candidates[0] if candidates else None
+
+        # 郵便番号の抽出（住所の近くにあるもの、なければ〒記号付きのパターンを優先）
         postal_code = None
-        for pattern in self.postal_code_patterns:
-            try:
-                match = re.search(pattern, text)
-                if match:
-                    postal_code = match.group(0)
-                    # 正規化（ハイフン付きの形式に統一）
-                    postal_code = re.sub(r'[〒\s]', '', postal_code)
-                    if len(postal_code) == 7:
-                        postal_code = f"{postal_code[:3]}-{postal_code[3:]}"
-                    break
-            except re.error as e:
-                logger.error(f"Regex error in postal code pattern '{pattern}': {e}")
-
-        # 都道府県の抽出
-        prefecture_pattern = r'(北海道|青森県|岩手県|宮城県|秋田県|山形県|福島県|茨城県|栃木県|群馬県|埼玉県|千葉県|東京都|神奈川県|新潟県|富山県|石川県|福井県|山梨県|長野県|岐阜県|静岡県|愛知県|三重県|滋賀県|京都府|大阪府|兵庫県|奈良県|和歌山県|鳥取県|島根県|岡山県|広島県|山口県|徳島県|香川県|愛媛県|高知県|福岡県|佐賀県|長崎県|熊本県|大分県|宮崎県|鹿児島県|沖縄県)'
-        prefecture_match = re.search(prefecture_pattern, text)
-        prefecture = prefecture_match.group(0) if prefecture_match else None
-
-        # 市区町村の抽出（Phase 2で実装）
-        city = None
-        if prefecture:
-            # 都道府県の後に続く市区町村を抽出
-            city_pattern = rf'{re.escape(prefecture)}([^\s]+?[市区町村])'
-            city_match = re.search(city_pattern, text)
-            if city_match:
-                city = city_match.group(1)
-
-        # 詳細住所の抽出（Phase 2で実装）
-        full_address = None
-        if prefecture:
-            # 都道府県から始まる住所パターンを抽出
-            # 番地・号まで含む住所を抽出
-            address_pattern = rf'{re.escape(prefecture)}[^\s。、]{5,50}?(?:\d+[-ー\s]?\d+[-ー\s]?\d+|[0-9０-９]+[-ー\s]?[0-9０-９]+)'
-            address_match = re.search(address_pattern, text)
-            if address_match:
-                full_address = address_match.group(0)
-                # 余分な文字を除去
-                full_address = re.sub(r'[「」『』【】\(\)]', '', full_address).strip()
+        match = best.postal_match if best and best.postal_match else scan.first(KIND_POSTAL_CODE)
+        if match:
+            # 正規化（ハイフン付きの形式に統一）
+            postal_code = re.sub(r'[〒\s]', '', match.value)
+            if len(postal_code) == 7:
+                postal_code = f"{postal_code[:3]}-{postal_code[3:]}"
+
+        # 郵便番号索引で都道府県・市区町村を照合する
+        postal_city = self.postal_index.lookup_city(postal_code) if self.postal_index and postal_code else None
+        if postal_city and best is not None and best.postal_match is None and best.prefecture != postal_city[0]:
+            # 住所から離れた郵便番号と都道府県が一致しない場合は、一致する候補を優先する
+            best = next((candidate for candidate in candidates if candidate.prefecture == postal_city[0]), best)
+
+        prefecture = best.prefecture if best else None
+        city = best.city if best else None
+        full_address = best.address if best else None
+
+        # 本文から取得できなかった都道府県・市区町村を郵便番号索引で補完する
+        if postal_city:
+            if prefecture is None:
+                prefecture, city = postal_city
+            elif prefecture == postal_city[0] and (city is None or postal_city[1].startswith(city)):
+                city = postal_city[1]
 
         if postal_code or prefecture:
             address_info = {
@@ -219,65 +442,51 @@ class InfoExtractor:
         logger.debug("No address information found")
         return None
 
-    def extract_fax(self, html: str) -> list[str]:
+    def extract_fax(self, html: HtmlSource) -> list[str]:
         """FAX番号を抽出
 
         HTMLからFAX番号を抽出します。
 
         Args:
-            html: 解析対象のHTML文字列
+            html: 解析対象のHTML文字列または解析済みドキュメント
 
         Returns:
-            抽出されたFAX番号のリスト（重複除去済み）
+            抽出されたFAX番号のリスト（重複除去済み。バッチ検証の場合は一致した値のまま）
         """
-        if not html:
+        document = as_document(html, self.parser_backend)
+        if document is None:
             logger.warning("HTML is empty")
             return []
 
-        text = self._strip_html_tags(html)
-        fax_numbers = set()
-
-        # FAXの近くにある電話番号パターンを検索
-        fax_pattern = r'(?:FAX|Fax|fax|ファックス|ファクス)[:\s]*([0-9\-\(\)]+)'
-
-        try:
-            matches = re.findall(fax_pattern, text)
-            for match in matches:
-                normalized = self._normalize_phone(match)
-                if normalized and self._validate_phone(normalized):
-                    fax_numbers.add(normalized)
-        except re.error as e:
-            logger.error(f"Regex error in fax pattern: {e}")
+        # FAXの後に続く番号
+        fax_numbers = self._phone_values(self._scan(document).values(KIND_FAX))
 
         result = sorted(list(fax_numbers))
         logger.debug(f"Extracted {len(result)} fax numbers")
         return result
 
-    def extract_company_name(self, html: str) -> Optional[str]:
+    def extract_company_name(self, html: HtmlSource) -> Optional[str]:
         """会社名・店舗名を抽出（Phase 2で拡充）
 
         HTMLから会社名や店舗名を抽出します。
         metaタグ、hタグ、JSON-LD、titleタグの順に試行します。
 
         Args:
-            html: 解析対象のHTML文字列
+            html: 解析対象のHTML文字列または解析済みドキュメント
 
         Returns:
             抽出された会社名。見つからない場合はNone
         """
-        if not html:
+        document = as_document(html, self.parser_backend)
+        if document is None:
             logger.warning("HTML is empty")
             return None
 
         try:
-            soup = BeautifulSoup(html, 'lxml')
-
             # 1. JSON-LDから抽出を試みる（構造化データ）
-            json_ld_scripts = soup.find_all('script', type='application/ld+json')
-            for script in json_ld_scripts:
+            for script in document.json_ld:
                 try:
-                    import json
-                    data = json.loads(script.string)
+                    data = json.loads(script)
                     # 組織名または店舗名を取得
                     if isinstance(data, dict):
                         name = data.get('name') or data.get('legalName')
@@ -295,25 +504,23 @@ class InfoExtractor:
                     logger.debug(f"Failed to parse JSON-LD: {e}")
 
             # 2. metaタグのog:site_nameから抽出
-            og_site_name = soup.find('meta', property='og:site_name')
-            if og_site_name and og_site_name.get('content'):
-                company_name = og_site_name['content'].strip()
+            og_site_name = document.meta.get('og:site_name')
+            if og_site_name:
+                company_name = og_site_name.strip()
                 logger.debug(f"Extracted company name from og:site_name: {company_name}")
                 return company_name
 
             # 3. h1タグから抽出（最初のh1を会社名とみなす）
-            h1 = soup.find('h1')
-            if h1 and h1.get_text():
-                company_name = h1.get_text().strip()
+            if document.h1:
+                company_name = document.h1.strip()
                 # 明らかに会社名ではないものを除外
                 if len(company_name) < 50 and '検索' not in company_name:
                     logger.debug(f"Extracted company name from h1: {company_name}")
                     return company_name
 
             # 4. titleタグから抽出（従来の方法）
-            title = soup.find('title')
-            if title and title.string:
-                company_name = title.string.strip()
+            if document.title:
+                company_name = document.title.strip()
                 # 余分な文字列を除去
                 separators = ['|', '-', '–', '—', '/', '＜', '【']
                 for sep in separators:
@@ -330,71 +537,185 @@ class InfoExtractor:
         logger.debug("No company name found")
         return None
 
-    def extract_sns_links(self, html: str) -> dict[str, list[str]]:
+    def extract_sns_links(self, html: HtmlSource) -> dict[str, list[str]]:
         """SNSリンクを抽出
 
         HTMLからSNS（Twitter, Facebook, Instagram等）のリンクを抽出します。
+        aタグのhrefのうち、ホスト名がSNS_DOMAINSのドメインのもの（共有ボタン・トップページを除く）を、
+        ヘッダー・フッターのリンクを先にして返します。
 
         Args:
-            html: 解析対象のHTML文字列
+            html: 解析対象のHTML文字列または解析済みドキュメント
 
         Returns:
             SNS名をキー、URLのリストを値とする辞書
         """
-        if not html:
+        document = as_document(html, self.parser_backend)
+        if document is None:
             logger.warning("HTML is empty")
             return {}
 
-        sns_links = {
-            "twitter": [],
-            "facebook": [],
-            "instagram": [],
-            "line": [],
-            "youtube": []
-        }
-
-        sns_patterns = {
-            "twitter": r'https?://(?:www\.)?(?:twitter\.com|x\.com)/[\w]+',
-            "facebook": r'https?://(?:www\.)?facebook\.com/[\w\.]+',
-            "instagram": r'https?://(?:www\.)?instagram\.com/[\w\.]+',
-            "line": r'https?://line\.me/[\w/]+',
-            "youtube": r'https?://(?:www\.)?youtube\.com/[\w/\?=]+',
-        }
-
-        for sns_name, pattern in sns_patterns.items():
-            try:
-                matches = re.findall(pattern, html, re.IGNORECASE)
-                sns_links[sns_name] = list(set(matches))
-            except re.error as e:
-                logger.error(f"Regex error in {sns_name} pattern: {e}")
-
-        # 空のリストを除外
-        sns_links = {k: v for k, v in sns_links.items() if v}
+        # ページのリンク索引のSNSのアカウントのリンク（script内や共有ボタンのURLは含まない）
+        sns_links = document.anchors.sns_urls()
 
         logger.debug(f"Extracted SNS links: {list(sns_links.keys())}")
         return sns_links
 
-    def _strip_html_tags(self, html: str) -> str:
+    def _strip_html_tags(self, html: HtmlSource) -> str:
         """HTMLタグを除去
 
         Args:
-            html: HTML文字列
+            html: HTML文字列または解析済みドキュメント
 
         Returns:
             タグを除去したテキスト
         """
-        try:
-            soup = BeautifulSoup(html, 'lxml')
-            # scriptとstyleタグを削除
-            for script in soup(["script", "style"]):
-                script.decompose()
-            text = soup.get_text(separator=' ')
-            # 連続する空白を1つにまとめる
-            text = re.sub(r'\s+', ' ', text)
-            return text.strip()
-        except Exception as e:
-            logger.error(f"Error stripping HTML tags: {e}")
-            return html
+        document = as_document(html, self.parser_backend)
+        return document.text if document else ""
+
+    def _fingerprint(self) -> str:
+        """抽出器のフィンガープリントを計算（抽出結果キャッシュのキーに使用）
+
+        コードのバージョン・パターン（パターンパックのバージョン）・パーサーのバックエンドのいずれかが変わると、値が変わります。
+        """
+        source = json.dumps({
+            "version": EXTRACTOR_VERSION,
+            "backend": self.parser_backend.name,
+            "structured_data": self.use_structured_data,
+            "batch_validation": self.batch_validation,
+            "patterns": self.scanner.patterns,
+            "pattern_packs": self.scanner.versions,
+            "gazetteer": self.gazetteer.fingerprint,
+            "postal_index": self.postal_index.fingerprint if self.postal_index else None,
+        }, ensure_ascii=False, sort_keys=True)
+        return hashlib.blake2b(source.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _extract_structured(
+        self, document: ParsedDocument, sources: dict[str, str], fields: tuple[str, ...] = DETAIL_FIELDS
+    ) -> dict:
+        """構造化データから詳細情報の値を取得
+
+        リストの項目はすべての取得元の値を結合し、単一の値の項目は優先度の高い取得元の値を使います。
+
+        Args:
+            document: 解析済みドキュメント
+            sources: 項目名 → 取得元の辞書（値を取得した項目の取得元を追加）
+            fields: 取得する項目
+
+        Returns:
+            項目名 → 値の辞書（値を取得できた項目のみ）
+        """
+        values: dict = {}
+        if not any(name in _STRUCTURED_FIELDS for name in fields):
+            return values
+
+        def add_list(name: str, items: list, source: str) -> None:
+            items = [item for item in items if item]
+            if items:
+                values[name] = _merge_lists(values.get(name, []), items)
+                sources.setdefault(name, source)
+
+        def set_value(name: str, value, source: str) -> None:
+            if value and name not in values:
+                values[name] = value
+                sources[name] = source
+
+        for structured in extract_structured_data(document):
+            source = structured.source
+            if "phone" in fields:
+                add_list("phone", [self._normalize_structured_phone(phone) for phone in structured.telephones],
+                         source)
+            if "fax" in fields:
+                add_list("fax", [self._normalize_structured_phone(fax) for fax in structured.fax_numbers], source)
+            if "email" in fields:
+                add_list("email", [email if self.batch_validation else email.lower() for email in structured.emails
+                                   if " " not in email
+                                   and (self.batch_validation or self._validate_email(email.lower()))], source)
+            if "sns_links" in fields and structured.sns_links:
+                sns_links = values.setdefault("sns_links", {})
+                for name, links in structured.sns_links.items():
+                    sns_links[name] = _merge_lists(sns_links.get(name, []), links)
+                sources.setdefault("sns_links", source)
+            if "company_name" in fields:
+                set_value("company_name", next(iter(structured.names), None), source)
+            if "business_hours" in fields and structured.opening_hours:
+                business_hours = " / ".join(dict.fromkeys(structured.opening_hours))
+                if len(business_hours) > 100:
+                    business_hours = business_hours[:100] + '...'
+                set_value("business_hours", business_hours, source)
+            if "address" in fields and "address" not in values:
+                set_value("address", self._structured_address(structured.addresses), source)
+
+        if values:
+            logger.debug(f"Extracted from structured data: {sources}")
+        return values
+
+    def _structured_address(self, addresses: list[StructuredAddress]) -> Optional[dict]:
+        """構造化データの住所を、地名辞書と郵便番号索引で照合して住所情報の辞書にする
+
+        Args:
+            addresses: 構造化データの住所のリスト
+
+        Returns:
+            最初に照合できた住所の住所情報の辞書（extract_addressと同じ形式）。照合できない場合はNone
+        """
+        for address in addresses:
+            text = normalize(address.to_text())
+            address_info = self._address_from_text(text, self.scanner.scan(text))
+            if address_info is None:
+                continue
+            if not address_info["address"]:
+                # 番地の形式でない住所（英語表記など）は、構造化データの表記のまま使う
+                address_info["address"] = StructuredAddress(
+                    region=address.region, locality=address.locality, street=address.street
+                ).to_text() or None
+            return address_info
+        return None
+
+    def _normalize_structured_phone(self, phone: str) -> Optional[str]:
+        """構造化データの電話番号を本文の電話番号と同じ形式に正規化
+
+        Args:
+            phone: 電話番号の表記（"+81-3-1234-5678"、"03-1234-5678（代表）"など）
+
+        Returns:
+            正規化された電話番号。妥当な電話番号でない場合はNone
+            （バッチ検証の場合は、番号部分の表記のまま検証しない）
+        """
+        match = _STRUCTURED_PHONE_PATTERN.search(normalize(phone))
+        if not match:
+            return None
+        if self.batch_validation:
+            return match.group().strip()
+        normalized = _COUNTRY_CODE_PATTERN.sub('0', self._normalize_phone(match.group()))
+        return normalized if self._validate_phone(normalized) else None
+
+    def _scan(self, document: ParsedDocument) -> ScanResult:
+        """ドキュメントの正規化したテキストを走査（結果はドキュメントに保持して再利用）
+
+        Args:
+            document: 解析済みドキュメント
+
+        Returns:
+            走査結果
+        """
+        result = document.scans.get(self.scanner)
+        if result is None:
+            result = self.scanner.scan(document.normalized.text)
+            document.scans[self.scanner] = result
+        return result
+
+    def _phone_values(self, matches: list[str]) -> set[str]:
+        """電話番号・FAX番号の一致した値を正規化・検証（バッチ検証の場合は一致した値のまま）"""
+        if self.batch_validation:
+            return {match.strip() for match in matches if match.strip()}
+        phone_numbers = set()
+        for match in matches:
+            # 正規化（ハイフンの統一など）
+            normalized = self._normalize_phone(match)
+            if normalized and self._validate_phone(normalized):
+                phone_numbers.add(normalized)
+        return phone_numbers
 
     def _normalize_phone(self, phone: str) -> str:
         """電話番号を正規化
@@ -405,8 +726,8 @@ class InfoExtractor:
         Returns:
             正規化された電話番号
         """
-        # 全角数字を半角に変換
-        phone = phone.translate(str.maketrans('0123456789', '0123456789'))
+        # 全角数字・全角記号を半角に変換
+        phone = normalize(phone)
         # 括弧を除去
         phone = re.sub(r'[()（）]', '', phone)
         # スペースを除去
@@ -429,31 +750,14 @@ class InfoExtractor:
         if not digits_only.startswith('0'):
             return False
 
-        # 各種番号の桁数チェック
+        # 番号の種類（フリーダイヤル・ナビダイヤル・IP電話・携帯電話）ごとの桁数チェック
         length = len(digits_only)
-
-        # フリーダイヤル (0120/0800)
-        if digits_only.startswith('0120') or digits_only.startswith('0800'):
-            return length == 10
-
-        # ナビダイヤル (0570)
-        if digits_only.startswith('0570'):
-            return length == 10
-
-        # IP電話 (050)
-        if digits_only.startswith('050'):
-            return length == 11
-
-        # 携帯電話 (070/080/090)
-        if digits_only.startswith(('070', '080', '090')):
-            return length == 11
+        for prefixes, lengths in PHONE_PREFIX_CLASSES:
+            if prefixes.match(digits_only):
+                return length in lengths
 
         # 固定電話 (市外局番による桁数の違い)
-        # 10桁または11桁を許可
-        if length in [10, 11]:
-            return True
-
-        return False
+        return length in PHONE_FIXED_LINE_LENGTHS
 
     def _validate_email(self, email: str) -> bool:
         """メールアドレスの妥当性を検証
@@ -469,91 +773,65 @@ class InfoExtractor:
             return False
 
         # 画像ファイル等を除外
-        invalid_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.svg']
-        if any(email.endswith(ext) for ext in invalid_extensions):
+        if email.endswith(EMAIL_INVALID_EXTENSIONS):
             return False
 
         return True
 
-    def extract_business_hours(self, html: str) -> Optional[str]:
+    def extract_business_hours(self, html: HtmlSource) -> Optional[str]:
         """営業時間を抽出（Phase 2で追加）
 
         HTMLから営業時間を抽出します。
 
         Args:
-            html: 解析対象のHTML文字列
+            html: 解析対象のHTML文字列または解析済みドキュメント
 
         Returns:
             抽出された営業時間。見つからない場合はNone
         """
-        if not html:
+        document = as_document(html, self.parser_backend)
+        if document is None:
             logger.warning("HTML is empty")
             return None
 
-        text = self._strip_html_tags(html)
-
-        # 営業時間のパターン
-        patterns = [
-            r'営業時間[：:\s]*([^\n。、]{5,50})',
-            r'営業[：:\s]*([0-9０-９]+[時:：][0-9０-９]+[^\n。、]{0,30})',
-            r'受付時間[：:\s]*([^\n。、]{5,50})',
-            r'定休日を除く[：:\s]*([0-9０-９]+[時:：][0-9０-９]+[^\n。、]{0,30})',
-            r'([月火水木金土日祝]+)[：:\s]*([0-9０-９]+[時:：][0-9０-９]+[-~〜～][0-9０-９]+[時:：][0-9０-９]+)',
-        ]
-
-        for pattern in patterns:
-            try:
-                match = re.search(pattern, text)
-                if match:
-                    business_hours = match.group(1).strip() if len(match.groups()) == 1 else match.group(0).strip()
-                    # 長すぎる場合は先頭50文字のみ
-                    if len(business_hours) > 100:
-                        business_hours = business_hours[:100] + '...'
-                    logger.debug(f"Extracted business hours: {business_hours}")
-                    return business_hours
-            except re.error as e:
-                logger.error(f"Regex error in business hours pattern: {e}")
+        # 優先度の高いパターンの一致を採用
+        match = self._scan(document).first(KIND_BUSINESS_HOURS)
+        if match:
+            business_hours = match.value.strip()
+            # 長すぎる場合は先頭100文字のみ
+            if len(business_hours) > 100:
+                business_hours = business_hours[:100] + '...'
+            logger.debug(f"Extracted business hours: {business_hours}")
+            return business_hours
 
         logger.debug("No business hours found")
         return None
 
-    def extract_closed_days(self, html: str) -> Optional[str]:
+    def extract_closed_days(self, html: HtmlSource) -> Optional[str]:
         """定休日を抽出（Phase 2で追加）
 
         HTMLから定休日を抽出します。
 
         Args:
-            html: 解析対象のHTML文字列
+            html: 解析対象のHTML文字列または解析済みドキュメント
 
         Returns:
             抽出された定休日。見つからない場合はNone
         """
-        if not html:
+        document = as_document(html, self.parser_backend)
+        if document is None:
             logger.warning("HTML is empty")
             return None
 
-        text = self._strip_html_tags(html)
-
-        # 定休日のパターン
-        patterns = [
-            r'定休日[：:\s]*([^\n。、]{2,30})',
-            r'休業日[：:\s]*([^\n。、]{2,30})',
-            r'休み[：:\s]*([月火水木金土日祝、・]+)',
-            r'([月火水木金土日]+曜日?)休み',
-        ]
-
-        for pattern in patterns:
-            try:
-                match = re.search(pattern, text)
-                if match:
-                    closed_days = match.group(1).strip() if len(match.groups()) == 1 else match.group(0).strip()
-                    # 長すぎる場合は先頭50文字のみ
-                    if len(closed_days) > 50:
-                        closed_days = closed_days[:50] + '...'
-                    logger.debug(f"Extracted closed days: {closed_days}")
-                    return closed_days
-            except re.error as e:
-                logger.error(f"Regex error in closed days pattern: {e}")
+        # 優先度の高いパターンの一致を採用
+        match = self._scan(document).first(KIND_CLOSED_DAYS)
+        if match:
+            closed_days = match.value.strip()
+            # 長すぎる場合は先頭50文字のみ
+            if len(closed_days) > 50:
+                closed_days = closed_days[:50] + '...'
+            logger.debug(f"Extracted closed days: {closed_days}")
+            return closed_days
 
         logger.debug("No closed days found")
         return None
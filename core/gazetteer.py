@@ -0,0 +1,336 @@
+"""住所の地名辞書（ガゼッティア）モジュール
+
+このモジュールは、都道府県と市区町村の名前をもとに、テキスト中の住所の候補を
+検出する機能を提供します。
+
+- 地名は、市区町村データファイル（config/data/municipalities.tsv）から読み込みます。
+- すべての地名を、末尾から先頭へたどる1つのトライ木にまとめます。
+  地名の末尾になり得る文字（「都」「県」「市」「町」など）の位置を正規表現で1回走査して求め、
+  その位置からトライ木をさかのぼることで、すべての地名の出現位置が得られます。
+- 都道府県名に続く市区町村名を組にして住所の候補を作り、郵便番号との距離などで採点します。
+  最初に出現した都道府県名が住所と無関係な場合でも、郵便番号に近い住所を選べます。
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+import hashlib
+import re
+
+from config.constants import PREFECTURES
+from config.settings import Settings
+from core.scanner import ScanMatch
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+KIND_PREFECTURE = "prefecture"
+KIND_MUNICIPALITY = "municipality"
+
+# 都道府県名と市区町村名の間に許容する空白の文字数
+MAX_NAME_GAP = 1
+# 郵便番号と住所の候補の距離（文字数）がこの値以下なら近いとみなす
+POSTAL_PROXIMITY = 20
+
+# 採点の重み
+SCORE_PREFECTURE = 2  # 都道府県名がある
+SCORE_CITY = 3  # 市区町村名がある
+SCORE_STREET = 2  # 番地まである
+SCORE_NEAR_POSTAL_CODE = 4  # 郵便番号が近くにある
+
+# 市区町村名の後ろの番地までの住所（従来の住所パターンと同じ）
+_STREET_PATTERN = re.compile(
+    r'[^\s。、]{5,50}?(?:\d+[-ー\s]?\d+[-ー\s]?\d+|[0-9０-９]+[-ー\s]?[0-9０-９]+)'
+)
+_BRACKETS_PATTERN = re.compile(r'[「」『』【】\(\)]')
+# 郡部の町村（「〇〇郡〇〇町」）と政令指定都市の区（「〇〇市〇〇区」）
+_COUNTY_PATTERN = re.compile(r'^(.+?郡)(.+[町村])$')
+_WARD_PATTERN = re.compile(r'^(.+?市)(.+?区)$')
+# トライ木で地名の先頭に達したことを示すキー（1文字のキーと衝突しない）
+_TERMINAL = ""
+
+
+@dataclass(frozen=True)
+class GazetteerEntry:
+    """地名の見出し語に対応する地名"""
+    kind: str
+    prefecture: str
+    city: Optional[str] = None  # 市区町村データの表記（都道府県の場合はNone）
+
+
+@dataclass
+class GazetteerMatch:
+    """テキスト中の地名の出現"""
+    name: str  # テキスト中の表記
+    start: int
+    end: int
+    entries: tuple[GazetteerEntry, ...]
+
+    @property
+    def is_prefecture(self) -> bool:
+        return self.entries[0].kind == KIND_PREFECTURE
+
+
+@dataclass
+class AddressCandidate:
+    """住所の候補"""
+    start: int
+    end: int
+    prefecture: str
+    city: Optional[str] = None
+    address: Optional[str] = None  # 番地までの住所（見つからない場合はNone）
+    explicit_prefecture: bool = True  # テキストに都道府県名があるか（Falseは市区町村名から推定）
+    postal_match: Optional[ScanMatch] = None  # 近くにある郵便番号
+    score: int = 0
+
+
+class AddressGazetteer:
+    """都道府県・市区町村の地名辞書
+
+    コンパイル済みの正規表現を保持するため、インスタンスは使い回してください。
+    """
+
+    def __init__(self, municipalities: dict[str, list[str]]):
+        """初期化
+
+        Args:
+            municipalities: 都道府県名をキー、市区町村名のリストを値とする辞書
+        """
+        self._entries: dict[str, list[GazetteerEntry]] = {}
+        for prefecture in PREFECTURES:
+            self._add(prefecture, GazetteerEntry(KIND_PREFECTURE, prefecture))
+        for prefecture, cities in municipalities.items():
+            for city in cities:
+                for name, canonical in _name_variants(city):
+                    self._add(name, GazetteerEntry(KIND_MUNICIPALITY, prefecture, canonical))
+
+        self._trie = reversed_trie(self._entries)
+        self._suffix_pattern = re.compile(f"[{''.join(sorted({re.escape(name[-1]) for name in self._entries}))}]")
+        self.fingerprint = hashlib.blake2b(
+            "\n".join(sorted(self._entries)).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        logger.debug(f"AddressGazetteer compiled {len(self._entries)} names")
+
+    @classmethod
+    def from_file(cls, path: Optional[Path] = None) -> "AddressGazetteer":
+        """市区町村データファイルから作成
+
+        ファイルを読み込めない場合は、都道府県名のみの辞書になります。
+
+        Args:
+            path: 市区町村データファイルのパス（Noneの場合は設定値）
+
+        Returns:
+            地名辞書
+        """
+        path = Path(path or Settings.MUNICIPALITIES_PATH)
+        municipalities: dict[str, list[str]] = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.rstrip("\n")
+                    if not line or line.startswith("#"):
+                        continue
+                    prefecture, _, cities = line.partition("\t")
+                    municipalities[prefecture] = [city for city in cities.split(",") if city]
+        except OSError as e:
+            logger.error(f"Failed to load municipalities from {path}: {e}")
+        return cls(municipalities)
+
+    def find_mentions(self, text: str) -> list[GazetteerMatch]:
+        """テキスト中の地名の出現をすべて検出
+
+        重なる出現は、開始位置が前のもの、同じ位置からは長いものを優先します（最長一致）。
+
+        Args:
+            text: 検索対象のテキスト
+
+        Returns:
+            出現位置の順の地名の出現のリスト（重なりなし）
+        """
+        text = text or ""
+        spans = []
+        for suffix in self._suffix_pattern.finditer(text):
+            end = suffix.end()
+            node = self._trie
+            position = end - 1
+            while position >= 0:
+                node = node.get(text[position])
+                if node is None:
+                    break
+                if _TERMINAL in node:
+                    spans.append((position, end))
+                position -= 1
+
+        spans.sort(key=lambda span: (span[0], -span[1]))
+        mentions = []
+        last_end = 0
+        for start, end in spans:
+            if start < last_end:
+                continue
+            name = text[start:end]
+            mentions.append(GazetteerMatch(name, start, end, tuple(self._entries[name])))
+            last_end = end
+        return mentions
+
+    def find_candidates(self, text: str, postal_matches: Iterable[ScanMatch] = ()) -> list[AddressCandidate]:
+        """テキスト中の住所の候補を検出して採点
+
+        都道府県名（と続く市区町村名）、または都道府県を特定できる市区町村名から
+        候補を作ります。都道府県を特定できない市区町村名（「府中市」など）のみの場合と、
+        市区町村名のみで番地も近くの郵便番号もない場合は候補にしません。
+
+        Args:
+            text: 検索対象のテキスト
+            postal_matches: テキスト中の郵便番号の一致（採点に使用）
+
+        Returns:
+            スコアの高い順（同点は出現位置の順）の住所の候補のリスト
+        """
+        text = text or ""
+        postal_matches = list(postal_matches)
+        mentions = self.find_mentions(text)
+        candidates = []
+
+        index = 0
+        while index < len(mentions):
+            mention = mentions[index]
+            index += 1
+
+            if mention.is_prefecture:
+                prefecture = mention.name
+                city_entry = None
+                if index < len(mentions):
+                    city_entry = self._following_city(text, mention, mentions[index])
+                    if city_entry is not None:
+                        index += 1
+                candidate = AddressCandidate(
+                    start=mention.start,
+                    end=mentions[index - 1].end if city_entry else mention.end,
+                    prefecture=prefecture,
+                    city=city_entry.city if city_entry else None
+                )
+                street_start = mention.end
+            else:
+                prefectures = {entry.prefecture for entry in mention.entries}
+                if len(prefectures) != 1:
+                    continue
+                entry = mention.entries[0]
+                candidate = AddressCandidate(
+                    start=mention.start, end=mention.end, prefecture=entry.prefecture,
+                    city=entry.city, explicit_prefecture=False
+                )
+                street_start = mention.start
+
+            street = _STREET_PATTERN.match(text, street_start)
+            if street:
+                candidate.address = _BRACKETS_PATTERN.sub('', text[candidate.start:street.end()]).strip()
+                candidate.end = max(candidate.end, street.end())
+
+            candidate.postal_match = _nearest_postal_code(candidate, postal_matches)
+            # 市区町村名のみの場合は、番地か郵便番号がなければ住所とみなさない（「港区」などの一般的な記述）
+            if not candidate.explicit_prefecture and not candidate.address and candidate.postal_match is None:
+                continue
+            candidate.score = _score(candidate)
+            candidates.append(candidate)
+
+        candidates.sort(key=lambda candidate: (-candidate.score, candidate.start))
+        return candidates
+
+    def _add(self, name: str, entry: GazetteerEntry) -> None:
+        entries = self._entries.setdefault(name, [])
+        if entry not in entries:
+            entries.append(entry)
+
+    def _following_city(
+        self, text: str, prefecture: GazetteerMatch, mention: GazetteerMatch
+    ) -> Optional[GazetteerEntry]:
+        """都道府県名の直後にある、その都道府県の市区町村名を取得"""
+        gap = text[prefecture.end:mention.start]
+        if len(gap) > MAX_NAME_GAP or gap.strip():
+            return None
+        for entry in mention.entries:
+            if entry.kind == KIND_MUNICIPALITY and entry.prefecture == prefecture.name:
+                return entry
+        return None
+
+
+def reversed_trie(names: Iterable[str]) -> dict:
+    """地名を末尾から先頭の順にたどるトライ木を作成
+
+    Args:
+        names: 地名
+
+    Returns:
+        文字をキーとする入れ子の辞書（地名の先頭に達したノードは_TERMINALキーを持つ）
+    """
+    trie: dict = {}
+    for name in names:
+        node = trie
+        for char in reversed(name):
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = True
+    return trie
+
+
+def _name_variants(city: str) -> list[tuple[str, str]]:
+    """市区町村名の表記のバリエーション
+
+    郡部の町村は郡名を省略した表記（市区町村名は郡名付き）、
+    政令指定都市の区は市名のみの表記（市区町村名も市名のみ）も追加します。
+
+    Returns:
+        （表記, 市区町村名）のリスト
+    """
+    variants = [(city, city)]
+    county = _COUNTY_PATTERN.match(city)
+    if county:
+        variants.append((county.group(2), city))
+    ward = _WARD_PATTERN.match(city)
+    if ward:
+        variants.append((ward.group(1), ward.group(1)))
+    return variants
+
+
+def _nearest_postal_code(candidate: AddressCandidate, postal_matches: list[ScanMatch]) -> Optional[ScanMatch]:
+    """住所の候補の近くにある郵便番号を取得（前にある郵便番号を優先）"""
+    nearest = None
+    nearest_distance = POSTAL_PROXIMITY + 1
+    for match in postal_matches:
+        if match.end <= candidate.start:
+            distance = candidate.start - match.end
+        elif match.start >= candidate.end:
+            distance = match.start - candidate.end + 1
+        else:
+            continue
+        if distance < nearest_distance:
+            nearest, nearest_distance = match, distance
+    return nearest
+
+
+def _score(candidate: AddressCandidate) -> int:
+    score = 0
+    if candidate.explicit_prefecture:
+        score += SCORE_PREFECTURE
+    if candidate.city:
+        score += SCORE_CITY
+    if candidate.address:
+        score += SCORE_STREET
+    if candidate.postal_match is not None:
+        score += SCORE_NEAR_POSTAL_CODE
+    return score
+
+
+_default_gazetteer: Optional[AddressGazetteer] = None
+
+
+def get_default_gazetteer() -> AddressGazetteer:
+    """市区町村データファイルから作成した共有のAddressGazetteerを取得
+
+    Returns:
+        共有のAddressGazetteer（初回呼び出し時に作成）
+    """
+    global _default_gazetteer
+    if _default_gazetteer is None:
+        _default_gazetteer = AddressGazetteer.from_file()
+    return _default_gazetteer
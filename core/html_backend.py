@@ -0,0 +1,333 @@
+"""HTMLパーサーのバックエンドモジュール
+
+このモジュールは、HTMLの解析方法を切り替えるためのバックエンドを提供します。
+InfoExtractor（ParsedDocumentの作成）とGoogleSearcher（検索結果の解析）が利用します。
+
+- LxmlBackend: lxml.htmlで直接解析します（デフォルト、高速）。
+  script/style/svg/noscript/templateタグはツリー上で中身を削除します。
+- BeautifulSoupBackend: BeautifulSoup（lxmlパーサー）で解析します（従来の方法、互換性のため）。
+
+どちらのバックエンドも、同じHTMLから同じParsedDocumentを作成します。
+"""
+
+from typing import Any, Optional
+import re
+
+from bs4 import BeautifulSoup
+from lxml import etree
+import lxml.html
+
+from config.settings import Settings
+from core.document import (
+    REGION_FOOTER, REGION_HEADER, REGION_MAIN, DocumentLink, MicrodataProperty, ParsedDocument,
+    normalize_whitespace,
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# テキストの抽出前に中身を削除するタグ
+STRIP_TAGS = ("script", "style", "svg", "noscript", "template")
+
+# </html>の後ろの内容はlibxml2が破棄するため、解析前に閉じタグを除去する
+_HTML_END_TAG_PATTERN = re.compile(r'</html\s*>', re.IGNORECASE)
+
+# リンクの位置を決める要素（タグ名・role属性・id/class属性の語）
+_REGION_TAGS = {"header": REGION_HEADER, "footer": REGION_FOOTER}
+_REGION_ROLES = {"banner": REGION_HEADER, "contentinfo": REGION_FOOTER}
+# id/class属性の値のうち、"header"・"footer"を"-"・"_"・空白で区切られた語として含むもの（"site-footer"など）
+_REGION_NAME_PATTERN = re.compile(r'(?<![^\s_-])(header|footer)(?![^\s_-])')
+
+# microdataのプロパティ値を属性から取得するタグ（HTML仕様の値の規則）
+_MICRODATA_VALUE_ATTRIBUTES = {
+    "meta": "content",
+    "a": "href", "area": "href", "link": "href",
+    "img": "src", "audio": "src", "video": "src", "source": "src", "iframe": "src", "embed": "src",
+    "object": "data",
+    "time": "datetime",
+    "data": "value", "meter": "value",
+}
+
+
+class HtmlBackend:
+    """HTMLパーサーのバックエンドの基底クラス
+
+    ParsedDocumentの作成と、CSSセレクタによる要素の検索を提供します。
+    要素の型はバックエンドごとに異なるため、要素の操作はバックエンドのメソッドで行ってください。
+    """
+
+    name = ""
+
+    def parse_document(self, html: str) -> ParsedDocument:
+        """HTMLを解析してParsedDocumentを作成
+
+        Args:
+            html: 解析対象のHTML文字列
+
+        Returns:
+            解析済みのドキュメント。解析に失敗した場合は、テキストにHTMLをそのまま持つ
+        """
+        document = ParsedDocument(html=html or "", backend=self.name)
+        if not html:
+            return document
+
+        try:
+            self._fill_document(document, html)
+        except Exception as e:
+            logger.error(f"Error parsing HTML ({self.name}): {e}")
+            document.text = html
+
+        return document
+
+    def parse_tree(self, html: str) -> Any:
+        """HTMLを解析してルート要素を取得（タグの削除は行わない）"""
+        raise NotImplementedError
+
+    def select(self, node: Any, selector: str) -> list:
+        """CSSセレクタに一致する要素をすべて取得"""
+        raise NotImplementedError
+
+    def select_one(self, node: Any, selector: str) -> Optional[Any]:
+        """CSSセレクタに一致する最初の要素を取得"""
+        elements = self.select(node, selector)
+        return elements[0] if elements else None
+
+    def get_text(self, node: Any, strip: bool = False) -> str:
+        """要素のテキストを取得（strip=Trueの場合は各文字列の前後の空白を除去して連結）"""
+        raise NotImplementedError
+
+    def get_attribute(self, node: Any, name: str, default: str = "") -> str:
+        """要素の属性値を取得"""
+        raise NotImplementedError
+
+    def _fill_document(self, document: ParsedDocument, html: str) -> None:
+        raise NotImplementedError
+
+
+class BeautifulSoupBackend(HtmlBackend):
+    """BeautifulSoup（lxmlパーサー）によるバックエンド"""
+
+    name = "beautifulsoup"
+
+    def parse_tree(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, 'lxml')
+
+    def select(self, node: Any, selector: str) -> list:
+        return node.select(selector)
+
+    def select_one(self, node: Any, selector: str) -> Optional[Any]:
+        return node.select_one(selector)
+
+    def get_text(self, node: Any, strip: bool = False) -> str:
+        return node.get_text(strip=strip)
+
+    def get_attribute(self, node: Any, name: str, default: str = "") -> str:
+        return node.get(name, default)
+
+    def _fill_document(self, document: ParsedDocument, html: str) -> None:
+        soup = BeautifulSoup(html, 'lxml')
+
+        # head内のメタデータ（scriptタグを削除する前に取得）
+        document.json_ld = [
+            script.string for script in soup.find_all('script', type='application/ld+json')
+            if script.string
+        ]
+        if soup.title is not None:
+            document.title = soup.title.string
+        for meta in soup.find_all('meta'):
+            _add_meta(document, meta.get('property') or meta.get('name'), meta.get('content'))
+        base = soup.find('base', href=True)
+        if base is not None:
+            document.base_href = base['href'].strip()
+
+        for element in soup(list(STRIP_TAGS)):
+            element.decompose()
+
+        h1 = soup.find('h1')
+        if h1 is not None:
+            document.h1 = h1.get_text()
+
+        for anchor in soup.find_all('a', href=True):
+            parts = [anchor.get_text(" ", strip=True), anchor.get("title", "")]
+            parts.extend(image.get("alt", "") for image in anchor.find_all("img"))
+            region = next((
+                region for region in (
+                    element_region(parent.name, parent.get('role'), parent.get('id'), " ".join(parent.get('class') or ()))
+                    for parent in anchor.parents
+                ) if region
+            ), REGION_MAIN)
+            document.links.append(DocumentLink(
+                href=anchor['href'].strip(), text=_join_parts(parts),
+                rel=_normalize_rel(" ".join(anchor.get('rel') or ())), region=region
+            ))
+
+        for element in soup.find_all(attrs={'itemprop': True}):
+            if element.has_attr('itemscope'):
+                continue
+            scope = element.find_parent(attrs={'itemscope': True})
+            attribute = _MICRODATA_VALUE_ATTRIBUTES.get(element.name)
+            value = element.get(attribute) if attribute else None
+            if value is None:
+                value = element.get_text(separator=' ')
+            _add_microdata(document, element['itemprop'], scope.get('itemtype') if scope is not None else None, value)
+
+        document.text = normalize_whitespace(soup.get_text(separator=' '))
+        document.tree = soup
+
+
+class LxmlBackend(HtmlBackend):
+    """lxml.htmlによるバックエンド
+
+    CSSセレクタの利用にはcssselectパッケージが必要です。
+    """
+
+    name = "lxml"
+
+    def parse_tree(self, html: str) -> Optional[Any]:
+        # 文字列のままではXML宣言付きのHTMLを解析できないため、UTF-8のバイト列で渡す
+        html = _HTML_END_TAG_PATTERN.sub('', html)
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+        return etree.fromstring(html.encode('utf-8', errors='replace'), parser)
+
+    def select(self, node: Any, selector: str) -> list:
+        if node is None:
+            return []
+        return node.cssselect(selector)
+
+    def get_text(self, node: Any, strip: bool = False) -> str:
+        if strip:
+            return "".join(text.strip() for text in node.itertext())
+        return "".join(node.itertext())
+
+    def get_attribute(self, node: Any, name: str, default: str = "") -> str:
+        return node.get(name, default)
+
+    def _fill_document(self, document: ParsedDocument, html: str) -> None:
+        root = self.parse_tree(html)
+        if root is None:
+            # 空白やコメントのみのHTML
+            document.tree = root
+            return
+
+        # head内のメタデータ（scriptタグの中身を削除する前に取得）
+        document.json_ld = [
+            script.text for script in root.iter('script')
+            if script.get('type') == 'application/ld+json' and script.text
+        ]
+        title = next(root.iter('title'), None)
+        if title is not None and len(title) == 0:
+            document.title = title.text
+        for meta in root.iter('meta'):
+            _add_meta(document, meta.get('property') or meta.get('name'), meta.get('content'))
+        base = next((element for element in root.iter('base') if element.get('href') is not None), None)
+        if base is not None:
+            document.base_href = base.get('href').strip()
+
+        # 要素ごと削除すると前後のテキストが連結されるため、中身だけを削除する
+        for element in list(root.iter(*STRIP_TAGS)):
+            element.clear(keep_tail=True)
+
+        h1 = next(root.iter('h1'), None)
+        if h1 is not None:
+            document.h1 = "".join(h1.itertext())
+
+        for anchor in root.iter('a'):
+            href = anchor.get('href')
+            if href is None:
+                continue
+            parts = [" ".join(text.strip() for text in anchor.itertext() if text.strip()), anchor.get("title", "")]
+            parts.extend(image.get("alt", "") for image in anchor.iter("img"))
+            region = next((
+                region for region in (
+                    element_region(parent.tag, parent.get('role'), parent.get('id'), parent.get('class'))
+                    for parent in anchor.iterancestors()
+                ) if region
+            ), REGION_MAIN)
+            document.links.append(DocumentLink(
+                href=href.strip(), text=_join_parts(parts), rel=_normalize_rel(anchor.get('rel')), region=region
+            ))
+
+        for element in root.xpath('//*[@itemprop]'):
+            if element.get('itemscope') is not None:
+                continue
+            scope = next((parent for parent in element.iterancestors() if parent.get('itemscope') is not None), None)
+            attribute = _MICRODATA_VALUE_ATTRIBUTES.get(element.tag)
+            value = element.get(attribute) if attribute else None
+            if value is None:
+                value = " ".join(element.itertext())
+            _add_microdata(document, element.get('itemprop'), scope.get('itemtype') if scope is not None else None, value)
+
+        document.text = normalize_whitespace(" ".join(root.itertext()))
+        document.tree = root
+
+
+def _add_meta(document: ParsedDocument, key: Optional[str], content: Optional[str]) -> None:
+    """metaタグの値を追加（同じキーは最初の値を優先）"""
+    if key and content is not None and key.lower() not in document.meta:
+        document.meta[key.lower()] = content
+
+
+def _add_microdata(document: ParsedDocument, itemprop: str, item_type: Optional[str], value: str) -> None:
+    """microdataのプロパティを追加（itemprop属性の空白区切りの名前ごと）"""
+    # itemtypeはURL（"https://schema.org/LocalBusiness"など）のため、末尾の型名のみを保持する
+    type_name = item_type.split()[0].rstrip('/').rsplit('/', 1)[-1] if item_type and item_type.strip() else ""
+    value = normalize_whitespace(value)
+    for name in itemprop.split():
+        document.microdata.append(MicrodataProperty(item_type=type_name, name=name, value=value))
+
+
+def element_region(tag: str, role: Optional[str], element_id: Optional[str], classes: Optional[str]) -> Optional[str]:
+    """要素がページのヘッダー・フッターを表す場合はその位置（REGION_HEADER・REGION_FOOTER）、それ以外はNone
+
+    Args:
+        tag: タグ名（小文字）
+        role: role属性の値
+        element_id: id属性の値
+        classes: class属性の値（空白区切り）
+    """
+    region = _REGION_TAGS.get(tag)
+    if region is None and role:
+        region = _REGION_ROLES.get(role.strip().lower())
+    if region is None and (element_id or classes):
+        match = _REGION_NAME_PATTERN.search(f"{element_id or ''} {classes or ''}".lower())
+        region = match.group(1) if match else None
+    return region
+
+
+def _normalize_rel(rel: Optional[str]) -> str:
+    """rel属性の値を小文字・空白区切りにそろえる"""
+    return " ".join(rel.lower().split()) if rel else ""
+
+
+def _join_parts(parts: list[str]) -> str:
+    return " ".join(part for part in parts if part)
+
+
+PARSER_BACKENDS: dict[str, type[HtmlBackend]] = {
+    LxmlBackend.name: LxmlBackend,
+    BeautifulSoupBackend.name: BeautifulSoupBackend,
+}
+
+_backends: dict[str, HtmlBackend] = {}
+
+
+def get_parser_backend(name: Optional[str] = None) -> HtmlBackend:
+    """HTMLパーサーのバックエンドを取得
+
+    Args:
+        name: バックエンド名（"lxml"または"beautifulsoup"、Noneの場合は設定値）
+
+    Returns:
+        バックエンド（名前ごとに共有のインスタンス）
+
+    Raises:
+        ValueError: 不明なバックエンド名の場合
+    """
+    name = (name or Settings.HTML_PARSER_BACKEND).lower()
+    backend = _backends.get(name)
+    if backend is None:
+        backend_class = PARSER_BACKENDS.get(name)
+        if backend_class is None:
+            raise ValueError(f"Unknown HTML parser backend: {name}")
+        backend = _backends[name] = backend_class()
+    return backend
@@ -0,0 +1,365 @@
+"""HTTPレスポンスをディスクにキャッシュするモジュール
+
+このモジュールは、WebScraper.fetch_pageで取得したページをSQLiteに保存し、
+再実行時に再利用する機能を提供します。新鮮なエントリはそのまま返し、
+期限切れのエントリはIf-None-Match/If-Modified-Sinceで再検証します。
+合計サイズが上限を超えた場合は、最も古く参照されたエントリから削除します（LRU）。
+"""
+
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+import json
+import re
+import sqlite3
+import threading
+import time
+
+from config.settings import Settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# キャッシュに保存するレスポンスヘッダー
+CACHED_HEADERS = ("content-type", "etag", "last-modified", "cache-control", "expires", "date")
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """キャッシュキー用にURLを正規化
+
+    スキーム・ホストの小文字化、デフォルトポートの除去、
+    フラグメントの除去、クエリパラメータのソートを行います。
+
+    Args:
+        url: URL
+
+    Returns:
+        正規化されたURL
+    """
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+
+    netloc = host
+    if parsed.port and parsed.port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{parsed.port}"
+
+    path = parsed.path or "/"
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+
+    return urlunparse((scheme, netloc, path, parsed.params, query, ""))
+
+
+@dataclass
+class CachedResponse:
+    """キャッシュされたレスポンス"""
+    url: str
+    body: bytes
+    headers: dict[str, str]
+    encoding: Optional[str]
+    stored_at: float
+    expires_at: float
+    final_url: Optional[str] = None  # リダイレクト後の最終的なURL（リダイレクトされていない場合はNone）
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("last-modified")
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """有効期限内かどうか"""
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """再検証用の条件付きリクエストヘッダー"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def text(self) -> str:
+        """本文を文字列として取得"""
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+
+@dataclass
+class CacheStats:
+    """キャッシュの利用統計"""
+    hits: int = 0  # 新鮮なエントリをそのまま返した回数
+    revalidated: int = 0  # 304で再検証できた回数
+    misses: int = 0  # キャッシュになかった・再検証で変更があった回数
+    stores: int = 0  # 保存した回数
+    evictions: int = 0  # LRUで削除した回数
+    bytes_served: int = 0  # キャッシュから返した本文のバイト数
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.revalidated + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """ダウンロードを省略できた割合（0.0〜1.0）"""
+        return (self.hits + self.revalidated) / self.lookups if self.lookups else 0.0
+
+    def report(self) -> str:
+        """ログ・画面出力用のレポート文字列"""
+        return (f"hits={self.hits}, revalidated={self.revalidated}, misses={self.misses}, "
+                f"hit_rate={self.hit_rate:.1%}, stores={self.stores}, evictions={self.evictions}, "
+                f"bytes_served={self.bytes_served}")
+
+
+class HttpCache:
+    """HTTPレスポンスのディスクキャッシュ
+
+    SQLiteファイルにURL（正規化済み）をキーとして本文とヘッダーを保存します。
+    複数スレッドから利用できるよう、内部でロックを使用します。
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        default_ttl: Optional[float] = None
+    ):
+        """初期化
+
+        Args:
+            path: キャッシュファイルのパス（Noneの場合は設定値）
+            max_bytes: キャッシュの最大サイズ（バイト、Noneの場合は設定値）
+            default_ttl: Cache-Control等がない場合の有効期間（秒、Noneの場合は設定値）
+        """
+        self.path = Path(path or Settings.HTTP_CACHE_PATH)
+        self.max_bytes = max_bytes if max_bytes is not None else Settings.HTTP_CACHE_MAX_BYTES
+        self.default_ttl = default_ttl if default_ttl is not None else Settings.HTTP_CACHE_DEFAULT_TTL
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                headers TEXT NOT NULL,
+                encoding TEXT,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL,
+                final_url TEXT
+            )
+            """
+        )
+        # final_url列がない古いキャッシュファイルには列を追加する
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "final_url" not in columns:
+            self._conn.execute("ALTER TABLE responses ADD COLUMN final_url TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON responses(last_access)")
+        self._conn.commit()
+        logger.info(f"HttpCache initialized (path={self.path}, max_bytes={self.max_bytes})")
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """キャッシュエントリを取得
+
+        期限切れのエントリも返します（再検証に使用するため）。
+
+        Args:
+            url: URL
+
+        Returns:
+            キャッシュエントリ。存在しない場合はNone
+        """
+        key = canonicalize_url(url)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, headers, encoding, stored_at, expires_at, final_url FROM responses WHERE url = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (time.time(), key))
+            self._conn.commit()
+
+        body, headers, encoding, stored_at, expires_at, final_url = row
+        return CachedResponse(
+            url=key,
+            body=body,
+            headers=json.loads(headers),
+            encoding=encoding,
+            stored_at=stored_at,
+            expires_at=expires_at,
+            final_url=final_url
+        )
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        headers: dict,
+        encoding: Optional[str] = None,
+        final_url: Optional[str] = None
+    ) -> None:
+        """レスポンスを保存
+
+        Cache-Control: no-storeが指定されている場合は保存しません。
+
+        Args:
+            url: URL
+            body: レスポンス本文
+            headers: レスポンスヘッダー
+            encoding: 本文の文字コード
+            final_url: リダイレクト後の最終的なURL（キャッシュから返すページの相対URLの解決に使用）
+        """
+        stored_headers = self._select_headers(headers)
+        if "no-store" in stored_headers.get("cache-control", "").lower():
+            logger.debug(f"Not caching (no-store): {url}")
+            return
+
+        if len(body) > self.max_bytes:
+            logger.debug(f"Not caching (too large: {len(body)} bytes): {url}")
+            return
+
+        now = time.time()
+        expires_at = now + self._freshness_lifetime(stored_headers, now)
+        key = canonicalize_url(url)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, body, headers, encoding, stored_at, expires_at, last_access, size, final_url) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(body), json.dumps(stored_headers), encoding,
+                 now, expires_at, now, len(body), final_url)
+            )
+            self._conn.commit()
+            self.stats.stores += 1
+            self._evict()
+
+        logger.debug(f"Cached response: {key} ({len(body)} bytes)")
+
+    def refresh(self, cached: CachedResponse, headers: dict) -> CachedResponse:
+        """304応答を受けてエントリの有効期限を更新
+
+        Args:
+            cached: 再検証したキャッシュエントリ
+            headers: 304レスポンスのヘッダー
+
+        Returns:
+            更新後のキャッシュエントリ
+        """
+        updated_headers = dict(cached.headers)
+        updated_headers.update(self._select_headers(headers))
+
+        now = time.time()
+        expires_at = now + self._freshness_lifetime(updated_headers, now)
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, stored_at = ?, expires_at = ?, last_access = ? "
+                "WHERE url = ?",
+                (json.dumps(updated_headers), now, expires_at, now, cached.url)
+            )
+            self._conn.commit()
+
+        cached.headers = updated_headers
+        cached.stored_at = now
+        cached.expires_at = expires_at
+        return cached
+
+    def record_hit(self, cached: CachedResponse) -> None:
+        """新鮮なエントリを返したことを記録"""
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.bytes_served += len(cached.body)
+
+    def record_revalidated(self, cached: CachedResponse) -> None:
+        """304で再検証できたことを記録"""
+        with self._lock:
+            self.stats.revalidated += 1
+            self.stats.bytes_served += len(cached.body)
+
+    def record_miss(self) -> None:
+        """キャッシュを利用できなかったことを記録"""
+        with self._lock:
+            self.stats.misses += 1
+
+    def total_size(self) -> int:
+        """保存されている本文の合計サイズ（バイト）"""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def clear(self) -> None:
+        """すべてのエントリを削除"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """キャッシュファイルを閉じる"""
+        logger.info(f"Closing HTTP cache ({self.stats.report()})")
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        """合計サイズが上限を超えている場合、LRUでエントリを削除（ロック取得済みで呼ぶ）"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute("SELECT url, size FROM responses ORDER BY last_access ASC").fetchall()
+        evicted = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((url,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM responses WHERE url = ?", evicted)
+        self._conn.commit()
+        self.stats.evictions += len(evicted)
+        logger.debug(f"Evicted {len(evicted)} cache entries")
+
+    def _select_headers(self, headers: dict) -> dict[str, str]:
+        """保存対象のヘッダーを小文字キーで抽出"""
+        return {
+            key.lower(): value
+            for key, value in headers.items()
+            if key.lower() in CACHED_HEADERS
+        }
+
+    def _freshness_lifetime(self, headers: dict[str, str], now: float) -> float:
+        """レスポンスの有効期間（秒）を計算
+
+        Cache-Controlのno-cache/max-age、Expiresの順に参照し、
+        どちらもない場合はdefault_ttlを使用します。
+        """
+        cache_control = headers.get("cache-control", "").lower()
+
+        if "no-cache" in cache_control:
+            return 0
+
+        max_age = re.search(r"max-age=(\d+)", cache_control)
+        if max_age:
+            return int(max_age.group(1))
+
+        expires = headers.get("expires")
+        if expires:
+            try:
+                return max(0.0, parsedate_to_datetime(expires).timestamp() - now)
+            except (TypeError, ValueError):
+                return 0
+
+        return self.default_ttl
@@ -0,0 +1,234 @@
+"""HTTPセッション・コネクションプールを管理するモジュール
+
+このモジュールは、WebScraper・GoogleSearcher・SearchAPIClientで共有する
+requests.Sessionを提供します。ホストごとにコネクションをプールして
+keep-aliveで再利用し、TCP/TLSハンドシェイクの回数を減らします。
+プールの利用状況（再利用回数・新規接続数）も集計できます。
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from config.settings import Settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class HostPoolStats:
+    """ホストごとのプール統計"""
+    requests: int = 0  # プールからコネクションを取り出した回数
+    new_connections: int = 0  # 新たに確立したTCP接続の数
+
+    @property
+    def hits(self) -> int:
+        """既存のコネクションを再利用した回数"""
+        return max(0, self.requests - self.new_connections)
+
+
+class PoolStats:
+    """コネクションプールの統計を集計するクラス
+
+    複数スレッドから更新されるため、内部でロックを使用します。
+    """
+
+    def __init__(self):
+        """初期化"""
+        self._hosts: dict[str, HostPoolStats] = {}
+        self._lock = threading.Lock()
+
+    def record_request(self, host: str) -> None:
+        """コネクションの取り出しを記録"""
+        with self._lock:
+            self._hosts.setdefault(host, HostPoolStats()).requests += 1
+
+    def record_new_connection(self, host: str) -> None:
+        """新規接続を記録"""
+        with self._lock:
+            self._hosts.setdefault(host, HostPoolStats()).new_connections += 1
+
+    @property
+    def requests(self) -> int:
+        with self._lock:
+            return sum(stats.requests for stats in self._hosts.values())
+
+    @property
+    def new_connections(self) -> int:
+        with self._lock:
+            return sum(stats.new_connections for stats in self._hosts.values())
+
+    @property
+    def hits(self) -> int:
+        with self._lock:
+            return sum(stats.hits for stats in self._hosts.values())
+
+    @property
+    def reuse_rate(self) -> float:
+        """コネクションの再利用率（0.0〜1.0）"""
+        requests_count = self.requests
+        return self.hits / requests_count if requests_count else 0.0
+
+    def by_host(self) -> dict[str, HostPoolStats]:
+        """ホストごとの統計のコピーを取得"""
+        with self._lock:
+            return {
+                host: HostPoolStats(stats.requests, stats.new_connections)
+                for host, stats in self._hosts.items()
+            }
+
+    def reset(self) -> None:
+        """統計をリセット"""
+        with self._lock:
+            self._hosts.clear()
+
+    def summary(self) -> str:
+        """ログ出力用のサマリー文字列"""
+        return (f"requests={self.requests}, hits={self.hits}, "
+                f"new_connections={self.new_connections}, reuse_rate={self.reuse_rate:.1%}")
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """統計収集とホストごとのプールサイズ指定に対応したHTTPAdapter
+
+    urllib3のコネクションプールとコネクションのクラスを差し替えて、
+    コネクションの取り出しと新規接続を記録します。
+    """
+
+    def __init__(
+        self,
+        stats: PoolStats,
+        pool_connections: int,
+        pool_maxsize: int,
+        host_pool_sizes: Optional[dict[str, int]] = None,
+        **kwargs
+    ):
+        """初期化
+
+        Args:
+            stats: 統計の記録先
+            pool_connections: プールを保持するホスト数
+            pool_maxsize: ホストごとの最大コネクション数（デフォルト）
+            host_pool_sizes: ホスト名ごとの最大コネクション数の上書き
+        """
+        self.stats = stats
+        self.host_pool_sizes = dict(host_pool_sizes or {})
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": self._make_pool_class(HTTPConnectionPool, HTTPConnection),
+            "https": self._make_pool_class(HTTPSConnectionPool, HTTPSConnection),
+        }
+
+    def _make_pool_class(self, pool_base: type, connection_base: type) -> type:
+        """統計を記録するプールクラスを作成"""
+        stats = self.stats
+        host_pool_sizes = self.host_pool_sizes
+
+        class CountingConnection(connection_base):
+            def connect(self):
+                stats.record_new_connection(self.host)
+                return super().connect()
+
+        class CountingConnectionPool(pool_base):
+            ConnectionCls = CountingConnection
+
+            def __init__(self, host, port=None, *args, **kwargs):
+                if host in host_pool_sizes:
+                    kwargs["maxsize"] = host_pool_sizes[host]
+                super().__init__(host, port, *args, **kwargs)
+
+            def _get_conn(self, timeout=None):
+                stats.record_request(self.host)
+                return super()._get_conn(timeout=timeout)
+
+        return CountingConnectionPool
+
+
+class HttpSessionPool:
+    """共有HTTPセッションを管理するクラス
+
+    コネクションプール付きのrequests.Sessionを作成し、統計を保持します。
+    通常はget_shared_session()でプロセス共通のインスタンスを使用します。
+    """
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        host_pool_sizes: Optional[dict[str, int]] = None
+    ):
+        """初期化
+
+        Args:
+            pool_connections: プールを保持するホスト数（Noneの場合は設定値）
+            pool_maxsize: ホストごとの最大コネクション数（Noneの場合は設定値）
+            host_pool_sizes: ホスト名ごとの最大コネクション数の上書き
+        """
+        self.pool_connections = pool_connections or Settings.HTTP_POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or Settings.HTTP_POOL_MAXSIZE
+        self.host_pool_sizes = host_pool_sizes or Settings.HTTP_HOST_POOL_SIZES
+        self.stats = PoolStats()
+        self.session = self._create_session()
+        logger.info(f"HttpSessionPool initialized (pool_connections={self.pool_connections}, "
+                    f"pool_maxsize={self.pool_maxsize})")
+
+    def _create_session(self) -> requests.Session:
+        """コネクションプール付きのセッションを作成"""
+        session = requests.Session()
+        adapter = PooledHTTPAdapter(
+            self.stats,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            host_pool_sizes=self.host_pool_sizes
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self) -> None:
+        """セッションを閉じる"""
+        logger.info(f"Closing HTTP session pool ({self.stats.summary()})")
+        self.session.close()
+
+
+_shared_pool: Optional[HttpSessionPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_pool() -> HttpSessionPool:
+    """プロセス共通のHttpSessionPoolを取得
+
+    Returns:
+        共有のHttpSessionPool（初回呼び出し時に作成）
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = HttpSessionPool()
+        return _shared_pool
+
+
+def get_shared_session() -> requests.Session:
+    """プロセス共通のrequests.Sessionを取得
+
+    Returns:
+        共有のセッション
+    """
+    return get_shared_pool().session
+
+
+def get_pool_stats() -> PoolStats:
+    """共有セッションのプール統計を取得
+
+    Returns:
+        プール統計
+    """
+    return get_shared_pool().stats
@@ -0,0 +1,123 @@
+"""リンク索引モジュール
+
+このモジュールは、ページのリンク（ParsedDocument.links）を種類ごとにまとめたAnchorIndexと、
+URLのSNSの種類の判定を提供します。索引は1ページにつき一度だけ作成し（ParsedDocument.anchors）、
+次の処理で共有します。HTMLを正規表現で走査し直すことはありません。
+
+- SNSリンクの抽出（InfoExtractor.extract_sns_links）: SNSのアカウントのリンク
+- 構造化データの取得（core.structured_data）: tel:/mailto:のリンク
+- 問い合わせページの巡回（ContactPageCrawler）: ページへのリンク（http(s)と相対URL）
+
+SNSの判定は、SNS_DOMAINSから作成したホスト名の接尾辞の表（SNS_HOST_SUFFIXES）を、
+ホスト名の末尾のラベルから順に引いて行います。共有ボタンなどのリンク（SNS_SHARE_PATHS）と
+トップページのリンクは、アカウントのリンクとみなしません。
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urlsplit
+import re
+
+from config.constants import SNS_DOMAINS, SNS_SHARE_PATHS
+from core.document import REGION_MAIN, DocumentLink
+
+SCHEME_TEL = "tel"
+SCHEME_MAILTO = "mailto"
+# ページへのリンクのスキーム（空文字列は相対URL）
+PAGE_SCHEMES = ("", "http", "https")
+
+# ホスト名の接尾辞（SNSのドメイン）→ SNS名
+SNS_HOST_SUFFIXES: dict[str, str] = {
+    domain: name for name, domains in SNS_DOMAINS.items() for domain in domains
+}
+
+# URLのスキーム（RFC 3986）
+_SCHEME_PATTERN = re.compile(r'[A-Za-z][A-Za-z0-9+.\-]*')
+
+
+@dataclass
+class AnchorIndex:
+    """1ページのリンクの索引
+
+    各リストはページ内の出現順です。同じhrefのリンクも、それぞれ索引に含めます。
+    """
+    tel: list[DocumentLink] = field(default_factory=list)  # tel:のリンク
+    mailto: list[DocumentLink] = field(default_factory=list)  # mailto:のリンク
+    sns: dict[str, list[DocumentLink]] = field(default_factory=dict)  # SNS名 → アカウントのリンク
+    pages: list[DocumentLink] = field(default_factory=list)  # http(s)と相対URLのリンク（SNSを含む）
+
+    @classmethod
+    def build(cls, links: list[DocumentLink]) -> "AnchorIndex":
+        """リンクのリストから索引を作成"""
+        index = cls()
+        for link in links:
+            scheme = link_scheme(link.href)
+            if scheme == SCHEME_TEL:
+                index.tel.append(link)
+            elif scheme == SCHEME_MAILTO:
+                index.mailto.append(link)
+            elif scheme in PAGE_SCHEMES:
+                index.pages.append(link)
+                name = classify_sns_url(link.href) if scheme else None
+                if name is not None:
+                    index.sns.setdefault(name, []).append(link)
+        return index
+
+    def sns_urls(self) -> dict[str, list[str]]:
+        """SNS名 → アカウントのURLのリスト
+
+        ヘッダー・フッターのリンクとrel="me"のリンク（サイト自身のアカウントである可能性が高い）を
+        本文のリンクより先に並べます。同じURLは1つにまとめます。
+        """
+        result = {}
+        for name, links in self.sns.items():
+            ordered = sorted(links, key=lambda link: link.region == REGION_MAIN and "me" not in link.rel.split())
+            result[name] = list(dict.fromkeys(link.href for link in ordered))
+        return result
+
+
+def link_scheme(href: str) -> str:
+    """hrefのスキーム（小文字）。相対URLの場合は空文字列"""
+    scheme, separator, _ = href.partition(":")
+    if not separator or not _SCHEME_PATTERN.fullmatch(scheme):
+        return ""
+    return scheme.lower()
+
+
+def classify_sns_url(url: str) -> Optional[str]:
+    """URLのホスト名からSNSの種類を判定
+
+    Args:
+        url: URL
+
+    Returns:
+        SNS名（SNS_DOMAINSのキー）。SNSのアカウントなどのURLでない場合
+        （トップページ・共有ボタンのURLを含む）はNone
+    """
+    try:
+        parsed = urlsplit(url.strip())
+        host = (parsed.hostname or "").lower()
+    except ValueError:
+        return None
+    if parsed.scheme not in ("http", "https") or not host:
+        return None
+    path = parsed.path.strip("/").lower()
+    if not path or _is_share_path(path):
+        return None
+    return sns_name_for_host(host)
+
+
+def sns_name_for_host(host: str) -> Optional[str]:
+    """ホスト名（小文字）がSNSのドメインまたはそのサブドメインであれば、SNS名を返す"""
+    while host:
+        name = SNS_HOST_SUFFIXES.get(host)
+        if name is not None:
+            return name
+        host = host.partition(".")[2]
+    return None
+
+
+def _is_share_path(path: str) -> bool:
+    """前後の"/"を除いた小文字のパスが共有ボタンなどのパスかどうか"""
+    path += "/"
+    return any(path.startswith(prefix + "/") for prefix in SNS_SHARE_PATHS)
@@ -0,0 +1,300 @@
+"""パターンパックの登録モジュール
+
+このモジュールは、本文の走査に使う正規表現パターンをパターンパック（config/patterns/*.json）から
+読み込むPatternRegistryを提供します。
+
+- パックは、日本の電話番号（jp_phone）・メールアドレス（email）・郵便番号（jp_address）・
+  営業時間と定休日（business_hours）と、業種別のパック（medicalなど）です。
+  使用するパックと優先順はSettings.PATTERN_PACKSで指定します。
+- パックのファイルは、そのパックを最初に使うときに読み込みます（使わないパックは読み込みません）。
+- 読み込み時に形式を検証し、すべてのパターンをコンパイルします（core.scanner.PatternSpec）。
+  種類ごとにまとめた正規表現も、パックごとと複数のパックをまとめるときにコンパイルして検証します。
+  不正なパックはPatternPackErrorになり、一部のパターンだけを使うことはありません。
+- 各パックはバージョンを持ち、抽出結果キャッシュのキー（InfoExtractorのフィンガープリント）に含めます。
+
+パックの形式:
+
+    {
+      "name": "jp_phone",  # ファイル名（拡張子を除く）と同じ
+      "version": "1",
+      "description": "説明",
+      "patterns": {
+        "phone": [{"pattern": "0\\\\d{1,4}-\\\\d{1,4}-\\\\d{4}", "label": "ハイフン区切り"}, ...],
+        ...
+      }
+    }
+
+パターンは優先度の高い順に並べます。"label"は省略でき、パターンは文字列だけでも指定できます。
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+import json
+import re
+import threading
+
+from config.settings import Settings
+from core.scanner import PatternScanner, PatternSpec, combine_patterns
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# パターンパックのファイルの拡張子
+PACK_SUFFIX = ".json"
+
+# パック名・種類名として使える文字列
+_NAME_PATTERN = re.compile(r'[a-z][a-z0-9_]*')
+# パターンの項目で使えるキー
+_ENTRY_KEYS = frozenset({"pattern", "label"})
+
+
+class PatternPackError(ValueError):
+    """パターンパックを読み込めない、または形式が不正"""
+
+
+@dataclass
+class PatternPack:
+    """読み込み済みのパターンパック"""
+    name: str
+    version: str
+    description: str = ""
+    patterns: dict[str, list[PatternSpec]] = field(default_factory=dict)  # 種類 → パターン（優先度の順）
+    path: Optional[Path] = None
+
+    @property
+    def compile_ms(self) -> float:
+        """すべてのパターンのコンパイル時間の合計（ミリ秒）"""
+        return sum(spec.compile_ms for specs in self.patterns.values() for spec in specs)
+
+    @classmethod
+    def load(cls, path: Path) -> "PatternPack":
+        """パターンパックのファイルを読み込み、検証してコンパイル
+
+        Args:
+            path: パターンパックのファイルのパス
+
+        Returns:
+            パターンパック
+
+        Raises:
+            PatternPackError: ファイルを読み込めない場合・形式が不正な場合・不正なパターンがある場合
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise PatternPackError(f"Failed to load pattern pack {path}: {e}") from e
+        return cls.from_dict(data, path)
+
+    @classmethod
+    def from_dict(cls, data, path: Optional[Path] = None) -> "PatternPack":
+        """パターンパックの内容を検証してコンパイル
+
+        Args:
+            data: パターンパックのJSONの内容
+            path: パターンパックのファイルのパス（エラーメッセージとファイル名の照合に使用）
+
+        Returns:
+            パターンパック
+
+        Raises:
+            PatternPackError: 形式が不正な場合・不正なパターンがある場合
+        """
+        source = str(path) if path else "<pattern pack>"
+        if not isinstance(data, dict):
+            raise PatternPackError(f"Pattern pack is not a JSON object: {source}")
+
+        name = data.get("name")
+        if not isinstance(name, str) or not _NAME_PATTERN.fullmatch(name):
+            raise PatternPackError(f"Invalid pack name {name!r}: {source}")
+        if path is not None and path.stem != name:
+            raise PatternPackError(f"Pack name {name!r} does not match the file name: {source}")
+        version = data.get("version")
+        if not isinstance(version, str) or not version:
+            raise PatternPackError(f"Pack {name} has no version: {source}")
+        description = data.get("description", "")
+        if not isinstance(description, str):
+            raise PatternPackError(f"Pack {name} has an invalid description: {source}")
+        kinds = data.get("patterns")
+        if not isinstance(kinds, dict) or not kinds:
+            raise PatternPackError(f"Pack {name} has no patterns: {source}")
+
+        patterns = {}
+        for kind, entries in kinds.items():
+            if not _NAME_PATTERN.fullmatch(kind):
+                raise PatternPackError(f"Invalid kind {kind!r} in pack {name}: {source}")
+            if not isinstance(entries, list) or not entries:
+                raise PatternPackError(f"Pack {name} has no {kind} patterns: {source}")
+            patterns[kind] = [_compile_entry(name, kind, index, entry) for index, entry in enumerate(entries)]
+            _check_combined(kind, patterns[kind], f"pack {name}")
+
+        pack = cls(name=name, version=version, description=description, patterns=patterns, path=path)
+        logger.debug(f"Loaded pattern pack {name}@{version}: "
+                     f"{sum(len(specs) for specs in patterns.values())} patterns in {pack.compile_ms:.2f} ms")
+        return pack
+
+
+class PatternRegistry:
+    """パターンパックの登録
+
+    パックはファイル名（拡張子を除く）で指定し、最初に使うときに読み込みます。
+    読み込んだパックと作成したPatternScannerは保持して使い回します。複数スレッドから利用できます。
+    """
+
+    def __init__(self, directory: Optional[Path] = None, default_packs: Optional[Iterable[str]] = None):
+        """初期化
+
+        Args:
+            directory: パターンパックのディレクトリ（Noneの場合は設定値）
+            default_packs: 既定で使うパック名（優先度の順、Noneの場合は設定値）
+        """
+        self.directory = Path(directory or Settings.PATTERN_PACKS_DIR)
+        self.default_packs = tuple(default_packs if default_packs is not None else Settings.PATTERN_PACKS)
+        self._packs: dict[str, PatternPack] = {}
+        self._scanners: dict[tuple[str, ...], PatternScanner] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def available(self) -> list[str]:
+        """ディレクトリにあるパック名（ファイルは読み込まない）"""
+        if not self.directory.is_dir():
+            return []
+        return sorted(path.stem for path in self.directory.glob(f"*{PACK_SUFFIX}"))
+
+    @property
+    def loaded(self) -> list[str]:
+        """読み込み済みのパック名"""
+        return list(self._packs)
+
+    def pack(self, name: str) -> PatternPack:
+        """パックを取得（初回はファイルを読み込んで検証）
+
+        Raises:
+            PatternPackError: パックがない場合・形式が不正な場合
+        """
+        with self._lock:
+            pack = self._packs.get(name)
+            if pack is None:
+                if not _NAME_PATTERN.fullmatch(name):
+                    raise PatternPackError(f"Invalid pack name: {name!r}")
+                path = self.directory / f"{name}{PACK_SUFFIX}"
+                if not path.is_file():
+                    raise PatternPackError(f"Pattern pack not found: {name} ({self.directory})")
+                pack = PatternPack.load(path)
+                self._packs[name] = pack
+            return pack
+
+    def patterns(self, names: Optional[Iterable[str]] = None) -> dict[str, list[PatternSpec]]:
+        """パックのパターンを種類ごとにまとめる
+
+        先に指定したパックのパターンを優先します。同じ種類の同じパターンは、最初のものだけを使います。
+
+        Args:
+            names: パック名（Noneの場合は既定のパック）
+
+        Returns:
+            種類 → パターン（優先度の順）の辞書
+
+        Raises:
+            PatternPackError: パックがない場合・形式が不正な場合・まとめた正規表現が不正になる場合
+        """
+        names = self._names(names)
+        merged: dict[str, list[PatternSpec]] = {}
+        for name in names:
+            for kind, specs in self.pack(name).patterns.items():
+                kind_specs = merged.setdefault(kind, [])
+                seen = {spec.pattern for spec in kind_specs}
+                for spec in specs:
+                    if spec.pattern in seen:
+                        logger.warning(f"Duplicate {kind} pattern in pack {name} ignored: {spec.pattern}")
+                        continue
+                    kind_specs.append(spec)
+        if len(names) > 1:
+            for kind, kind_specs in merged.items():
+                _check_combined(kind, kind_specs, f"packs {', '.join(names)}")
+        return merged
+
+    def versions(self, names: Optional[Iterable[str]] = None) -> dict[str, str]:
+        """パック名 → バージョン"""
+        return {name: self.pack(name).version for name in self._names(names)}
+
+    def scanner(self, names: Optional[Iterable[str]] = None) -> PatternScanner:
+        """パックのパターンをまとめたPatternScannerを取得（同じパックの組み合わせには同じ照合器を返す）
+
+        Args:
+            names: パック名（Noneの場合は既定のパック）
+
+        Raises:
+            PatternPackError: パックがない場合・形式が不正な場合
+        """
+        key = self._names(names)
+        with self._lock:
+            scanner = self._scanners.get(key)
+            if scanner is None:
+                scanner = PatternScanner(self.patterns(key), self.versions(key))
+                self._scanners[key] = scanner
+                logger.info(f"Pattern packs in use: {', '.join(f'{n}@{v}' for n, v in scanner.versions.items())}")
+            return scanner
+
+    def _names(self, names: Optional[Iterable[str]]) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(names if names is not None else self.default_packs))
+
+
+def _compile_entry(pack: str, kind: str, index: int, entry) -> PatternSpec:
+    """パターンの項目を検証してコンパイル
+
+    Raises:
+        PatternPackError: 項目の形式が不正な場合・パターンが不正な場合・空文字列に一致するパターンの場合
+    """
+    location = f"{pack}/{kind}[{index}]"
+    if isinstance(entry, str):
+        entry = {"pattern": entry}
+    if not isinstance(entry, dict):
+        raise PatternPackError(f"Pattern {location} must be a string or an object")
+    unknown = set(entry) - _ENTRY_KEYS
+    if unknown:
+        raise PatternPackError(f"Unknown keys in pattern {location}: {', '.join(sorted(unknown))}")
+    pattern = entry.get("pattern")
+    label = entry.get("label", "")
+    if not isinstance(pattern, str) or not pattern:
+        raise PatternPackError(f"Pattern {location} is empty")
+    if not isinstance(label, str):
+        raise PatternPackError(f"Label of pattern {location} must be a string")
+
+    try:
+        spec = PatternSpec.compile(kind, pattern, pack=pack, label=label)
+    except re.error as e:
+        raise PatternPackError(f"Invalid regex in pattern {location} '{pattern}': {e}") from e
+    # 空文字列に一致するパターンは、走査で一致を返さないまま位置ごとに照合されるため許可しない
+    if spec.compiled.match("") is not None:
+        raise PatternPackError(f"Pattern {location} matches an empty string: '{pattern}'")
+    return spec
+
+
+def _check_combined(kind: str, specs: list[PatternSpec], source: str) -> None:
+    """種類ごとにまとめた正規表現（PatternScannerが走査に使うもの）をコンパイルできるか検証
+
+    Raises:
+        PatternPackError: まとめた正規表現が不正な場合（インラインのグローバルフラグ・重複するグループ名・
+            グループ番号がずれる後方参照）
+    """
+    try:
+        combine_patterns([spec.compiled for spec in specs])
+    except re.error as e:
+        raise PatternPackError(f"Invalid regex in combined {kind} patterns of {source}: {e}") from e
+
+
+_default_registry: Optional[PatternRegistry] = None
+
+
+def get_pattern_registry() -> PatternRegistry:
+    """設定値のディレクトリとパックの共有のPatternRegistryを取得
+
+    Returns:
+        共有のPatternRegistry（初回呼び出し時に作成）
+    """
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = PatternRegistry()
+    return _default_registry
@@ -0,0 +1,312 @@
+"""郵便番号索引モジュール
+
+このモジュールは、郵便番号（7桁）から都道府県・市区町村・町域を引く索引を提供します。
+索引は日本郵便の郵便番号データ（KEN_ALL.CSV）から scripts/build_postal_index.py で作成し、
+読み込み時は解析せずにファイルをメモリマップします（起動時間がほとんどかかりません）。
+
+索引ファイルの形式（リトルエンディアン）:
+    ヘッダー: マジック（8バイト）、件数、市区町村数、文字列領域のサイズ（各uint32）
+    バケット: 上3桁ごとの開始位置（uint32 × 1001）
+    下4桁: 昇順（uint16 × 件数）
+    市区町村番号: uint16 × 件数
+    町域の位置: 文字列領域内の位置（uint32 × 件数）
+    市区町村: 都道府県番号（uint16）と名前の位置（uint32）の組 × 市区町村数
+    文字列領域: NUL終端のUTF-8文字列
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+import hashlib
+import mmap
+import re
+import struct
+import sys
+
+from config.constants import PREFECTURES
+from config.settings import Settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"JPPOST01"
+_HEADER = struct.Struct("<8sIII")
+_BUCKET_COUNT = 1000
+_CITY = struct.Struct("<HI")
+
+# 郵便番号の正規化（全角数字を半角に変換し、数字以外を除去）
+_DIGITS_TRANSLATION = str.maketrans("０１２３４５６７８９", "0123456789")
+_NON_DIGIT_PATTERN = re.compile(r"\D")
+
+# 町域として扱わないKEN_ALLの表記
+_TOWN_NOTE_PATTERN = re.compile(r"（.*$|^以下に掲載がない場合$|.*の次に.*番地がくる場合$")
+
+
+@dataclass
+class PostalAddress:
+    """郵便番号に対応する住所"""
+    postal_code: str  # ハイフン付きの形式（例: "100-0001"）
+    prefecture: str
+    city: str
+    town: str = ""  # 町域（複数の町域にまたがる郵便番号などは空文字列）
+
+
+class PostalIndex:
+    """メモリマップした郵便番号索引
+
+    複数スレッドから利用できます（読み取りのみ）。
+    """
+
+    def __init__(self, path: Path):
+        """初期化
+
+        Args:
+            path: 索引ファイルのパス
+
+        Raises:
+            OSError: ファイルを開けない場合
+            ValueError: 索引ファイルの形式が正しくない場合
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, count, city_count, strings_size = _HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                raise ValueError(f"Not a postal index file: {self.path}")
+
+            offset = _HEADER.size
+            self._buckets = self._array(offset, "I", _BUCKET_COUNT + 1)
+            offset += 4 * (_BUCKET_COUNT + 1)
+            self._codes = self._array(offset, "H", count)
+            offset += 2 * count
+            self._city_ids = self._array(offset, "H", count)
+            offset += 2 * count
+            self._towns = self._array(offset, "I", count)
+            offset += 4 * count
+            self._cities_offset = offset
+            self._strings_offset = offset + _CITY.size * city_count
+            if self._strings_offset + strings_size != len(self._mmap):
+                raise ValueError(f"Postal index file is truncated: {self.path}")
+        except (struct.error, TypeError, ValueError) as e:
+            self._mmap.close()
+            raise ValueError(f"Invalid postal index file {self.path}: {e}") from e
+
+        self.count = count
+        self._city_names: dict[int, tuple[str, str]] = {}
+        self.fingerprint = hashlib.blake2b(self._mmap[:_HEADER.size + 4 * (_BUCKET_COUNT + 1)],
+                                           digest_size=8).hexdigest()
+
+    def lookup(self, postal_code: str) -> Optional[PostalAddress]:
+        """郵便番号から住所を取得
+
+        Args:
+            postal_code: 郵便番号（"〒100-0001"、"1000001"、全角数字などの表記に対応）
+
+        Returns:
+            郵便番号に対応する住所。索引にない場合・7桁でない場合はNone
+        """
+        code = _parse_postal_code(postal_code)
+        index = self._find(code) if code is not None else -1
+        if index < 0:
+            return None
+
+        prefecture, city = self._city(self._city_ids[index])
+        return PostalAddress(
+            postal_code=f"{code // 10000:03d}-{code % 10000:04d}",
+            prefecture=prefecture,
+            city=city,
+            town=self._string(self._towns[index])
+        )
+
+    def lookup_city(self, postal_code: str) -> Optional[tuple[str, str]]:
+        """郵便番号から都道府県名と市区町村名のみを取得（町域をデコードしないため高速）
+
+        Args:
+            postal_code: 郵便番号（lookupと同じ表記に対応）
+
+        Returns:
+            （都道府県名, 市区町村名）。索引にない場合・7桁でない場合はNone
+        """
+        code = _parse_postal_code(postal_code)
+        index = self._find(code) if code is not None else -1
+        if index < 0:
+            return None
+        return self._city(self._city_ids[index])
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        """索引ファイルを閉じる"""
+        for view in (self._buckets, self._codes, self._city_ids, self._towns):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+
+    def _array(self, offset: int, typecode: str, length: int):
+        """ファイル内の数値の配列を取得（リトルエンディアンの環境ではコピーせずに参照）"""
+        size = struct.calcsize(typecode) * length
+        if offset + size > len(self._mmap):
+            raise ValueError("array exceeds file size")
+        if sys.byteorder == "little":
+            return memoryview(self._mmap)[offset:offset + size].cast(typecode)
+        return list(struct.unpack_from(f"<{length}{typecode}", self._mmap, offset))
+
+    def _find(self, code: int) -> int:
+        """7桁の郵便番号（整数）のレコード番号を取得（索引にない場合は-1）"""
+        bucket, low = divmod(code, 10000)
+        start, end = self._buckets[bucket], self._buckets[bucket + 1]
+        index = bisect_left(self._codes, low, start, end)
+        if index == end or self._codes[index] != low:
+            return -1
+        return index
+
+    def _city(self, city_id: int) -> tuple[str, str]:
+        """市区町村番号から（都道府県名, 市区町村名）を取得（名前は初回参照時にデコードして保持）"""
+        names = self._city_names.get(city_id)
+        if names is None:
+            prefecture_id, name_offset = _CITY.unpack_from(self._mmap, self._cities_offset + _CITY.size * city_id)
+            names = self._city_names[city_id] = (PREFECTURES[prefecture_id], self._string(name_offset))
+        return names
+
+    def _string(self, offset: int) -> str:
+        start = self._strings_offset + offset
+        return self._mmap[start:self._mmap.find(b"\0", start)].decode("utf-8")
+
+
+def _parse_postal_code(postal_code: str) -> Optional[int]:
+    """郵便番号の表記を7桁の整数に変換（7桁でない場合はNone）"""
+    if not postal_code:
+        return None
+    # よく使われる表記（"1000001"、"100-0001"）は正規表現を使わずに変換する
+    if len(postal_code) == 7 and postal_code.isascii() and postal_code.isdigit():
+        return int(postal_code)
+    if (len(postal_code) == 8 and postal_code[3] == "-" and postal_code.isascii()
+            and postal_code[:3].isdigit() and postal_code[4:].isdigit()):
+        return int(postal_code[:3]) * 10000 + int(postal_code[4:])
+
+    digits = _NON_DIGIT_PATTERN.sub("", postal_code.translate(_DIGITS_TRANSLATION))
+    return int(digits) if len(digits) == 7 and digits.isascii() else None
+
+
+def normalize_town(town: str) -> str:
+    """KEN_ALLの町域名から注記を除去
+
+    「以下に掲載がない場合」などの注記と、括弧書き（「（次のビルを除く）」など）を除去します。
+
+    Args:
+        town: KEN_ALLの町域名
+
+    Returns:
+        町域名（注記のみの場合は空文字列）
+    """
+    return _TOWN_NOTE_PATTERN.sub("", town).strip()
+
+
+def build_postal_index(records: Iterable[tuple[str, str, str, str]], path: Path) -> int:
+    """郵便番号索引ファイルを作成
+
+    同じ郵便番号の行が複数ある場合は、最初の行の市区町村を使用し、
+    町域が一致しない場合は町域を空文字列にします。
+
+    Args:
+        records: （郵便番号7桁, 都道府県名, 市区町村名, 町域名）の組
+        path: 出力先のパス
+
+    Returns:
+        索引に登録した郵便番号の件数
+
+    Raises:
+        ValueError: 不明な都道府県名・7桁でない郵便番号がある場合
+    """
+    prefecture_ids = {prefecture: index for index, prefecture in enumerate(PREFECTURES)}
+    entries: dict[int, list] = {}
+    for postal_code, prefecture, city, town in records:
+        if len(postal_code) != 7 or not postal_code.isdigit():
+            raise ValueError(f"Invalid postal code: {postal_code!r}")
+        if prefecture not in prefecture_ids:
+            raise ValueError(f"Unknown prefecture: {prefecture!r}")
+        town = normalize_town(town)
+        entry = entries.get(int(postal_code))
+        if entry is None:
+            entries[int(postal_code)] = [(prefecture, city), town]
+        elif entry[1] != town:
+            entry[1] = ""
+
+    strings = bytearray()
+    string_offsets: dict[str, int] = {}
+
+    def add_string(value: str) -> int:
+        offset = string_offsets.get(value)
+        if offset is None:
+            offset = string_offsets[value] = len(strings)
+            strings.extend(value.encode("utf-8") + b"\0")
+        return offset
+
+    city_ids: dict[tuple[str, str], int] = {}
+    cities = bytearray()
+    buckets = [0] * (_BUCKET_COUNT + 1)
+    codes = []
+    record_cities = []
+    towns = []
+    for code in sorted(entries):
+        city_key, town = entries[code]
+        if city_key not in city_ids:
+            city_ids[city_key] = len(city_ids)
+            cities.extend(_CITY.pack(prefecture_ids[city_key[0]], add_string(city_key[1])))
+        buckets[code // 10000 + 1] += 1
+        codes.append(code % 10000)
+        record_cities.append(city_ids[city_key])
+        towns.append(add_string(town))
+
+    for index in range(1, len(buckets)):
+        buckets[index] += buckets[index - 1]
+
+    count = len(codes)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, count, len(city_ids), len(strings)))
+        f.write(struct.pack(f"<{len(buckets)}I", *buckets))
+        f.write(struct.pack(f"<{count}H", *codes))
+        f.write(struct.pack(f"<{count}H", *record_cities))
+        f.write(struct.pack(f"<{count}I", *towns))
+        f.write(cities)
+        f.write(strings)
+
+    logger.info(f"Built postal index: {count} codes, {len(city_ids)} cities -> {path}")
+    return count
+
+
+_postal_index: Optional[PostalIndex] = None
+_postal_index_loaded = False
+
+
+def get_postal_index() -> Optional[PostalIndex]:
+    """設定値のパスの共有のPostalIndexを取得
+
+    索引ファイルがない場合・無効にしている場合はNoneを返します
+    （住所の抽出は索引なしで行われます）。
+
+    Returns:
+        共有のPostalIndex（初回呼び出し時にメモリマップ）、またはNone
+    """
+    global _postal_index, _postal_index_loaded
+    if _postal_index_loaded or not Settings.POSTAL_INDEX_ENABLED:
+        return _postal_index
+
+    _postal_index_loaded = True
+    path = Path(Settings.POSTAL_INDEX_PATH)
+    if not path.exists():
+        logger.info(f"Postal index not found ({path}); run scripts/build_postal_index.py to enable it")
+        return None
+
+    try:
+        _postal_index = PostalIndex(path)
+        logger.debug(f"Postal index mapped: {path} ({len(_postal_index)} codes)")
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to open postal index {path}: {e}")
+    return _postal_index
@@ -0,0 +1,337 @@
+"""ドメイン単位の適応型レート制限モジュール
+
+このモジュールは、ドメインごとのトークンバケットでリクエストの送信間隔を制御する
+RateLimiterを提供します。送信レートはサーバーの応答に応じてAIMD
+（加算的増加・乗算的減少）で調整します。
+
+- 正常な応答が続くドメインでは、レートを少しずつ上げます。
+- 429/503や応答時間の急増があったドメインでは、レートを半分に下げます。
+- Retry-Afterヘッダーがある場合は、指定された時刻まで送信を止めます。
+
+WebScraper、GoogleSearcher、SearchAPIClientで1つのインスタンスを共有できます。
+"""
+
+from dataclasses import dataclass
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+from urllib.parse import urlparse
+import threading
+import time
+
+from config.settings import Settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# レートを下げる対象のステータスコード
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Retry-Afterヘッダーの値を待機秒数に変換
+
+    秒数とHTTP日付の両方の形式に対応します。
+
+    Args:
+        value: Retry-Afterヘッダーの値
+        now: 現在時刻（UNIX時間、Noneの場合は現在時刻）
+
+    Returns:
+        待機秒数。解釈できない場合はNone
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    current = now if now is not None else time.time()
+    return max(0.0, retry_at.timestamp() - current)
+
+
+def get_retry_wait_time(wait_time: float, attempt: int) -> float:
+    """リトライ前の待機時間を計算（指数バックオフ）
+
+    Args:
+        wait_time: 基本待機時間（秒）
+        attempt: 失敗した試行の回数（1始まり）
+
+    Returns:
+        待機時間（秒）
+    """
+    return wait_time * (2 ** (attempt - 1))
+
+
+def get_rate_limit_key(url: str) -> str:
+    """URLからレート制限のキー（ドメイン）を取得
+
+    Args:
+        url: URLまたはドメイン
+
+    Returns:
+        小文字のドメイン（ポート番号を含む）
+    """
+    netloc = urlparse(url).netloc if "//" in url else url
+    return netloc.lower()
+
+
+@dataclass
+class DomainRate:
+    """ドメインごとのレート制限の状態"""
+    rate: float  # 送信レート（リクエスト/秒）
+    max_rate: float  # レートの上限
+    tokens: float  # 残りトークン数（予約済みのリクエストがある場合は負）
+    updated_at: float  # トークンを最後に補充した時刻
+    blocked_until: float = 0.0  # Retry-Afterによる送信停止の期限
+    latency: Optional[float] = None  # 応答時間の指数移動平均（秒）
+    requests: int = 0
+    throttled: int = 0  # 429/503・応答時間の急増でレートを下げた回数
+
+    @property
+    def interval(self) -> float:
+        """現在の送信間隔（秒）"""
+        return 1.0 / self.rate
+
+
+class RateLimiter:
+    """ドメイン単位の適応型レート制限
+
+    ドメインごとのトークンバケットで送信時刻を予約します。
+    トークンが足りない場合は、補充されるまでの時間だけ待機します。
+    複数スレッドから利用できます。
+    """
+
+    def __init__(
+        self,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        increase_step: Optional[float] = None,
+        decrease_factor: Optional[float] = None,
+        latency_factor: Optional[float] = None
+    ):
+        """初期化
+
+        Args:
+            min_rate: レートの下限（リクエスト/秒、Noneの場合は設定値）
+            max_rate: レートの上限（リクエスト/秒、Noneの場合は設定値）
+            burst: 連続して送信できる最大数（Noneの場合は設定値）
+            increase_step: 正常な応答ごとに加算するレート（Noneの場合は設定値）
+            decrease_factor: スロットリング時にレートに掛ける係数（Noneの場合は設定値）
+            latency_factor: 平均の何倍の応答時間を急増とみなすか（Noneの場合は設定値）
+        """
+        self.min_rate = min_rate or Settings.RATE_LIMIT_MIN_RATE
+        self.max_rate = max_rate or Settings.RATE_LIMIT_MAX_RATE
+        self.burst = burst or Settings.RATE_LIMIT_BURST
+        self.increase_step = increase_step if increase_step is not None else Settings.RATE_LIMIT_INCREASE_STEP
+        self.decrease_factor = decrease_factor or Settings.RATE_LIMIT_DECREASE_FACTOR
+        self.latency_factor = latency_factor or Settings.RATE_LIMIT_LATENCY_FACTOR
+        self.domains: dict[str, DomainRate] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, url: str, interval: float, min_interval: Optional[float] = None) -> float:
+        """送信時刻を予約し、送信までの待機秒数を返す（待機はしない）
+
+        Args:
+            url: これからアクセスするURL
+            interval: 初回アクセス時の送信間隔（秒）。0以下の場合は、
+                スロットリングされるまではRetry-Afterによる停止のみ適用
+            min_interval: 最小の送信間隔（robots.txtのCrawl-delayなど）
+
+        Returns:
+            送信までの待機秒数
+        """
+        key = get_rate_limit_key(url)
+
+        with self._lock:
+            now = time.time()
+            state = self._get_state(key, interval, now)
+            state.requests += 1
+            wait = max(0.0, state.blocked_until - now)
+
+            if interval <= 0 and not min_interval and not state.throttled:
+                return wait
+
+            rate = state.rate
+            capacity = float(self.burst)
+            if min_interval:
+                # Crawl-delayの指定がある場合は連続送信を許可しない
+                rate = min(rate, 1.0 / min_interval)
+                capacity = 1.0
+
+            elapsed = max(0.0, now - state.updated_at)
+            state.tokens = min(capacity, state.tokens + elapsed * rate)
+            state.updated_at = max(now, state.updated_at)
+            state.tokens -= 1
+
+            if state.tokens < 0:
+                wait = max(wait, (state.updated_at - now) + (-state.tokens / rate))
+
+        return wait
+
+    def acquire(self, url: str, interval: float, min_interval: Optional[float] = None) -> float:
+        """送信時刻まで待機
+
+        待機中にRetry-Afterで送信停止が指定された場合は、その期限まで待機を延長します。
+
+        Args:
+            url: これからアクセスするURL
+            interval: 初回アクセス時の送信間隔（秒）
+            min_interval: 最小の送信間隔（robots.txtのCrawl-delayなど）
+
+        Returns:
+            待機した秒数
+        """
+        key = get_rate_limit_key(url)
+        wait = self.reserve(url, interval, min_interval)
+        if wait > 0:
+            logger.debug(f"Rate limiting ({key}): waiting {wait:.2f} seconds")
+            time.sleep(wait)
+
+        blocked = self.blocked_for(url)
+        if blocked > 0:
+            logger.debug(f"Retry-After ({key}): waiting {blocked:.2f} more seconds")
+            time.sleep(blocked)
+            wait += blocked
+
+        return wait
+
+    def on_response(
+        self,
+        url: str,
+        status_code: int,
+        headers: Optional[Mapping[str, str]] = None,
+        latency: Optional[float] = None
+    ) -> None:
+        """応答結果からレートを調整
+
+        429/503の場合と応答時間が急増した場合はレートを下げ（乗算的減少）、
+        それ以外の正常な応答ではレートを上げます（加算的増加）。
+        Retry-Afterヘッダーがある場合は、その時刻まで送信を止めます。
+
+        Args:
+            url: アクセスしたURL
+            status_code: HTTPステータスコード
+            headers: レスポンスヘッダー
+            latency: 応答時間（秒）
+        """
+        key = get_rate_limit_key(url)
+
+        with self._lock:
+            now = time.time()
+            state = self.domains.get(key)
+            if state is None:
+                return
+
+            retry_after = parse_retry_after((headers or {}).get("Retry-After"), now)
+            if retry_after is not None and status_code in THROTTLE_STATUS_CODES:
+                retry_after = min(retry_after, Settings.RATE_LIMIT_MAX_RETRY_AFTER)
+                state.blocked_until = max(state.blocked_until, now + retry_after)
+                # 停止明けに予約済みのリクエストが一斉に送信されないよう、補充を停止期限から再開する
+                state.updated_at = max(state.updated_at, state.blocked_until)
+                state.tokens = min(state.tokens, 1.0)
+                logger.info(f"Retry-After from {key}: pausing for {retry_after:.1f} seconds")
+
+            latency_spike = (
+                latency is not None
+                and state.latency is not None
+                and latency > state.latency * self.latency_factor
+                and latency > Settings.RATE_LIMIT_MIN_SLOW_LATENCY
+            )
+            if latency is not None:
+                state.latency = latency if state.latency is None else 0.8 * state.latency + 0.2 * latency
+
+            if status_code in THROTTLE_STATUS_CODES or latency_spike:
+                previous = state.rate
+                state.rate = max(self.min_rate, state.rate * self.decrease_factor)
+                state.throttled += 1
+                reason = f"status {status_code}" if status_code in THROTTLE_STATUS_CODES else f"latency {latency:.2f}s"
+                logger.info(f"Throttling {key} ({reason}): {previous:.3f} -> {state.rate:.3f} req/s")
+            elif status_code < 500:
+                state.rate = min(state.max_rate, state.rate + self.increase_step)
+
+    def retry_delay(self, url: str, attempt: int, base_wait: float) -> float:
+        """リトライ前の待機秒数を取得
+
+        Retry-Afterで送信停止中の場合はその残り時間を、
+        それ以外の場合は指数バックオフの待機時間を返します。
+
+        Args:
+            url: リトライするURL
+            attempt: 失敗した試行回数（1から開始）
+            base_wait: 指数バックオフの基準となる待機時間（秒）
+
+        Returns:
+            待機秒数
+        """
+        blocked = self.blocked_for(url)
+        if blocked > 0:
+            return blocked
+        return get_retry_wait_time(base_wait, attempt)
+
+    def blocked_for(self, url: str) -> float:
+        """Retry-Afterによる送信停止の残り秒数"""
+        state = self.domains.get(get_rate_limit_key(url))
+        if state is None:
+            return 0.0
+        return max(0.0, state.blocked_until - time.time())
+
+    def get_rate(self, url: str) -> Optional[float]:
+        """ドメインの現在の送信レート（リクエスト/秒、未アクセスの場合はNone）"""
+        state = self.domains.get(get_rate_limit_key(url))
+        return state.rate if state else None
+
+    def summary(self) -> str:
+        """ドメインごとの状態の要約（ログ出力用）"""
+        with self._lock:
+            parts = [
+                f"{key}: {state.rate:.2f} req/s (requests={state.requests}, throttled={state.throttled})"
+                for key, state in self.domains.items()
+            ]
+        return ", ".join(parts) if parts else "no requests"
+
+    def reset(self) -> None:
+        """すべてのドメインの状態をクリア"""
+        with self._lock:
+            self.domains.clear()
+
+    def _get_state(self, key: str, interval: float, now: float) -> DomainRate:
+        """ドメインの状態を取得（初回は送信間隔から作成）"""
+        state = self.domains.get(key)
+        if state is None:
+            rate = 1.0 / interval if interval > 0 else self.max_rate
+            rate = max(self.min_rate, rate)
+            state = DomainRate(
+                rate=rate,
+                max_rate=max(self.max_rate, rate),
+                tokens=float(self.burst),
+                updated_at=now
+            )
+            self.domains[key] = state
+        return state
+
+
+_shared_rate_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> RateLimiter:
+    """アプリケーション全体で共有するRateLimiterを取得
+
+    Returns:
+        共有のRateLimiter（初回呼び出し時に作成）
+    """
+    global _shared_rate_limiter
+    with _shared_lock:
+        if _shared_rate_limiter is None:
+            _shared_rate_limiter = RateLimiter()
+        return _shared_rate_limiter
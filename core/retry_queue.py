@@ -0,0 +1,85 @@
+"""遅延リトライキューと取得ジョブのレポートモジュール
+
+このモジュールは、一時的な障害で取得できなかったURLをジョブの最後に
+まとめて再試行するためのキューと、ジョブの結果をまとめたレポートを提供します。
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import threading
+
+from core.circuit_breaker import BreakerTrip
+
+
+@dataclass
+class DeferredItem:
+    """遅延リトライの対象"""
+    index: int  # 入力リスト内の位置
+    url: str
+    attempts: int = 1  # これまでの試行回数
+    error: str = ""  # 最後の失敗理由
+
+
+@dataclass
+class RetryOutcome:
+    """遅延リトライの最終結果"""
+    url: str
+    attempts: int
+    succeeded: bool
+    error: str = ""
+
+
+class DeferredRetryQueue:
+    """遅延リトライキュー（複数スレッドから追加可能）"""
+
+    def __init__(self):
+        self._items: list[DeferredItem] = []
+        self._lock = threading.Lock()
+
+    def add(self, item: DeferredItem) -> None:
+        """キューに追加"""
+        with self._lock:
+            self._items.append(item)
+
+    def pop_all(self) -> list[DeferredItem]:
+        """キューの内容をすべて取り出す"""
+        with self._lock:
+            items, self._items = self._items, []
+        return items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+
+@dataclass
+class FetchReport:
+    """取得ジョブのレポート"""
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    breaker_trips: list[BreakerTrip] = field(default_factory=list)
+    retry_outcomes: list[RetryOutcome] = field(default_factory=list)
+
+    @property
+    def recovered(self) -> int:
+        """遅延リトライで取得できた件数"""
+        return sum(1 for outcome in self.retry_outcomes if outcome.succeeded)
+
+    def summary(self) -> str:
+        """1行の要約"""
+        return (f"fetched {self.succeeded}/{self.total}, failed {self.failed}, "
+                f"breaker trips {len(self.breaker_trips)}, "
+                f"deferred retries {self.recovered}/{len(self.retry_outcomes)} recovered")
+
+    def lines(self) -> list[str]:
+        """表示用の行（サーキットが開いたホストと遅延リトライの結果）"""
+        lines = [self.summary()]
+        for trip in self.breaker_trips:
+            tripped_at = datetime.fromtimestamp(trip.tripped_at).strftime("%H:%M:%S")
+            lines.append(f"breaker tripped: {trip.host} at {tripped_at} ({trip.failures} consecutive failures)")
+        for outcome in self.retry_outcomes:
+            result = "recovered" if outcome.succeeded else f"failed ({outcome.error})"
+            lines.append(f"retry {result}: {outcome.url} (attempts: {outcome.attempts})")
+        return lines
+
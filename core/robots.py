@@ -0,0 +1,373 @@
+"""robots.txtを取得・キャッシュするモジュール
+
+このモジュールは、robots.txtの取得と判定を行うRobotsCacheを提供します。
+取得にはタイムアウトを設定し、結果はTTL付きでファイルに永続化します。
+ファイルへの保存は、取得した結果を保存するたびに最短でもsave_intervalの間隔を空けて行い、
+間隔内の変更はスクレイパーの処理の終わり（fetch_many・close）に保存します。
+取得に失敗したドメインも一定時間キャッシュ（ネガティブキャッシュ）し、
+同じドメインのURLごとに再取得しないようにします。
+Crawl-delayの取得と、検索結果の全ドメインを並列に事前取得する機能も含みます。
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import urlparse, urljoin
+from urllib.robotparser import RobotFileParser
+import json
+import threading
+import time
+import requests
+
+from config.settings import Settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def parse_robots_txt(robots_url: str, status_code: int, body: str) -> RobotFileParser:
+    """取得したrobots.txtからRobotFileParserを作成
+
+    RobotFileParser.read()と同じ規則でステータスコードを解釈します。
+    401/403の場合はすべて拒否、その他の4xxの場合はすべて許可とします。
+
+    Args:
+        robots_url: robots.txtのURL
+        status_code: HTTPステータスコード
+        body: レスポンス本文
+
+    Returns:
+        解析済みのRobotFileParser
+    """
+    rp = RobotFileParser()
+    rp.set_url(robots_url)
+
+    if status_code in (401, 403):
+        rp.disallow_all = True
+    elif 400 <= status_code < 500:
+        rp.allow_all = True
+    else:
+        rp.parse(body.splitlines())
+
+    return rp
+
+
+def get_robots_domain(url: str) -> str:
+    """URLからrobots.txtのキャッシュキー（スキーム付きドメイン）を取得
+
+    Args:
+        url: URL
+
+    Returns:
+        スキーム付きドメイン（例: https://example.com）
+    """
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc.lower()}"
+
+
+@dataclass
+class RobotsEntry:
+    """robots.txtのキャッシュエントリ"""
+    domain: str
+    status_code: int  # 取得に失敗した場合は0
+    body: str
+    fetched_at: float
+    expires_at: float
+    failed: bool = False  # 取得失敗（ネガティブキャッシュ）の場合True
+
+    def __post_init__(self):
+        self._parser: Optional[RobotFileParser] = None
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """有効期限切れかどうか"""
+        return (now if now is not None else time.time()) >= self.expires_at
+
+    @property
+    def parser(self) -> Optional[RobotFileParser]:
+        """解析済みのRobotFileParser（取得失敗の場合はNone）"""
+        if self.failed:
+            return None
+        if self._parser is None:
+            self._parser = parse_robots_txt(urljoin(self.domain, "/robots.txt"), self.status_code, self.body)
+        return self._parser
+
+    def to_dict(self) -> dict:
+        """永続化用の辞書に変換"""
+        return asdict(self)
+
+
+class RobotsCache:
+    """robots.txtのキャッシュ
+
+    ドメインごとにrobots.txtを1回だけ取得し、TTLの間は再利用します。
+    複数スレッドから利用でき、同じドメインのrobots.txtを同時に
+    複数回取得しないようドメイン単位でロックします。
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        user_agent: Optional[str] = None,
+        timeout: Optional[float] = None,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+        path: Optional[Path] = None,
+        save_interval: Optional[float] = None
+    ):
+        """初期化
+
+        Args:
+            session: robots.txtの取得に使用するHTTPセッション（Noneの場合はrequests）
+            user_agent: User-Agent文字列（Noneの場合は設定値）
+            timeout: 取得のタイムアウト（秒、Noneの場合は設定値）
+            ttl: 取得成功時の有効期間（秒、Noneの場合は設定値）
+            negative_ttl: 取得失敗時の有効期間（秒、Noneの場合は設定値）
+            path: 永続化ファイルのパス（Noneの場合は設定値。設定で無効ならメモリのみ）
+            save_interval: 取得した結果をファイルに保存する最短の間隔（秒、Noneの場合は設定値）
+        """
+        self.session = session or requests
+        self.user_agent = user_agent or Settings.USER_AGENT
+        self.timeout = timeout if timeout is not None else Settings.ROBOTS_TIMEOUT
+        self.ttl = ttl if ttl is not None else Settings.ROBOTS_CACHE_TTL
+        self.negative_ttl = negative_ttl if negative_ttl is not None else Settings.ROBOTS_NEGATIVE_TTL
+        if path is None and Settings.ROBOTS_CACHE_PERSIST:
+            path = Settings.ROBOTS_CACHE_PATH
+        self.path = Path(path) if path else None
+        self.save_interval = save_interval if save_interval is not None else Settings.ROBOTS_CACHE_SAVE_INTERVAL
+
+        self.entries: dict[str, RobotsEntry] = {}
+        self._lock = threading.Lock()
+        self._domain_locks: dict[str, threading.Lock] = {}
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        self._last_saved = 0.0
+
+        self._load()
+        logger.info(f"RobotsCache initialized ({len(self.entries)} entries loaded)")
+
+    def can_fetch(self, url: str, user_agent: Optional[str] = None) -> bool:
+        """robots.txtでアクセスが許可されているかを判定
+
+        robots.txtが取得できなかった場合はアクセスを許可します。
+
+        Args:
+            url: チェックするURL
+            user_agent: User-Agent文字列（Noneの場合はインスタンスの値）
+
+        Returns:
+            アクセスが許可されている場合True
+        """
+        parser = self.get_entry(url).parser
+        if parser is None:
+            return True
+        return parser.can_fetch(user_agent or self.user_agent, url)
+
+    def crawl_delay(self, url: str, user_agent: Optional[str] = None) -> Optional[float]:
+        """Crawl-delayを取得（キャッシュ済みの場合のみ）
+
+        robots.txtの取得は行わず、キャッシュにあるエントリだけを参照します。
+
+        Args:
+            url: URL
+            user_agent: User-Agent文字列（Noneの場合はインスタンスの値）
+
+        Returns:
+            Crawl-delay（秒）。指定がない・未取得の場合はNone
+        """
+        entry = self.lookup(get_robots_domain(url))
+        if entry is None or entry.parser is None:
+            return None
+
+        delay = entry.parser.crawl_delay(user_agent or self.user_agent)
+        return float(delay) if delay is not None else None
+
+    def lookup(self, domain: str) -> Optional[RobotsEntry]:
+        """有効期限内のエントリを取得（取得処理は行わない）
+
+        Args:
+            domain: スキーム付きドメイン
+
+        Returns:
+            エントリ。存在しない・期限切れの場合はNone
+        """
+        entry = self.entries.get(domain)
+        if entry is None or entry.is_expired():
+            return None
+        return entry
+
+    def get_entry(self, url: str) -> RobotsEntry:
+        """URLのドメインのエントリを取得（なければrobots.txtを取得）
+
+        Args:
+            url: URL
+
+        Returns:
+            エントリ
+        """
+        domain = get_robots_domain(url)
+
+        entry = self.lookup(domain)
+        if entry is not None:
+            return entry
+
+        with self._get_domain_lock(domain):
+            # 待機中に他のスレッドが取得済みの場合はそれを使う
+            entry = self.lookup(domain)
+            if entry is None:
+                entry = self._fetch(domain)
+            return entry
+
+    def prefetch(self, urls: Iterable[str], max_workers: Optional[int] = None) -> None:
+        """URLリストの全ドメインのrobots.txtを並列に取得
+
+        フェッチ段階の前に呼び出すことで、robots.txtの取得待ちが
+        ページ取得の間に挟まらないようにします。
+
+        Args:
+            urls: URLのリスト
+            max_workers: 並列数（Noneの場合は設定値）
+        """
+        domains = []
+        for url in urls:
+            parsed = urlparse(url)
+            if not parsed.scheme or not parsed.netloc:
+                continue
+            domain = get_robots_domain(url)
+            if domain not in domains and self.lookup(domain) is None:
+                domains.append(domain)
+
+        if not domains:
+            return
+
+        workers = max(1, min(max_workers or Settings.MAX_WORKERS, len(domains)))
+        logger.info(f"Prefetching robots.txt for {len(domains)} domains ({workers} workers)")
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="robots") as executor:
+            list(executor.map(lambda domain: self.get_entry(f"{domain}/"), domains))
+
+        self.save()
+
+    def store(self, domain: str, status_code: int, body: str) -> RobotsEntry:
+        """取得したrobots.txtを保存
+
+        5xxの場合は取得失敗として扱います。
+
+        Args:
+            domain: スキーム付きドメイン
+            status_code: HTTPステータスコード
+            body: レスポンス本文
+
+        Returns:
+            保存したエントリ
+        """
+        if status_code >= 500:
+            return self.store_failure(domain)
+
+        now = time.time()
+        entry = RobotsEntry(domain, status_code, body, fetched_at=now, expires_at=now + self.ttl)
+        self._put(entry)
+        return entry
+
+    def store_failure(self, domain: str) -> RobotsEntry:
+        """取得失敗を保存（ネガティブキャッシュ）
+
+        Args:
+            domain: スキーム付きドメイン
+
+        Returns:
+            保存したエントリ
+        """
+        now = time.time()
+        entry = RobotsEntry(domain, 0, "", fetched_at=now, expires_at=now + self.negative_ttl, failed=True)
+        self._put(entry)
+        return entry
+
+    def save(self) -> None:
+        """キャッシュをファイルに保存（変更がある場合のみ）"""
+        if self.path is None or not self._dirty:
+            return
+
+        # 複数スレッドから同時に呼び出されても、一時ファイルへの書き込みが重ならないようにする
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                now = time.time()
+                data = {
+                    domain: entry.to_dict()
+                    for domain, entry in self.entries.items()
+                    if not entry.is_expired(now)
+                }
+                self._dirty = False
+                self._last_saved = time.monotonic()
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+                tmp_path.replace(self.path)
+                logger.debug(f"Saved robots.txt cache ({len(data)} entries): {self.path}")
+            except OSError as e:
+                logger.warning(f"Failed to save robots.txt cache: {e}")
+
+    def clear(self) -> None:
+        """キャッシュをクリア"""
+        with self._lock:
+            self.entries.clear()
+            self._dirty = True
+
+    def _fetch(self, domain: str) -> RobotsEntry:
+        """robots.txtを取得してキャッシュに保存"""
+        robots_url = urljoin(domain, "/robots.txt")
+        logger.debug(f"Loading robots.txt for domain: {domain}")
+
+        try:
+            response = self.session.get(
+                robots_url,
+                headers={'User-Agent': self.user_agent},
+                timeout=self.timeout
+            )
+        except requests.RequestException as e:
+            logger.warning(f"Failed to load robots.txt for {domain}: {e}")
+            return self.store_failure(domain)
+
+        if response.status_code >= 500:
+            logger.warning(f"Failed to load robots.txt for {domain}: status {response.status_code}")
+        else:
+            logger.debug(f"robots.txt loaded successfully: {domain} (status: {response.status_code})")
+
+        return self.store(domain, response.status_code, response.text)
+
+    def _put(self, entry: RobotsEntry) -> None:
+        with self._lock:
+            self.entries[entry.domain] = entry
+            self._dirty = True
+            save_due = time.monotonic() - self._last_saved >= self.save_interval
+
+        # prefetch以外（ページ取得時の遅延取得）で取得した結果も保存する（間隔内の変更はsave()で保存）
+        if save_due and self.path is not None:
+            self.save()
+
+    def _get_domain_lock(self, domain: str) -> threading.Lock:
+        with self._lock:
+            lock = self._domain_locks.get(domain)
+            if lock is None:
+                lock = threading.Lock()
+                self._domain_locks[domain] = lock
+            return lock
+
+    def _load(self) -> None:
+        """ファイルからキャッシュを読み込む"""
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            now = time.time()
+            for domain, values in data.items():
+                entry = RobotsEntry(**values)
+                if not entry.is_expired(now):
+                    self.entries[domain] = entry
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Failed to load robots.txt cache: {e}")
@@ -0,0 +1,355 @@
+"""複数の正規表現パターンをまとめて照合するモジュール
+
+このモジュールは、電話番号・FAX番号・メールアドレス・郵便番号・営業時間・定休日のパターン
+（core.pattern_registryのパターンパック）をコンパイル済みの照合器にまとめ、
+テキストから種類付きの一致（位置付き）を返すPatternScannerを提供します。
+
+- 種類ごとに、パターンを1つの正規表現（非キャプチャの選択）にまとめて1回だけ走査します。
+  同じ種類のパターンが重複して一致することはありません（re.findallと同様に重なりません）。
+- どのパターンが一致したかは、一致した位置でのみ個別のパターンを照合して判定します。
+- 走査は種類ごとに、結果を最初に参照したときに行います。
+  最初の一致だけが必要な種類（郵便番号・営業時間・定休日）は、
+  優先度の高いパターンから順に探し、見つかった時点で打ち切ります。
+
+すべての種類を1つの正規表現にまとめると、先頭文字による読み飛ばしが効かなくなり、
+Pythonのreでは数倍から数十倍遅くなるため、種類ごとにまとめています。
+
+パターンはPatternSpecとして一度だけコンパイルし、コンパイル時間と一致件数を記録します
+（PatternScanner.statistics）。種類ごとにまとめた正規表現は、その種類を最初に走査するときに作成します。
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional, Union
+import re
+import threading
+import time
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+KIND_PHONE = "phone"
+KIND_FAX = "fax"
+KIND_EMAIL = "email"
+KIND_POSTAL_CODE = "postal_code"
+KIND_BUSINESS_HOURS = "business_hours"
+KIND_CLOSED_DAYS = "closed_days"
+
+
+@dataclass
+class ScanMatch:
+    """種類付きの一致"""
+    kind: str
+    value: str  # パターンのグループが1つの場合はグループ1、それ以外は一致全体
+    start: int  # 一致全体の開始位置
+    end: int  # 一致全体の終了位置
+    priority: int  # 種類内でのパターンの順番（小さいほど優先）
+
+
+@dataclass
+class PatternSpec:
+    """コンパイル済みのパターン1つと、その統計
+
+    一致件数は、このパターンを使うすべてのPatternScannerの合計です
+    （複数スレッドから同時に走査した場合は概数になります）。
+    """
+    kind: str  # 種類（KIND_PHONEなど）
+    pattern: str  # 正規表現
+    compiled: re.Pattern = field(repr=False, compare=False)
+    pack: str = ""  # パターンパック名（パックを使わずに指定した場合は空文字列）
+    label: str = ""  # パターンの説明
+    compile_ms: float = 0.0  # コンパイルにかかった時間（ミリ秒）
+    matches: int = field(default=0, compare=False)  # 一致件数
+
+    @classmethod
+    def compile(cls, kind: str, pattern: str, pack: str = "", label: str = "") -> "PatternSpec":
+        """パターンをコンパイルしてPatternSpecを作成
+
+        Raises:
+            re.error: パターンが不正な場合
+        """
+        started = time.perf_counter()
+        compiled = re.compile(pattern)
+        compile_ms = (time.perf_counter() - started) * 1000
+        return cls(kind=kind, pattern=pattern, compiled=compiled, pack=pack, label=label, compile_ms=compile_ms)
+
+
+@dataclass
+class PatternStats:
+    """パターン1つの統計"""
+    pack: str
+    label: str
+    pattern: str
+    compile_ms: float  # コンパイルにかかった時間（ミリ秒）
+    matches: int  # 一致件数
+
+
+@dataclass
+class KindStats:
+    """1種類分の統計"""
+    kind: str
+    scans: int  # 走査した回数
+    scan_ms: float  # 走査にかかった時間の合計（ミリ秒）
+    combined_compile_ms: Optional[float]  # まとめた正規表現のコンパイル時間（未作成の場合はNone）
+    patterns: list[PatternStats]  # 優先度の順
+
+
+class _KindMatcher:
+    """1種類分のコンパイル済みパターン"""
+
+    def __init__(self, kind: str, specs: list[PatternSpec]):
+        self.kind = kind
+        self.specs = specs
+        self.patterns: list[re.Pattern] = [spec.compiled for spec in specs]
+        self.scans = 0
+        self.scan_seconds = 0.0
+        self.combined_compile_ms: Optional[float] = None
+        self._combined: Optional[re.Pattern] = None
+        self._lock = threading.Lock()
+
+    @property
+    def combined(self) -> Optional[re.Pattern]:
+        """すべてのパターンを1つにまとめた正規表現（最初の参照時に作成）"""
+        if self._combined is None and self.patterns:
+            with self._lock:
+                if self._combined is None:
+                    started = time.perf_counter()
+                    combined = combine_patterns(self.patterns)
+                    self.combined_compile_ms = (time.perf_counter() - started) * 1000
+                    self._combined = combined
+        return self._combined
+
+    def statistics(self) -> KindStats:
+        """統計を取得"""
+        return KindStats(
+            kind=self.kind,
+            scans=self.scans,
+            scan_ms=self.scan_seconds * 1000,
+            combined_compile_ms=self.combined_compile_ms,
+            patterns=[
+                PatternStats(spec.pack, spec.label, spec.pattern, spec.compile_ms, spec.matches)
+                for spec in self.specs
+            ],
+        )
+
+    def find_all(self, text: str) -> list[ScanMatch]:
+        """重ならない一致をすべて取得（出現順）"""
+        combined = self.combined
+        if combined is None:
+            return []
+        started = time.perf_counter()
+        matches = []
+        for combined_match in combined.finditer(text):
+            if combined_match.end() == combined_match.start():
+                continue
+            match = self._identify(text, combined_match.start())
+            if match is not None:
+                matches.append(match)
+        self._record(started)
+        return matches
+
+    def find_first(self, text: str) -> Optional[ScanMatch]:
+        """優先度の高いパターンから順に探した最初の一致を取得"""
+        started = time.perf_counter()
+        result = None
+        for priority, pattern in enumerate(self.patterns):
+            match = pattern.search(text)
+            if match:
+                result = self._to_scan_match(match, priority)
+                break
+        self._record(started)
+        return result
+
+    def _record(self, started: float) -> None:
+        self.scans += 1
+        self.scan_seconds += time.perf_counter() - started
+
+    def _identify(self, text: str, start: int) -> Optional[ScanMatch]:
+        """指定位置で一致したパターンを判定（選択の順に最初に一致したもの）"""
+        for priority, pattern in enumerate(self.patterns):
+            match = pattern.match(text, start)
+            if match:
+                return self._to_scan_match(match, priority)
+        return None
+
+    def _to_scan_match(self, match: re.Match, priority: int) -> ScanMatch:
+        self.specs[priority].matches += 1
+        value = match.group(1) if match.re.groups == 1 else match.group(0)
+        return ScanMatch(
+            kind=self.kind,
+            value=value or "",
+            start=match.start(),
+            end=match.end(),
+            priority=priority
+        )
+
+
+class ScanResult:
+    """1テキスト分の走査結果
+
+    種類ごとの走査は、その種類の結果を最初に参照したときに行い、結果を保持します。
+    """
+
+    def __init__(self, text: str, matchers: dict[str, _KindMatcher]):
+        self.text = text
+        self._matchers = matchers
+        self._all: dict[str, list[ScanMatch]] = {}
+        self._first: dict[str, Optional[ScanMatch]] = {}
+
+    @property
+    def matches(self) -> list[ScanMatch]:
+        """すべての種類の一致（開始位置の順）"""
+        matches = [match for kind in self._matchers for match in self.get(kind)]
+        return sorted(matches, key=lambda match: (match.start, match.kind))
+
+    def get(self, kind: str) -> list[ScanMatch]:
+        """指定した種類の一致を出現順に取得"""
+        if kind not in self._all:
+            matcher = self._matchers.get(kind)
+            self._all[kind] = matcher.find_all(self.text) if matcher and self.text else []
+        return self._all[kind]
+
+    def values(self, kind: str) -> list[str]:
+        """指定した種類の一致した値を出現順に取得"""
+        return [match.value for match in self.get(kind)]
+
+    def first(self, kind: str) -> Optional[ScanMatch]:
+        """指定した種類で最も優先度の高いパターンの最初の一致を取得
+
+        パターンを優先度の順にre.searchした場合と同じ一致を返します。
+        """
+        if kind not in self._first:
+            matcher = self._matchers.get(kind)
+            self._first[kind] = matcher.find_first(self.text) if matcher and self.text else None
+        return self._first[kind]
+
+
+class PatternScanner:
+    """複数の正規表現パターンをまとめた照合器
+
+    コンパイル済みの正規表現を保持するため、インスタンスは使い回してください。
+    複数スレッドから利用できます（ScanResultはスレッド間で共有しないでください）。
+    """
+
+    def __init__(
+        self,
+        patterns: Optional[dict[str, list[Union[str, PatternSpec]]]] = None,
+        versions: Optional[dict[str, str]] = None
+    ):
+        """初期化
+
+        Args:
+            patterns: 種類をキー、パターン（文字列またはコンパイル済みのPatternSpec）のリストを値とする辞書
+                （Noneの場合は設定値のパターンパックのパターン）。リストは優先度の高い順。
+                文字列のパターンのうち不正なものは、ログに記録して除外します
+            versions: パターンパック名 → バージョン（抽出結果キャッシュのキーに使用）
+        """
+        if patterns is None:
+            from core.pattern_registry import get_pattern_registry
+
+            registry = get_pattern_registry()
+            patterns, versions = registry.patterns(), registry.versions()
+        specs = {kind: _compile_all(kind, kind_patterns) for kind, kind_patterns in patterns.items()}
+        self.patterns = {kind: [spec.pattern for spec in kind_specs] for kind, kind_specs in specs.items()}
+        self.versions = dict(versions or {})
+        self._matchers = {kind: _KindMatcher(kind, kind_specs) for kind, kind_specs in specs.items()}
+        self.kinds = tuple(self._matchers)
+        logger.debug(f"PatternScanner uses {sum(len(m.patterns) for m in self._matchers.values())} "
+                     f"patterns for {len(self.kinds)} kinds")
+
+    def statistics(self) -> dict[str, KindStats]:
+        """種類ごとの走査回数・走査時間と、パターンごとのコンパイル時間・一致件数
+
+        Returns:
+            種類 → 統計の辞書
+        """
+        return {kind: matcher.statistics() for kind, matcher in self._matchers.items()}
+
+    def scan(self, text: str) -> ScanResult:
+        """テキストの走査結果を作成
+
+        Args:
+            text: 走査対象のテキスト
+
+        Returns:
+            走査結果（各種類は最初に参照したときに走査されます）
+        """
+        return ScanResult(text or "", self._matchers)
+
+
+def combine_patterns(patterns: list[re.Pattern]) -> re.Pattern:
+    """パターンを1つの正規表現（非キャプチャの選択）にまとめてコンパイル
+
+    個別には正しいパターンでも、まとめると不正になる場合があります（途中のインラインのグローバルフラグ、
+    パターン間で重複するグループ名）。また、2つ目以降のパターンでは前のパターンのグループの分だけ
+    グループ番号がずれるため、番号付きの後方参照（\\1や(?(1)...)）は別のグループを参照してしまいます。
+    これらの場合はre.errorにします。
+
+    Args:
+        patterns: コンパイル済みのパターン（優先度の順）
+
+    Returns:
+        まとめた正規表現
+
+    Raises:
+        re.error: まとめた正規表現が不正な場合・グループ番号がずれる後方参照がある場合
+    """
+    offset = 0
+    for pattern in patterns:
+        if offset and _has_numbered_reference(pattern.pattern):
+            raise re.error(f"numbered group reference in '{pattern.pattern}' would be shifted "
+                           f"by {offset} groups of the preceding patterns")
+        offset += pattern.groups
+    # キャプチャグループを含めると先頭文字による読み飛ばしが効かないため、非キャプチャでまとめる
+    return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+
+
+def _has_numbered_reference(pattern: str) -> bool:
+    """番号付きの後方参照（文字クラス外の\\1〜\\9で始まるもの、(?(1)...)）を含むか"""
+    index = 0
+    in_class = False
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            if not in_class and pattern[index + 1:index + 2] in tuple("123456789"):
+                return True
+            index += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # 文字クラスの先頭の"^"と"]"はクラスの文字
+            if pattern.startswith("^", index + 1):
+                index += 1
+            if pattern.startswith("]", index + 1):
+                index += 1
+        elif pattern.startswith("(?(", index) and pattern[index + 3:index + 4].isdigit():
+            return True
+        index += 1
+    return False
+
+
+def _compile_all(kind: str, patterns: list[Union[str, PatternSpec]]) -> list[PatternSpec]:
+    """パターンのリストをPatternSpecのリストにする（不正な文字列のパターンは除外）"""
+    specs = []
+    for pattern in patterns:
+        if isinstance(pattern, PatternSpec):
+            specs.append(pattern)
+            continue
+        try:
+            specs.append(PatternSpec.compile(kind, pattern))
+        except re.error as e:
+            logger.error(f"Regex error in {kind} pattern '{pattern}': {e}")
+    return specs
+
+
+def get_default_scanner() -> PatternScanner:
+    """設定値のパターンパックをまとめた共有のPatternScannerを取得
+
+    Returns:
+        共有のPatternScanner（初回呼び出し時に作成）
+    """
+    from core.pattern_registry import get_pattern_registry
+
+    return get_pattern_registry().scanner()
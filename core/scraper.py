@@ -5,18 +5,71 @@ robots.txtの遵守やリトライ機能を含みます。
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 import time
 import requests
-from urllib.parse import urlparse, urljoin
-from urllib.robotparser import RobotFileParser
+from urllib.parse import urlparse
 
 from config.settings import Settings
 from config.constants import ERROR_MESSAGES
+from core.http_cache import HttpCache, CachedResponse
+from core.http_session import get_shared_session
+from core.robots import RobotsCache
+from core.encoding import decode_html
+from core.document import ParsedDocument
+from core.extraction_plan import ExtractionPlan
+from core.extractor import DetailedInfo, InfoExtractor
+from core.stream_extractor import StreamingExtraction
+from core.rate_limiter import RateLimiter, get_shared_rate_limiter
+from core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from core.retry_queue import DeferredRetryQueue, DeferredItem, RetryOutcome, FetchReport
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# ストリーミング受信のチャンクサイズ（バイト）
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# 本文の終わりを検出するマーカー（チャンク境界をまたいでも検出できるよう末尾を保持する）
+BODY_END_MARKER = b"</body"
+
+
+def build_request_headers(user_agent: str) -> dict[str, str]:
+    """ページ取得用のリクエストヘッダーを作成
+
+    同期版・非同期版のスクレイパーで共通のヘッダーを使用します。
+
+    Args:
+        user_agent: User-Agent文字列
+
+    Returns:
+        リクエストヘッダーの辞書
+    """
+    return {
+        'User-Agent': user_agent,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'ja,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    }
+
+
+def is_transient_status(status_code: int) -> bool:
+    """一時的な障害としてリトライするステータスコードか（5xx・429）
+
+    同期版・非同期版のスクレイパーで共通のリトライ方針です。その他の4xxはリトライしても
+    結果が変わらないため、リトライしません。
+
+    Args:
+        status_code: HTTPステータスコード
+
+    Returns:
+        リトライする場合True
+    """
+    return status_code >= 500 or status_code == 429
+
 
 @dataclass
 class PageContent:
@@ -26,6 +79,33 @@ class PageContent:
     status_code: int
     content_type: str
     encoding: str
+    encoding_source: Optional[str] = None  # 文字コードの判定根拠（"bom", "header", "meta", "detector", "cache"）
+    from_cache: bool = False  # ディスクキャッシュから返した場合True
+    bytes_downloaded: int = 0  # 実際に受信したバイト数（転送時の圧縮後サイズ）
+    bytes_saved: int = 0  # 途中で打ち切ったことにより受信しなかったバイト数
+    truncated: bool = False  # 本文の途中で受信を打ち切った場合True
+    abort_reason: Optional[str] = None  # 打ち切り理由（"content_type", "max_bytes", "body_end"）
+    # ストリーミング抽出（WebScraper.enable_streaming）に切り替えた場合True。
+    # 本文は保持せず（htmlは空）、受信しながら抽出した詳細情報とリンクなどを持つ
+    streamed: bool = False
+    detail: Optional[DetailedInfo] = None
+    document: Optional[ParsedDocument] = None
+    # リダイレクト後の最終的なURL（キャッシュから返した場合はキャッシュに保存したURL。不明な場合はNone）
+    final_url: Optional[str] = None
+
+    @property
+    def base_url(self) -> str:
+        """ページ内の相対URLの基準となるURL（リダイレクト後のURL、なければ取得したURL）"""
+        return self.final_url or self.url
+
+    @property
+    def has_content(self) -> bool:
+        """本文、またはストリーミング抽出の結果があるかどうか"""
+        return bool(self.html) or self.streamed
+
+
+class TransientFetchError(RuntimeError):
+    """一時的な障害（タイムアウト・接続エラー・5xx・429）でページを取得できなかった場合の例外"""
 
 
 class WebScraper:
@@ -35,23 +115,74 @@ class WebScraper:
     robots.txtの遵守、User-Agent設定、リトライ機能を含みます。
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        cache: Optional[HttpCache] = None,
+        robots: Optional[RobotsCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
         """初期化
 
         WebScraperインスタンスを初期化します。
+
+        Args:
+            session: 使用するHTTPセッション（Noneの場合は共有セッション）
+            cache: レスポンスキャッシュ（Noneの場合、設定で有効なときのみ作成）
+            robots: robots.txtキャッシュ（Noneの場合は新たに作成）
+            rate_limiter: ドメイン単位のレート制限（Noneの場合は共有のRateLimiter）
+            circuit_breaker: ホスト単位のサーキットブレーカー（Noneの場合は新たに作成）
         """
+        self.session = session or get_shared_session()
+        if cache is None and Settings.HTTP_CACHE_ENABLED:
+            cache = HttpCache()
+        self.cache = cache
         self.timeout = Settings.REQUEST_TIMEOUT
         self.max_retries = Settings.MAX_RETRIES
         self.user_agent = Settings.USER_AGENT
         self.wait_time = Settings.DEFAULT_WAIT_TIME
-        self.last_request_time = 0
-        self.robots_parsers = {}  # ドメインごとのRobotFileParserをキャッシュ
+        self.max_workers = Settings.MAX_WORKERS
+        self.max_page_bytes = Settings.MAX_PAGE_BYTES
+        self.stop_at_body_end = Settings.STOP_AT_BODY_END
+        # ストリーミング抽出（enable_streamingで有効にする）
+        self.stream_extractor: Optional[InfoExtractor] = None
+        self.stream_plan: Optional[ExtractionPlan] = None
+        self.streaming_threshold = Settings.STREAMING_THRESHOLD_BYTES
+        self.streaming_max_page_bytes = Settings.STREAMING_MAX_PAGE_BYTES
+        self.robots = robots or RobotsCache(session=self.session, user_agent=self.user_agent)
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.defer_retries = Settings.DEFERRED_RETRY_ENABLED
+        self.deferred_retry_rounds = Settings.DEFERRED_RETRY_ROUNDS
+        self.last_report: Optional[FetchReport] = None  # 直近のfetch_manyのレポート
+        self._retry_lock = threading.Lock()
         logger.info("WebScraper initialized")
 
+    def enable_streaming(self, extractor: InfoExtractor, plan: Optional[ExtractionPlan] = None) -> None:
+        """ストリーミング抽出を有効にする
+
+        受信量がstreaming_thresholdを超えたページは、本文を保持せずに受信しながら抽出し、
+        結果をPageContent.detailに設定します（最大受信バイト数はstreaming_max_page_bytes）。
+        本文を保持しないため、そのページはレスポンスキャッシュに保存しません。
+
+        Args:
+            extractor: 抽出に使用するInfoExtractor
+            plan: 抽出する項目の計画（Noneの場合はInfoExtractorの計画）
+        """
+        self.stream_extractor = extractor
+        self.stream_plan = plan
+
+    def disable_streaming(self) -> None:
+        """ストリーミング抽出を無効にする"""
+        self.stream_extractor = None
+        self.stream_plan = None
+
     def fetch_page(self, url: str, respect_robots: bool = True) -> Optional[PageContent]:
         """ページコンテンツを取得
 
         指定されたURLのページコンテンツを取得します。
+        一時的な障害の場合はその場でリトライします。
 
         Args:
             url: 取得するページのURL
@@ -64,6 +195,34 @@ class WebScraper:
             ValueError: URLが不正な場合
             RuntimeError: robots.txtでアクセスが禁止されている場合
         """
+        try:
+            return self._fetch_page(url, respect_robots)
+        except (TransientFetchError, CircuitOpenError) as e:
+            logger.error(f"Failed to fetch page: {url} ({e})")
+            return None
+
+    def _fetch_page(
+        self,
+        url: str,
+        respect_robots: bool,
+        max_attempts: Optional[int] = None
+    ) -> Optional[PageContent]:
+        """ページコンテンツを取得（一時的な障害は例外で通知）
+
+        Args:
+            url: 取得するページのURL
+            respect_robots: robots.txtを遵守するかどうか
+            max_attempts: 最大試行回数（Noneの場合はmax_retries）
+
+        Returns:
+            ページコンテンツ。取得に失敗した場合はNone
+
+        Raises:
+            ValueError: URLが不正な場合
+            RuntimeError: robots.txtでアクセスが禁止されている場合
+            CircuitOpenError: ホストのサーキットが開いている場合
+            TransientFetchError: 一時的な障害で取得できなかった場合
+        """
         if not url or not url.strip():
             logger.error("URL is empty")
             raise ValueError(ERROR_MESSAGES["invalid_url"])
@@ -79,29 +238,251 @@ class WebScraper:
             logger.warning(f"Access denied by robots.txt: {url}")
             raise RuntimeError(ERROR_MESSAGES["robots_denied"])
 
+        # キャッシュのチェック（新鮮なエントリはリクエストせずに返す）
+        cached = self.cache.get(url) if self.cache else None
+        if cached and cached.is_fresh():
+            logger.info(f"Serving page from cache: {url}")
+            self.cache.record_hit(cached)
+            return PageContent(
+                url=url,
+                html=cached.text(),
+                status_code=200,
+                content_type=cached.headers.get("content-type", "text/html"),
+                encoding=cached.encoding or "utf-8",
+                encoding_source="cache",
+                from_cache=True,
+                final_url=cached.final_url
+            )
+
+        # 応答しないホストにはリクエストを送らずに即座に失敗する
+        if not self.circuit_breaker.allow(url):
+            raise CircuitOpenError(parsed.netloc.lower())
+
         logger.info(f"Fetching page: {url}")
 
-        # レート制限の適用
-        self._wait_for_rate_limit()
+        # レート制限の適用（ドメイン単位）
+        self._wait_for_rate_limit(url)
 
-        # HTMLの取得
-        html = self._fetch_html(url)
+        # HTMLの取得（期限切れのキャッシュがあれば条件付きリクエストで再検証）
+        page_content = self._fetch_content(url, cached, max_attempts=max_attempts)
 
-        if html is None:
+        if page_content is None:
             logger.error(f"Failed to fetch page: {url}")
             return None
 
-        # PageContentの作成
-        page_content = PageContent(
-            url=url,
-            html=html,
-            status_code=200,
-            content_type="text/html",
-            encoding="utf-8"
+        if page_content.abort_reason == "content_type":
+            logger.info(f"Skipped non-HTML page ({page_content.content_type}): {url}")
+        elif page_content.streamed:
+            logger.info(f"Successfully fetched and extracted page while streaming "
+                        f"(length: {page_content.bytes_downloaded} bytes"
+                        f"{', truncated: ' + page_content.abort_reason if page_content.truncated else ''})")
+        else:
+            logger.info(f"Successfully fetched page (length: {len(page_content.html)} chars"
+                        f"{', truncated: ' + page_content.abort_reason if page_content.truncated else ''})")
+        return page_content
+
+    def fetch_many(
+        self,
+        urls: list[str],
+        max_workers: Optional[int] = None,
+        respect_robots: bool = True,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> list[Optional[PageContent]]:
+        """複数ページを並列に取得
+
+        スレッドプールで複数のページを並列に取得します。
+        アクセス間隔はドメインごとに制御されるため、異なるドメインへの
+        リクエストは待機なしで並行して実行されます。
+
+        Args:
+            urls: 取得するページのURLリスト
+            max_workers: 並列数（Noneの場合は設定値を使用）
+            respect_robots: robots.txtを遵守するかどうか（デフォルト: True）
+            progress_callback: 1件完了するごとに呼ばれるコールバック
+                （完了件数, 全件数, URL）
+
+        Returns:
+            入力と同じ順序のページコンテンツのリスト。
+            取得に失敗したURLの位置にはNoneが入ります
+        """
+        if not urls:
+            self.last_report = FetchReport()
+            return []
+
+        workers = max(1, min(max_workers or self.max_workers, len(urls)))
+
+        # robots.txtを全ドメイン分まとめて事前取得
+        if respect_robots:
+            self.prefetch_robots(urls, max_workers=workers)
+
+        logger.info(f"Fetching {len(urls)} pages with {workers} workers")
+
+        results: list[Optional[PageContent]] = [None] * len(urls)
+        completed = 0
+        trips_before = len(self.circuit_breaker.trips)
+
+        # 遅延リトライが有効な場合は、一時的な障害でもその場ではリトライしない
+        max_attempts = 1 if self.defer_retries else None
+        queue = DeferredRetryQueue()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper") as executor:
+            futures = {
+                executor.submit(self._fetch_page_safely, url, respect_robots, max_attempts): index
+                for index, url in enumerate(urls)
+            }
+
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except (TransientFetchError, CircuitOpenError) as e:
+                    attempts = 0 if isinstance(e, CircuitOpenError) else (max_attempts or self.max_retries)
+                    queue.add(DeferredItem(index=index, url=urls[index], attempts=attempts, error=str(e)))
+                completed += 1
+
+                if progress_callback:
+                    progress_callback(completed, len(urls), urls[index])
+
+        retry_outcomes = self._drain_retry_queue(queue, results, respect_robots, workers)
+        # ページ取得中に遅延取得したrobots.txtも保存
+        self.robots.save()
+
+        success_count = sum(1 for result in results if result is not None)
+        aborted = [result for result in results if result is not None and result.truncated]
+        bytes_saved = sum(result.bytes_saved for result in aborted)
+        logger.info(f"Fetched {success_count}/{len(urls)} pages "
+                    f"(aborted early: {len(aborted)}, bytes saved: {bytes_saved})")
+
+        self.last_report = FetchReport(
+            total=len(urls),
+            succeeded=success_count,
+            failed=len(urls) - success_count,
+            breaker_trips=self.circuit_breaker.trips[trips_before:],
+            retry_outcomes=retry_outcomes
         )
+        logger.info(f"Fetch report: {self.last_report.summary()}")
+        return results
 
-        logger.info(f"Successfully fetched page (length: {len(html)} chars)")
-        return page_content
+    def _fetch_page_safely(
+        self,
+        url: str,
+        respect_robots: bool,
+        max_attempts: Optional[int] = None
+    ) -> Optional[PageContent]:
+        """一時的な障害以外の例外を送出せずにページを取得（fetch_many用）
+
+        Args:
+            url: 取得するページのURL
+            respect_robots: robots.txtを遵守するかどうか
+            max_attempts: 最大試行回数（Noneの場合はmax_retries）
+
+        Returns:
+            ページコンテンツ。取得に失敗した場合はNone
+
+        Raises:
+            CircuitOpenError: ホストのサーキットが開いている場合
+            TransientFetchError: 一時的な障害で取得できなかった場合（遅延リトライの対象）
+        """
+        try:
+            return self._fetch_page(url, respect_robots, max_attempts)
+        except (TransientFetchError, CircuitOpenError):
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to fetch page {url}: {e}")
+            return None
+
+    def _drain_retry_queue(
+        self,
+        queue: DeferredRetryQueue,
+        results: list[Optional[PageContent]],
+        respect_robots: bool,
+        workers: int
+    ) -> list[RetryOutcome]:
+        """遅延リトライキューのURLを再取得
+
+        deferred_retry_rounds回まで繰り返し、取得できたページはresultsの該当位置に格納します。
+        サーキットが開いているホストは、試行を再開できる時刻まで待ってから再取得します。
+
+        Args:
+            queue: 遅延リトライキュー
+            results: 取得結果のリスト（入力順）
+            respect_robots: robots.txtを遵守するかどうか
+            workers: 並列数
+
+        Returns:
+            遅延リトライの最終結果のリスト
+        """
+        outcomes: list[RetryOutcome] = []
+
+        for round_number in range(1, self.deferred_retry_rounds + 1):
+            items = queue.pop_all()
+            if not items:
+                break
+
+            logger.info(f"Retrying {len(items)} deferred URLs (round {round_number}/{self.deferred_retry_rounds})")
+            last_round = round_number == self.deferred_retry_rounds
+
+            probed_hosts: set[str] = set()
+            with ThreadPoolExecutor(max_workers=min(workers, len(items)), thread_name_prefix="retry") as executor:
+                futures = {
+                    executor.submit(self._retry_deferred, item, respect_robots, probed_hosts): item
+                    for item in items
+                }
+
+                for future in as_completed(futures):
+                    item = futures[future]
+                    try:
+                        page = future.result()
+                    except CircuitOpenError as e:
+                        item.error = str(e)
+                    except TransientFetchError as e:
+                        item.attempts += 1
+                        item.error = str(e)
+                    else:
+                        item.attempts += 1
+                        results[item.index] = page
+                        outcomes.append(RetryOutcome(item.url, item.attempts, page is not None))
+                        continue
+
+                    if last_round:
+                        outcomes.append(RetryOutcome(item.url, item.attempts, False, item.error))
+                    else:
+                        queue.add(item)
+
+        for item in queue.pop_all():
+            outcomes.append(RetryOutcome(item.url, item.attempts, False, item.error))
+        return outcomes
+
+    def _retry_deferred(
+        self,
+        item: DeferredItem,
+        respect_robots: bool,
+        probed_hosts: set[str]
+    ) -> Optional[PageContent]:
+        """遅延リトライの1件を再取得
+
+        サーキットが開いているホストは、ラウンドごとに最初の1件だけが
+        試行の再開まで待機して再取得します。同じホストの残りは待機せず、
+        サーキットが閉じていなければ即座に失敗して次のラウンドに回ります。
+
+        Args:
+            item: 遅延リトライの対象
+            respect_robots: robots.txtを遵守するかどうか
+            probed_hosts: このラウンドで待機済みのホスト（スレッド間で共有）
+
+        Returns:
+            ページコンテンツ。取得に失敗した場合はNone
+        """
+        host = urlparse(item.url).netloc.lower()
+        with self._retry_lock:
+            first_for_host = host not in probed_hosts
+            probed_hosts.add(host)
+
+        wait = self.circuit_breaker.time_until_probe(item.url) if first_for_host else 0
+        if wait > 0:
+            logger.debug(f"Waiting {wait:.1f} seconds for circuit to half-open: {host}")
+            time.sleep(wait)
+        return self._fetch_page_safely(item.url, respect_robots, max_attempts=1)
 
     def check_robots_txt(self, url: str) -> bool:
         """robots.txtをチェック
@@ -115,28 +496,7 @@ class WebScraper:
             アクセスが許可されている場合True
         """
         try:
-            parsed = urlparse(url)
-            domain = f"{parsed.scheme}://{parsed.netloc}"
-
-            # キャッシュからRobotFileParserを取得
-            if domain not in self.robots_parsers:
-                logger.debug(f"Loading robots.txt for domain: {domain}")
-                rp = RobotFileParser()
-                robots_url = urljoin(domain, "/robots.txt")
-                rp.set_url(robots_url)
-
-                try:
-                    rp.read()
-                    self.robots_parsers[domain] = rp
-                    logger.debug(f"robots.txt loaded successfully: {domain}")
-                except Exception as e:
-                    logger.warning(f"Failed to load robots.txt for {domain}: {e}")
-                    # robots.txtが取得できない場合はアクセスを許可
-                    return True
-
-            # アクセス可否の判定
-            rp = self.robots_parsers[domain]
-            can_fetch = rp.can_fetch(self.user_agent, url)
+            can_fetch = self.robots.can_fetch(url, self.user_agent)
 
             if can_fetch:
                 logger.debug(f"Access allowed by robots.txt: {url}")
@@ -150,86 +510,311 @@ class WebScraper:
             # エラー時はアクセスを許可
             return True
 
-    def _fetch_html(self, url: str) -> Optional[str]:
-        """HTMLを取得（リトライ機能付き）
+    def prefetch_robots(self, urls: list[str], max_workers: Optional[int] = None) -> None:
+        """URLリストの全ドメインのrobots.txtを並列に事前取得
+
+        Args:
+            urls: URLのリスト
+            max_workers: 並列数（Noneの場合は設定値）
+        """
+        self.robots.prefetch(urls, max_workers=max_workers or self.max_workers)
+
+    def _fetch_content(
+        self,
+        url: str,
+        cached: Optional[CachedResponse] = None,
+        max_attempts: Optional[int] = None
+    ) -> Optional[PageContent]:
+        """ページを取得（リトライ機能付き）
+
+        レスポンスはストリーミングで受信し、HTML以外のContent-Typeの場合は
+        本文を受信せずに打ち切ります。本文はmax_page_bytesまでに制限し、
+        stop_at_body_endが有効な場合は</body>を受信した時点で打ち切ります。
+
+        キャッシュエントリが渡された場合は条件付きリクエストを送り、
+        304 Not Modifiedならキャッシュの本文を返します。
+
+        タイムアウト・接続エラー・5xx・429は一時的な障害としてリトライし、
+        ホストのサーキットブレーカーに失敗を記録します。サーキットが開いた場合は
+        残りのリトライを行わずにCircuitOpenErrorを送出します。
 
         Args:
             url: 取得するURL
+            cached: 再検証する期限切れのキャッシュエントリ
+            max_attempts: 最大試行回数（Noneの場合はmax_retries）
 
         Returns:
-            取得したHTML。失敗した場合はNone
+            ページコンテンツ。404・403などの場合はNone
+
+        Raises:
+            CircuitOpenError: 失敗によりホストのサーキットが開いた場合
+            TransientFetchError: 一時的な障害ですべての試行に失敗した場合
         """
-        headers = {
-            'User-Agent': self.user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'ja,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
-
-        for attempt in range(1, self.max_retries + 1):
+        headers = build_request_headers(self.user_agent)
+        if cached:
+            headers.update(cached.conditional_headers())
+
+        max_attempts = max_attempts or self.max_retries
+        last_error = ""
+
+        for attempt in range(1, max_attempts + 1):
             try:
-                logger.debug(f"Fetching HTML (attempt {attempt}/{self.max_retries})")
+                logger.debug(f"Fetching HTML (attempt {attempt}/{max_attempts})")
 
-                response = requests.get(
+                response = self.session.get(
                     url,
                     headers=headers,
                     timeout=self.timeout,
-                    allow_redirects=True
+                    allow_redirects=True,
+                    stream=True
                 )
 
-                # ステータスコードのチェック
-                if response.status_code == 200:
-                    logger.debug(f"Successfully fetched HTML (status: {response.status_code})")
-                    return response.text
-                elif response.status_code == 404:
-                    logger.warning(f"Page not found (404): {url}")
-                    return None
-                elif response.status_code == 403:
-                    logger.warning(f"Access forbidden (403): {url}")
-                    return None
-                else:
-                    logger.warning(f"Unexpected status code {response.status_code}: {url}")
-                    response.raise_for_status()
+                with response:
+                    # 応答結果（429/503・Retry-After・応答時間）からドメインのレートを調整
+                    self.rate_limiter.on_response(
+                        url, response.status_code, response.headers, response.elapsed.total_seconds()
+                    )
+
+                    # 5xx・429は一時的な障害としてリトライ
+                    if is_transient_status(response.status_code):
+                        raise requests.HTTPError(
+                            f"{response.status_code} Server Error for url: {url}", response=response
+                        )
+
+                    # ホストは応答しているのでサーキットを閉じる
+                    self.circuit_breaker.record_success(url)
+
+                    # ステータスコードのチェック
+                    if response.status_code == 304 and cached and self.cache:
+                        logger.debug(f"Not modified (304), using cached HTML: {url}")
+                        self.cache.refresh(cached, response.headers)
+                        self.cache.record_revalidated(cached)
+                        return PageContent(
+                            url=url,
+                            html=cached.text(),
+                            status_code=200,
+                            content_type=cached.headers.get("content-type", "text/html"),
+                            encoding=cached.encoding or "utf-8",
+                            encoding_source="cache",
+                            from_cache=True,
+                            final_url=response.url or cached.final_url
+                        )
+                    elif response.status_code == 200:
+                        logger.debug(f"Successfully fetched HTML (status: {response.status_code})")
+                        return self._read_content(url, response)
+                    elif response.status_code == 404:
+                        logger.warning(f"Page not found (404): {url}")
+                        return None
+                    elif response.status_code == 403:
+                        logger.warning(f"Access forbidden (403): {url}")
+                        return None
+                    else:
+                        # その他の4xxはリトライしても結果が変わらない
+                        logger.warning(f"Unexpected status code {response.status_code}: {url}")
+                        return None
 
             except requests.Timeout as e:
-                logger.warning(f"Request timeout (attempt {attempt}/{self.max_retries}): {e}")
-
-                if attempt == self.max_retries:
-                    logger.error(f"Max retries exceeded due to timeout: {url}")
-                    return None
+                last_error = f"timeout: {e}"
+                logger.warning(f"Request timeout (attempt {attempt}/{max_attempts}): {e}")
 
             except requests.RequestException as e:
-                logger.warning(f"Request failed (attempt {attempt}/{self.max_retries}): {e}")
+                last_error = str(e)
+                logger.warning(f"Request failed (attempt {attempt}/{max_attempts}): {e}")
 
-                if attempt == self.max_retries:
-                    logger.error(f"Max retries exceeded: {url}")
-                    return None
+            # 失敗を記録し、サーキットが開いた場合は残りのリトライを行わない
+            if self.circuit_breaker.record_failure(url):
+                raise CircuitOpenError(urlparse(url).netloc.lower())
 
-            # 次のリトライ前に待機（指数バックオフ）
-            if attempt < self.max_retries:
-                wait_time = self.wait_time * (2 ** (attempt - 1))
+            # 次のリトライ前に待機（Retry-Afterの指定があればその時間、なければ指数バックオフ）
+            if attempt < max_attempts:
+                wait_time = self.rate_limiter.retry_delay(url, attempt, self.wait_time)
                 logger.debug(f"Waiting {wait_time} seconds before retry")
                 time.sleep(wait_time)
 
-        return None
+        logger.error(f"Max retries exceeded: {url}")
+        raise TransientFetchError(last_error)
+
+    def _read_content(self, url: str, response: requests.Response) -> PageContent:
+        """ストリーミングレスポンスから本文を読み込んでPageContentを作成
 
-    def _wait_for_rate_limit(self) -> None:
-        """レート制限のための待機
+        Args:
+            url: 取得したURL
+            response: stream=Trueで取得したレスポンス
 
-        前回のリクエストから十分な時間が経過していない場合、待機します。
+        Returns:
+            ページコンテンツ
         """
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
+        content_type = response.headers.get("Content-Type", "")
+        content_length = self._get_content_length(response)
+
+        # HTML以外は本文を受信せずに打ち切る
+        if not self._is_html_content_type(content_type):
+            return PageContent(
+                url=url,
+                html="",
+                status_code=response.status_code,
+                content_type=content_type,
+                final_url=response.url or None,
+                encoding="",
+                bytes_downloaded=0,
+                bytes_saved=content_length or 0,
+                truncated=True,
+                abort_reason="content_type"
+            )
+
+        body, abort_reason, stream = self._read_body(response, content_type)
+        bytes_downloaded = self._get_bytes_received(response, stream.bytes_received if stream else len(body))
+        bytes_saved = max(0, content_length - bytes_downloaded) if content_length and abort_reason else 0
+
+        if abort_reason == "max_bytes":
+            max_bytes = self.streaming_max_page_bytes if stream else self.max_page_bytes
+            logger.warning(f"Page exceeded {max_bytes} bytes, truncated: {url}")
+
+        if stream is not None:
+            # 本文は保持していないため、キャッシュせずに抽出結果を返す
+            detail = stream.close()
+            if self.cache:
+                self.cache.record_miss()
+            return PageContent(
+                url=url,
+                html="",
+                status_code=response.status_code,
+                content_type=content_type,
+                final_url=response.url or None,
+                encoding=stream.encoding.encoding,
+                encoding_source=stream.encoding.source,
+                bytes_downloaded=bytes_downloaded,
+                bytes_saved=bytes_saved,
+                truncated=abort_reason is not None,
+                abort_reason=abort_reason,
+                streamed=True,
+                detail=detail,
+                document=stream.document
+            )
+
+        # BOM・ヘッダー・<meta>・サンプル推定の順に判定（統計的な推定は本文全体には行わない）
+        html, detected = decode_html(body, content_type)
+        encoding = detected.encoding
+        logger.debug(f"Detected encoding {encoding} (source: {detected.source}): {url}")
+
+        # 完全に受信できた本文のみキャッシュする（</body>での打ち切りは本文として完全）
+        if self.cache:
+            self.cache.record_miss()
+            if abort_reason != "max_bytes":
+                self.cache.put(url, body, response.headers, encoding, final_url=response.url or None)
+
+        return PageContent(
+            url=url,
+            html=html,
+            status_code=response.status_code,
+            content_type=content_type,
+            final_url=response.url or None,
+            encoding=encoding,
+            encoding_source=detected.source,
+            bytes_downloaded=bytes_downloaded,
+            bytes_saved=bytes_saved,
+            truncated=abort_reason is not None,
+            abort_reason=abort_reason
+        )
+
+    def _read_body(
+        self,
+        response: requests.Response,
+        content_type: str = ""
+    ) -> tuple[bytes, Optional[str], Optional[StreamingExtraction]]:
+        """本文をチャンク単位で読み込む
+
+        ストリーミング抽出が有効な場合、受信量がstreaming_thresholdを超えた時点で
+        受信済みの本文をStreamingExtractionに渡し、以降のチャンクも保持せずに渡します。
+
+        Args:
+            response: stream=Trueで取得したレスポンス
+            content_type: Content-Typeヘッダーの値（ストリーミング抽出の文字コードの判定に使用）
 
-        if elapsed < self.wait_time:
-            wait_duration = self.wait_time - elapsed
-            logger.debug(f"Rate limiting: waiting {wait_duration:.2f} seconds")
-            time.sleep(wait_duration)
+        Returns:
+            (本文, 打ち切り理由, ストリーミング抽出)。最後まで読み込んだ場合の理由はNone。
+            ストリーミング抽出に切り替えた場合、本文は空です（closeは呼び出し元で行う）
+        """
+        chunks = []
+        total = 0
+        tail = b""
+        max_bytes = self.max_page_bytes
+        stream = None
+
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            if not chunk:
+                continue
+
+            if stream is None and self.stream_extractor is not None and total + len(chunk) > self.streaming_threshold:
+                stream = StreamingExtraction(self.stream_extractor, self.stream_plan, content_type)
+                for buffered in chunks:
+                    stream.feed(buffered)
+                chunks = []
+                max_bytes = self.streaming_max_page_bytes
+
+            # 上限を超える分を受信した場合のみ打ち切りとする（上限ちょうどで終わる本文は打ち切らない）
+            remaining = max_bytes - total
+            if len(chunk) > remaining:
+                if remaining > 0:
+                    chunk = chunk[:remaining]
+                    if stream is not None:
+                        stream.feed(chunk)
+                    else:
+                        chunks.append(chunk)
+                return b"".join(chunks), "max_bytes", stream
+
+            if stream is not None:
+                stream.feed(chunk)
+            else:
+                chunks.append(chunk)
+            total += len(chunk)
 
-        self.last_request_time = time.time()
+            if self.stop_at_body_end:
+                window = (tail + chunk).lower()
+                if BODY_END_MARKER in window:
+                    return b"".join(chunks), "body_end", stream
+                tail = window[-len(BODY_END_MARKER):]
+
+        return b"".join(chunks), None, stream
+
+    def _is_html_content_type(self, content_type: str) -> bool:
+        """HTMLとして扱うContent-Typeかどうか
+
+        Content-Typeがない場合はHTMLとみなします。
+        """
+        if not content_type:
+            return True
+        mime_type = content_type.split(";")[0].strip().lower()
+        return mime_type in Settings.HTML_CONTENT_TYPES
+
+    def _get_content_length(self, response: requests.Response) -> Optional[int]:
+        """Content-Lengthヘッダーの値を取得"""
+        try:
+            return int(response.headers.get("Content-Length", ""))
+        except ValueError:
+            return None
+
+    def _get_bytes_received(self, response: requests.Response, default: int) -> int:
+        """転送されたバイト数を取得（取得できない場合はdefault）"""
+        try:
+            return int(response.raw.tell())
+        except (AttributeError, TypeError, ValueError):
+            return default
+
+    def _wait_for_rate_limit(self, url: str) -> None:
+        """レート制限のための待機（ドメイン単位）
+
+        共有のRateLimiterで同じドメインへの送信時刻を予約し、その時刻まで待機します。
+        初回の送信間隔はwait_time秒で、以降は応答に応じて調整されます。
+        robots.txtのCrawl-delayがある場合は、その間隔より短くなりません。
+
+        Args:
+            url: これからアクセスするURL
+        """
+        crawl_delay = self.robots.crawl_delay(url, self.user_agent)
+        self.rate_limiter.acquire(url, self.wait_time, crawl_delay)
 
     def clear_robots_cache(self) -> None:
         """robots.txtのキャッシュをクリア"""
         logger.info("Clearing robots.txt cache")
-        self.robots_parsers.clear()
+        self.robots.clear()
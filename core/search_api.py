@@ -9,6 +9,8 @@ from dataclasses import dataclass
 
 from config.settings import Settings
 from config.constants import ERROR_MESSAGES
+from core.http_session import get_shared_session
+from core.rate_limiter import RateLimiter, get_shared_rate_limiter
 from core.searcher import SearchItem, SearchOptions
 from utils.logger import get_logger
 
@@ -18,12 +20,26 @@ logger = get_logger(__name__)
 class SearchAPIClient:
     """検索APIクライアント（Tavily/Google対応）"""
 
-    def __init__(self, provider: Optional[str] = None):
+    TAVILY_API_URL = "https://api.tavily.com/search"
+    GOOGLE_API_URL = "https://www.googleapis.com/customsearch/v1"
+    API_TIMEOUT = 30  # 秒
+    API_INTERVAL = 0  # APIへの送信間隔（秒）。0の場合は429/503を受けるまで制限しない
+
+    def __init__(
+        self,
+        provider: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
         """初期化
 
         Args:
             provider: 使用するAPI（"tavily" or "google"）。Noneの場合は設定ファイルから取得
+            session: 使用するHTTPセッション（Noneの場合は共有セッション）
+            rate_limiter: ドメイン単位のレート制限（Noneの場合は共有のRateLimiter）
         """
+        self.session = session or get_shared_session()
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
         self.provider = provider or Settings.SEARCH_API_PROVIDER
 
         if self.provider == "tavily":
@@ -78,9 +94,35 @@ class SearchAPIClient:
         Returns:
             検索結果のリスト
         """
-        url = "https://api.tavily.com/search"
+        url = self.TAVILY_API_URL
+        payload = self._build_tavily_payload(keyword, options)
 
-        payload = {
+        try:
+            logger.debug(f"Calling Tavily API: {url}")
+            self.rate_limiter.acquire(url, self.API_INTERVAL)
+            response = self.session.post(url, json=payload, timeout=self.API_TIMEOUT)
+            self.rate_limiter.on_response(
+                url, response.status_code, response.headers, response.elapsed.total_seconds()
+            )
+            response.raise_for_status()
+
+            return self._parse_tavily_response(response.json())
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Tavily API request failed: {e}", exc_info=True)
+            raise RuntimeError(f"Tavily API呼び出しに失敗しました: {e}")
+
+    def _build_tavily_payload(self, keyword: str, options: SearchOptions) -> dict:
+        """Tavily APIのリクエストボディを作成
+
+        Args:
+            keyword: 検索キーワード
+            options: 検索オプション
+
+        Returns:
+            リクエストボディ
+        """
+        return {
             "api_key": self.api_key,
             "query": keyword,
             "max_results": options.num_results,
@@ -91,33 +133,32 @@ class SearchAPIClient:
             "exclude_domains": []
         }
 
-        try:
-            logger.debug(f"Calling Tavily API: {url}")
-            response = requests.post(url, json=payload, timeout=30)
-            response.raise_for_status()
+    def _parse_tavily_response(self, data: dict) -> list[SearchItem]:
+        """Tavily APIのレスポンスをSearchItemに変換
 
-            data = response.json()
-            results = data.get("results", [])
+        Args:
+            data: レスポンスのJSON
 
-            logger.info(f"Tavily API returned {len(results)} results")
+        Returns:
+            検索結果のリスト
+        """
+        results = data.get("results", [])
 
-            # SearchItemに変換
-            search_items = []
-            for rank, result in enumerate(results, start=1):
-                search_item = SearchItem(
-                    rank=rank,
-                    title=result.get("title", ""),
-                    url=result.get("url", ""),
-                    description=result.get("content", ""),
-                    snippet=result.get("content", "")[:200]  # 最初の200文字をスニペットに
-                )
-                search_items.append(search_item)
+        logger.info(f"Tavily API returned {len(results)} results")
 
-            return search_items
+        # SearchItemに変換
+        search_items = []
+        for rank, result in enumerate(results, start=1):
+            search_item = SearchItem(
+                rank=rank,
+                title=result.get("title", ""),
+                url=result.get("url", ""),
+                description=result.get("content", ""),
+                snippet=result.get("content", "")[:200]  # 最初の200文字をスニペットに
+            )
+            search_items.append(search_item)
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Tavily API request failed: {e}", exc_info=True)
-            raise RuntimeError(f"Tavily API呼び出しに失敗しました: {e}")
+        return search_items
 
     def _search_google(self, keyword: str, options: SearchOptions) -> list[SearchItem]:
         """Google Custom Search APIで検索
@@ -129,9 +170,35 @@ class SearchAPIClient:
         Returns:
             検索結果のリスト
         """
-        url = "https://www.googleapis.com/customsearch/v1"
+        url = self.GOOGLE_API_URL
+        params = self._build_google_params(keyword, options)
 
-        params = {
+        try:
+            logger.debug(f"Calling Google Custom Search API: {url}")
+            self.rate_limiter.acquire(url, self.API_INTERVAL)
+            response = self.session.get(url, params=params, timeout=self.API_TIMEOUT)
+            self.rate_limiter.on_response(
+                url, response.status_code, response.headers, response.elapsed.total_seconds()
+            )
+            response.raise_for_status()
+
+            return self._parse_google_response(response.json())
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Google API request failed: {e}", exc_info=True)
+            raise RuntimeError(f"Google API呼び出しに失敗しました: {e}")
+
+    def _build_google_params(self, keyword: str, options: SearchOptions) -> dict:
+        """Google Custom Search APIのクエリパラメータを作成
+
+        Args:
+            keyword: 検索キーワード
+            options: 検索オプション
+
+        Returns:
+            クエリパラメータ
+        """
+        return {
             "key": self.api_key,
             "cx": self.cx_id,
             "q": keyword,
@@ -140,30 +207,29 @@ class SearchAPIClient:
             "lr": f"lang_{options.language}"
         }
 
-        try:
-            logger.debug(f"Calling Google Custom Search API: {url}")
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-            items = data.get("items", [])
+    def _parse_google_response(self, data: dict) -> list[SearchItem]:
+        """Google Custom Search APIのレスポンスをSearchItemに変換
 
-            logger.info(f"Google API returned {len(items)} results")
-
-            # SearchItemに変換
-            search_items = []
-            for rank, item in enumerate(items, start=1):
-                search_item = SearchItem(
-                    rank=rank,
-                    title=item.get("title", ""),
-                    url=item.get("link", ""),
-                    description=item.get("snippet", ""),
-                    snippet=item.get("snippet", "")
-                )
-                search_items.append(search_item)
-
-            return search_items
+        Args:
+            data: レスポンスのJSON
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Google API request failed: {e}", exc_info=True)
-            raise RuntimeError(f"Google API呼び出しに失敗しました: {e}")
+        Returns:
+            検索結果のリスト
+        """
+        items = data.get("items", [])
+
+        logger.info(f"Google API returned {len(items)} results")
+
+        # SearchItemに変換
+        search_items = []
+        for rank, item in enumerate(items, start=1):
+            search_item = SearchItem(
+                rank=rank,
+                title=item.get("title", ""),
+                url=item.get("link", ""),
+                description=item.get("snippet", ""),
+                snippet=item.get("snippet", "")
+            )
+            search_items.append(search_item)
+
+        return search_items
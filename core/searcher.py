@@ -7,11 +7,13 @@ from dataclasses import dataclass, field
 from typing import Optional
 import time
 import requests
-from bs4 import BeautifulSoup
 from urllib.parse import quote_plus, urljoin
 
 from config.settings import Settings
 from config.constants import GOOGLE_SEARCH_URL, ERROR_MESSAGES
+from core.html_backend import HtmlBackend, get_parser_backend
+from core.http_session import get_shared_session
+from core.rate_limiter import RateLimiter, get_shared_rate_limiter
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -45,16 +47,28 @@ class GoogleSearcher:
     アクセス間隔の制御やCAPTCHA検出などの機能を含みます。
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        parser_backend: Optional[HtmlBackend] = None
+    ):
         """初期化
 
         GoogleSearcherインスタンスを初期化します。
+
+        Args:
+            session: 使用するHTTPセッション（Noneの場合は共有セッション）
+            rate_limiter: ドメイン単位のレート制限（Noneの場合は共有のRateLimiter）
+            parser_backend: 検索結果の解析に使用するバックエンド（Noneの場合は設定値のバックエンド）
         """
+        self.session = session or get_shared_session()
+        self.rate_limiter = rate_limiter or get_shared_rate_limiter()
+        self.parser_backend = parser_backend or get_parser_backend()
         self.wait_time = Settings.DEFAULT_WAIT_TIME
         self.timeout = Settings.REQUEST_TIMEOUT
         self.max_retries = Settings.MAX_RETRIES
         self.user_agent = Settings.USER_AGENT
-        self.last_request_time = 0
         logger.info("GoogleSearcher initialized")
 
     def search(self, keyword: str, options: Optional[SearchOptions] = None) -> list[SearchItem]:
@@ -155,27 +169,28 @@ class GoogleSearcher:
         Returns:
             抽出された検索結果のリスト
         """
-        soup = BeautifulSoup(html, 'lxml')
+        backend = self.parser_backend
+        root = backend.parse_tree(html)
         search_items = []
 
         # Google検索結果のdiv要素を取得
         # NOTE: Googleの構造は変更される可能性があるため、複数のセレクタを試行
-        result_divs = soup.select('div.g') or soup.select('div[data-sokoban-container]')
+        result_divs = backend.select(root, 'div.g') or backend.select(root, 'div[data-sokoban-container]')
 
         logger.debug(f"Found {len(result_divs)} result elements")
 
         for rank, div in enumerate(result_divs[:max_results], start=1):
             try:
                 # タイトルとURLの取得
-                title_elem = div.select_one('h3')
-                link_elem = div.select_one('a')
+                title_elem = backend.select_one(div, 'h3')
+                link_elem = backend.select_one(div, 'a')
 
-                if not title_elem or not link_elem:
+                if title_elem is None or link_elem is None:
                     logger.debug(f"Skipping result {rank}: missing title or link")
                     continue
 
-                title = title_elem.get_text(strip=True)
-                url = link_elem.get('href', '')
+                title = backend.get_text(title_elem, strip=True)
+                url = backend.get_attribute(link_elem, 'href')
 
                 # URLの正規化
                 if url.startswith('/url?q='):
@@ -183,8 +198,10 @@ class GoogleSearcher:
                     url = url.split('/url?q=')[1].split('&')[0]
 
                 # 説明文の取得
-                desc_elem = div.select_one('div[data-sncf]') or div.select_one('div.VwiC3b')
-                description = desc_elem.get_text(strip=True) if desc_elem else ""
+                desc_elem = backend.select_one(div, 'div[data-sncf]')
+                if desc_elem is None:
+                    desc_elem = backend.select_one(div, 'div.VwiC3b')
+                description = backend.get_text(desc_elem, strip=True) if desc_elem is not None else ""
 
                 # スニペット（要約）の取得
                 snippet = description[:200] if description else title
@@ -227,11 +244,14 @@ class GoogleSearcher:
         for attempt in range(1, self.max_retries + 1):
             try:
                 logger.debug(f"Fetching search results (attempt {attempt}/{self.max_retries})")
-                response = requests.get(
+                response = self.session.get(
                     url,
                     headers=headers,
                     timeout=self.timeout
                 )
+                self.rate_limiter.on_response(
+                    url, response.status_code, response.headers, response.elapsed.total_seconds()
+                )
                 response.raise_for_status()
 
                 logger.debug(f"Successfully fetched search results (status: {response.status_code})")
@@ -244,8 +264,8 @@ class GoogleSearcher:
                     logger.error(f"Max retries exceeded for URL: {url}")
                     raise
 
-                # 次のリトライ前に待機
-                time.sleep(self.wait_time * attempt)
+                # 次のリトライ前に待機（Retry-Afterの指定があればその時間）
+                time.sleep(self.rate_limiter.retry_delay(url, attempt, self.wait_time))
 
         # このコードには到達しないが、型チェッカー対策
         raise RuntimeError("Unexpected error in _fetch_search_results")
@@ -253,17 +273,10 @@ class GoogleSearcher:
     def _wait_for_rate_limit(self) -> None:
         """レート制限のための待機
 
-        前回のリクエストから十分な時間が経過していない場合、待機します。
+        共有のRateLimiterで検索ページへの送信時刻を予約し、その時刻まで待機します。
+        429/503やRetry-Afterを受けた場合は、以降の検索の間隔が広がります。
         """
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
-
-        if elapsed < self.wait_time:
-            wait_duration = self.wait_time - elapsed
-            logger.debug(f"Rate limiting: waiting {wait_duration:.2f} seconds")
-            time.sleep(wait_duration)
-
-        self.last_request_time = time.time()
+        self.rate_limiter.acquire(GOOGLE_SEARCH_URL, self.wait_time)
 
     def _detect_captcha(self, html: str) -> bool:
         """CAPTCHA検出
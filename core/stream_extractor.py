@@ -0,0 +1,497 @@
+"""ストリーミング抽出モジュール
+
+このモジュールは、受信中のHTMLのバイト列を増分パーサー（lxmlのHTMLParserのfeed）に渡し、
+ページ全体を保持せずに詳細情報を抽出するStreamingExtractionを提供します。
+
+- 文字コードは先頭のサンプル（DETECT_SAMPLE_BYTES）で判定し、以降は増分デコードします。
+- パーサーは解析ツリーを作らず、パーサーターゲットのイベントから、LxmlBackendと同じ
+  リンク・head内のメタデータ・JSON-LD・h1・microdataと、タグを除去したテキストを取り出します。
+- テキストは一定の文字数（窓）ごとに、抽出計画の項目のパターン（PatternScanner）と
+  地名辞書で走査し、一致の前後だけを抜粋として残します。住所は、候補のうちスコアの高いもの
+  （_MAX_ADDRESS_CANDIDATES件）のみを残します。次の窓には末尾の一定文字数を持ち越すため、
+  窓の境界をまたぐ一致も検出できます。SNSリンクはリンク（ParsedDocument.anchors）から取得します。
+- テキストはテキストノードごとに正規化（core.text_normalizer）してから窓に加えるため、
+  窓と抜粋は通常の抽出の正規化したテキスト（ParsedDocument.normalized）と同じ表記になります。
+- 最後に、抜粋をテキストに持つParsedDocument（streamed=True）をInfoExtractor.extract_allに渡すため、
+  正規化・検証・構造化データの優先などは通常の抽出と同じ処理になります。
+
+保持するのは窓・抜粋・リンクなどのみのため、ページのサイズによらずメモリ使用量はほぼ一定です。
+抜粋どうしの間には区切りを挟むため、離れた位置の郵便番号と住所が近いとみなされることはありません。
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+import codecs
+import re
+
+from lxml import etree
+
+from config.settings import Settings
+from core.document import REGION_MAIN, DocumentLink, MicrodataProperty, ParsedDocument
+from core.encoding import DETECT_SAMPLE_BYTES, EncodingResult, detect_encoding
+from core.extraction_plan import ExtractionPlan
+from core.extractor import DetailedInfo, InfoExtractor
+from core.gazetteer import POSTAL_PROXIMITY, AddressCandidate
+from core.html_backend import (
+    STRIP_TAGS, LxmlBackend, _MICRODATA_VALUE_ATTRIBUTES, _add_meta, _add_microdata, _join_parts, _normalize_rel,
+    element_region,
+)
+from core.scanner import (
+    KIND_BUSINESS_HOURS, KIND_CLOSED_DAYS, KIND_EMAIL, KIND_FAX, KIND_PHONE, KIND_POSTAL_CODE
+)
+from core.text_normalizer import normalize
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 抽出計画の項目ごとに走査するパターンの種類
+_FIELD_KINDS = {
+    "phone": (KIND_PHONE,),
+    "email": (KIND_EMAIL,),
+    "fax": (KIND_FAX,),
+    "address": (KIND_POSTAL_CODE,),
+    "business_hours": (KIND_BUSINESS_HOURS,),
+    "closed_days": (KIND_CLOSED_DAYS,),
+}
+
+# 一致の前後に抜粋として残す文字数（パターンの前後の文脈）
+_EXCERPT_MARGIN = 64
+# 抜粋として残す住所の候補の数（スコアの高い順）
+_MAX_ADDRESS_CANDIDATES = 16
+# 抜粋どうしの区切り。どのパターンも「。」をまたいで一致せず、
+# 郵便番号と住所の候補が近いとみなされる距離（POSTAL_PROXIMITY）より長くする
+_EXCERPT_SEPARATOR = "。" * (POSTAL_PROXIMITY + 1)
+
+# XML宣言（デコード済みのHTMLをUTF-8で渡すため、宣言の文字コードをパーサーに使わせない）
+_XML_DECLARATION_PATTERN = re.compile(r'^\s*<\?xml[^>]*>')
+# 連続する空白を1つにまとめるパターン
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+@dataclass
+class _Excerpt:
+    """一致の前後の抜粋（ページのテキスト内の位置）"""
+    start: int
+    end: int
+    parts: list[str]  # 後ろの一致とつなげた部分を順に持つ（連結のコピーを避ける）
+
+
+@dataclass
+class _Anchor:
+    """終了タグを待っているリンク"""
+    index: int  # document.linksでの位置（開始タグの順にそろえる）
+    href: str
+    title: str
+    rel: str
+    region: str
+    texts: list[str] = field(default_factory=list)
+    alts: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _Frame:
+    """開いている要素"""
+    tag: str
+    item_type: Optional[str] = None  # itemscope属性を持つ場合のitemtype（型がない場合は空文字列）
+    region: Optional[str] = None  # ヘッダー・フッターを表す要素の場合はその位置
+    strip: bool = False
+    title: bool = False
+    h1: bool = False
+    json_ld: Optional[list[str]] = None
+    anchor: Optional[_Anchor] = None
+    # テキストを値とするmicrodataのプロパティ（終了タグで値を設定）
+    properties: Optional[list[MicrodataProperty]] = None
+    property_texts: list[str] = field(default_factory=list)
+
+
+class _DocumentTarget:
+    """lxmlのパーサーターゲット
+
+    解析ツリーを作らずに、イベントからdocumentのリンク・メタデータ・JSON-LD・h1・microdataを設定し、
+    タグを除去したテキストノードをon_textに渡します。内容はLxmlBackendが解析ツリーから
+    取り出すものと同じです（script/style/svg/noscript/templateタグの中身は除きます）。
+    """
+
+    def __init__(self, document: ParsedDocument, on_text):
+        self.document = document
+        self._on_text = on_text
+        self._stack: list[_Frame] = []
+        self._strip_depth = 0
+        # dataは1つのテキストノードが分割されて届くため、次のタグまでためる
+        self._node: list[str] = []
+        self._title: Optional[list[str]] = None
+        self._title_seen = False
+        self._title_has_children = False
+        self._h1: Optional[list[str]] = None
+        self._anchors: list[_Anchor] = []
+        self._links: list[Optional[DocumentLink]] = []
+
+    def start(self, tag, attrib) -> None:
+        self._flush()
+        if not isinstance(tag, str):
+            return
+        tag = tag.lower()
+        frame = _Frame(tag)
+        if attrib.get('itemscope') is not None:
+            frame.item_type = attrib.get('itemtype') or ""
+        frame.region = element_region(tag, attrib.get('role'), attrib.get('id'), attrib.get('class'))
+        if self._title is not None:
+            self._title_has_children = True
+
+        # head内のメタデータ（LxmlBackendと同様に、中身を削除するタグの中も対象）
+        if tag == 'meta':
+            _add_meta(self.document, attrib.get('property') or attrib.get('name'), attrib.get('content'))
+        elif tag == 'title' and not self._title_seen:
+            # LxmlBackendと同様に最初のtitleタグのみ（子要素を含む場合はNone）
+            self._title_seen = True
+            self._title = []
+            frame.title = True
+        elif tag == 'script' and attrib.get('type') == 'application/ld+json':
+            frame.json_ld = []
+        elif tag == 'base' and self.document.base_href is None and attrib.get('href') is not None:
+            self.document.base_href = attrib.get('href').strip()
+
+        if tag in STRIP_TAGS:
+            self._strip_depth += 1
+            frame.strip = True
+        elif not self._strip_depth:
+            self._start_content(tag, attrib, frame)
+
+        self._stack.append(frame)
+
+    def end(self, tag) -> None:
+        self._flush()
+        if not self._stack:
+            return
+        frame = self._stack.pop()
+        if frame.strip:
+            self._strip_depth -= 1
+        if frame.json_ld:
+            self.document.json_ld.append("".join(frame.json_ld))
+        if frame.title:
+            if not self._title_has_children and self._title:
+                self.document.title = "".join(self._title)
+            self._title = None
+        if frame.h1:
+            self.document.h1 = "".join(self._h1)
+            self._h1 = None
+        if frame.anchor is not None:
+            anchor = frame.anchor
+            self._anchors.remove(anchor)
+            parts = [" ".join(anchor.texts), anchor.title]
+            parts.extend(anchor.alts)
+            self._links[anchor.index] = DocumentLink(
+                href=anchor.href, text=_join_parts(parts), rel=anchor.rel, region=anchor.region
+            )
+        if frame.properties:
+            value = _WHITESPACE_PATTERN.sub(' ', " ".join(frame.property_texts)).strip()
+            for prop in frame.properties:
+                prop.value = value
+
+    def data(self, data: str) -> None:
+        if self._strip_depth:
+            # JSON-LDのscriptタグの中身のみ保持する
+            frame = self._stack[-1] if self._stack else None
+            if frame is not None and frame.json_ld is not None:
+                frame.json_ld.append(data)
+            elif self._title is not None:
+                self._title.append(data)
+            return
+        self._node.append(data)
+
+    def comment(self, text: str) -> None:
+        # コメントの前後は別のテキストノード
+        self._flush()
+
+    def close(self) -> None:
+        self._flush()
+        while self._stack:
+            self.end(self._stack[-1].tag)
+        self.document.links = [link for link in self._links if link is not None]
+
+    def _start_content(self, tag: str, attrib, frame: _Frame) -> None:
+        """本文の要素（中身を削除するタグの外）の開始タグを処理"""
+        if tag == 'h1' and self.document.h1 is None and self._h1 is None:
+            self._h1 = []
+            frame.h1 = True
+        elif tag == 'a':
+            href = attrib.get('href')
+            if href is not None:
+                region = next((parent.region for parent in reversed(self._stack) if parent.region), REGION_MAIN)
+                anchor = _Anchor(index=len(self._links), href=href.strip(), title=attrib.get('title', ""),
+                                 rel=_normalize_rel(attrib.get('rel')), region=region)
+                self._links.append(None)
+                self._anchors.append(anchor)
+                frame.anchor = anchor
+        elif tag == 'img':
+            for anchor in self._anchors:
+                anchor.alts.append(attrib.get('alt', ""))
+
+        itemprop = attrib.get('itemprop')
+        if itemprop is None or frame.item_type is not None:
+            return
+        scope = next((parent.item_type for parent in reversed(self._stack) if parent.item_type is not None), None)
+        attribute = _MICRODATA_VALUE_ATTRIBUTES.get(tag)
+        value = attrib.get(attribute) if attribute else None
+        count = len(self.document.microdata)
+        _add_microdata(self.document, itemprop, scope, value or "")
+        if value is None:
+            # 値はテキストのため、終了タグで設定する（プロパティの順序は開始タグの順）
+            frame.properties = self.document.microdata[count:]
+
+    def _flush(self) -> None:
+        """ためたテキストノードを処理"""
+        if not self._node:
+            return
+        text = "".join(self._node)
+        self._node = []
+        self._on_text(text)
+        if self._title is not None:
+            self._title.append(text)
+        if self._h1 is not None:
+            self._h1.append(text)
+        stripped = text.strip()
+        if stripped:
+            for anchor in self._anchors:
+                anchor.texts.append(stripped)
+        for frame in self._stack:
+            if frame.properties:
+                frame.property_texts.append(text)
+
+
+class StreamingExtraction:
+    """1ページ分のストリーミング抽出
+
+    受信したバイト列を順にfeedに渡し、最後にcloseで抽出結果を取得します。
+    closeの後のdocumentは、リンク・メタデータ・JSON-LD・microdataと、
+    一致の前後の抜粋（text）を持ちます（htmlは空文字列）。
+    インスタンスはスレッド間で共有しないでください。
+    """
+
+    def __init__(
+        self,
+        extractor: InfoExtractor,
+        plan: Optional[ExtractionPlan] = None,
+        content_type: Optional[str] = None,
+        window_chars: Optional[int] = None,
+        overlap_chars: Optional[int] = None,
+        max_excerpt_chars: Optional[int] = None
+    ):
+        """初期化
+
+        Args:
+            extractor: 抽出に使用するInfoExtractor（パターン・地名辞書・抽出処理を共有）
+            plan: 抽出する項目の計画（Noneの場合はextractorの計画）
+            content_type: Content-Typeヘッダーの値（文字コードの判定に使用）
+            window_chars: 1回に走査するテキストの文字数（Noneの場合は設定値）
+            overlap_chars: 次の走査に持ち越す文字数（Noneの場合は設定値）
+            max_excerpt_chars: 抜粋として保持する最大文字数（Noneの場合は設定値）
+        """
+        self.extractor = extractor
+        self.plan = plan or extractor.plan
+        self.content_type = content_type
+        self.window_chars = max(1, window_chars or Settings.STREAMING_WINDOW_CHARS)
+        overlap = Settings.STREAMING_OVERLAP_CHARS if overlap_chars is None else overlap_chars
+        self.overlap_chars = min(overlap, self.window_chars // 2)
+        self.max_excerpt_chars = max_excerpt_chars or Settings.STREAMING_MAX_EXCERPT_CHARS
+
+        fields = self.plan.detail_fields
+        self._kinds = tuple(kind for name in fields for kind in _FIELD_KINDS.get(name, ()))
+        self._find_addresses = "address" in fields
+
+        self.document = ParsedDocument(html="", backend=LxmlBackend.name, streamed=True)
+        self.encoding: Optional[EncodingResult] = None
+        self.bytes_received = 0
+        self.chars_received = 0  # タグを除去したテキストの文字数
+        self.peak_buffer_chars = 0  # 同時に保持したテキストの最大文字数（抜粋を除く）
+
+        self._head: list[bytes] = []  # 文字コードの判定前に受信したバイト列
+        self._head_size = 0
+        self._decoder = None
+        self._target = _DocumentTarget(self.document, self._add_text)
+        self._parser = etree.HTMLParser(target=self._target, encoding='utf-8')
+
+        # 走査待ちのテキスト（_textは前の窓から持ち越した部分、_text_startはその先頭のページ内の位置）
+        self._text = ""
+        self._text_start = 0
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._space = True  # 直前のテキストが空白で終わっているか（先頭の空白は除く）
+
+        # 一致の前後の抜粋（開始位置の順）と、住所の候補の抜粋（(順位のキー, 抜粋)のスコアの高い順）
+        self._excerpts: list[_Excerpt] = []
+        self._excerpt_chars = 0
+        self._dropped_excerpts = 0
+        self._address_excerpts: list[tuple[tuple[int, int], _Excerpt]] = []
+        self._accepted_end = 0  # 前の窓までに採用した範囲の終わり（ページ内の位置）
+
+        self._result: Optional[DetailedInfo] = None
+
+    def feed(self, chunk: bytes) -> None:
+        """受信したバイト列を渡す
+
+        Args:
+            chunk: HTMLのバイト列（受信した順）
+
+        Raises:
+            RuntimeError: close後に呼び出した場合
+        """
+        if self._result is not None:
+            raise RuntimeError("StreamingExtraction is already closed")
+        if not chunk:
+            return
+        self.bytes_received += len(chunk)
+        if self._decoder is None:
+            # 文字コードの判定に十分な量を受信するまでためる
+            self._head.append(chunk)
+            self._head_size += len(chunk)
+            if self._head_size >= DETECT_SAMPLE_BYTES:
+                self._start_decoding()
+            return
+        self._feed_html(self._decoder.decode(chunk))
+
+    def close(self) -> DetailedInfo:
+        """受信を終えて抽出結果を取得
+
+        Returns:
+            抽出された詳細情報（2回目以降は同じ結果）
+        """
+        if self._result is not None:
+            return self._result
+
+        if self._decoder is None:
+            self._start_decoding()
+        self._feed_html(self._decoder.decode(b"", final=True))
+        try:
+            self._parser.close()
+        except etree.LxmlError as e:
+            # 空のページなど（受信済みの内容は処理済み）
+            logger.debug(f"Streaming parser closed with error: {e}")
+
+        self._scan_text(final=True)
+
+        self.document.text = _EXCERPT_SEPARATOR.join(self._merged_excerpts())
+        logger.debug(f"Streamed {self.bytes_received} bytes ({self.chars_received} chars of text, "
+                     f"{len(self._excerpts) + len(self._address_excerpts)} excerpts, "
+                     f"{len(self.document.text)} chars kept, "
+                     f"peak buffer {self.peak_buffer_chars} chars)")
+        if self._dropped_excerpts:
+            logger.warning(f"Dropped {self._dropped_excerpts} excerpts over "
+                           f"{self.max_excerpt_chars} chars while streaming")
+
+        self._result = self.extractor.extract_all(self.document, self.plan)
+        return self._result
+
+    def _start_decoding(self) -> None:
+        """先頭のバイト列から文字コードを判定し、増分デコードを開始"""
+        head = b"".join(self._head)
+        self._head = []
+        self.encoding = detect_encoding(head, self.content_type)
+        try:
+            self._decoder = codecs.getincrementaldecoder(self.encoding.encoding)(errors="replace")
+        except LookupError:
+            logger.warning(f"Unknown encoding '{self.encoding.encoding}', falling back to utf-8")
+            self.encoding = EncodingResult("utf-8", "default")
+            self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._feed_html(_XML_DECLARATION_PATTERN.sub('', self._decoder.decode(head), count=1))
+
+    def _feed_html(self, html: str) -> None:
+        """デコードしたHTMLをパーサーに渡す"""
+        if not html:
+            return
+        # LxmlBackendと同様に、UTF-8のバイト列で渡す
+        self._parser.feed(html.encode('utf-8', errors='replace'))
+
+    def _add_text(self, text: str) -> None:
+        """テキストノードを正規化して追加（連続する空白は1つにまとめ、ノードの間には空白を挟む）"""
+        piece = _WHITESPACE_PATTERN.sub(' ', " " + normalize(text))
+        if self._space:
+            piece = piece[1:]
+        if not piece:
+            return
+        self._space = piece.endswith(' ')
+        self._pending.append(piece)
+        self._pending_chars += len(piece)
+        self.chars_received += len(piece)
+        if self._pending_chars >= self.window_chars:
+            self._scan_text(final=False)
+
+    def _scan_text(self, final: bool) -> None:
+        """走査待ちのテキストを走査して、一致の前後を抜粋に追加
+
+        最後の窓でなければ、末尾のoverlap_chars文字より前から始まる一致のみを採用し、
+        残りは次の窓に持ち越します。
+        """
+        window = self._text + "".join(self._pending)
+        self._pending = []
+        self._pending_chars = 0
+        self.peak_buffer_chars = max(self.peak_buffer_chars, len(window))
+        limit = len(window) if final else len(window) - self.overlap_chars
+
+        scan = self.extractor.scanner.scan(window)
+        spans = []
+        for kind in self._kinds:
+            spans.extend((match.start, match.end) for match in scan.get(kind) if match.start < limit)
+        for start, end in sorted(spans):
+            self._add_excerpt(window, max(0, start - _EXCERPT_MARGIN), min(len(window), end + _EXCERPT_MARGIN))
+
+        if self._find_addresses:
+            for candidate in self.extractor.gazetteer.find_candidates(window, scan.get(KIND_POSTAL_CODE)):
+                # 前の窓で採用済みの候補（持ち越した部分）は除く
+                if candidate.start < limit and self._text_start + candidate.start >= self._accepted_end:
+                    self._add_address_candidate(window, candidate)
+
+        if final:
+            self._text = ""
+            return
+        self._accepted_end = self._text_start + limit
+        # 次の窓で前後の文脈として使えるよう、採用範囲の末尾の手前から持ち越す
+        keep = max(0, limit - _EXCERPT_MARGIN)
+        self._text = window[keep:]
+        self._text_start += keep
+
+    def _add_excerpt(self, window: str, start: int, end: int) -> None:
+        """窓の範囲を抜粋に追加（直前の抜粋と重なる場合はつなげる）"""
+        if self._excerpt_chars >= self.max_excerpt_chars:
+            self._dropped_excerpts += 1
+            return
+        page_start = self._text_start + start
+        page_end = self._text_start + end
+        last = self._excerpts[-1] if self._excerpts else None
+        if last is not None and page_start <= last.end:
+            if page_end > last.end:
+                last.parts.append(window[last.end - self._text_start:end])
+                self._excerpt_chars += page_end - last.end
+                last.end = page_end
+            return
+        self._excerpts.append(_Excerpt(page_start, page_end, [window[start:end]]))
+        self._excerpt_chars += end - start
+
+    def _add_address_candidate(self, window: str, candidate: AddressCandidate) -> None:
+        """住所の候補の前後を抜粋に追加（スコアの高い順に_MAX_ADDRESS_CANDIDATES件まで）"""
+        start = max(0, candidate.start - _EXCERPT_MARGIN)
+        end = min(len(window), candidate.end + _EXCERPT_MARGIN)
+        # 全体を走査した場合と同じく、スコアの高い順・同点は出現位置の順
+        key = (-candidate.score, self._text_start + candidate.start)
+        excerpt = _Excerpt(self._text_start + start, self._text_start + end, [window[start:end]])
+        self._address_excerpts.append((key, excerpt))
+        if len(self._address_excerpts) > _MAX_ADDRESS_CANDIDATES:
+            self._address_excerpts.sort(key=lambda item: item[0])
+            del self._address_excerpts[_MAX_ADDRESS_CANDIDATES:]
+
+    def _merged_excerpts(self) -> list[str]:
+        """一致の抜粋と住所の候補の抜粋を位置の順に並べ、重なるものをつなげたテキストのリスト"""
+        excerpts = sorted(
+            [(excerpt.start, excerpt.end, "".join(excerpt.parts)) for excerpt in self._excerpts]
+            + [(excerpt.start, excerpt.end, "".join(excerpt.parts)) for _, excerpt in self._address_excerpts]
+        )
+        merged: list[list] = []
+        for start, end, text in excerpts:
+            if merged and start <= merged[-1][1]:
+                last = merged[-1]
+                if end > last[1]:
+                    last[2].append(text[last[1] - start:])
+                    last[1] = end
+            else:
+                merged.append([start, end, [text]])
+        return ["".join(parts) for _, _, parts in merged]
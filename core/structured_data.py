@@ -0,0 +1,319 @@
+"""構造化データ抽出モジュール
+
+このモジュールは、ページに埋め込まれた構造化データから、会社・店舗の
+名前・電話番号・メールアドレス・住所・営業時間・SNSを取り出す機能を提供します。
+
+取得元は次の4つで、この順に優先します。
+
+- JSON-LD: schema.orgのOrganization/LocalBusiness（と派生型）のノード。
+  @graphや入れ子のノードもたどり、address（PostalAddress）とcontactPointの値も取得します。
+- microdata: 会社・店舗の型のアイテムと、PostalAddressのアイテムのitemprop。
+- OpenGraph: og:phone_number、business:contact_data:street_addressなどのmetaタグ。
+- リンク: tel:/mailto:のhref（ページのリンク索引から取得）。
+
+値はページに書かれた表記のまま返します（電話番号の検証や住所の照合はInfoExtractorが行います）。
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+from urllib.parse import unquote
+import json
+import re
+
+from config.constants import SCHEMA_ORG_BUSINESS_TYPES
+from core.document import MicrodataProperty, ParsedDocument
+from core.link_index import AnchorIndex, classify_sns_url
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SOURCE_JSON_LD = "json_ld"
+SOURCE_MICRODATA = "microdata"
+SOURCE_OPEN_GRAPH = "open_graph"
+SOURCE_LINK = "link"
+# 構造化データの取得元（優先度の高い順）
+STRUCTURED_SOURCES = (SOURCE_JSON_LD, SOURCE_MICRODATA, SOURCE_OPEN_GRAPH, SOURCE_LINK)
+
+# 型名がこれらで終わるschema.orgの型も会社・店舗とみなす
+_BUSINESS_TYPE_SUFFIXES = ("Business", "Organization", "Store")
+
+# OpenGraph・Facebookのビジネス情報のmetaタグ（小文字のキー）
+_META_PHONE_KEYS = ("og:phone_number", "business:contact_data:phone_number")
+_META_FAX_KEYS = ("og:fax_number", "business:contact_data:fax_number")
+_META_EMAIL_KEYS = ("og:email", "business:contact_data:email")
+_META_ADDRESS_KEYS = {
+    "postal_code": ("og:postal-code", "business:contact_data:postal_code"),
+    "region": ("og:region", "business:contact_data:region"),
+    "locality": ("og:locality", "business:contact_data:locality"),
+    "street": ("og:street-address", "business:contact_data:street_address"),
+}
+
+# PostalAddressのプロパティ名とStructuredAddressの属性名
+_POSTAL_ADDRESS_PROPERTIES = {
+    "postalCode": "postal_code",
+    "addressRegion": "region",
+    "addressLocality": "locality",
+    "streetAddress": "street",
+}
+
+# schema.orgの曜日（dayOfWeekの値、openingHoursの2文字の略記）
+_DAY_NAMES = {
+    "Monday": "月", "Tuesday": "火", "Wednesday": "水", "Thursday": "木",
+    "Friday": "金", "Saturday": "土", "Sunday": "日", "PublicHolidays": "祝",
+}
+_DAY_CODE_PATTERN = re.compile(r'\b(Mo|Tu|We|Th|Fr|Sa|Su)\b')
+_DAY_CODES = {"Mo": "月", "Tu": "火", "We": "水", "Th": "木", "Fr": "金", "Sa": "土", "Su": "日"}
+# "09:00:00"などの秒を除去
+_SECONDS_PATTERN = re.compile(r'^(\d{1,2}:\d{2}):\d{2}$')
+
+
+@dataclass
+class StructuredAddress:
+    """構造化データの住所（schema.orgのPostalAddressに対応）"""
+    postal_code: Optional[str] = None
+    region: Optional[str] = None  # 都道府県
+    locality: Optional[str] = None  # 市区町村
+    street: Optional[str] = None  # 町域・番地（住所全体が1つの文字列の場合もここに入る）
+
+    def to_text(self) -> str:
+        """住所の照合に使う1行の文字列（例: "〒100-0001 東京都千代田区千代田1-1"）
+
+        後ろの項目に含まれている項目（番地に都道府県名から書かれている場合など）は重複させません。
+        英語表記の住所は、番地から順にカンマ区切りでつなげます。
+        """
+        parts = [part.strip() for part in (self.region, self.locality, self.street) if part and part.strip()]
+        parts = [part for index, part in enumerate(parts) if not any(part in later for later in parts[index + 1:])]
+        text = ", ".join(reversed(parts)) if all(part.isascii() for part in parts) else "".join(parts)
+        if self.postal_code and self.postal_code.strip():
+            text = f"〒{self.postal_code.strip()} {text}"
+        return text.strip()
+
+
+@dataclass
+class StructuredValues:
+    """1つの取得元から得た構造化データの値（ページの表記のまま）"""
+    source: str
+    names: list[str] = field(default_factory=list)
+    telephones: list[str] = field(default_factory=list)
+    emails: list[str] = field(default_factory=list)
+    fax_numbers: list[str] = field(default_factory=list)
+    addresses: list[StructuredAddress] = field(default_factory=list)
+    opening_hours: list[str] = field(default_factory=list)
+    sns_links: dict[str, list[str]] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return not (self.names or self.telephones or self.emails or self.fax_numbers
+                    or self.addresses or self.opening_hours or self.sns_links)
+
+    def add_sns_link(self, url: str) -> None:
+        """SNSのURLであれば追加"""
+        name = classify_sns_url(url)
+        if name is not None:
+            links = self.sns_links.setdefault(name, [])
+            if url not in links:
+                links.append(url)
+
+
+def extract_structured_data(document: ParsedDocument) -> list[StructuredValues]:
+    """ページの構造化データを取得
+
+    Args:
+        document: 解析済みドキュメント
+
+    Returns:
+        取得元ごとの値のリスト（優先度の高い順、値のない取得元は含まない）
+    """
+    results = [
+        _from_json_ld(document.json_ld),
+        _from_microdata(document.microdata),
+        _from_meta(document.meta),
+        _from_links(document.anchors),
+    ]
+    return [values for values in results if not values.is_empty()]
+
+
+def is_business_type(types: list[str]) -> bool:
+    """schema.orgの型が会社・店舗の型かどうか
+
+    Args:
+        types: 型名のリスト（"https://schema.org/"などの接頭辞は除去済み）
+
+    Returns:
+        いずれかの型が会社・店舗の型の場合True
+    """
+    return any(type_name in SCHEMA_ORG_BUSINESS_TYPES or type_name.endswith(_BUSINESS_TYPE_SUFFIXES)
+               for type_name in types)
+
+
+def _from_json_ld(scripts: list[str]) -> StructuredValues:
+    values = StructuredValues(SOURCE_JSON_LD)
+    for script in scripts:
+        try:
+            data = json.loads(script, strict=False)
+        except ValueError as e:
+            logger.debug(f"Failed to parse JSON-LD: {e}")
+            continue
+
+        for node in _iter_nodes(data):
+            if not is_business_type(_node_types(node)):
+                continue
+            values.names.extend(_strings(node.get("name")) or _strings(node.get("legalName")))
+            _add_contact(values, node)
+            for contact in _iter_dicts(node.get("contactPoint")):
+                _add_contact(values, contact)
+            _add_addresses(values, node.get("address"))
+            for place in _iter_dicts(node.get("location")):
+                _add_addresses(values, place.get("address"))
+            values.opening_hours.extend(_format_opening_hours(hours) for hours in _strings(node.get("openingHours")))
+            values.opening_hours.extend(
+                hours for hours in map(_format_opening_hours_specification,
+                                       _iter_dicts(node.get("openingHoursSpecification"))) if hours
+            )
+            for url in _strings(node.get("sameAs")) + _strings(node.get("url")):
+                values.add_sns_link(url)
+    return values
+
+
+def _from_microdata(properties: list[MicrodataProperty]) -> StructuredValues:
+    values = StructuredValues(SOURCE_MICRODATA)
+    address = StructuredAddress()
+    for prop in properties:
+        if not prop.value:
+            continue
+        if prop.item_type == "PostalAddress":
+            attribute = _POSTAL_ADDRESS_PROPERTIES.get(prop.name)
+            if attribute and getattr(address, attribute) is None:
+                setattr(address, attribute, prop.value)
+        elif is_business_type([prop.item_type]):
+            if prop.name in ("name", "legalName"):
+                values.names.append(prop.value)
+            elif prop.name == "telephone":
+                values.telephones.append(prop.value)
+            elif prop.name == "faxNumber":
+                values.fax_numbers.append(prop.value)
+            elif prop.name == "email":
+                values.emails.append(_strip_mailto(prop.value))
+            elif prop.name == "address":
+                # PostalAddressのアイテムでなく、住所が文字列で書かれている場合
+                values.addresses.append(StructuredAddress(street=prop.value))
+            elif prop.name == "openingHours":
+                values.opening_hours.append(_format_opening_hours(prop.value))
+            elif prop.name == "sameAs":
+                values.add_sns_link(prop.value)
+
+    if address.to_text():
+        values.addresses.insert(0, address)
+    return values
+
+
+def _from_meta(meta: dict[str, str]) -> StructuredValues:
+    values = StructuredValues(SOURCE_OPEN_GRAPH)
+    values.telephones.extend(meta[key] for key in _META_PHONE_KEYS if meta.get(key))
+    values.fax_numbers.extend(meta[key] for key in _META_FAX_KEYS if meta.get(key))
+    values.emails.extend(_strip_mailto(meta[key]) for key in _META_EMAIL_KEYS if meta.get(key))
+    address = StructuredAddress(**{
+        attribute: next((meta[key] for key in keys if meta.get(key)), None)
+        for attribute, keys in _META_ADDRESS_KEYS.items()
+    })
+    if address.to_text():
+        values.addresses.append(address)
+    return values
+
+
+def _from_links(anchors: AnchorIndex) -> StructuredValues:
+    values = StructuredValues(SOURCE_LINK)
+    for link in anchors.tel:
+        target = link.href.partition(":")[2]
+        if target:
+            values.telephones.append(unquote(target))
+    for link in anchors.mailto:
+        if link.href.partition(":")[2]:
+            values.emails.extend(_strip_mailto(link.href).split(","))
+    return values
+
+
+def _iter_nodes(data: Any) -> Iterator[dict]:
+    """JSON-LDのすべてのノード（@typeを持つ辞書）を文書順に列挙"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_nodes(item)
+    elif isinstance(data, dict):
+        if "@type" in data:
+            yield data
+        for value in data.values():
+            if isinstance(value, (dict, list)):
+                yield from _iter_nodes(value)
+
+
+def _iter_dicts(value: Any) -> Iterator[dict]:
+    """値が辞書または辞書のリストの場合に、その辞書を列挙"""
+    for item in value if isinstance(value, list) else [value]:
+        if isinstance(item, dict):
+            yield item
+
+
+def _node_types(node: dict) -> list[str]:
+    """ノードの型名（"https://schema.org/"などの接頭辞を除去）"""
+    return [type_name.rstrip("/").rsplit("/", 1)[-1] for type_name in _strings(node.get("@type"))]
+
+
+def _strings(value: Any) -> list[str]:
+    """JSON-LDの値（文字列、文字列のリスト、{"@value": ...}）を空でない文字列のリストに変換"""
+    if isinstance(value, list):
+        return [string for item in value for string in _strings(item)]
+    if isinstance(value, dict):
+        return _strings(value.get("@value") or value.get("@id"))
+    if isinstance(value, (str, int)) and not isinstance(value, bool):
+        string = str(value).strip()
+        return [string] if string else []
+    return []
+
+
+def _add_contact(values: StructuredValues, node: dict) -> None:
+    """ノードの電話番号・FAX番号・メールアドレスを追加"""
+    values.telephones.extend(_strings(node.get("telephone")))
+    values.fax_numbers.extend(_strings(node.get("faxNumber")))
+    values.emails.extend(_strip_mailto(email) for email in _strings(node.get("email")))
+
+
+def _add_addresses(values: StructuredValues, value: Any) -> None:
+    """JSON-LDのaddress（文字列またはPostalAddress、そのリスト）を追加"""
+    for item in value if isinstance(value, list) else [value]:
+        if isinstance(item, str) and item.strip():
+            values.addresses.append(StructuredAddress(street=item))
+        elif isinstance(item, dict):
+            address = StructuredAddress(**{
+                attribute: next(iter(_strings(item.get(name))), None)
+                for name, attribute in _POSTAL_ADDRESS_PROPERTIES.items()
+            })
+            if address.to_text():
+                values.addresses.append(address)
+
+
+def _strip_mailto(email: str) -> str:
+    """メールアドレスの"mailto:"と"?subject="などのクエリを除去"""
+    email = email.strip()
+    if email.lower().startswith("mailto:"):
+        email = email[len("mailto:"):]
+    return unquote(email.partition("?")[0]).strip()
+
+
+def _format_opening_hours(hours: str) -> str:
+    """openingHours（"Mo-Fr 09:00-18:00"など）の曜日の略記を日本語にする"""
+    return _DAY_CODE_PATTERN.sub(lambda match: _DAY_CODES[match.group(1)], hours.strip())
+
+
+def _format_opening_hours_specification(specification: dict) -> Optional[str]:
+    """OpeningHoursSpecificationを"月・火 9:00〜18:00"の形式にする（時刻がない場合はNone）"""
+    opens = next(iter(_strings(specification.get("opens"))), None)
+    closes = next(iter(_strings(specification.get("closes"))), None)
+    if not opens or not closes:
+        return None
+    days = [day.rstrip("/").rsplit("/", 1)[-1] for day in _strings(specification.get("dayOfWeek"))]
+    day_names = "・".join(_DAY_NAMES.get(day, day) for day in days)
+    hours = f"{_trim_seconds(opens)}〜{_trim_seconds(closes)}"
+    return f"{day_names} {hours}" if day_names else hours
+
+
+def _trim_seconds(time: str) -> str:
+    return _SECONDS_PATTERN.sub(r'\1', time)
@@ -0,0 +1,216 @@
+"""テキストの正規化モジュール
+
+このモジュールは、ページのテキストを抽出処理の前に一度だけ正規化するnormalize_textと、
+正規化後の位置を元のテキストの位置に戻すNormalizedTextを提供します。
+
+正規化は次のとおりです。
+
+- NFKC（全角英数字・全角記号・半角カタカナ・「㈱」などの互換文字を標準の文字に変換）
+- 数字に挟まれたハイフンに似た文字（「ー」「‐」「−」「–」など）を「-」に統一
+- 連続する空白を1つの半角空白にまとめる
+
+NFKCで1文字が1文字になる文字は変換表で変換し、長さが変わる文字
+（「㈱」→「(株)」、半角カタカナと濁点の組など）と連続する空白のみを個別に変換して、
+その位置を記録します。そのため、ページのサイズによらず位置の対応表は小さく、
+変換しない文字（ほとんどの文字）は正規表現の走査のみで読み飛ばします。
+"""
+
+from bisect import bisect_right
+from typing import Optional
+import re
+import sys
+import unicodedata
+
+# 数字に挟まれた場合に「-」に統一する文字（NFKCの後の表記）
+DASH_CHARACTERS = "‐‒–—―−ー─━ｰ⁃"
+_DASH_BETWEEN_DIGITS_PATTERN = re.compile(f"(?<=[0-9])[{DASH_CHARACTERS}](?=[0-9])")
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 直前の文字と合成される可能性がある文字（結合文字と、NFKCで結合文字になる半角の濁点・半濁点）
+_VOICED_MARKS = "ﾞﾟ"
+
+_translation: Optional[dict[int, str]] = None
+_single_pattern: Optional[re.Pattern] = None
+_special_pattern: Optional[re.Pattern] = None
+
+
+class NormalizedText:
+    """正規化したテキストと、元のテキストとの位置の対応
+
+    位置の対応は、元のテキストをそのまま（1文字ずつ）変換した区間と、
+    長さが変わる変換をした区間の先頭位置のリストで保持します。
+    """
+
+    def __init__(self, text: str, source: str, segments: list[tuple[int, int, int, bool]]):
+        """初期化
+
+        Args:
+            text: 正規化したテキスト
+            source: 元のテキスト
+            segments: 区間ごとの(正規化後の開始位置, 元の開始位置, 元の終了位置, 1文字ずつの変換か)
+                （正規化後の開始位置の順）
+        """
+        self.text = text
+        self.source = source
+        self._starts = [segment[0] for segment in segments]
+        self._segments = segments
+
+    @property
+    def is_identity(self) -> bool:
+        """正規化で位置が変わらないかどうか（元のテキストと同じ長さで、すべて1文字ずつの変換）"""
+        return len(self._segments) <= 1 and len(self.text) == len(self.source)
+
+    def to_original(self, position: int) -> int:
+        """正規化後の位置を元のテキストの位置に変換
+
+        長さが変わる変換をした区間の中の位置は、その区間の先頭の位置になります。
+
+        Args:
+            position: 正規化したテキストの位置（0以上len(text)以下）
+
+        Returns:
+            元のテキストの位置
+        """
+        if position >= len(self.text):
+            return len(self.source)
+        start, original_start, original_end, copied = self._segment(position)
+        return original_start + (position - start) if copied else original_start
+
+    def original_span(self, start: int, end: int) -> tuple[int, int]:
+        """正規化後の範囲を元のテキストの範囲に変換
+
+        長さが変わる変換をした区間に一部でもかかる場合は、その区間全体を含めます。
+
+        Args:
+            start: 正規化したテキストの開始位置
+            end: 正規化したテキストの終了位置
+
+        Returns:
+            元のテキストの(開始位置, 終了位置)
+        """
+        original_start = self.to_original(start)
+        if end <= start:
+            return original_start, original_start
+        if end >= len(self.text):
+            return original_start, len(self.source)
+        segment_start, segment_original_start, segment_original_end, copied = self._segment(end - 1)
+        original_end = segment_original_start + (end - segment_start) if copied else segment_original_end
+        return original_start, original_end
+
+    def original(self, start: int, end: int) -> str:
+        """正規化後の範囲に対応する元のテキスト"""
+        original_start, original_end = self.original_span(start, end)
+        return self.source[original_start:original_end]
+
+    def _segment(self, position: int) -> tuple[int, int, int, bool]:
+        return self._segments[max(0, bisect_right(self._starts, position) - 1)]
+
+
+def normalize_text(text: str) -> NormalizedText:
+    """テキストを正規化し、元のテキストとの位置の対応を作成
+
+    Args:
+        text: 元のテキスト
+
+    Returns:
+        正規化したテキストと位置の対応
+    """
+    text = text or ""
+    translation, single, special = _tables()
+    pieces = []
+    segments = []
+    position = 0  # 正規化したテキストの位置
+    copied_from = 0  # 元のテキストの未処理の位置
+    for match in special.finditer(text):
+        start, end = match.span()
+        if match.lastgroup == "marks" and start > copied_from:
+            # 結合文字は直前の文字と合わせて正規化する
+            start -= 1
+        if start > copied_from:
+            segments.append((position, copied_from, start, True))
+            pieces.append(_translate(text[copied_from:start], translation, single))
+            position += start - copied_from
+        replacement = _normalize_sequence(text[start:end])
+        segments.append((position, start, end, False))
+        pieces.append(replacement)
+        position += len(replacement)
+        copied_from = end
+    if copied_from < len(text) or not segments:
+        segments.append((position, copied_from, len(text), True))
+        pieces.append(_translate(text[copied_from:], translation, single))
+
+    normalized = "".join(pieces)
+    # 1文字を1文字に置き換えるため、位置は変わらない
+    normalized = _DASH_BETWEEN_DIGITS_PATTERN.sub("-", normalized)
+    return NormalizedText(normalized, text, segments)
+
+
+def normalize(text: str) -> str:
+    """テキストを正規化（位置の対応が不要な場合）"""
+    return normalize_text(text).text
+
+
+def _translate(text: str, translation: dict[int, str], single: re.Pattern) -> str:
+    """1文字を1文字に変換する（変換する文字のみを置き換える）"""
+    return single.sub(lambda match: translation[ord(match.group())], text)
+
+
+def _normalize_sequence(sequence: str) -> str:
+    """長さが変わる可能性のある文字列をNFKCで正規化し、空白をまとめる"""
+    return _WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFKC", sequence))
+
+
+def _tables() -> tuple[dict[int, str], re.Pattern, re.Pattern]:
+    """変換表と、変換表の文字のパターン、長さが変わる可能性のある文字列のパターン（初回呼び出し時に作成）
+
+    基本多言語面（U+0000〜U+FFFF）の文字は、NFKCの結果から変換表とパターンに振り分けます。
+    それ以外の面の文字（数学用英数字・絵文字など）は、すべてパターンで個別に正規化します。
+    ほとんどの位置はどちらのパターンにも一致しないため、長さが変わる可能性のある文字列のパターンは
+    先頭の文字の先読みで候補の位置を絞り込みます。
+    """
+    global _translation, _single_pattern, _special_pattern
+    if _translation is not None and _single_pattern is not None and _special_pattern is not None:
+        return _translation, _single_pattern, _special_pattern
+
+    translation = {}
+    variable = []
+    marks = []
+    for code in range(0x10000):
+        if 0xD800 <= code <= 0xDFFF:
+            continue
+        char = chr(code)
+        normalized = unicodedata.normalize("NFKC", char)
+        if unicodedata.combining(char) or char in _VOICED_MARKS:
+            marks.append(code)
+        if char.isspace() and char != " ":
+            normalized = " " if normalized.isspace() else normalized
+        if normalized == char:
+            continue
+        if len(normalized) == 1 and not normalized.isspace() or normalized == " ":
+            translation[code] = normalized
+        else:
+            variable.append(code)
+
+    non_bmp = rf"\U00010000-\U{sys.maxunicode:08X}"
+    mark_class = _character_class(marks)
+    variable_class = _character_class(variable)[:-1] + non_bmp + "]"
+    first_class = f"[\\s{mark_class[1:-1]}{variable_class[1:-1]}]"
+    single = re.compile(_character_class(sorted(translation)))
+    special = re.compile(rf"(?={first_class})(?:(?P<marks>{mark_class}+)|{variable_class}{mark_class}*|\s\s+)")
+    _translation, _single_pattern, _special_pattern = translation, single, special
+    return translation, single, special
+
+
+def _character_class(codes: list[int]) -> str:
+    """文字コードのリストから正規表現の文字クラスを作成（連続する文字コードは範囲にまとめる）"""
+    ranges = []
+    for code in codes:
+        if ranges and ranges[-1][1] == code - 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    parts = [
+        re.escape(chr(first)) if first == last else f"{re.escape(chr(first))}-{re.escape(chr(last))}"
+        for first, last in ranges
+    ]
+    return f"[{''.join(parts)}]"
@@ -5,8 +5,11 @@
 
 import customtkinter as ctk
 from typing import Callable, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from config.settings import Settings
+from config.constants import EXTRACTION_FIELDS
+from core.extraction_plan import BASIC_FIELDS, DETAIL_FIELDS, ExtractionPlan, default_plan, list_presets
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,6 +21,9 @@ class SearchConfig:
     keyword: str
     num_results: int = 10
     fetch_details: bool = False
+    crawl_pages: bool = False  # 会社概要・お問い合わせページも巡回するか
+    use_process_pool: bool = False  # 詳細情報の抽出を複数プロセスで行うか
+    plan: ExtractionPlan = field(default_factory=ExtractionPlan.all)  # 抽出・出力する項目
 
 
 class SearchPanel(ctk.CTkFrame):
@@ -110,7 +116,56 @@ class SearchPanel(ctk.CTkFrame):
             font=ctk.CTkFont(size=10),
             text_color="gray"
         )
-        detail_info.pack(pady=(0, 20), padx=10, anchor="w")
+        detail_info.pack(pady=(0, 5), padx=10, anchor="w")
+
+        # 抽出項目のプリセット（選択するとチェックボックスに反映）
+        initial_plan = default_plan()
+        self._basic_fields = [name for name in BASIC_FIELDS if initial_plan.wants(name)]
+        self._preset_names = {label: name for name, label in list_presets().items()}
+        self.preset_menu = ctk.CTkOptionMenu(
+            self,
+            values=["プリセットを選択", *self._preset_names],
+            command=self._on_preset_selected,
+            height=28,
+            font=ctk.CTkFont(size=11)
+        )
+        self.preset_menu.pack(pady=(0, 5), padx=20, fill="x")
+
+        # 抽出項目のチェックボックス（2列）
+        fields_frame = ctk.CTkFrame(self, fg_color="transparent")
+        fields_frame.pack(pady=(0, 5), padx=20, fill="x")
+        self.field_vars: dict[str, ctk.BooleanVar] = {}
+        self.field_checkboxes: list[ctk.CTkCheckBox] = []
+        for index, name in enumerate(DETAIL_FIELDS):
+            self.field_vars[name] = ctk.BooleanVar(value=initial_plan.wants(name))
+            checkbox = ctk.CTkCheckBox(
+                fields_frame,
+                text=EXTRACTION_FIELDS[name],
+                variable=self.field_vars[name],
+                font=ctk.CTkFont(size=11)
+            )
+            checkbox.grid(row=index // 2, column=index % 2, padx=(0, 10), pady=2, sticky="w")
+            self.field_checkboxes.append(checkbox)
+
+        # 問い合わせページ巡回チェックボックス
+        self.crawl_var = ctk.BooleanVar(value=False)
+        self.crawl_checkbox = ctk.CTkCheckBox(
+            self,
+            text="会社概要・お問い合わせページも巡回する",
+            variable=self.crawl_var,
+            font=ctk.CTkFont(size=12)
+        )
+        self.crawl_checkbox.pack(pady=(5, 5), padx=10, anchor="w")
+
+        # マルチプロセス抽出チェックボックス
+        self.process_pool_var = ctk.BooleanVar(value=Settings.EXTRACTION_USE_PROCESS_POOL)
+        self.process_pool_checkbox = ctk.CTkCheckBox(
+            self,
+            text="複数プロセスで抽出する（大量のページ向け）",
+            variable=self.process_pool_var,
+            font=ctk.CTkFont(size=12)
+        )
+        self.process_pool_checkbox.pack(pady=(5, 20), padx=10, anchor="w")
 
         # 検索ボタン
         self.search_button = ctk.CTkButton(
@@ -182,19 +237,51 @@ class SearchPanel(ctk.CTkFrame):
             # TODO: エラーダイアログを表示
             return
 
+        plan = self.get_plan()
+        if self.detail_var.get() and not plan.has_details:
+            logger.warning("No extraction fields selected")
+            # TODO: エラーダイアログを表示
+            return
+
         # 検索設定の作成
         config = SearchConfig(
             keyword=keyword,
             num_results=num_results,
-            fetch_details=self.detail_var.get()
+            fetch_details=self.detail_var.get(),
+            crawl_pages=self.detail_var.get() and self.crawl_var.get(),
+            use_process_pool=self.detail_var.get() and self.process_pool_var.get(),
+            plan=plan
         )
 
-        logger.info(f"Search config: keyword={config.keyword}, num={config.num_results}, details={config.fetch_details}")
+        logger.info(f"Search config: keyword={config.keyword}, num={config.num_results}, "
+                    f"details={config.fetch_details}, crawl={config.crawl_pages}, "
+                    f"process_pool={config.use_process_pool}, fields={config.plan.key}")
 
         # コールバック関数の呼び出し
         if self.on_search_callback:
             self.on_search_callback(config)
 
+    def _on_preset_selected(self, label: str) -> None:
+        """プリセット選択時の処理（プリセットの項目をチェックボックスに反映）"""
+        name = self._preset_names.get(label)
+        if name is None:
+            return
+        try:
+            plan = ExtractionPlan.from_preset(name)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load preset {name}: {e}")
+            return
+
+        self._basic_fields = [field_name for field_name in BASIC_FIELDS if plan.wants(field_name)]
+        for field_name, var in self.field_vars.items():
+            var.set(plan.wants(field_name))
+        logger.info(f"Preset selected: {name} ({plan.key})")
+
+    def get_plan(self) -> ExtractionPlan:
+        """チェックボックスで選択された項目の抽出計画を取得"""
+        selected = [name for name, var in self.field_vars.items() if var.get()]
+        return ExtractionPlan(frozenset([*self._basic_fields, *selected]))
+
     def _on_export_click(self) -> None:
         """Excel出力ボタンクリック時の処理"""
         logger.info("Export button clicked")
@@ -224,10 +311,20 @@ class SearchPanel(ctk.CTkFrame):
             self.keyword_entry.configure(state="disabled")
             self.num_entry.configure(state="disabled")
             self.detail_checkbox.configure(state="disabled")
+            self.crawl_checkbox.configure(state="disabled")
+            self.process_pool_checkbox.configure(state="disabled")
+            self.preset_menu.configure(state="disabled")
+            for checkbox in self.field_checkboxes:
+                checkbox.configure(state="disabled")
         else:
             self.search_button.configure(state="normal", text="検索開始")
             self.keyword_entry.configure(state="normal")
             self.num_entry.configure(state="normal")
             self.detail_checkbox.configure(state="normal")
+            self.crawl_checkbox.configure(state="normal")
+            self.process_pool_checkbox.configure(state="normal")
+            self.preset_menu.configure(state="normal")
+            for checkbox in self.field_checkboxes:
+                checkbox.configure(state="normal")
 
         logger.debug(f"Search running state: {is_running}")
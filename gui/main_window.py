@@ -17,7 +17,11 @@ from gui.components.result_panel import ResultPanel
 from core.search_api import SearchAPIClient
 from core.searcher import SearchOptions
 from core.scraper import WebScraper
-from core.extractor import InfoExtractor
+from core.extractor import FieldSourceStats, InfoExtractor
+from core.crawler import ContactPageCrawler
+from core.extraction_pool import ExtractionExecutor
+from core.http_session import get_pool_stats
+from core.rate_limiter import get_shared_rate_limiter
 from output.formatter import DataFormatter
 from output.excel_writer import ExcelWriter
 
@@ -53,11 +57,17 @@ class MainWindow(ctk.CTk):
         # 変数の初期化
         self.search_running = False
         self.search_results = []
+        self.search_plan = None  # 最後の検索の抽出計画（Excel出力の列に使用）
 
         # コアコンポーネントの初期化
         self.search_client = SearchAPIClient()
         self.scraper = WebScraper()
-        self.extractor = InfoExtractor()
+        # 電話番号・メールアドレスの正規化と検証は、データの整形時にまとめて行う
+        self.extractor = InfoExtractor(batch_validation=True)
+        self.crawler = ContactPageCrawler(self.scraper, self.extractor)
+        # ワーカープロセスは最初に使用したときに起動する
+        self.extraction_executor = ExtractionExecutor(parser_backend=self.extractor.parser_backend.name,
+                                                      batch_validation=self.extractor.batch_validation)
         self.formatter = DataFormatter()
         self.excel_writer = ExcelWriter()
 
@@ -248,33 +258,95 @@ class MainWindow(ctk.CTk):
                 self.after(0, lambda: self.result_panel.show_progress("詳細情報を抽出中..."))
                 self.after(0, lambda: self.update_status("詳細情報を抽出中..."))
 
-                detailed_infos = []
-                for i, item in enumerate(search_items, 1):
-                    self.after(0, lambda i=i: self.result_panel.show_progress(f"  [{i}/{len(search_items)}] {item.url}"))
-
-                    try:
-                        # HTMLを取得
-                        page_content = self.scraper.fetch_page(item.url)
-                        if page_content and page_content.html:
-                            # 詳細情報を抽出
-                            detailed_info = self.extractor.extract_all(page_content.html)
-                            detailed_infos.append(detailed_info)
-                        else:
+                # ページコンテンツを並列に取得（入力順で返される）
+                def on_fetched(completed: int, total: int, url: str) -> None:
+                    self.after(0, lambda: self.result_panel.show_progress(f"  [{completed}/{total}] {url}"))
+
+                # 大きなページは本文を保持せずに受信しながら抽出する
+                if Settings.STREAMING_EXTRACTION_ENABLED:
+                    self.scraper.enable_streaming(self.extractor, config.plan)
+
+                urls = [item.url for item in search_items]
+                page_contents = self.scraper.fetch_many(urls, progress_callback=on_fetched)
+
+                # サーキットブレーカーの作動と遅延リトライの結果
+                report = self.scraper.last_report
+                if report and (report.breaker_trips or report.retry_outcomes):
+                    for line in report.lines():
+                        self.after(0, lambda line=line: self.result_panel.show_progress(f"  {line}"))
+
+                if self.scraper.cache:
+                    cache_report = self.scraper.cache.stats.report()
+                    logger.info(f"HTTP cache stats: {cache_report}")
+                    self.after(0, lambda: self.result_panel.show_progress(f"  キャッシュ: {cache_report}"))
+
+                if config.use_process_pool:
+                    # ワーカープロセスでまとめて抽出（失敗したページはNone）
+                    def on_extracted(completed: int, total: int) -> None:
+                        self.after(0, lambda: self.result_panel.show_progress(f"  抽出 [{completed}/{total}]"))
+
+                    detailed_infos = self.extraction_executor.extract_many(
+                        [page_content.html if page_content else None for page_content in page_contents],
+                        progress_callback=on_extracted,
+                        plan=config.plan
+                    )
+                    # 受信しながら抽出済みのページはその結果を使う
+                    detailed_infos = [
+                        page_content.detail if page_content and page_content.streamed else detailed_info
+                        for page_content, detailed_info in zip(page_contents, detailed_infos)
+                    ]
+                    for item, detailed_info in zip(search_items, detailed_infos):
+                        if detailed_info is None:
+                            self.after(0, lambda url=item.url: self.result_panel.show_progress(f"  ⚠ スキップ: {url}"))
+                else:
+                    detailed_infos = []
+                    for item, page_content in zip(search_items, page_contents):
+                        try:
+                            if page_content and page_content.streamed:
+                                # 受信しながら抽出済み
+                                detailed_infos.append(page_content.detail)
+                            elif page_content and page_content.html:
+                                # 詳細情報を抽出
+                                detailed_info = self.extractor.extract_all(page_content.html, config.plan)
+                                detailed_infos.append(detailed_info)
+                            else:
+                                self.after(0, lambda url=item.url: self.result_panel.show_progress(f"  ⚠ スキップ: {url}"))
+                                detailed_infos.append(None)
+                        except Exception as e:
+                            # 個別の抽出エラーはログに記録して続行
+                            logger.warning(f"Failed to extract details from {item.url}: {e}")
+                            self.after(0, lambda url=item.url: self.result_panel.show_progress(f"  ⚠ スキップ: {url}"))
                             detailed_infos.append(None)
-                    except Exception as e:
-                        # 個別のスクレイピングエラーはログに記録して続行
-                        logger.warning(f"Failed to fetch details from {item.url}: {e}")
-                        self.after(0, lambda url=item.url: self.result_panel.show_progress(f"  ⚠ スキップ: {url}"))
-                        detailed_infos.append(None)
+
+                # 会社概要・お問い合わせページを巡回して不足項目を補完
+                if config.crawl_pages:
+                    self.after(0, lambda: self.result_panel.show_progress("会社概要・お問い合わせページを巡回中..."))
+
+                    def on_crawled(completed: int, total: int, url: str) -> None:
+                        self.after(0, lambda: self.result_panel.show_progress(f"  巡回 [{completed}/{total}] {url}"))
+
+                    detailed_infos = self.crawler.crawl_many(
+                        page_contents, detailed_infos, progress_callback=on_crawled, plan=config.plan
+                    )
+
+                if self.extractor.cache and self.extractor.cache.stats.lookups:
+                    logger.info(f"Extraction cache stats: {self.extractor.cache.stats.report()}")
+
+                source_stats = FieldSourceStats.from_results(detailed_infos)
+                if source_stats.pages:
+                    logger.info(f"Field source stats: {source_stats.report()}")
 
             # データの整形
             self.after(0, lambda: self.update_status("データを整形中..."))
-            output_data = self.formatter.format_data(search_items, detailed_infos)
+            output_data = self.formatter.format_data(search_items, detailed_infos, config.plan)
             output_data = self.formatter.remove_duplicates(output_data)
             output_data = self.formatter.validate_data(output_data)
 
             # 結果を保存
             self.search_results = output_data
+            self.search_plan = config.plan
+            logger.info(f"HTTP pool stats: {get_pool_stats().summary()}")
+            logger.info(f"Rate limiter: {get_shared_rate_limiter().summary()}")
 
             # 結果を表示
             self.after(0, lambda: self.result_panel.show_search_results(output_data, config.keyword))
@@ -308,7 +380,8 @@ class MainWindow(ctk.CTk):
             # Excel出力
             output_path = self.excel_writer.write(
                 self.search_results,
-                filename
+                filename,
+                plan=self.search_plan
             )
 
             if output_path:
@@ -336,7 +409,10 @@ class MainWindow(ctk.CTk):
         イベントループを開始します。
         """
         logger.info("Starting main window")
-        self.mainloop()
+        try:
+            self.mainloop()
+        finally:
+            self.extraction_executor.close()
 
 
 def main():
@@ -14,12 +14,17 @@ sys.path.insert(0, str(Path(__file__).parent))
 from core.search_api import SearchAPIClient
 from core.searcher import SearchOptions
 from core.scraper import WebScraper
-from core.extractor import InfoExtractor
+from core.extractor import FieldSourceStats, InfoExtractor
+from core.crawler import ContactPageCrawler
+from core.extraction_pool import ExtractionExecutor
+from core.extraction_plan import ExtractionPlan, default_plan, list_presets
+from core.http_session import get_pool_stats
+from core.rate_limiter import get_shared_rate_limiter
 from output.formatter import DataFormatter
 from output.excel_writer import ExcelWriter
 from utils.logger import get_logger
 from config.settings import Settings
-from config.constants import SUCCESS_MESSAGES, ERROR_MESSAGES
+from config.constants import EXTRACTION_FIELDS, SUCCESS_MESSAGES, ERROR_MESSAGES
 
 logger = get_logger(__name__)
 
@@ -54,11 +59,36 @@ def main():
     extract_details_input = input("詳細情報を取得しますか? (y/n, デフォルト: n): ").strip().lower()
     extract_details = extract_details_input == 'y'
 
+    # 抽出する項目の選択（プリセットまたは項目名）
+    plan = default_plan()
+    if extract_details:
+        plan = input_extraction_plan(plan)
+        if not plan.has_details:
+            print("詳細情報の項目が選択されていないため、詳細情報は取得しません。")
+            extract_details = False
+
+    # 会社概要・お問い合わせページを巡回するかの確認
+    crawl_pages = False
+    if extract_details:
+        crawl_pages_input = input("会社概要・お問い合わせページも巡回しますか? (y/n, デフォルト: n): ").strip().lower()
+        crawl_pages = crawl_pages_input == 'y'
+
+    # 詳細情報の抽出を複数プロセスで行うかの確認
+    use_process_pool = False
+    if extract_details:
+        default = 'y' if Settings.EXTRACTION_USE_PROCESS_POOL else 'n'
+        process_pool_input = input(f"複数プロセスで抽出しますか? (y/n, デフォルト: {default}): ").strip().lower()
+        use_process_pool = (process_pool_input or default) == 'y'
+
     print()
     print("-" * 60)
     print(f"検索キーワード: {keyword}")
     print(f"取得件数: {num_results}件")
     print(f"詳細情報取得: {'はい' if extract_details else 'いいえ'}")
+    if extract_details:
+        print(f"抽出項目: {plan.describe()}")
+        print(f"問い合わせページ巡回: {'はい' if crawl_pages else 'いいえ'}")
+        print(f"マルチプロセス抽出: {'はい' if use_process_pool else 'いいえ'}")
     print("-" * 60)
     print()
 
@@ -84,28 +114,94 @@ def main():
             logger.info("Starting detail extraction")
 
             scraper = WebScraper()
-            extractor = InfoExtractor()
+            # 電話番号・メールアドレスの正規化と検証は、データの整形時にまとめて行う
+            extractor = InfoExtractor(batch_validation=True)
             detailed_infos = []
 
-            for i, item in enumerate(search_items, 1):
-                print(f"  処理中: {i}/{len(search_items)} - {item.title[:50]}...")
+            # ページコンテンツを並列に取得（入力順で返される）
+            def on_fetched(completed: int, total: int, url: str) -> None:
+                print(f"  取得済み: {completed}/{total} - {url[:60]}")
+
+            # 大きなページは本文を保持せずに受信しながら抽出する
+            if Settings.STREAMING_EXTRACTION_ENABLED:
+                scraper.enable_streaming(extractor, plan)
+
+            urls = [item.url for item in search_items]
+            page_contents = scraper.fetch_many(urls, progress_callback=on_fetched)
+
+            # サーキットブレーカーの作動と遅延リトライの結果
+            report = scraper.last_report
+            if report and (report.breaker_trips or report.retry_outcomes):
+                print(f"  取得結果: {report.summary()}")
+                for line in report.lines()[1:]:
+                    print(f"    {line}")
+
+            if scraper.cache:
+                print(f"  キャッシュ: {scraper.cache.stats.report()}")
+                logger.info(f"HTTP cache stats: {scraper.cache.stats.report()}")
+
+            if use_process_pool:
+                # ワーカープロセスでまとめて抽出（失敗したページはNone）
+                def on_extracted(completed: int, total: int) -> None:
+                    print(f"  抽出済み: {completed}/{total}")
+
+                with ExtractionExecutor(parser_backend=extractor.parser_backend.name,
+                                        batch_validation=extractor.batch_validation) as executor:
+                    detailed_infos = executor.extract_many(
+                        [page_content.html if page_content else None for page_content in page_contents],
+                        progress_callback=on_extracted,
+                        plan=plan
+                    )
+                # 受信しながら抽出済みのページはその結果を使う
+                detailed_infos = [
+                    page_content.detail if page_content and page_content.streamed else detail
+                    for page_content, detail in zip(page_contents, detailed_infos)
+                ]
+                for item, detail in zip(search_items, detailed_infos):
+                    if detail is None:
+                        logger.warning(f"Failed to fetch or extract page: {item.url}")
+                        print(f"  ⚠ スキップ: {item.url}")
+            else:
+                for item, page_content in zip(search_items, page_contents):
+                    try:
+                        if page_content and page_content.streamed:
+                            # 受信しながら抽出済み
+                            detailed_infos.append(page_content.detail)
+                        elif page_content and page_content.html:
+                            # 情報の抽出
+                            detail = extractor.extract_all(page_content.html, plan)
+                            detailed_infos.append(detail)
+                        else:
+                            logger.warning(f"Failed to fetch page: {item.url}")
+                            print(f"  ⚠ スキップ: {item.url}")
+                            detailed_infos.append(None)
+
+                    except Exception as e:
+                        logger.warning(f"Failed to extract details from {item.url}: {e}")
+                        print(f"  ⚠ スキップ: {item.url} (理由: {str(e)[:50]})")
+                        detailed_infos.append(None)
+
+            # 電話番号・住所などが不足しているサイトは問い合わせページ等を巡回して補完
+            if crawl_pages:
+                print("  会社概要・お問い合わせページを巡回中...")
+                crawler = ContactPageCrawler(scraper, extractor)
 
-                try:
-                    # ページコンテンツの取得
-                    page_content = scraper.fetch_page(item.url, respect_robots=True)
+                def on_crawled(completed: int, total: int, url: str) -> None:
+                    print(f"  巡回済み: {completed}/{total} - {url[:60]}")
 
-                    if page_content:
-                        # 情報の抽出
-                        detail = extractor.extract_all(page_content.html)
-                        detailed_infos.append(detail)
-                    else:
-                        logger.warning(f"Failed to fetch page: {item.url}")
-                        detailed_infos.append(None)
+                detailed_infos = crawler.crawl_many(
+                    page_contents, detailed_infos, progress_callback=on_crawled, plan=plan
+                )
 
-                except Exception as e:
-                    logger.warning(f"Failed to fetch details from {item.url}: {e}")
-                    print(f"  ⚠ スキップ: {item.url} (理由: {str(e)[:50]})")
-                    detailed_infos.append(None)
+            if extractor.cache and extractor.cache.stats.lookups:
+                print(f"  抽出結果キャッシュ: {extractor.cache.stats.report()}")
+                logger.info(f"Extraction cache stats: {extractor.cache.stats.report()}")
+
+            # 項目ごとの取得元（構造化データ・本文）の集計
+            source_stats = FieldSourceStats.from_results(detailed_infos)
+            if source_stats.pages:
+                print(f"  取得元: {source_stats.report()}")
+                logger.info(f"Field source stats: {source_stats.report()}")
 
             print(f"✓ 詳細情報の抽出が完了しました")
             logger.info("Detail extraction completed")
@@ -119,7 +215,7 @@ def main():
         logger.info("Formatting data")
 
         formatter = DataFormatter()
-        output_data = formatter.format_data(search_items, detailed_infos)
+        output_data = formatter.format_data(search_items, detailed_infos, plan)
 
         # 重複除去
         output_data = formatter.remove_duplicates(output_data)
@@ -139,7 +235,7 @@ def main():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"search_results_{timestamp}.xlsx"
 
-        output_path = writer.write(output_data, filename, apply_format=True)
+        output_path = writer.write(output_data, filename, apply_format=True, plan=plan)
 
         if output_path:
             print(f"✓ Excelファイルを保存しました: {output_path}")
@@ -160,8 +256,16 @@ def main():
         print(f"検索結果件数: {len(search_items)}件")
         print(f"出力データ件数: {len(output_data)}件")
         print(f"出力ファイル: {output_path}")
+
+        pool_stats = get_pool_stats()
+        if pool_stats.requests:
+            print(f"HTTP接続: 再利用 {pool_stats.hits}回 / 新規 {pool_stats.new_connections}回 "
+                  f"(再利用率 {pool_stats.reuse_rate:.0%})")
         print("=" * 60)
 
+        logger.info(f"HTTP pool stats: {pool_stats.summary()}")
+        logger.info(f"Rate limiter: {get_shared_rate_limiter().summary()}")
+
         logger.info("Application completed successfully")
 
     except KeyboardInterrupt:
@@ -177,5 +281,31 @@ def main():
         return
 
 
+def input_extraction_plan(default: ExtractionPlan) -> ExtractionPlan:
+    """抽出する項目を入力
+
+    Args:
+        default: 入力が空の場合の抽出計画
+
+    Returns:
+        入力された抽出計画（入力が不正な場合はdefault）
+    """
+    print("抽出できる項目: " + ", ".join(f"{name}({label})" for name, label in EXTRACTION_FIELDS.items()))
+    presets = list_presets()
+    if presets:
+        print("プリセット: " + ", ".join(f"{name}({label})" for name, label in presets.items()))
+
+    text = input("抽出する項目を入力してください (all / プリセット名 / カンマ区切りの項目名, "
+                 "デフォルト: 設定値): ").strip()
+    if not text:
+        return default
+    try:
+        return ExtractionPlan.parse(text)
+    except (OSError, ValueError) as e:
+        print(f"無効な指定です（{e}）。設定値の項目を使用します。")
+        logger.warning(f"Invalid extraction plan {text!r}: {e}")
+        return default
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,189 @@
+"""詳細情報の列単位の後処理モジュール
+
+このモジュールは、バッチ全体の詳細情報（DetailedInfoのリスト）を項目ごとの列にまとめ、
+pandasの文字列操作で一度に正規化・検証して、出力データ（OutputData）の詳細情報の列を作成する
+build_detail_columnsを提供します。DataFormatterが使用します。
+
+リストの項目（電話番号・メールアドレス・FAX番号・SNSリンク）は、値1つを1行とする縦長の列
+（インデックスは出力データの行番号）にしてから処理し、最後に行ごとにカンマ区切りで結合します。
+
+- 電話番号・FAX番号: 全角の数字・記号を半角に変換し、括弧で囲んだ市外局番をハイフン区切りに、
+  括弧・空白を除去、国番号（+81）を0に置換。
+  番号の種類（0120/0570/050/070〜090など）ごとの桁数で検証（core.extractor.PHONE_PREFIX_CLASSES）
+- メールアドレス: 前後の空白を除去して小文字に統一。画像ファイル名など（EMAIL_INVALID_EXTENSIONS）を除外
+- 郵便番号: 〒・空白・ハイフンを除去し、7桁の場合は"123-4567"の形式に統一
+
+バッチ検証（InfoExtractorのbatch_validation）で抽出した値は、ここで初めて正規化・検証されます。
+正規化と検証はバッチ内の重複しない値ごとに一度だけ行います。同じ行で正規化後に同じ値になったものは
+1つにまとめます（最初の出現順を保持）。
+"""
+
+from itertools import chain
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from config.constants import EMAIL_INVALID_EXTENSIONS, PHONE_FIXED_LINE_LENGTHS
+from core.extraction_plan import ExtractionPlan
+from core.extractor import PHONE_PREFIX_CLASSES, DetailedInfo
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 出力データの詳細情報の列（OutputDataのフィールド順）
+DETAIL_COLUMNS = (
+    "phone", "email", "postal_code", "prefecture", "fax", "company_name",
+    "sns_twitter", "sns_facebook", "sns_instagram", "business_hours", "closed_days",
+)
+# SNSリンクの列 → SNS名
+SNS_COLUMNS = {"sns_twitter": "twitter", "sns_facebook": "facebook", "sns_instagram": "instagram"}
+# リストの値を結合する区切り
+LIST_SEPARATOR = ", "
+
+# 電話番号・郵便番号の全角の数字・記号 → 半角
+_DIGITS_TRANSLATION = str.maketrans(
+    "０１２３４５６７８９－‐−ー（）＋　", "0123456789----()+ "
+)
+# 括弧で囲んだ市外局番（"(03) 1234-5678"の"(03) "）
+_AREA_CODE_PARENTHESES_PATTERN = r'^\((0[0-9]{1,4})\)\s*'
+# 国番号（+81）付きの電話番号（括弧と空白を除去した後の表記）
+_COUNTRY_CODE_PATTERN = r'^\+81-?0?'
+
+
+def canonicalize_phones(phones: pd.Series) -> pd.Series:
+    """電話番号の列を正規化（全角→半角、括弧・空白の除去、国番号を0に置換）
+
+    括弧で囲んだ市外局番（"(03) 1234-5678"）は、ハイフン区切り（"03-1234-5678"）にします。
+    """
+    return (
+        phones.str.translate(_DIGITS_TRANSLATION)
+        .str.replace(_AREA_CODE_PARENTHESES_PATTERN, r'\1-', regex=True)
+        .str.replace(r'[()\s]', '', regex=True)
+        .str.replace(_COUNTRY_CODE_PATTERN, '0', regex=True)
+    )
+
+
+def valid_phone_mask(phones: pd.Series) -> pd.Series:
+    """電話番号の列の妥当性
+
+    0で始まり、番号の種類ごとの桁数（ハイフンを除く）であるものをTrueとします。
+    種類の判定にはInfoExtractor._validate_phoneと同じPHONE_PREFIX_CLASSESを使い、
+    最初に一致した種類の桁数で判定します。
+    """
+    digits = phones.str.replace(r'[^0-9]', '', regex=True)
+    lengths = digits.str.len()
+    valid = digits.str.startswith("0") & lengths.isin(PHONE_FIXED_LINE_LENGTHS)
+    classified = pd.Series(False, index=digits.index)
+    for prefixes, allowed in PHONE_PREFIX_CLASSES:
+        in_class = digits.str.match(prefixes.pattern) & ~classified
+        valid = valid.mask(in_class, lengths.isin(allowed))
+        classified |= in_class
+    return valid.astype(bool)
+
+
+def canonicalize_emails(emails: pd.Series) -> pd.Series:
+    """メールアドレスの列を正規化（前後の空白を除去して小文字に統一）"""
+    return emails.str.strip().str.lower()
+
+
+def valid_email_mask(emails: pd.Series) -> pd.Series:
+    """メールアドレスの列の妥当性（"@"を含み、画像ファイル名などでないものをTrue）"""
+    return (emails.str.contains("@", regex=False) & ~emails.str.endswith(EMAIL_INVALID_EXTENSIONS)).astype(bool)
+
+
+def format_postal_codes(codes: pd.Series) -> pd.Series:
+    """郵便番号の列を"123-4567"の形式に統一（7桁でないものは〒・空白を除いた表記のまま）"""
+    digits = codes.str.translate(_DIGITS_TRANSLATION).str.replace(r'[〒\s]', '', regex=True)
+    compact = digits.str.replace('-', '', regex=False)
+    is_seven = compact.str.fullmatch(r'[0-9]{7}')
+    formatted = compact.str.slice(0, 3) + "-" + compact.str.slice(3)
+    return formatted.where(is_seven, digits)
+
+
+def build_detail_columns(
+    detailed_infos: Sequence[Optional[DetailedInfo]],
+    row_count: int,
+    plan: ExtractionPlan
+) -> pd.DataFrame:
+    """詳細情報のリストから出力データの詳細情報の列を作成
+
+    Args:
+        detailed_infos: 出力データの行ごとの詳細情報（Noneの行、row_countに満たない分は空の値）
+        row_count: 出力データの行数
+        plan: 出力する項目の計画。計画にない項目の列は空文字列にします
+
+    Returns:
+        DETAIL_COLUMNSの列を持ち、インデックスが行番号（0〜row_count-1）のDataFrame
+    """
+    infos = list(detailed_infos[:row_count]) + [None] * max(0, row_count - len(detailed_infos))
+    columns = {column: pd.Series("", index=range(row_count), dtype=object) for column in DETAIL_COLUMNS}
+
+    if plan.wants("phone"):
+        phones = _explode([info.phone if info else [] for info in infos])
+        columns["phone"] = _join_lists(_canonical_column(phones, canonicalize_phones, valid_phone_mask), row_count)
+    if plan.wants("fax"):
+        faxes = _explode([info.fax if info else [] for info in infos])
+        columns["fax"] = _join_lists(_canonical_column(faxes, canonicalize_phones, valid_phone_mask), row_count)
+    if plan.wants("email"):
+        emails = _explode([info.email if info else [] for info in infos])
+        columns["email"] = _join_lists(_canonical_column(emails, canonicalize_emails, valid_email_mask), row_count)
+    if plan.wants("address"):
+        addresses = [(info.address or {}) if info else {} for info in infos]
+        postal_codes = pd.Series([address.get("postal_code") or "" for address in addresses], dtype=object)
+        columns["postal_code"] = format_postal_codes(postal_codes).astype(object)
+        columns["prefecture"] = pd.Series([address.get("prefecture") or "" for address in addresses], dtype=object)
+    if plan.wants("company_name"):
+        columns["company_name"] = _scalar_column([info.company_name if info else None for info in infos])
+    if plan.wants("sns_links"):
+        for column, name in SNS_COLUMNS.items():
+            links = _explode([(info.sns_links or {}).get(name, []) if info else [] for info in infos])
+            columns[column] = _join_lists(links, row_count)
+    if plan.wants("business_hours"):
+        columns["business_hours"] = _scalar_column([info.business_hours if info else None for info in infos])
+    if plan.wants("closed_days"):
+        columns["closed_days"] = _scalar_column([info.closed_days if info else None for info in infos])
+
+    logger.debug(f"Built detail columns for {row_count} rows")
+    return pd.DataFrame(columns, index=range(row_count))
+
+
+def _canonical_column(
+    values: pd.Series,
+    canonicalize: Callable[[pd.Series], pd.Series],
+    is_valid: Callable[[pd.Series], pd.Series]
+) -> pd.Series:
+    """縦長の列を正規化し、妥当な値のみを残す
+
+    バッチ内の同じ値（複数の検索結果に現れる同じ店舗の番号など）は一度だけ処理します。
+    """
+    codes, uniques = pd.factorize(values)
+    canonical = canonicalize(pd.Series(uniques, dtype=object))
+    keep = is_valid(canonical).to_numpy()[codes]
+    return pd.Series(canonical.to_numpy(dtype=object)[codes][keep], index=values.index[keep], dtype=object)
+
+
+def _explode(lists: list[list[str]]) -> pd.Series:
+    """行ごとのリストを、値1つを1行とする縦長の列にする（インデックスは元の行番号）"""
+    lengths = np.fromiter((len(values) for values in lists), dtype=np.int64, count=len(lists))
+    rows = np.repeat(np.arange(len(lists)), lengths)
+    return pd.Series(list(chain.from_iterable(lists)), index=rows, dtype=object)
+
+
+def _join_lists(values: pd.Series, row_count: int) -> pd.Series:
+    """縦長の列を、同じ行の値を重複を除いてカンマ区切りで結合した列にする
+
+    結合はgroupbyの合計（文字列の連結）で行い、末尾の区切りを除きます。
+    """
+    frame = pd.DataFrame({"row": values.index, "value": values.to_numpy(dtype=object)})
+    frame = frame[frame["value"] != ""].drop_duplicates()
+    if frame.empty:
+        return pd.Series("", index=range(row_count), dtype=object)
+    joined = (frame["value"] + LIST_SEPARATOR).groupby(frame["row"], sort=True).sum()
+    joined = joined.str.slice(0, -len(LIST_SEPARATOR))
+    return joined.reindex(range(row_count), fill_value="").astype(object)
+
+
+def _scalar_column(values: list[Optional[str]]) -> pd.Series:
+    """単一の値の列（Noneは空文字列）"""
+    return pd.Series([value or "" for value in values], dtype=object)
@@ -13,6 +13,7 @@ from openpyxl.utils import get_column_letter
 
 from config.settings import Settings
 from config.constants import ERROR_MESSAGES, SUCCESS_MESSAGES
+from core.extraction_plan import ExtractionPlan
 from output.formatter import OutputData
 from utils.logger import get_logger
 
@@ -38,7 +39,8 @@ class ExcelWriter:
         self,
         data_list: list[OutputData],
         filename: str,
-        apply_format: bool = True
+        apply_format: bool = True,
+        plan: Optional[ExtractionPlan] = None
     ) -> Optional[Path]:
         """データをExcelに書き込み
 
@@ -46,6 +48,7 @@ class ExcelWriter:
             data_list: 出力データのリスト
             filename: 出力ファイル名（拡張子含む）
             apply_format: フォーマットを適用するかどうか（デフォルト: True）
+            plan: 出力する項目の計画（Noneの場合はすべての列）
 
         Returns:
             出力したファイルのパス。失敗した場合はNone
@@ -65,6 +68,8 @@ class ExcelWriter:
         try:
             # DataFrameに変換
             df = pd.DataFrame([data.to_dict() for data in data_list])
+            if plan is not None:
+                df = df[plan.output_columns]
 
             # 列名の日本語化（Phase 2で営業時間・定休日を追加）
             column_names = {
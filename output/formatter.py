@@ -2,6 +2,7 @@
 
 このモジュールは、抽出されたデータの整形、重複除去、
 バリデーションを行う機能を提供します。
+詳細情報の正規化と結合は、output.columnarで列ごとにまとめて行います。
 """
 
 from dataclasses import dataclass, asdict
@@ -10,6 +11,8 @@ import pandas as pd
 
 from core.searcher import SearchItem
 from core.extractor import DetailedInfo
+from core.extraction_plan import ExtractionPlan
+from output.columnar import build_detail_columns
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -62,7 +65,8 @@ class DataFormatter:
     def format_data(
         self,
         search_items: list[SearchItem],
-        detailed_infos: Optional[list[Optional[DetailedInfo]]] = None
+        detailed_infos: Optional[list[Optional[DetailedInfo]]] = None,
+        plan: Optional[ExtractionPlan] = None
     ) -> list[OutputData]:
         """データを整形
 
@@ -71,26 +75,47 @@ class DataFormatter:
         Args:
             search_items: 検索結果のリスト
             detailed_infos: 詳細情報のリスト（Noneの場合は詳細情報なし）
+            plan: 出力する項目の計画（Noneの場合はすべての項目）。計画にない詳細情報の項目は空のままにします
 
         Returns:
             整形された出力データのリスト
         """
-        logger.info(f"Formatting {len(search_items)} search items")
+        df = self.format_frame(search_items, detailed_infos, plan)
+        output_data_list = [OutputData(**record) for record in df.to_dict('records')]
 
-        output_data_list = []
+        logger.info(f"Formatted {len(output_data_list)} output data items")
+        return output_data_list
 
-        for i, search_item in enumerate(search_items):
-            # 詳細情報の取得
-            detailed_info = None
-            if detailed_infos and i < len(detailed_infos):
-                detailed_info = detailed_infos[i]
+    def format_frame(
+        self,
+        search_items: list[SearchItem],
+        detailed_infos: Optional[list[Optional[DetailedInfo]]] = None,
+        plan: Optional[ExtractionPlan] = None
+    ) -> pd.DataFrame:
+        """データを整形してDataFrameを作成
 
-            # OutputDataの作成
-            output_data = self._create_output_data(search_item, detailed_info)
-            output_data_list.append(output_data)
+        詳細情報の正規化・検証・結合は、行ごとではなくバッチ全体の列に対して一度に行います
+        （output.columnar）。
 
-        logger.info(f"Formatted {len(output_data_list)} output data items")
-        return output_data_list
+        Args:
+            search_items: 検索結果のリスト
+            detailed_infos: 詳細情報のリスト（Noneの場合は詳細情報なし）
+            plan: 出力する項目の計画（Noneの場合はすべての項目）。計画にない詳細情報の項目は空のままにします
+
+        Returns:
+            OutputDataのすべてのフィールドを列に持つDataFrame（行は検索結果の順）
+        """
+        logger.info(f"Formatting {len(search_items)} search items")
+        plan = plan or ExtractionPlan.all()
+
+        df = pd.DataFrame({
+            "rank": pd.Series([item.rank for item in search_items], dtype=object),
+            "title": pd.Series([item.title for item in search_items], dtype=object),
+            "url": pd.Series([item.url for item in search_items], dtype=object),
+            "description": pd.Series([item.description for item in search_items], dtype=object),
+        }, index=range(len(search_items)))
+        details = build_detail_columns(detailed_infos or [], len(search_items), plan)
+        return pd.concat([df, details], axis=1)
 
     def remove_duplicates(self, data_list: list[OutputData]) -> list[OutputData]:
         """重複を除去
@@ -152,11 +177,12 @@ class DataFormatter:
         logger.info(f"Validated: {len(valid_data)} valid, {len(data_list) - len(valid_data)} invalid")
         return valid_data
 
-    def to_dataframe(self, data_list: list[OutputData]) -> pd.DataFrame:
+    def to_dataframe(self, data_list: list[OutputData], plan: Optional[ExtractionPlan] = None) -> pd.DataFrame:
         """DataFrameに変換
 
         Args:
             data_list: 出力データのリスト
+            plan: 出力する項目の計画（Noneの場合はすべての列）
 
         Returns:
             pandas DataFrame
@@ -166,73 +192,11 @@ class DataFormatter:
             return pd.DataFrame()
 
         df = pd.DataFrame([data.to_dict() for data in data_list])
+        if plan is not None:
+            df = df[plan.output_columns]
         logger.debug(f"Converted to DataFrame: shape={df.shape}")
         return df
 
-    def _create_output_data(
-        self,
-        search_item: SearchItem,
-        detailed_info: Optional[DetailedInfo]
-    ) -> OutputData:
-        """OutputDataを作成
-
-        Args:
-            search_item: 検索結果
-            detailed_info: 詳細情報（Noneの場合もあり）
-
-        Returns:
-            出力用データ
-        """
-        # 基本情報
-        output_data = OutputData(
-            rank=search_item.rank,
-            title=search_item.title,
-            url=search_item.url,
-            description=search_item.description
-        )
-
-        # 詳細情報の追加
-        if detailed_info:
-            # 電話番号（カンマ区切りで結合）
-            if detailed_info.phone:
-                output_data.phone = ", ".join(detailed_info.phone)
-
-            # メールアドレス（カンマ区切りで結合）
-            if detailed_info.email:
-                output_data.email = ", ".join(detailed_info.email)
-
-            # FAX番号（カンマ区切りで結合）
-            if detailed_info.fax:
-                output_data.fax = ", ".join(detailed_info.fax)
-
-            # 住所情報
-            if detailed_info.address:
-                output_data.postal_code = detailed_info.address.get("postal_code") or ""
-                output_data.prefecture = detailed_info.address.get("prefecture") or ""
-
-            # 会社名
-            if detailed_info.company_name:
-                output_data.company_name = detailed_info.company_name
-
-            # SNSリンク
-            if detailed_info.sns_links:
-                if "twitter" in detailed_info.sns_links:
-                    output_data.sns_twitter = ", ".join(detailed_info.sns_links["twitter"])
-                if "facebook" in detailed_info.sns_links:
-                    output_data.sns_facebook = ", ".join(detailed_info.sns_links["facebook"])
-                if "instagram" in detailed_info.sns_links:
-                    output_data.sns_instagram = ", ".join(detailed_info.sns_links["instagram"])
-
-            # 営業時間（Phase 2で追加）
-            if detailed_info.business_hours:
-                output_data.business_hours = detailed_info.business_hours
-
-            # 定休日（Phase 2で追加）
-            if detailed_info.closed_days:
-                output_data.closed_days = detailed_info.closed_days
-
-        return output_data
-
     def _is_valid_data(self, data: OutputData) -> bool:
         """データの妥当性を検証
 
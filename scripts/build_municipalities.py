@@ -0,0 +1,74 @@
+"""市区町村データファイルの作成スクリプト
+
+日本郵便の郵便番号データ（KEN_ALL.CSV、Shift_JIS）から、
+住所の検出に使用する市区町村データファイル（config/data/municipalities.tsv）を作成します。
+
+郵便番号データは、以下からダウンロードしたZIPファイルを展開して使用してください。
+    https://www.post.japanpost.jp/zipcode/download.html
+
+使い方:
+    python scripts/build_municipalities.py KEN_ALL.CSV [--output PATH]
+"""
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.settings import Settings
+
+# KEN_ALL.CSVの列番号
+COLUMN_JIS_CODE = 0
+COLUMN_PREFECTURE = 6
+COLUMN_CITY = 7
+
+
+def read_municipalities(csv_path: Path) -> dict[str, list[str]]:
+    """郵便番号データから都道府県ごとの市区町村名を読み込み
+
+    Args:
+        csv_path: KEN_ALL.CSVのパス
+
+    Returns:
+        都道府県名をキー、市区町村名のリスト（全国地方公共団体コード順）を値とする辞書
+        （都道府県もコード順）
+    """
+    codes: dict[tuple[str, str], str] = {}
+    with open(csv_path, encoding="cp932", errors="replace", newline="") as f:
+        for row in csv.reader(f):
+            key = (row[COLUMN_PREFECTURE], row[COLUMN_CITY])
+            codes.setdefault(key, row[COLUMN_JIS_CODE])
+
+    municipalities: dict[str, list[str]] = {}
+    for (prefecture, city), _ in sorted(codes.items(), key=lambda item: item[1]):
+        municipalities.setdefault(prefecture, []).append(city)
+    return municipalities
+
+
+def write_municipalities(municipalities: dict[str, list[str]], output: Path) -> None:
+    """市区町村データファイルを書き込み（1行に1都道府県、タブの後に市区町村名をカンマ区切り）"""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8", newline="\n") as f:
+        f.write("# 都道府県<TAB>市区町村名（カンマ区切り）\n")
+        f.write("# 出典: 日本郵便 郵便番号データ（KEN_ALL.CSV）。scripts/build_municipalities.pyで作成\n")
+        for prefecture, cities in municipalities.items():
+            f.write(f"{prefecture}\t{','.join(cities)}\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="市区町村データファイルの作成")
+    parser.add_argument("csv_path", type=Path, help="KEN_ALL.CSVのパス")
+    parser.add_argument("--output", type=Path, default=Settings.MUNICIPALITIES_PATH, help="出力先のパス")
+    args = parser.parse_args()
+
+    municipalities = read_municipalities(args.csv_path)
+    write_municipalities(municipalities, args.output)
+
+    total = sum(len(cities) for cities in municipalities.values())
+    print(f"{len(municipalities)} prefectures, {total} municipalities -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
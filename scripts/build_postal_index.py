@@ -0,0 +1,56 @@
+"""郵便番号索引ファイルの作成スクリプト
+
+日本郵便の郵便番号データ（KEN_ALL.CSV、Shift_JIS）から、
+郵便番号から住所を引く索引ファイル（config/data/postal_index.bin）を作成します。
+
+郵便番号データは、以下からダウンロードしたZIPファイルを展開して使用してください。
+    https://www.post.japanpost.jp/zipcode/download.html
+
+使い方:
+    python scripts/build_postal_index.py KEN_ALL.CSV [--output PATH]
+"""
+
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config.settings import Settings
+from core.postal_index import PostalIndex, build_postal_index
+
+# KEN_ALL.CSVの列番号
+COLUMN_POSTAL_CODE = 2
+COLUMN_PREFECTURE = 6
+COLUMN_CITY = 7
+COLUMN_TOWN = 8
+
+
+def read_records(csv_path: Path):
+    """郵便番号データから（郵便番号, 都道府県名, 市区町村名, 町域名）を読み込み"""
+    with open(csv_path, encoding="cp932", errors="replace", newline="") as f:
+        for row in csv.reader(f):
+            yield row[COLUMN_POSTAL_CODE], row[COLUMN_PREFECTURE], row[COLUMN_CITY], row[COLUMN_TOWN]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="郵便番号索引ファイルの作成")
+    parser.add_argument("csv_path", type=Path, help="KEN_ALL.CSVのパス")
+    parser.add_argument("--output", type=Path, default=Settings.POSTAL_INDEX_PATH, help="出力先のパス")
+    args = parser.parse_args()
+
+    count = build_postal_index(read_records(args.csv_path), args.output)
+
+    start = time.perf_counter()
+    index = PostalIndex(args.output)
+    open_ms = (time.perf_counter() - start) * 1000
+    index.close()
+
+    print(f"{count} postal codes -> {args.output} ({args.output.stat().st_size / 1024:.0f} KB, "
+          f"opened in {open_ms:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
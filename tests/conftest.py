@@ -0,0 +1,154 @@
+"""テスト共通のフィクスチャ
+
+ネットワークにアクセスせずにHTTPクライアントをテストするための
+ローカルHTTPサーバーを提供します。
+"""
+
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+import threading
+import time
+
+import pytest
+from config.settings import Settings
+from core.rate_limiter import get_shared_rate_limiter
+
+
+class _Server(ThreadingHTTPServer):
+    """同時接続のテスト用にバックログを広げたサーバー"""
+    daemon_threads = True
+    request_queue_size = 128
+
+
+@dataclass
+class Route:
+    """ローカルサーバーの応答定義"""
+    body: bytes = b""
+    status: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+    delay: float = 0.0
+
+
+class LocalHTTPServer:
+    """テスト用のローカルHTTPサーバー
+
+    パスごとに応答を登録でき、受信したリクエストを記録します。
+    未登録のパスには404を返します。
+    """
+
+    def __init__(self):
+        self.routes: dict[str, Route] = {}
+        self.requests: list[tuple[str, str, dict[str, str]]] = []  # (method, path, headers)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def add_route(
+        self,
+        path: str,
+        body: bytes | str = b"",
+        status: int = 200,
+        headers: Optional[dict[str, str]] = None,
+        delay: float = 0.0
+    ) -> None:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        headers = dict(headers or {})
+        headers.setdefault("Content-Type", "text/html; charset=utf-8")
+        self.routes[path] = Route(body=body, status=status, headers=headers, delay=delay)
+
+    def count(self, path: str) -> int:
+        return sum(1 for _, request_path, _ in self.requests if request_path == path)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self._respond()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                self._respond()
+
+            def _respond(self):
+                path = self.path.split("?")[0]
+                with server._lock:
+                    server.requests.append((self.command, path, dict(self.headers)))
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+
+                try:
+                    route = server.routes.get(path, Route(body=b"not found", status=404))
+                    if route.delay:
+                        time.sleep(route.delay)
+
+                    # ETagが一致する条件付きリクエストには304を返す
+                    etag = route.headers.get("ETag")
+                    if etag and self.headers.get("If-None-Match") == etag:
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+
+                    self.send_response(route.status)
+                    for name, value in route.headers.items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Length", str(len(route.body)))
+                    self.end_headers()
+                    self.wfile.write(route.body)
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def local_server():
+    """ローカルHTTPサーバーのフィクスチャ"""
+    server = LocalHTTPServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(autouse=True)
+def disable_robots_persistence(monkeypatch):
+    """テスト中はrobots.txtキャッシュをファイルに保存しない"""
+    monkeypatch.setattr(Settings, "ROBOTS_CACHE_PERSIST", False)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_rate_limiter():
+    """テストごとに共有のレート制限の状態をクリア"""
+    get_shared_rate_limiter().reset()
+    yield
+    get_shared_rate_limiter().reset()
@@ -0,0 +1,190 @@
+"""非同期クライアントのテスト
+
+AsyncWebScraperとAsyncSearchAPIClientを、ローカルHTTPサーバーに対してテストします。
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from config.settings import Settings
+from core.async_scraper import AsyncWebScraper
+from core.async_search_api import AsyncSearchAPIClient
+from core.scraper import PageContent
+
+
+@pytest.fixture
+def async_scraper():
+    """AsyncWebScraperのフィクスチャ（待機時間なし）"""
+    scraper = AsyncWebScraper(max_concurrency=50, max_per_host=50)
+    scraper.wait_time = 0
+    return scraper
+
+
+def run(coro):
+    """コルーチンを実行するヘルパー"""
+    return asyncio.run(coro)
+
+
+class TestAsyncWebScraper:
+    """AsyncWebScraperのテスト"""
+
+    def test_fetch_page(self, async_scraper, local_server):
+        """1ページの取得"""
+        local_server.add_route("/page", "<html><body>こんにちは</body></html>")
+
+        async def scenario():
+            async with async_scraper:
+                return await async_scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+
+        page = run(scenario())
+        assert isinstance(page, PageContent)
+        assert "こんにちは" in page.html
+
+    def test_fetch_many_concurrent_and_ordered(self, async_scraper, local_server):
+        """同時に取得され、結果が入力順で返されること"""
+        for i in range(20):
+            # 前のページほど応答を遅くして、完了順を入力順と逆にする
+            local_server.add_route(f"/p{i}", f"<html>{i}</html>", delay=0.3 - i * 0.01)
+        urls = [local_server.url(f"/p{i}") for i in range(20)]
+
+        async def scenario():
+            async with async_scraper:
+                return await async_scraper.fetch_many(urls, respect_robots=False)
+
+        start = time.time()
+        pages = run(scenario())
+        elapsed = time.time() - start
+
+        assert [page.html for page in pages] == [f"<html>{i}</html>" for i in range(20)]
+        assert elapsed < 2.0  # 直列なら約4秒
+        assert local_server.max_active > 1
+
+    def test_per_host_limit(self, local_server):
+        """ドメインごとの同時実行数が制限されること"""
+        for i in range(6):
+            local_server.add_route(f"/p{i}", "<html></html>", delay=0.1)
+        scraper = AsyncWebScraper(max_concurrency=50, max_per_host=2)
+        scraper.wait_time = 0
+
+        async def scenario():
+            async with scraper:
+                return await scraper.fetch_many(
+                    [local_server.url(f"/p{i}") for i in range(6)], respect_robots=False
+                )
+
+        run(scenario())
+        assert local_server.max_active <= 2
+
+    def test_not_found_returns_none(self, async_scraper, local_server):
+        """404の場合はNoneを返すこと"""
+        async def scenario():
+            async with async_scraper:
+                return await async_scraper.fetch_page(local_server.url("/missing"), respect_robots=False)
+
+        assert run(scenario()) is None
+
+    def test_response_status_and_content_type(self, async_scraper, local_server):
+        """レスポンスのステータスコードとContent-TypeがPageContentに設定されること"""
+        local_server.add_route("/page", "<html></html>", headers={"Content-Type": "application/xhtml+xml"})
+
+        async def scenario():
+            async with async_scraper:
+                return await async_scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+
+        page = run(scenario())
+        assert page.status_code == 200
+        assert page.content_type == "application/xhtml+xml"
+        assert page.final_url == local_server.url("/page")
+
+    @pytest.mark.parametrize("status, expected_requests", [(400, 1), (410, 1), (503, 2)])
+    def test_retry_policy(self, async_scraper, local_server, status, expected_requests):
+        """5xx・429のみリトライし、その他の4xxはリトライしないこと（WebScraperと同じ方針）"""
+        local_server.add_route("/page", "error", status=status)
+        async_scraper.max_retries = 2
+
+        async def scenario():
+            async with async_scraper:
+                return await async_scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+
+        assert run(scenario()) is None
+        assert local_server.count("/page") == expected_requests
+
+    def test_robots_denied(self, async_scraper, local_server):
+        """robots.txtで禁止されたURLはRuntimeError"""
+        local_server.add_route(
+            "/robots.txt", "User-agent: *\nDisallow: /private\n",
+            headers={"Content-Type": "text/plain"}
+        )
+        local_server.add_route("/private/page", "<html></html>")
+
+        async def scenario():
+            async with async_scraper:
+                return await async_scraper.fetch_page(local_server.url("/private/page"))
+
+        with pytest.raises(RuntimeError):
+            run(scenario())
+
+    def test_robots_loaded_once_per_domain(self, async_scraper, local_server):
+        """robots.txtはドメインごとに1回だけ取得されること"""
+        local_server.add_route("/robots.txt", "User-agent: *\nAllow: /\n",
+                               headers={"Content-Type": "text/plain"})
+        for i in range(5):
+            local_server.add_route(f"/p{i}", "<html></html>")
+
+        async def scenario():
+            async with async_scraper:
+                return await async_scraper.fetch_many([local_server.url(f"/p{i}") for i in range(5)])
+
+        pages = run(scenario())
+        assert all(page is not None for page in pages)
+        assert local_server.count("/robots.txt") == 1
+
+
+class TestAsyncSearchAPIClient:
+    """AsyncSearchAPIClientのテスト"""
+
+    def test_tavily_search(self, local_server, monkeypatch):
+        """Tavily APIのレスポンスがSearchItemに変換されること"""
+        monkeypatch.setattr(Settings, "TAVILY_API_KEY", "test-key")
+        local_server.add_route(
+            "/search",
+            json.dumps({"results": [
+                {"title": "A", "url": "https://a.example.com", "content": "aaa"},
+                {"title": "B", "url": "https://b.example.com", "content": "bbb"},
+            ]}),
+            headers={"Content-Type": "application/json"}
+        )
+        client = AsyncSearchAPIClient(provider="tavily")
+        client.TAVILY_API_URL = local_server.url("/search")
+
+        async def scenario():
+            async with client:
+                return await client.search("テスト")
+
+        items = run(scenario())
+        assert [item.rank for item in items] == [1, 2]
+        assert items[1].url == "https://b.example.com"
+
+    def test_search_error(self, local_server, monkeypatch):
+        """APIエラーはRuntimeError"""
+        monkeypatch.setattr(Settings, "TAVILY_API_KEY", "test-key")
+        local_server.add_route("/search", "error", status=500)
+        client = AsyncSearchAPIClient(provider="tavily")
+        client.TAVILY_API_URL = local_server.url("/search")
+
+        async def scenario():
+            async with client:
+                return await client.search("テスト")
+
+        with pytest.raises(RuntimeError):
+            run(scenario())
+
+    def test_empty_keyword(self, monkeypatch):
+        """空のキーワードはValueError"""
+        monkeypatch.setattr(Settings, "TAVILY_API_KEY", "test-key")
+        client = AsyncSearchAPIClient(provider="tavily")
+
+        with pytest.raises(ValueError):
+            run(client.search(""))
@@ -0,0 +1,124 @@
+"""ベンチマーク用のページ生成と基準値の比較のテスト
+
+このモジュールは、benchmarks/corpus.pyのページ生成と、
+benchmarks/bench_extractor.pyの基準値との比較の単体テストを提供します。
+"""
+
+import json
+
+import pytest
+
+from benchmarks.bench_extractor import BASELINE_PATH, compare, repeat_for, write_baseline
+from benchmarks.corpus import CorpusPage, generate_corpus, generate_page
+from core.extraction_cache import ExtractionCache
+from core.extractor import InfoExtractor
+
+
+@pytest.fixture
+def extractor():
+    """キャッシュを使用しないInfoExtractorのフィクスチャ"""
+    return InfoExtractor(cache=ExtractionCache(max_entries=0))
+
+
+class TestCorpus:
+    """ページ生成のテスト"""
+
+    def test_deterministic(self):
+        """同じシード・サイズからは同じページが作成されることを確認"""
+        assert generate_page(20, seed=1).html == generate_page(20, seed=1).html
+        assert generate_page(20, seed=1).html != generate_page(20, seed=2).html
+
+    @pytest.mark.parametrize("size_kb", [10, 50, 300])
+    def test_size(self, size_kb):
+        """ページがおおよそ指定したサイズになることを確認"""
+        page = generate_page(size_kb)
+        assert size_kb * 1024 <= page.size_bytes < size_kb * 1024 * 1.2
+
+    def test_corpus(self):
+        """各サイズについてJSON-LDあり・なしのページが作成されることを確認"""
+        pages = generate_corpus((10, 20))
+        assert [page.name for page in pages] == ["10KB-jsonld", "10KB-plain", "20KB-jsonld", "20KB-plain"]
+        assert all(isinstance(page, CorpusPage) for page in pages)
+        assert "application/ld+json" in pages[0].html
+        assert "application/ld+json" not in pages[1].html
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    @pytest.mark.parametrize("structured", [True, False])
+    def test_extractor_finds_expected(self, extractor, seed, structured):
+        """生成したページから正解データが抽出できることを確認"""
+        page = generate_page(30, seed=seed, structured=structured)
+        info = extractor.extract_all(page.html)
+        expected = page.expected
+
+        assert expected["phone"] in info.phone
+        assert expected["fax"] in info.fax
+        assert info.email == [expected["email"]]
+        assert info.address["postal_code"] == expected["postal_code"]
+        assert info.address["prefecture"] == expected["prefecture"]
+        assert info.company_name == expected["company_name"]
+
+
+class TestBaseline:
+    """基準値との比較のテスト"""
+
+    @pytest.fixture
+    def baseline(self):
+        """基準値のフィクスチャ"""
+        return {
+            "calibration_ms": 10.0,
+            "tolerance": 1.5,
+            "tolerances": {"10KB-plain/parse": 3.0},
+            "min_limit_ms": 1.0,
+            "cases": {"10KB-plain/extract_all": 10.0, "10KB-plain/parse": 10.0, "10KB-plain/extract_fax": 0.1},
+        }
+
+    def test_compare(self, baseline):
+        """基準値×許容倍率を超えた項目が劣化と判定されることを確認"""
+        results = {
+            "10KB-plain/extract_all": 16.0,
+            "10KB-plain/parse": 25.0,
+            "10KB-plain/extract_fax": 0.5,
+            "10KB-plain/extract_email": 0.1,
+        }
+        rows = {row["name"]: row for row in compare(results, baseline, calibration_ms=10.0)}
+
+        assert rows["10KB-plain/extract_all"]["status"] == "regression"
+        assert rows["10KB-plain/extract_all"]["limit_ms"] == pytest.approx(15.0)
+        # 項目ごとの許容倍率
+        assert rows["10KB-plain/parse"]["status"] == "ok"
+        # 上限の下限
+        assert rows["10KB-plain/extract_fax"]["limit_ms"] == pytest.approx(1.0)
+        assert rows["10KB-plain/extract_fax"]["status"] == "ok"
+        assert rows["10KB-plain/extract_email"]["status"] == "new"
+
+    def test_compare_scales_by_calibration(self, baseline):
+        """較正の時間の比で上限が補正されることを確認"""
+        rows = compare({"10KB-plain/extract_all": 25.0}, baseline, calibration_ms=20.0)
+        assert rows[0]["limit_ms"] == pytest.approx(30.0)
+        assert rows[0]["status"] == "ok"
+
+    def test_write_baseline(self, tmp_path, baseline):
+        """基準値ファイルの更新で許容倍率が引き継がれることを確認"""
+        path = tmp_path / "baseline.json"
+        write_baseline(path, {"10KB-plain/extract_all": 12.3456}, 8.0, seed=7, previous=baseline)
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["seed"] == 7
+        assert data["calibration_ms"] == 8.0
+        assert data["tolerances"] == {"10KB-plain/parse": 3.0}
+        assert data["cases"]["10KB-plain/extract_all"] == 12.346
+        assert data["cases"]["10KB-plain/parse"] == 10.0
+
+    def test_repeat_for(self):
+        """大きなページほど繰り返し回数が少なくなることを確認"""
+        assert repeat_for(10 * 1024, 5) == 5
+        assert repeat_for(5000 * 1024, 5) == 4
+        assert repeat_for(100 * 1024 * 1024, 5) == 1
+
+    def test_shipped_baseline(self):
+        """同梱の基準値ファイルが既定のすべての項目を持つことを確認"""
+        data = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+        assert data["tolerance"] > 1
+        assert data["calibration_ms"] > 0
+        assert "5000KB-plain/extract_all" in data["cases"]
+        assert "10KB-jsonld/extract_all" in data["cases"]
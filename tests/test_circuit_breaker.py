@@ -0,0 +1,149 @@
+"""circuit_breakerモジュールと遅延リトライのテスト
+
+このモジュールは、CircuitBreakerクラスの単体テストと、
+WebScraper.fetch_manyの遅延リトライ・レポートのテストを提供します。
+"""
+
+import time
+
+import pytest
+from core.circuit_breaker import CircuitBreaker, STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN
+from core.rate_limiter import RateLimiter
+from core.scraper import WebScraper
+
+URL = "https://down.example.com/page"
+
+
+@pytest.fixture
+def breaker():
+    """CircuitBreakerのフィクスチャ"""
+    return CircuitBreaker(failure_threshold=2, reset_timeout=0.2)
+
+
+@pytest.fixture
+def scraper(breaker):
+    """待機時間を短縮したWebScraperのフィクスチャ"""
+    scraper = WebScraper(rate_limiter=RateLimiter(min_rate=100, max_rate=100), circuit_breaker=breaker)
+    scraper.wait_time = 0
+    scraper.max_retries = 3
+    return scraper
+
+
+class TestCircuitBreaker:
+    """サーキットの状態遷移のテスト"""
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        """連続した失敗で開き、リクエストを拒否すること"""
+        assert not breaker.record_failure(URL)
+        assert breaker.allow(URL)
+
+        assert breaker.record_failure(URL)
+        assert breaker.get_state(URL) == STATE_OPEN
+        assert not breaker.allow(URL)
+        assert len(breaker.trips) == 1
+        assert breaker.trips[0].host == "down.example.com"
+
+    def test_success_resets_failures(self, breaker):
+        """成功で連続失敗回数がリセットされること"""
+        breaker.record_failure(URL)
+        breaker.record_success(URL)
+        breaker.record_failure(URL)
+
+        assert breaker.get_state(URL) == STATE_CLOSED
+
+    def test_half_open_allows_single_probe(self, breaker):
+        """reset_timeout経過後は1件だけ試行を許可すること"""
+        breaker.record_failure(URL)
+        breaker.record_failure(URL)
+        time.sleep(0.25)
+
+        assert breaker.allow(URL)
+        assert breaker.get_state(URL) == STATE_HALF_OPEN
+        assert not breaker.allow(URL)
+
+    def test_half_open_failure_reopens(self, breaker):
+        """半開状態での失敗で再び開くこと"""
+        breaker.record_failure(URL)
+        breaker.record_failure(URL)
+        time.sleep(0.25)
+        breaker.allow(URL)
+
+        assert breaker.record_failure(URL)
+        assert breaker.get_state(URL) == STATE_OPEN
+        assert len(breaker.trips) == 2
+
+    def test_half_open_success_closes(self, breaker):
+        """半開状態での成功で閉じること"""
+        breaker.record_failure(URL)
+        breaker.record_failure(URL)
+        time.sleep(0.25)
+        breaker.allow(URL)
+        breaker.record_success(URL)
+
+        assert breaker.get_state(URL) == STATE_CLOSED
+        assert breaker.allow(URL)
+
+    def test_hosts_are_independent(self, breaker):
+        """ホストごとに独立していること"""
+        breaker.record_failure(URL)
+        breaker.record_failure(URL)
+
+        assert breaker.allow("https://up.example.com/")
+
+
+class TestDeferredRetry:
+    """WebScraperの遅延リトライのテスト"""
+
+    def test_down_host_fails_fast(self, scraper, local_server):
+        """ダウンしたホストへのリクエスト数がしきい値付近で止まること"""
+        local_server.add_route("/down", "error", status=503)
+        urls = [local_server.url("/down") + f"?page={i}" for i in range(6)]
+        scraper.deferred_retry_rounds = 1
+        scraper.max_workers = 1
+
+        results = scraper.fetch_many(urls, respect_robots=False)
+
+        assert results == [None] * 6
+        # 6件×3回のインラインリトライではなく、しきい値＋半開時の試行のみ
+        assert local_server.count("/down") <= 4
+        report = scraper.last_report
+        assert report.failed == 6
+        assert len(report.breaker_trips) >= 1
+        assert len(report.retry_outcomes) == 6
+        assert not any(outcome.succeeded for outcome in report.retry_outcomes)
+
+    def test_failed_url_recovered_at_end(self, scraper, local_server):
+        """一時的に失敗したURLがジョブの最後に再取得されること"""
+        local_server.add_route("/flaky", "error", status=503)
+        local_server.add_route("/ok", "<html><body>ok</body></html>")
+        urls = [local_server.url("/flaky"), local_server.url("/ok")]
+
+        def on_fetched(completed, total, url):
+            # 1回目の取得がすべて終わった時点でサーバーが復旧する
+            if completed == total:
+                local_server.add_route("/flaky", "<html><body>recovered</body></html>")
+
+        results = scraper.fetch_many(urls, respect_robots=False, progress_callback=on_fetched)
+
+        assert "recovered" in results[0].html
+        assert results[1] is not None
+        assert local_server.count("/flaky") == 2
+        outcome = scraper.last_report.retry_outcomes[0]
+        assert outcome.succeeded
+        assert outcome.attempts == 2
+
+    def test_not_found_not_deferred(self, scraper, local_server):
+        """404は遅延リトライの対象にならないこと"""
+        results = scraper.fetch_many([local_server.url("/missing")], respect_robots=False)
+
+        assert results == [None]
+        assert local_server.count("/missing") == 1
+        assert scraper.last_report.retry_outcomes == []
+
+    def test_fetch_page_retries_inline(self, scraper, local_server):
+        """fetch_pageは従来どおりその場でリトライすること"""
+        scraper.circuit_breaker = CircuitBreaker(failure_threshold=10)
+        local_server.add_route("/down", "error", status=500)
+
+        assert scraper.fetch_page(local_server.url("/down"), respect_robots=False) is None
+        assert local_server.count("/down") == 3
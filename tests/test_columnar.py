@@ -0,0 +1,138 @@
+"""columnarモジュールのテスト
+
+このモジュールは、詳細情報の列単位の後処理（電話番号・メールアドレス・郵便番号の正規化と検証、
+行ごとの結合）の単体テストを提供します。
+"""
+
+import pandas as pd
+import pytest
+from core.extraction_plan import ExtractionPlan
+from core.extraction_cache import ExtractionCache
+from core.extractor import DetailedInfo, InfoExtractor
+from output.columnar import (
+    DETAIL_COLUMNS, build_detail_columns, canonicalize_emails, canonicalize_phones, format_postal_codes,
+    valid_email_mask, valid_phone_mask,
+)
+
+
+@pytest.fixture
+def detailed_infos():
+    """テスト用DetailedInfoのフィクスチャ（3行目は詳細情報なし）"""
+    return [
+        DetailedInfo(
+            phone=["03-1234-5678", "０３－１２３４－５６７８", "(03) 1234-5679", "0120-123-45"],
+            email=[" Info@Example.JP ", "logo@2x.png"],
+            fax=["+81-3-1234-5670"],
+            address={"postal_code": "〒1500001", "prefecture": "東京都"},
+            company_name="テスト株式会社",
+            sns_links={"twitter": ["https://x.com/test", "https://x.com/test"]},
+            business_hours="9:00-18:00",
+        ),
+        DetailedInfo(phone=["090-1234-5678"], address={"postal_code": "530-0001", "prefecture": "大阪府"}),
+        None,
+    ]
+
+
+class TestPhoneColumn:
+    """電話番号の列の正規化と検証のテスト"""
+
+    def test_canonicalize(self):
+        phones = pd.Series(["０３－１２３４－５６７８", "(03) 1234-5678", "+81-3-1234-5678", "+81 (0)3-1234-5678"])
+        assert canonicalize_phones(phones).tolist() == ["03-1234-5678"] * 4
+
+    @pytest.mark.parametrize("phone, expected", [
+        ("03-1234-5678", True),
+        ("0123-45-6789", True),
+        ("0120-123-456", True),
+        ("0120-123-4567", False),
+        ("0570-123-456", True),
+        ("050-1234-5678", True),
+        ("050-123-4567", False),
+        ("090-1234-5678", True),
+        ("090-1234-567", False),
+        ("3-1234-5678", False),
+        ("", False),
+    ])
+    def test_valid_phone_mask(self, phone, expected):
+        """番号の種類ごとの桁数で検証され、InfoExtractorの検証と一致すること"""
+        assert valid_phone_mask(pd.Series([phone])).tolist() == [expected]
+        assert InfoExtractor._validate_phone(None, phone) is expected
+
+
+class TestEmailAndPostalColumns:
+    """メールアドレスと郵便番号の列のテスト"""
+
+    def test_emails(self):
+        emails = canonicalize_emails(pd.Series([" Info@Example.JP", "icon@2x.PNG", "no-at-mark"]))
+        assert emails.tolist() == ["info@example.jp", "icon@2x.png", "no-at-mark"]
+        assert valid_email_mask(emails).tolist() == [True, False, False]
+
+    def test_postal_codes(self):
+        codes = pd.Series(["1500001", "〒150-0001", "〒 １５０－０００１", "150-000", ""])
+        assert format_postal_codes(codes).tolist() == ["150-0001", "150-0001", "150-0001", "150-000", ""]
+
+
+class TestBuildDetailColumns:
+    """詳細情報の列の作成のテスト"""
+
+    def test_build(self, detailed_infos):
+        """行ごとに正規化・検証・重複除去した値が結合されること"""
+        df = build_detail_columns(detailed_infos, 4, ExtractionPlan.all())
+
+        assert list(df.columns) == list(DETAIL_COLUMNS)
+        assert len(df) == 4
+        first = df.iloc[0]
+        assert first["phone"] == "03-1234-5678, 03-1234-5679"
+        assert first["email"] == "info@example.jp"
+        assert first["fax"] == "03-1234-5670"
+        assert first["postal_code"] == "150-0001"
+        assert first["sns_twitter"] == "https://x.com/test"
+        assert first["business_hours"] == "9:00-18:00"
+        assert df.iloc[1]["phone"] == "090-1234-5678"
+        assert df.iloc[1]["prefecture"] == "大阪府"
+        # 詳細情報のない行・足りない行は空文字列
+        assert (df.iloc[2] == "").all()
+        assert (df.iloc[3] == "").all()
+
+    def test_plan(self, detailed_infos):
+        """計画にない項目の列は空文字列のままにすること"""
+        df = build_detail_columns(detailed_infos, 3, ExtractionPlan.from_fields(["phone"]))
+
+        assert df.iloc[0]["phone"] == "03-1234-5678, 03-1234-5679"
+        assert (df["email"] == "").all()
+        assert (df["postal_code"] == "").all()
+
+    def test_empty(self):
+        df = build_detail_columns([], 0, ExtractionPlan.all())
+        assert df.empty
+        assert list(df.columns) == list(DETAIL_COLUMNS)
+
+
+class TestBatchValidation:
+    """バッチ検証（抽出時に検証せず、列単位でまとめて検証）のテスト"""
+
+    HTML = (
+        "<html><body><p>TEL: ０３－１２３４－５６７８ / 0120-123-4567 / 0120-123-456</p>"
+        "<p>FAX: 03-1234-5670</p><p>Mail: Info@Example.JP logo@2x.png</p></body></html>"
+    )
+
+    def extract(self, batch_validation):
+        extractor = InfoExtractor(cache=ExtractionCache(max_entries=0), use_structured_data=False,
+                                  batch_validation=batch_validation)
+        return extractor.extract_all(self.HTML)
+
+    def test_raw_matches(self):
+        """抽出時は検証せず、一致した値のまま返すこと"""
+        info = self.extract(True)
+        assert "0120-123-4567" in info.phone
+        assert "logo@2x.png" in info.email
+
+    def test_same_columns_as_per_match_validation(self):
+        """列単位でまとめて検証した結果が、抽出時に検証した場合と同じになること"""
+        plan = ExtractionPlan.all()
+        batch = build_detail_columns([self.extract(True)], 1, plan)
+        per_match = build_detail_columns([self.extract(False)], 1, plan)
+
+        assert batch.equals(per_match)
+        assert set(batch.loc[0, "phone"].split(", ")) == {"03-1234-5678", "0120-123-456", "03-1234-5670"}
+        assert batch.loc[0, "email"] == "info@example.jp"
@@ -0,0 +1,220 @@
+"""crawlerモジュールのテスト
+
+このモジュールは、ContactPageCrawlerクラスとDetailedInfo.mergeの単体テストを提供します。
+ページの取得にはローカルHTTPサーバーを使用します。
+"""
+
+import pytest
+from core.crawler import ContactPageCrawler
+from core.extraction_plan import ExtractionPlan
+from core.extractor import DetailedInfo
+from core.http_cache import HttpCache
+from core.scraper import WebScraper, PageContent
+
+LANDING_HTML = """
+<html><body>
+<h1>サンプル商事</h1>
+<a href="/contact/">お問い合わせ</a>
+<a href="/company.html">会社概要</a>
+<a href="/blog/">ブログ</a>
+<a href="/brochure.pdf">会社案内（PDF）</a>
+<a href="https://other.example.com/contact/">お問い合わせ</a>
+<a href="#top">ページトップ</a>
+</body></html>
+"""
+
+
+@pytest.fixture
+def crawler():
+    """ContactPageCrawlerのフィクスチャ（待機時間なし）"""
+    scraper = WebScraper()
+    scraper.wait_time = 0
+    return ContactPageCrawler(scraper, max_pages=3)
+
+
+def make_page(url, html):
+    """テスト用のPageContentを作成"""
+    return PageContent(url=url, html=html, status_code=200, content_type="text/html", encoding="utf-8")
+
+
+class TestFindLinks:
+    """リンクのスコア付けのテスト"""
+
+    def test_same_site_links_ranked(self, crawler):
+        """同一サイトの問い合わせ系リンクのみがスコア順に返されること"""
+        links = crawler.find_links("https://www.example.com/", LANDING_HTML)
+
+        urls = [link.url for link in links]
+        assert urls == ["https://www.example.com/contact/", "https://www.example.com/company.html"]
+
+    def test_www_is_same_site(self, crawler):
+        """www.の有無は同一サイトとみなすこと"""
+        html = '<a href="https://example.com/access/">アクセス</a>'
+
+        links = crawler.find_links("https://www.example.com/", html)
+
+        assert [link.url for link in links] == ["https://example.com/access/"]
+
+    def test_image_alt_text(self, crawler):
+        """画像リンクのalt属性をアンカーテキストとして使うこと"""
+        html = '<a href="/page2"><img src="x.png" alt="会社概要"></a>'
+
+        links = crawler.find_links("https://example.com/", html)
+
+        assert links[0].anchor_text == "会社概要"
+
+    def test_base_href(self, crawler):
+        """<base href>がある場合は、相対URLをその値を基準に解決すること"""
+        html = '<head><base href="/ja/"></head><body><a href="contact/">お問い合わせ</a></body>'
+
+        links = crawler.find_links("https://www.example.com/", html)
+
+        assert [link.url for link in links] == ["https://www.example.com/ja/contact/"]
+
+    def test_low_score_excluded(self, crawler):
+        """スコアの低いリンクは除外されること"""
+        assert crawler.find_links("https://example.com/", '<a href="/news/">新着情報</a>') == []
+
+
+class TestCrawl:
+    """巡回のテスト"""
+
+    def test_merges_details_and_stops_early(self, crawler, local_server):
+        """詳細情報を統合し、必要な項目が埋まったら打ち切ること"""
+        landing = LANDING_HTML.replace("/contact/", local_server.url("/contact/"))
+        landing = landing.replace("/company.html", local_server.url("/company.html"))
+        local_server.add_route(
+            "/contact/",
+            "<html><body>TEL: 03-1234-5678 info@example.co.jp 〒100-0001 東京都千代田区千代田1-1-1</body></html>"
+        )
+        local_server.add_route("/company.html", "<html><body>会社概要</body></html>")
+
+        page = make_page(local_server.url("/"), landing)
+        detail = DetailedInfo(company_name="サンプル商事")
+
+        result = crawler.crawl(page, detail, respect_robots=False)
+
+        assert result.complete
+        assert result.fetched_urls == [local_server.url("/contact/")]
+        assert local_server.count("/company.html") == 0
+        assert result.detail.phone == ["03-1234-5678"]
+        assert result.detail.email == ["info@example.co.jp"]
+        assert result.detail.address["postal_code"] == "100-0001"
+        assert result.detail.company_name == "サンプル商事"
+
+    def test_redirected_page(self, crawler, local_server):
+        """リダイレクトされたページの相対URLは、リダイレクト後のURLを基準に解決すること"""
+        local_server.add_route("/", "", status=301, headers={"Location": "/ja/"})
+        local_server.add_route("/ja/", '<html><body><a href="contact/">お問い合わせ</a></body></html>')
+        local_server.add_route("/ja/contact/", "<html><body>TEL: 03-1234-5678</body></html>")
+
+        page = crawler.scraper.fetch_page(local_server.url("/"), respect_robots=False)
+        result = crawler.crawl(page, DetailedInfo(), respect_robots=False)
+
+        assert page.url == local_server.url("/")
+        assert page.final_url == local_server.url("/ja/")
+        assert result.fetched_urls == [local_server.url("/ja/contact/")]
+        assert result.detail.phone == ["03-1234-5678"]
+
+    def test_redirected_page_from_cache(self, local_server, tmp_path):
+        """キャッシュから返したリダイレクト後のページも、リダイレクト後のURLを基準に解決すること"""
+        local_server.add_route("/", "", status=301, headers={"Location": "/ja/"})
+        local_server.add_route("/ja/", '<html><body><a href="contact/">お問い合わせ</a></body></html>')
+        local_server.add_route("/ja/contact/", "<html><body>TEL: 03-1234-5678</body></html>")
+        cache = HttpCache(path=tmp_path / "cache.sqlite3", default_ttl=3600)
+        scraper = WebScraper(cache=cache)
+        scraper.wait_time = 0
+        crawler = ContactPageCrawler(scraper, max_pages=3)
+
+        results = []
+        for _ in range(2):
+            page = scraper.fetch_page(local_server.url("/"), respect_robots=False)
+            results.append((page, crawler.crawl(page, DetailedInfo(), respect_robots=False)))
+        cache.close()
+
+        (first, first_result), (second, second_result) = results
+        assert not first.from_cache and second.from_cache
+        assert second.final_url == local_server.url("/ja/")
+        assert second_result.fetched_urls == first_result.fetched_urls == [local_server.url("/ja/contact/")]
+        assert local_server.count("/ja/") == 1
+
+    def test_complete_detail_not_crawled(self, crawler, local_server):
+        """最初から項目が埋まっている場合は巡回しないこと"""
+        detail = DetailedInfo(
+            phone=["03-1234-5678"],
+            email=["info@example.co.jp"],
+            address={"postal_code": "100-0001", "prefecture": "東京都", "city": None, "address": None}
+        )
+        page = make_page(local_server.url("/"), f'<a href="{local_server.url("/contact/")}">お問い合わせ</a>')
+
+        result = crawler.crawl(page, detail, respect_robots=False)
+
+        assert result.complete
+        assert result.fetched_urls == []
+        assert local_server.count("/contact/") == 0
+
+    def test_plan_limits_required_fields(self, crawler, local_server):
+        """抽出計画にない項目は、巡回を続ける理由にしないこと"""
+        detail = DetailedInfo(phone=["03-1234-5678"])
+        page = make_page(local_server.url("/"), f'<a href="{local_server.url("/contact/")}">お問い合わせ</a>')
+
+        result = crawler.crawl(page, detail, respect_robots=False, plan=ExtractionPlan.from_fields(["phone"]))
+
+        assert result.complete
+        assert local_server.count("/contact/") == 0
+
+    def test_max_pages(self, crawler, local_server):
+        """取得ページ数が上限を超えないこと"""
+        crawler.max_pages = 1
+        links = "".join(
+            f'<a href="{local_server.url(f"/contact{i}")}">お問い合わせ</a>' for i in range(3)
+        )
+        for i in range(3):
+            local_server.add_route(f"/contact{i}", "<html><body>なし</body></html>")
+
+        result = crawler.crawl(make_page(local_server.url("/"), links), DetailedInfo(), respect_robots=False)
+
+        assert len(result.fetched_urls) == 1
+        assert not result.complete
+
+    def test_crawl_many_keeps_order_and_none(self, crawler, local_server):
+        """巡回結果が入力順で返され、Noneの位置はそのままであること"""
+        local_server.add_route("/contact/", "<html><body>TEL: 03-1234-5678</body></html>")
+        page = make_page(local_server.url("/"), f'<a href="{local_server.url("/contact/")}">お問い合わせ</a>')
+
+        results = crawler.crawl_many([page, None], [DetailedInfo(), None], respect_robots=False)
+
+        assert results[0].phone == ["03-1234-5678"]
+        assert results[1] is None
+
+
+class TestMergeDetailedInfo:
+    """DetailedInfo.mergeのテスト"""
+
+    def test_merge(self):
+        """リストは重複なく結合され、単一の値は元の値が優先されること"""
+        base = DetailedInfo(phone=["03-1111-1111"], company_name="A社", sns_links={"twitter": ["https://x.com/a"]})
+        other = DetailedInfo(
+            phone=["03-1111-1111", "03-2222-2222"],
+            company_name="B社",
+            business_hours="9:00-18:00",
+            sns_links={"twitter": ["https://x.com/b"], "facebook": ["https://facebook.com/a"]}
+        )
+
+        merged = base.merge(other)
+
+        assert merged.phone == ["03-1111-1111", "03-2222-2222"]
+        assert merged.company_name == "A社"
+        assert merged.business_hours == "9:00-18:00"
+        assert merged.sns_links == {
+            "twitter": ["https://x.com/a", "https://x.com/b"],
+            "facebook": ["https://facebook.com/a"]
+        }
+        assert base.phone == ["03-1111-1111"]
+
+    def test_merge_prefers_more_complete_address(self):
+        """埋まっている項目が多い住所を採用すること"""
+        base = DetailedInfo(address={"postal_code": None, "prefecture": "東京都", "city": None, "address": None})
+        other = DetailedInfo(address={"postal_code": "100-0001", "prefecture": "東京都", "city": "千代田区", "address": None})
+
+        assert base.merge(other).address["postal_code"] == "100-0001"
@@ -0,0 +1,104 @@
+"""documentモジュールのテスト
+
+このモジュールは、ParsedDocumentクラスの単体テストと、
+InfoExtractorが1ページを一度だけ解析することのテストを提供します。
+"""
+
+import pytest
+from core.document import ParsedDocument, as_document
+from core.html_backend import get_parser_backend
+from core.extractor import InfoExtractor
+
+
+HTML = """
+<html>
+<head>
+    <title>テスト商事 | トップ</title>
+    <meta property="og:site_name" content="テスト商事">
+    <meta name="Description" content="会社案内">
+    <script type="application/ld+json">{"@type": "Organization", "name": "株式会社テスト商事"}</script>
+    <style>.contact { color: red; }</style>
+</head>
+<body>
+    <h1>ようこそ</h1>
+    <script>var tel = "03-0000-0000";</script>
+    <p>電話:   03-1234-5678</p>
+    <p>〒100-0001 東京都千代田区千代田1-1-1</p>
+    <a href=" /company/ ">会社概要</a>
+    <a href="/contact/" title="お問い合わせ"><img src="mail.png" alt="メール"></a>
+    <a href="https://twitter.com/test_shoji">Twitter</a>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def document():
+    """ParsedDocumentのフィクスチャ"""
+    return ParsedDocument.from_html(HTML)
+
+
+class TestParsedDocument:
+    """ParsedDocumentの作成のテスト"""
+
+    def test_text_excludes_script_and_style(self, document):
+        """テキストにscriptとstyleの内容が含まれず、空白がまとめられること"""
+        assert "03-0000-0000" not in document.text
+        assert "color" not in document.text
+        assert "電話: 03-1234-5678" in document.text
+
+    def test_head_metadata(self, document):
+        """head内のメタデータを保持すること"""
+        assert document.title == "テスト商事 | トップ"
+        assert document.meta["og:site_name"] == "テスト商事"
+        assert document.meta["description"] == "会社案内"
+        assert len(document.json_ld) == 1
+        assert document.h1 == "ようこそ"
+
+    def test_links(self, document):
+        """リンクのhrefとアンカーテキストを保持すること"""
+        links = {link.href: link.text for link in document.links}
+
+        assert links["/company/"] == "会社概要"
+        assert links["/contact/"] == "お問い合わせ メール"
+
+    def test_as_document(self, document):
+        """as_documentが解析済みドキュメントをそのまま返し、空のHTMLはNoneを返すこと"""
+        assert as_document(document) is document
+        assert as_document("") is None
+        assert as_document(ParsedDocument.from_html("")) is None
+        assert isinstance(as_document(HTML), ParsedDocument)
+
+
+class TestSingleParse:
+    """InfoExtractorの解析回数のテスト"""
+
+    @pytest.mark.parametrize("backend_name", ["lxml", "beautifulsoup"])
+    def test_extract_all_parses_once(self, monkeypatch, backend_name):
+        """extract_allがHTMLを一度だけ解析すること"""
+        calls = []
+        backend = get_parser_backend(backend_name)
+        original = backend.parse_document
+
+        def counting_parse(html):
+            calls.append(html)
+            return original(html)
+
+        monkeypatch.setattr(backend, "parse_document", counting_parse)
+
+        InfoExtractor(parser_backend=backend).extract_all(HTML)
+
+        assert len(calls) == 1
+
+    def test_wrappers_match_document(self, document):
+        """HTML文字列と解析済みドキュメントで同じ結果になること"""
+        extractor = InfoExtractor()
+
+        for name in ("extract_phone", "extract_email", "extract_address", "extract_fax",
+                     "extract_company_name", "extract_sns_links", "extract_business_hours",
+                     "extract_closed_days"):
+            method = getattr(extractor, name)
+            assert method(HTML) == method(document), name
+
+        assert extractor.extract_all(HTML) == extractor.extract_all(document)
+        assert extractor.extract_company_name(document) == "株式会社テスト商事"
@@ -0,0 +1,140 @@
+"""encodingモジュールのテスト
+
+このモジュールは、文字コード判定（detect_encoding / decode_html）の単体テストを提供します。
+"""
+
+import codecs
+
+import pytest
+from core.encoding import detect_encoding, decode_html, normalize_encoding
+from core.scraper import WebScraper
+
+JAPANESE_HTML = "<html><head><title>会社概要</title></head><body><p>お問い合わせはこちらからどうぞ。</p></body></html>"
+
+
+class TestDetectionOrder:
+    """判定の優先順位のテスト"""
+
+    def test_bom_wins_over_header(self):
+        """BOMがヘッダーより優先されること"""
+        body = codecs.BOM_UTF8 + JAPANESE_HTML.encode("utf-8")
+
+        result = detect_encoding(body, "text/html; charset=shift_jis")
+
+        assert result.encoding == "utf-8-sig"
+        assert result.source == "bom"
+
+    def test_header_charset(self):
+        """ヘッダーのcharsetを使用すること"""
+        body = JAPANESE_HTML.encode("euc_jp")
+
+        result = detect_encoding(body, 'text/html; charset="EUC-JP"')
+
+        assert result.encoding == "euc_jp"
+        assert result.source == "header"
+
+    def test_header_without_charset_is_ignored(self):
+        """charsetのないtext/htmlをISO-8859-1として扱わないこと"""
+        body = JAPANESE_HTML.encode("utf-8")
+
+        result = detect_encoding(body, "text/html")
+
+        assert result.encoding == "utf-8"
+        assert result.source == "detector"
+
+    def test_meta_charset(self):
+        """<meta charset>を使用すること"""
+        body = ('<html><head><meta charset="Shift_JIS">' + JAPANESE_HTML[12:]).encode("cp932")
+
+        result = detect_encoding(body, "text/html")
+
+        assert result.encoding == "cp932"
+        assert result.source == "meta"
+
+    def test_meta_http_equiv(self):
+        """<meta http-equiv="Content-Type">を使用すること"""
+        meta = '<meta http-equiv="Content-Type" content="text/html; charset=euc-jp">'
+        body = (f"<html><head>{meta}" + JAPANESE_HTML[12:]).encode("euc_jp")
+
+        result = detect_encoding(body)
+
+        assert result.encoding == "euc_jp"
+        assert result.source == "meta"
+
+    def test_unknown_charset_falls_through(self):
+        """不明な文字コード名は無視して次の段階で判定すること"""
+        body = JAPANESE_HTML.encode("utf-8")
+
+        result = detect_encoding(body, "text/html; charset=x-unknown")
+
+        assert result.encoding == "utf-8"
+        assert result.source == "detector"
+
+
+class TestDetector:
+    """サンプルによる推定のテスト"""
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "cp932", "euc_jp"])
+    def test_japanese_encodings(self, encoding):
+        """ヘッダー・metaがなくても日本語の文字コードを判定できること"""
+        body = JAPANESE_HTML.encode(encoding)
+
+        html, result = decode_html(body)
+
+        assert result.source == "detector"
+        assert html == JAPANESE_HTML
+
+    def test_non_ascii_after_large_ascii_head(self):
+        """先頭の大きなASCII部分の後にある日本語から判定できること"""
+        html = "<html><head><script>" + "var x = 1;\n" * 10000 + "</script></head><body>日本語の本文です</body></html>"
+
+        decoded, result = decode_html(html.encode("cp932"))
+
+        assert result.encoding == "cp932"
+        assert decoded == html
+
+    def test_truncated_multibyte_tail(self):
+        """途中で打ち切られた本文（末尾の文字が欠けている）も判定できること"""
+        body = "あいうえお".encode("utf-8") + "か".encode("utf-8")[:2]
+
+        result = detect_encoding(body)
+
+        assert result.encoding == "utf-8"
+
+    def test_ascii_only(self):
+        """ASCIIのみの場合はUTF-8とすること"""
+        result = detect_encoding(b"<html><body>hello</body></html>")
+
+        assert result.encoding == "utf-8"
+
+
+class TestNormalizeEncoding:
+    """文字コード名の正規化のテスト"""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Shift_JIS", "cp932"),
+        ("x-sjis", "cp932"),
+        ("EUC-JP", "euc_jp"),
+        ("UTF-8", "utf-8"),
+        ("x-unknown", None),
+        (None, None),
+    ])
+    def test_aliases(self, name, expected):
+        """別名が実際のコーデック名にそろえられること"""
+        assert normalize_encoding(name) == expected
+
+
+class TestScraperIntegration:
+    """WebScraperでの判定結果の記録のテスト"""
+
+    def test_page_records_detected_encoding(self, local_server):
+        """charsetのないShift_JISページを正しくデコードし、判定結果を記録すること"""
+        local_server.add_route("/sjis", JAPANESE_HTML.encode("cp932"), headers={"Content-Type": "text/html"})
+        scraper = WebScraper()
+        scraper.wait_time = 0
+
+        page = scraper.fetch_page(local_server.url("/sjis"), respect_robots=False)
+
+        assert page.html == JAPANESE_HTML
+        assert page.encoding == "cp932"
+        assert page.encoding_source == "detector"
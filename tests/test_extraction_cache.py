@@ -0,0 +1,131 @@
+"""extraction_cacheモジュールのテスト
+
+このモジュールは、ExtractionCacheクラスの単体テストと、
+InfoExtractor.extract_allの結果のキャッシュのテストを提供します。
+"""
+
+import pytest
+from core.extraction_cache import ExtractionCache, content_hash
+from core.extractor import InfoExtractor
+from core.pattern_registry import get_pattern_registry
+from core.scanner import PatternScanner
+
+HTML = """
+<html><body>
+    <h1>株式会社キャッシュ</h1>
+    <p>〒100-0001 東京都千代田区千代田1-1-1</p>
+    <p>TEL: 03-1234-5678</p>
+</body></html>
+"""
+
+
+@pytest.fixture
+def cache():
+    """メモリのみのキャッシュのフィクスチャ"""
+    return ExtractionCache(max_entries=2, persist=False)
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """ファイルにも保存するキャッシュのフィクスチャ"""
+    cache = ExtractionCache(max_entries=2, persist=True, path=tmp_path / "extraction.sqlite3", max_disk_entries=3)
+    yield cache
+    cache.close()
+
+
+class TestContentHash:
+    """content_hashのテスト"""
+
+    def test_ignores_formatting(self):
+        """空白・改行の違いだけのHTMLは同じハッシュになること"""
+        assert content_hash("<p>TEL  03-1234-5678</p>\n") == content_hash("<p>TEL 03-1234-5678</p>")
+        assert content_hash("<p>TEL 03-1234-5678</p>") != content_hash("<p>TEL 03-1234-5679</p>")
+
+
+class TestExtractionCache:
+    """ExtractionCacheのテスト"""
+
+    def test_memory_lru(self, cache):
+        """上限を超えると最も古く参照されたエントリから削除されること"""
+        cache.put("v1", "a", {"phone": ["1"]})
+        cache.put("v1", "b", {"phone": ["2"]})
+        cache.get("v1", "a")
+        cache.put("v1", "c", {"phone": ["3"]})
+
+        assert cache.get("v1", "a") == {"phone": ["1"]}
+        assert cache.get("v1", "b") is None
+        assert cache.stats.evictions == 1
+
+    def test_returns_new_dict(self, cache):
+        """取得した辞書を変更してもキャッシュに影響しないこと"""
+        cache.put("v1", "a", {"phone": ["1"]})
+        cache.get("v1", "a")["phone"].append("2")
+
+        assert cache.get("v1", "a") == {"phone": ["1"]}
+
+    def test_fingerprint_separates_entries(self, cache):
+        """フィンガープリントが異なるエントリは参照されないこと"""
+        cache.put("v1", "a", {"phone": ["1"]})
+
+        assert cache.get("v2", "a") is None
+
+    def test_disk_tier(self, disk_cache, tmp_path):
+        """ファイルに保存したエントリを別のインスタンスから取得できること"""
+        disk_cache.put("v1", "a", {"phone": ["1"]})
+        disk_cache.close()
+
+        reopened = ExtractionCache(max_entries=2, persist=True, path=tmp_path / "extraction.sqlite3")
+        assert reopened.get("v1", "a") == {"phone": ["1"]}
+        assert reopened.get("v1", "a") == {"phone": ["1"]}
+        assert reopened.stats.disk_hits == 1
+        assert reopened.stats.memory_hits == 1
+        reopened.close()
+
+    def test_disk_eviction(self, disk_cache):
+        """ファイルのエントリも上限を超えるとLRUで削除されること"""
+        for key in "abcd":
+            disk_cache.put("v1", key, {"phone": [key]})
+        disk_cache._memory.clear()
+
+        assert disk_cache.get("v1", "a") is None
+        assert disk_cache.get("v1", "d") == {"phone": ["d"]}
+
+
+class TestExtractorCache:
+    """InfoExtractorの抽出結果キャッシュのテスト"""
+
+    def test_unchanged_page_skips_parsing(self, monkeypatch, cache):
+        """内容が同じページは解析せずに同じ結果を返すこと"""
+        extractor = InfoExtractor(cache=cache)
+        first = extractor.extract_all(HTML)
+
+        def fail_parse(html):
+            raise AssertionError("parsed again")
+
+        monkeypatch.setattr(extractor.parser_backend, "parse_document", fail_parse)
+        second = extractor.extract_all(HTML.replace("\n", "\n    "))
+
+        assert second == first
+        assert second is not first
+        assert cache.stats.memory_hits == 1
+
+    def test_pattern_change_invalidates(self, cache):
+        """パターンが変わると以前の抽出結果を使わないこと"""
+        extractor = InfoExtractor(cache=cache)
+        extractor.extract_all(HTML)
+
+        patterns = dict(get_pattern_registry().patterns(), phone=[r"(\d{2}-\d{4}-\d{4})"])
+        changed = InfoExtractor(cache=cache)
+        changed.scanner = PatternScanner(patterns)
+        changed.fingerprint = changed._fingerprint()
+
+        assert changed.fingerprint != extractor.fingerprint
+        changed.extract_all(HTML)
+        assert cache.stats.memory_hits == 0
+        assert cache.stats.misses == 2
+
+    def test_disabled(self, monkeypatch):
+        """設定で無効にした場合はキャッシュを作成しないこと"""
+        monkeypatch.setattr("config.settings.Settings.EXTRACTION_CACHE_ENABLED", False)
+
+        assert InfoExtractor().cache is None
@@ -0,0 +1,152 @@
+"""extraction_planモジュールのテスト
+
+このモジュールは、ExtractionPlanの作成と、抽出計画に従ったInfoExtractorの抽出のテストを提供します。
+"""
+
+import json
+from dataclasses import fields
+
+import pytest
+from config.constants import EXTRACTION_FIELDS
+from core.extraction_cache import ExtractionCache
+from core.extraction_plan import (
+    BASIC_FIELDS, DETAIL_FIELDS, ExtractionPlan, default_plan, list_presets, preset_path
+)
+from core.extraction_pool import ExtractionExecutor
+from core.extractor import InfoExtractor, DetailedInfo
+
+PAGE = """
+<html><head><title>テスト商店</title></head><body>
+<p>TEL 03-1234-5678 FAX 03-1234-5679 info@example.jp</p>
+<p>〒100-0001 東京都千代田区千代田1-1 営業時間 10:00〜19:00 定休日：水曜日</p>
+</body></html>
+"""
+
+
+@pytest.fixture
+def extractor():
+    """キャッシュを使わないInfoExtractorのフィクスチャ"""
+    return InfoExtractor(cache=ExtractionCache(max_entries=0))
+
+
+class TestExtractionPlan:
+    """抽出計画の作成のテスト"""
+
+    def test_detail_fields_match_detailed_info(self):
+        """詳細情報の項目はDetailedInfoのフィールドと同じ順序であること"""
+        names = [item.name for item in fields(DetailedInfo) if item.name != "field_sources"]
+
+        assert list(DETAIL_FIELDS) == names
+        assert set(BASIC_FIELDS) | set(DETAIL_FIELDS) == set(EXTRACTION_FIELDS)
+
+    def test_from_fields(self):
+        """検索結果の項目を加え、詳細情報の項目はDetailedInfoの順序で返すこと"""
+        plan = ExtractionPlan.from_fields(["email", "phone"])
+
+        assert plan.detail_fields == ("phone", "email")
+        assert plan.wants("url") and plan.has_details and not plan.is_full
+        assert ExtractionPlan.all().is_full
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError):
+            ExtractionPlan.from_fields(["phone", "telephone"])
+
+    def test_output_columns(self):
+        plan = ExtractionPlan.from_fields(["sns_links", "address"], include_basic=False)
+
+        assert plan.output_columns == ["postal_code", "prefecture", "sns_twitter", "sns_facebook", "sns_instagram"]
+
+    def test_presets(self):
+        """同梱のプリセットを読み込めること"""
+        presets = list_presets()
+
+        assert presets["default"] == "デフォルト設定"
+        assert not ExtractionPlan.from_preset("default").has_details
+        contact = ExtractionPlan.from_preset("contact")
+        assert contact.detail_fields == ("phone", "email", "address", "fax", "company_name")
+        assert not contact.wants("description")
+
+    def test_preset_file(self, tmp_path):
+        """パスを指定してプリセットを読み込めること（extraction_fieldsがない場合はValueError）"""
+        path = tmp_path / "custom.json"
+        path.write_text(json.dumps({"extraction_fields": {"url": True, "phone": True, "email": False}}))
+        broken = tmp_path / "broken.json"
+        broken.write_text(json.dumps({"name": "壊れたプリセット"}))
+
+        assert ExtractionPlan.from_preset(path).fields == {"url", "phone"}
+        with pytest.raises(ValueError):
+            ExtractionPlan.from_preset(broken)
+        with pytest.raises(FileNotFoundError):
+            ExtractionPlan.from_preset("no_such_preset")
+        assert preset_path("contact").name == "contact.json"
+
+    def test_parse(self):
+        """CLIの入力文字列から作成"""
+        assert ExtractionPlan.parse("all") == ExtractionPlan.all()
+        assert ExtractionPlan.parse("contact") == ExtractionPlan.from_preset("contact")
+        assert ExtractionPlan.parse("phone, email").detail_fields == ("phone", "email")
+        assert ExtractionPlan.parse("phone").detail_fields == ("phone",)
+        assert ExtractionPlan.parse("") == default_plan()
+
+    def test_default_plan(self, monkeypatch):
+        """設定値のプリセット（読み込めない場合はすべての項目）"""
+        monkeypatch.setattr("config.settings.Settings.EXTRACTION_PRESET", "contact")
+        assert default_plan() == ExtractionPlan.from_preset("contact")
+
+        monkeypatch.setattr("config.settings.Settings.EXTRACTION_PRESET", "no_such_preset")
+        assert default_plan() == ExtractionPlan.all()
+
+    def test_required_fields(self):
+        plan = ExtractionPlan.from_fields(["email", "business_hours"])
+
+        assert plan.required_fields(("phone", "email", "address")) == ("email",)
+        assert ExtractionPlan.from_fields(["closed_days"]).required_fields(("phone",)) == ("closed_days",)
+
+
+class TestPlannedExtraction:
+    """抽出計画に従った抽出のテスト"""
+
+    def test_only_planned_fields_extracted(self, extractor, monkeypatch):
+        """計画にない項目の抽出メソッドは呼ばれないこと"""
+        called = []
+        for method in ("extract_phone", "extract_email", "extract_address", "extract_fax",
+                       "extract_company_name", "extract_sns_links", "extract_business_hours", "extract_closed_days"):
+            original = getattr(extractor, method)
+            monkeypatch.setattr(extractor, method,
+                                lambda html, method=method, original=original: called.append(method) or original(html))
+
+        result = extractor.extract_all(PAGE, ExtractionPlan.from_fields(["phone", "closed_days"]))
+
+        assert called == ["extract_phone", "extract_closed_days"]
+        assert "03-1234-5678" in result.phone
+        assert result.fax == [] and result.email == [] and result.address is None
+        assert result.closed_days.startswith("水曜日")
+
+    def test_no_detail_fields_skips_parsing(self, extractor, monkeypatch):
+        """詳細情報の項目がない計画ではHTMLを解析しないこと"""
+        def fail(*args, **kwargs):
+            raise AssertionError("parsed")
+
+        monkeypatch.setattr(extractor.parser_backend, "parse_document", fail)
+
+        assert extractor.extract_all(PAGE, ExtractionPlan.from_preset("default")) == DetailedInfo()
+
+    def test_cache_separates_plans(self):
+        """計画ごとに別のキャッシュエントリを使うこと"""
+        extractor = InfoExtractor(cache=ExtractionCache(max_entries=10))
+
+        partial = extractor.extract_all(PAGE, ExtractionPlan.from_fields(["phone"]))
+        full = extractor.extract_all(PAGE)
+
+        assert partial.email == []
+        assert full.email == ["info@example.jp"]
+        assert extractor.cache.stats.stores == 2
+
+    def test_plan_in_executor(self):
+        """プロセスプール（呼び出し元のプロセスで抽出する場合）にも計画を渡せること"""
+        with ExtractionExecutor(max_workers=0) as executor:
+            results = executor.extract_many([PAGE, None], plan=ExtractionPlan.from_fields(["email"]))
+
+        assert results[0].email == ["info@example.jp"]
+        assert results[0].phone == []
+        assert results[1] is None
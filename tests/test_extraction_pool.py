@@ -0,0 +1,120 @@
+"""extraction_poolモジュールのテスト
+
+このモジュールは、ExtractionExecutorクラスの単体テストを提供します。
+プロセスの起動には時間がかかるため、ワーカープロセスを使うテストは最小限にしています。
+"""
+
+import pytest
+from core.extraction_pool import ExtractionExecutor, pack_detail, unpack_detail
+from core.extractor import DetailedInfo, InfoExtractor
+
+PAGE = """
+<html><head><title>株式会社テスト{index}</title></head>
+<body>
+    <p>〒100-0001 東京都千代田区千代田1-1-{index}</p>
+    <p>TEL: 03-1234-{index:04d} FAX: 03-9999-{index:04d}</p>
+    <p>info{index}@example.com 営業時間: 9:00〜18:00</p>
+    <a href="https://twitter.com/test{index}">Twitter</a>
+</body></html>
+"""
+
+
+@pytest.fixture
+def htmls():
+    """抽出対象のHTMLのフィクスチャ（取得失敗のNoneと空文字列を含む）"""
+    pages = [PAGE.format(index=index) for index in range(6)]
+    return pages[:2] + [None] + pages[2:4] + [""] + pages[4:]
+
+
+@pytest.fixture
+def expected(htmls):
+    """呼び出し元のプロセスで抽出した結果のフィクスチャ"""
+    extractor = InfoExtractor()
+    return [extractor.extract_all(html) if html else None for html in htmls]
+
+
+class TestPackDetail:
+    """DetailedInfoの変換のテスト"""
+
+    def test_round_trip(self):
+        """タプルに変換して復元すると元の値に戻ること"""
+        info = DetailedInfo(
+            phone=["03-1234-5678"], address={"postal_code": "〒100-0001"},
+            sns_links={"twitter": ["https://twitter.com/test"]}, business_hours="9:00〜18:00"
+        )
+
+        assert isinstance(pack_detail(info), tuple)
+        assert unpack_detail(pack_detail(info)) == info
+        assert unpack_detail(None) is None
+
+
+class TestInProcess:
+    """max_workers=0（呼び出し元のプロセスで抽出）のテスト"""
+
+    def test_same_results_in_order(self, htmls, expected):
+        """入力と同じ順序で、InfoExtractorと同じ結果を返すこと"""
+        progress = []
+        with ExtractionExecutor(max_workers=0, chunk_size=2) as executor:
+            results = executor.extract_many(htmls, progress_callback=lambda done, total: progress.append((done, total)))
+
+        assert results == expected
+        assert results[2] is None and results[5] is None
+        assert progress == [(2, 6), (4, 6), (6, 6)]
+        assert executor.pools_created == 0
+
+    def test_extraction_error_is_none(self, monkeypatch, htmls):
+        """抽出に失敗したページはNoneになり、他のページは抽出されること"""
+        original = InfoExtractor.extract_all
+
+        def failing_extract(self, html, plan=None):
+            if "株式会社テスト1<" in html:
+                raise RuntimeError("broken page")
+            return original(self, html, plan)
+
+        monkeypatch.setattr(InfoExtractor, "extract_all", failing_extract)
+
+        results = ExtractionExecutor(max_workers=0).extract_many(htmls)
+
+        assert results[1] is None
+        assert results[0] is not None and results[3] is not None
+
+    def test_empty_input(self):
+        """抽出対象がない場合はプールを作成しないこと"""
+        executor = ExtractionExecutor(max_workers=2)
+
+        assert executor.extract_many([]) == []
+        assert executor.extract_many([None, ""]) == [None, None]
+        assert executor.pools_created == 0
+
+
+class TestGenerations:
+    """プールの作り直しの単位のテスト"""
+
+    def test_split_by_page_budget(self):
+        """ワーカー数×ページ数の上限ごとに分割されること"""
+        executor = ExtractionExecutor(max_workers=2, chunk_size=2, max_pages_per_worker=2)
+        chunks = [[0, 1], [2, 3], [4, 5], [6, 7], [8]]
+
+        assert executor._split_generations(chunks) == [[[0, 1], [2, 3]], [[4, 5], [6, 7]], [[8]]]
+
+    def test_remaining_budget_of_running_pool(self):
+        """稼働中のプールは残りのページ数で区切られること"""
+        executor = ExtractionExecutor(max_workers=1, chunk_size=2, max_pages_per_worker=4)
+        executor._pool_pages = 3
+
+        assert executor._split_generations([[0, 1], [2, 3]]) == [[[0, 1]], [[2, 3]]]
+
+
+class TestProcessPool:
+    """ワーカープロセスでの抽出のテスト"""
+
+    def test_same_results_and_recycling(self, htmls, expected):
+        """入力と同じ順序で同じ結果を返し、上限のページ数でプールを作り直すこと"""
+        with ExtractionExecutor(max_workers=1, chunk_size=2, max_pages_per_worker=4) as executor:
+            results = executor.extract_many(htmls)
+
+            assert results == expected
+            assert executor.pools_created == 2
+            # 2回目の抽出は稼働中のプールを再利用する
+            assert executor.extract_many(htmls[:1]) == expected[:1]
+            assert executor.pools_created == 2
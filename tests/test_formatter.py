@@ -5,6 +5,7 @@
 
 import pytest
 from output.formatter import DataFormatter, OutputData
+from core.extraction_plan import ExtractionPlan
 from core.searcher import SearchItem
 from core.extractor import DetailedInfo
 
@@ -90,6 +91,27 @@ class TestFormatData:
         assert output_data_list[0].closed_days == "水曜日"
 
 
+    def test_format_data_with_plan(self, formatter, sample_search_items, sample_detailed_infos):
+        """抽出計画にない項目は空のままにすること"""
+        plan = ExtractionPlan.from_fields(["phone"])
+
+        output_data_list = formatter.format_data(sample_search_items, sample_detailed_infos, plan)
+
+        assert output_data_list[0].phone == "03-1234-5678"
+        assert output_data_list[0].email == ""
+        assert output_data_list[0].prefecture == ""
+
+    def test_format_frame(self, formatter, sample_search_items, sample_detailed_infos):
+        """DataFrameの列がOutputDataのフィールドと一致し、詳細情報が正規化されること"""
+        sample_detailed_infos[1].phone = ["０６－１２３４－５６７８", "06-1234-5678", "123"]
+
+        df = formatter.format_frame(sample_search_items, sample_detailed_infos)
+
+        assert list(df.columns) == list(OutputData(rank=0, title="", url="", description="").to_dict())
+        assert df["rank"].tolist() == [1, 2]
+        assert df.loc[1, "phone"] == "06-1234-5678"
+
+
 class TestRemoveDuplicates:
     """重複除去のテスト"""
 
@@ -186,6 +208,14 @@ class TestToDataFrame:
         assert "title" in df.columns
         assert "url" in df.columns
 
+    def test_to_dataframe_with_plan(self, formatter):
+        """抽出計画の列のみを出力すること"""
+        data_list = [OutputData(rank=1, title="Title1", url="https://example1.com", description="Desc1")]
+
+        df = formatter.to_dataframe(data_list, ExtractionPlan.from_fields(["address", "phone"]))
+
+        assert list(df.columns) == ["rank", "title", "url", "description", "phone", "postal_code", "prefecture"]
+
     def test_to_dataframe_empty(self, formatter):
         """空リストのDataFrame変換"""
         df = formatter.to_dataframe([])
@@ -0,0 +1,109 @@
+"""gazetteerモジュールのテスト
+
+このモジュールは、AddressGazetteerクラスの単体テストと、
+地名辞書を使用したInfoExtractor.extract_addressのテストを提供します。
+"""
+
+import pytest
+from config.constants import PREFECTURES
+from core.extractor import InfoExtractor
+from core.gazetteer import AddressGazetteer, get_default_gazetteer
+from core.scanner import KIND_POSTAL_CODE, get_default_scanner
+
+
+@pytest.fixture
+def gazetteer():
+    """市区町村データファイルから作成した地名辞書のフィクスチャ"""
+    return get_default_gazetteer()
+
+
+def find_candidates(gazetteer, text):
+    """郵便番号の一致を渡して住所の候補を検出"""
+    return gazetteer.find_candidates(text, get_default_scanner().scan(text).get(KIND_POSTAL_CODE))
+
+
+class TestFindMentions:
+    """地名の出現の検出のテスト"""
+
+    def test_all_mentions_with_positions(self, gazetteer):
+        """すべての地名を位置付きで、最長一致で検出すること"""
+        text = "東京都と大阪府大阪市北区、四日市市と市川市"
+        mentions = gazetteer.find_mentions(text)
+
+        assert [mention.name for mention in mentions] == ["東京都", "大阪府", "大阪市北区", "四日市市", "市川市"]
+        assert all(text[mention.start:mention.end] == mention.name for mention in mentions)
+
+    def test_name_variants(self, gazetteer):
+        """郡名を省略した町村と、区を省略した政令指定都市を検出すること"""
+        mentions = {mention.name: mention for mention in gazetteer.find_mentions("当別町 札幌市")}
+
+        assert mentions["当別町"].entries[0].city == "石狩郡当別町"
+        assert mentions["札幌市"].entries[0].prefecture == "北海道"
+
+    def test_data_file_loaded(self, gazetteer):
+        """全都道府県と市区町村が読み込まれていること"""
+        names = gazetteer._entries
+
+        assert all(prefecture in names for prefecture in PREFECTURES)
+        assert sum(1 for entries in names.values() if entries[0].kind == "municipality") > 1700
+
+    def test_missing_data_file(self, tmp_path):
+        """データファイルがない場合は都道府県のみで動作すること"""
+        gazetteer = AddressGazetteer.from_file(tmp_path / "missing.tsv")
+
+        assert [mention.name for mention in gazetteer.find_mentions("東京都千代田区")] == ["東京都"]
+
+
+class TestFindCandidates:
+    """住所の候補の検出と採点のテスト"""
+
+    def test_prefers_address_near_postal_code(self, gazetteer):
+        """最初の都道府県名が無関係な場合でも、郵便番号に近い住所を優先すること"""
+        text = "東京都の最新情報をお届けします。本社 〒530-0001 大阪府大阪市北区梅田1-2-3 梅田ビル"
+        best = find_candidates(gazetteer, text)[0]
+
+        assert best.prefecture == "大阪府"
+        assert best.city == "大阪市北区"
+        assert best.address == "大阪府大阪市北区梅田1-2-3"
+        assert best.postal_match.value == "〒530-0001"
+
+    def test_infers_prefecture_from_city(self, gazetteer):
+        """都道府県名がなくても、都道府県を特定できる市区町村名と番地から候補を作ること"""
+        best = find_candidates(gazetteer, "所在地：横浜市中区山下町1-2")[0]
+
+        assert best.prefecture == "神奈川県"
+        assert best.city == "横浜市中区"
+        assert not best.explicit_prefecture
+
+    def test_ambiguous_or_bare_city_skipped(self, gazetteer):
+        """都道府県を特定できない市区町村名や、番地のない市区町村名のみは候補にしないこと"""
+        assert find_candidates(gazetteer, "府中市本町1-2-3") == []
+        assert find_candidates(gazetteer, "港区のイベント情報") == []
+
+    def test_city_must_belong_to_prefecture(self, gazetteer):
+        """都道府県名に続く市区町村名は、その都道府県のもののみ組にすること"""
+        best = find_candidates(gazetteer, "東京都府中市宮西町1-1")[0]
+
+        assert best.prefecture == "東京都"
+        assert best.city == "府中市"
+
+
+class TestExtractAddress:
+    """地名辞書を使用したextract_addressのテスト"""
+
+    def test_skips_unrelated_prefecture(self):
+        """本文の最初の都道府県名ではなく、郵便番号付きの住所を抽出すること"""
+        html = """
+            <html><body>
+            <p>北海道フェア開催中！</p>
+            <p>会社所在地 〒812-0011 福岡県福岡市博多区博多駅前1-2-3</p>
+            </body></html>
+        """
+        address = InfoExtractor().extract_address(html)
+
+        assert address == {
+            "postal_code": "812-0011",
+            "prefecture": "福岡県",
+            "city": "福岡市博多区",
+            "address": "福岡県福岡市博多区博多駅前1-2-3",
+        }
@@ -0,0 +1,187 @@
+"""html_backendモジュールのテスト
+
+このモジュールは、lxmlバックエンドとBeautifulSoupバックエンドが
+同じHTMLから同じ抽出結果を返すことのテストを提供します。
+"""
+
+import pytest
+from core.extractor import InfoExtractor
+from core.html_backend import get_parser_backend, LxmlBackend, BeautifulSoupBackend
+from core.searcher import GoogleSearcher
+
+PAGES = {
+    "company": """
+        <!DOCTYPE html>
+        <html lang="ja">
+        <head>
+            <meta charset="utf-8">
+            <title>株式会社テスト｜会社概要</title>
+            <meta property="og:site_name" content="株式会社テスト">
+            <script type="application/ld+json">{"@type": "Organization", "legalName": "株式会社テスト"}</script>
+            <style>p { margin: 0 }</style>
+        </head>
+        <body>
+            <h1>会社<span>概要</span></h1>
+            <table>
+                <tr><th>所在地</th><td>〒530-0001<br>大阪府大阪市北区梅田1-2-3</td></tr>
+                <tr><th>電話</th><td>06-1234-5678</td></tr>
+                <tr><th>FAX</th><td>06-1234-5679</td></tr>
+                <tr><th>営業時間</th><td>10:00〜19:00</td></tr>
+                <tr><th>定休日</th><td>土日祝</td></tr>
+            </table>
+            <a href="mailto:info@test.co.jp">info@test.co.jp</a>
+            <a href="/contact/" title="お問い合わせ"><img src="a.png" alt="問い合わせ"></a>
+        </body>
+        </html>
+    """,
+    "scripts_between_text": """
+        <html><body>
+            <p>TEL<script>var tel = "03-0000-0000";</script>03-1111-2222</p>
+            <p>営業時間<noscript>JavaScriptを有効にしてください</noscript>：9時〜17時</p>
+            <svg><title>アイコン</title><text>090-0000-0000</text></svg>
+            <p>メール<!-- comment 050-0000-0000 -->support@example.com</p>
+        </body></html>
+    """,
+    "xml_declaration": """<?xml version="1.0" encoding="Shift_JIS"?>
+        <html><head><title>旧サイト - トップ</title></head>
+        <body><p>&nbsp;〒100-0001&nbsp;東京都千代田区千代田1-1&amp;2</p><p>TEL:03-1234-5678</p></body></html>
+    """,
+    "malformed": """
+        <div><p>株式会社壊れたHTML<p>電話 0120-123-456<div>休み：水・木
+        <a href="https://twitter.com/broken">Twitter</a><a>リンクなし</a>
+    """,
+    "trailing_content": """
+        <html><body><template><p>090-9999-9999</p></template><p>本文</p></body></html>
+        <p>閉じタグの後ろ TEL 03-5555-6666</p>
+    """,
+    "microdata": """
+        <html><body>
+            <div itemscope itemtype="https://schema.org/LocalBusiness">
+                <h2 itemprop="name">テスト<b>商店</b></h2>
+                <meta itemprop="openingHours" content="Mo-Fr 10:00-19:00">
+                <a itemprop="telephone" href="tel:06-1234-5678">電話する</a>
+                <div itemprop="address" itemscope itemtype="https://schema.org/PostalAddress">
+                    <span itemprop="postalCode">530-0001</span>
+                    <span itemprop="addressRegion addressLocality">大阪府</span>
+                </div>
+                <p itemprop="description">説明<script>var x = 1;</script>文</p>
+            </div>
+            <span itemprop="orphan">型なし</span>
+        </body></html>
+    """,
+    "regions": """
+        <html><body>
+            <header class="l-header"><a href="/" rel="home">トップ</a></header>
+            <div role="banner"><nav><a href="https://www.instagram.com/shop/">Instagram</a></nav></div>
+            <main><a href="https://twitter.com/other">紹介</a>
+                <div class="footer-like"><a href="/news/" rel="Next  Prev">お知らせ</a></div></main>
+            <footer><div class="inner"><a href="https://twitter.com/shop" rel="me">X</a></div></footer>
+            <div id="footer_sub"><a href="tel:03-1234-5678">電話</a></div>
+        </body></html>
+    """,
+    "whitespace_only": "   \n  ",
+}
+
+
+@pytest.fixture
+def lxml_backend():
+    """lxmlバックエンドのフィクスチャ"""
+    return get_parser_backend("lxml")
+
+
+@pytest.fixture
+def soup_backend():
+    """BeautifulSoupバックエンドのフィクスチャ"""
+    return get_parser_backend("beautifulsoup")
+
+
+class TestParserBackends:
+    """バックエンドの取得のテスト"""
+
+    def test_get_backend(self):
+        """名前でバックエンドを取得できること（インスタンスは共有）"""
+        assert isinstance(get_parser_backend("lxml"), LxmlBackend)
+        assert isinstance(get_parser_backend("BeautifulSoup"), BeautifulSoupBackend)
+        assert get_parser_backend("lxml") is get_parser_backend("lxml")
+
+    def test_unknown_backend(self):
+        """不明なバックエンド名はValueError"""
+        with pytest.raises(ValueError):
+            get_parser_backend("html5lib")
+
+    def test_default_backend(self, monkeypatch):
+        """デフォルトは設定値のバックエンド"""
+        monkeypatch.setattr("config.settings.Settings.HTML_PARSER_BACKEND", "beautifulsoup")
+
+        assert isinstance(get_parser_backend(), BeautifulSoupBackend)
+
+
+class TestBackendEquivalence:
+    """lxmlバックエンドとBeautifulSoupバックエンドの同等性のテスト"""
+
+    @pytest.mark.parametrize("name", list(PAGES))
+    def test_same_document(self, lxml_backend, soup_backend, name):
+        """同じテキスト・リンク・メタデータを持つParsedDocumentになること"""
+        fast = lxml_backend.parse_document(PAGES[name])
+        compatible = soup_backend.parse_document(PAGES[name])
+
+        assert fast.text == compatible.text
+        assert fast.links == compatible.links
+        assert fast.title == compatible.title
+        assert fast.meta == compatible.meta
+        assert fast.json_ld == compatible.json_ld
+        assert fast.h1 == compatible.h1
+        assert fast.microdata == compatible.microdata
+
+    @pytest.mark.parametrize("name", list(PAGES))
+    def test_same_extraction(self, lxml_backend, soup_backend, name):
+        """InfoExtractorの抽出結果が同じになること"""
+        fast = InfoExtractor(parser_backend=lxml_backend).extract_all(PAGES[name])
+        compatible = InfoExtractor(parser_backend=soup_backend).extract_all(PAGES[name])
+
+        assert fast == compatible
+
+    def test_stripped_tags(self, lxml_backend):
+        """script/style/svg/noscriptの中身とコメントがテキストに含まれないこと"""
+        document = lxml_backend.parse_document(PAGES["scripts_between_text"])
+
+        assert "03-0000-0000" not in document.text
+        assert "JavaScript" not in document.text
+        assert "090-0000-0000" not in document.text
+        assert "050-0000-0000" not in document.text
+        # 削除したタグの前後のテキストは連結されない
+        assert "TEL 03-1111-2222" in document.text
+
+    def test_microdata(self, lxml_backend):
+        """itempropの値をアイテムの型名と組にして取得すること（値がアイテムのプロパティは除く）"""
+        document = lxml_backend.parse_document(PAGES["microdata"])
+
+        assert [(prop.item_type, prop.name, prop.value) for prop in document.microdata] == [
+            ("LocalBusiness", "name", "テスト 商店"),
+            ("LocalBusiness", "openingHours", "Mo-Fr 10:00-19:00"),
+            ("LocalBusiness", "telephone", "tel:06-1234-5678"),
+            ("PostalAddress", "postalCode", "530-0001"),
+            ("PostalAddress", "addressRegion", "大阪府"),
+            ("PostalAddress", "addressLocality", "大阪府"),
+            ("LocalBusiness", "description", "説明 文"),
+            ("", "orphan", "型なし"),
+        ]
+
+    def test_same_search_results(self, lxml_backend, soup_backend):
+        """検索結果の解析結果が同じになること"""
+        html = """
+            <html><body>
+            <div class="g"><a href="/url?q=https://a.example.com/&sa=U"><h3>結果<b>A</b></h3></a>
+                <div class="VwiC3b">説明 <span>A</span></div></div>
+            <div class="g"><a href="https://b.example.com/"><h3>結果B</h3></a></div>
+            <div class="g"><span>タイトルなし</span></div>
+            </body></html>
+        """
+
+        fast = GoogleSearcher(parser_backend=lxml_backend).parse_search_results(html, 10)
+        compatible = GoogleSearcher(parser_backend=soup_backend).parse_search_results(html, 10)
+
+        assert fast == compatible
+        assert [item.url for item in fast] == ["https://a.example.com/", "https://b.example.com/"]
+        assert fast[0].title == "結果A"
+        assert fast[0].description == "説明A"
@@ -0,0 +1,167 @@
+"""http_cacheモジュールのテスト
+
+このモジュールは、HttpCacheとWebScraperのキャッシュ連携をテストします。
+"""
+
+import sqlite3
+
+import pytest
+from core.http_cache import HttpCache, canonicalize_url
+from core.http_session import HttpSessionPool
+from core.scraper import WebScraper
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """HttpCacheのフィクスチャ"""
+    cache = HttpCache(path=tmp_path / "cache.sqlite3", max_bytes=1024 * 1024, default_ttl=3600)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def make_scraper():
+    """キャッシュ付きWebScraperを作成するフィクスチャ"""
+    pool = HttpSessionPool()
+
+    def factory(cache):
+        scraper = WebScraper(session=pool.session, cache=cache)
+        scraper.wait_time = 0
+        return scraper
+
+    yield factory
+    pool.close()
+
+
+class TestCanonicalizeUrl:
+    """URL正規化のテスト"""
+
+    def test_host_and_port(self):
+        """ホストの小文字化とデフォルトポートの除去"""
+        assert canonicalize_url("HTTPS://Example.COM:443/a") == "https://example.com/a"
+
+    def test_query_and_fragment(self):
+        """クエリのソートとフラグメントの除去"""
+        assert canonicalize_url("https://example.com/a?b=2&a=1#top") == "https://example.com/a?a=1&b=2"
+
+    def test_empty_path(self):
+        """空のパスは/に統一"""
+        assert canonicalize_url("https://example.com") == "https://example.com/"
+
+
+class TestHttpCache:
+    """HttpCache単体のテスト"""
+
+    def test_put_and_get(self, cache):
+        """保存したエントリを取得できること"""
+        cache.put("https://example.com/", b"<html></html>", {"ETag": '"v1"'}, "utf-8")
+
+        cached = cache.get("https://EXAMPLE.com/#section")
+        assert cached is not None
+        assert cached.text() == "<html></html>"
+        assert cached.conditional_headers() == {"If-None-Match": '"v1"'}
+        assert cached.is_fresh()
+
+    def test_no_store(self, cache):
+        """no-storeのレスポンスは保存しないこと"""
+        cache.put("https://example.com/", b"x", {"Cache-Control": "no-store"})
+        assert cache.get("https://example.com/") is None
+
+    def test_max_age(self, cache):
+        """max-age=0のエントリは期限切れになること"""
+        cache.put("https://example.com/", b"x", {"Cache-Control": "max-age=0"})
+        assert not cache.get("https://example.com/").is_fresh()
+
+    def test_lru_eviction(self, tmp_path):
+        """上限を超えると最も古く参照されたエントリが削除されること"""
+        cache = HttpCache(path=tmp_path / "lru.sqlite3", max_bytes=250, default_ttl=3600)
+        cache.put("https://example.com/a", b"a" * 100, {})
+        cache.put("https://example.com/b", b"b" * 100, {})
+        cache.get("https://example.com/a")  # aを参照してbを最古にする
+        cache.put("https://example.com/c", b"c" * 100, {})
+
+        assert cache.get("https://example.com/a") is not None
+        assert cache.get("https://example.com/b") is None
+        assert cache.get("https://example.com/c") is not None
+        assert cache.stats.evictions == 1
+        assert cache.total_size() <= 250
+        cache.close()
+
+    def test_persistence(self, tmp_path):
+        """プロセスをまたいでエントリが残ること"""
+        path = tmp_path / "persist.sqlite3"
+        cache = HttpCache(path=path)
+        cache.put("https://example.com/", b"persisted", {})
+        cache.close()
+
+        reopened = HttpCache(path=path)
+        assert reopened.get("https://example.com/").body == b"persisted"
+        reopened.close()
+
+    def test_old_schema_migrated(self, tmp_path):
+        """final_url列のない古いキャッシュファイルも読み込めること"""
+        path = tmp_path / "old.sqlite3"
+        conn = sqlite3.connect(str(path))
+        conn.execute(
+            "CREATE TABLE responses (url TEXT PRIMARY KEY, body BLOB NOT NULL, headers TEXT NOT NULL, "
+            "encoding TEXT, stored_at REAL NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL, "
+            "size INTEGER NOT NULL)"
+        )
+        conn.execute("INSERT INTO responses VALUES ('https://example.com/', x'6f6c64', '{}', NULL, 0, 0, 0, 3)")
+        conn.commit()
+        conn.close()
+
+        cache = HttpCache(path=path)
+        assert cache.get("https://example.com/").final_url is None
+        cache.put("https://example.com/a", b"new", {}, final_url="https://example.com/a/")
+        assert cache.get("https://example.com/a").final_url == "https://example.com/a/"
+        cache.close()
+
+
+class TestScraperWithCache:
+    """WebScraperとキャッシュの連携テスト"""
+
+    def test_fresh_entry_skips_request(self, cache, make_scraper, local_server):
+        """新鮮なエントリはリクエストせずに返すこと"""
+        local_server.add_route("/page", "<html>本文</html>")
+        scraper = make_scraper(cache)
+
+        first = scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+        second = scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+
+        assert first.from_cache is False
+        assert second.from_cache is True
+        assert second.html == "<html>本文</html>"
+        assert local_server.count("/page") == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_stale_entry_revalidated_with_304(self, tmp_path, make_scraper, local_server):
+        """期限切れのエントリは条件付きリクエストで再検証されること"""
+        cache = HttpCache(path=tmp_path / "stale.sqlite3", default_ttl=0)
+        local_server.add_route("/page", "<html>v1</html>", headers={"ETag": '"v1"'})
+        scraper = make_scraper(cache)
+
+        scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+        page = scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+
+        assert page.html == "<html>v1</html>"
+        assert page.final_url == local_server.url("/page")
+        assert local_server.requests[-1][2].get("If-None-Match") == '"v1"'
+        assert cache.stats.revalidated == 1
+        cache.close()
+
+    def test_changed_entry_is_replaced(self, tmp_path, make_scraper, local_server):
+        """ETagが変わった場合は新しい本文を保存すること"""
+        cache = HttpCache(path=tmp_path / "changed.sqlite3", default_ttl=0)
+        local_server.add_route("/page", "<html>v1</html>", headers={"ETag": '"v1"'})
+        scraper = make_scraper(cache)
+        scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+
+        local_server.add_route("/page", "<html>v2</html>", headers={"ETag": '"v2"'})
+        page = scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+
+        assert page.html == "<html>v2</html>"
+        assert cache.get(local_server.url("/page")).etag == '"v2"'
+        assert cache.stats.misses == 2
+        cache.close()
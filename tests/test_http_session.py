@@ -0,0 +1,77 @@
+"""http_sessionモジュールのテスト
+
+このモジュールは、共有HTTPセッションのコネクション再利用と統計をテストします。
+"""
+
+import pytest
+from core.http_session import HttpSessionPool, get_shared_session
+from core.scraper import WebScraper
+from core.search_api import SearchAPIClient
+from core.searcher import GoogleSearcher
+
+
+@pytest.fixture
+def pool():
+    """HttpSessionPoolのフィクスチャ"""
+    pool = HttpSessionPool(pool_connections=4, pool_maxsize=2)
+    yield pool
+    pool.close()
+
+
+class TestConnectionReuse:
+    """コネクション再利用のテスト"""
+
+    def test_keep_alive_reuse(self, pool, local_server):
+        """同一ホストへの連続リクエストでコネクションが再利用されること"""
+        local_server.add_route("/page", "<html></html>")
+
+        for _ in range(5):
+            response = pool.session.get(local_server.url("/page"), timeout=5)
+            assert response.status_code == 200
+
+        assert pool.stats.requests == 5
+        assert pool.stats.new_connections == 1
+        assert pool.stats.hits == 4
+        assert pool.stats.reuse_rate == pytest.approx(0.8)
+
+    def test_stats_by_host(self, pool, local_server):
+        """ホストごとの統計が取得できること"""
+        local_server.add_route("/page", "<html></html>")
+        pool.session.get(local_server.url("/page"), timeout=5)
+
+        by_host = pool.stats.by_host()
+        assert by_host["127.0.0.1"].requests == 1
+
+    def test_reset(self, pool, local_server):
+        """統計のリセット"""
+        local_server.add_route("/page", "<html></html>")
+        pool.session.get(local_server.url("/page"), timeout=5)
+
+        pool.stats.reset()
+        assert pool.stats.requests == 0
+        assert pool.stats.reuse_rate == 0.0
+
+    def test_host_pool_size_override(self, local_server):
+        """ホストごとのプールサイズ指定"""
+        pool = HttpSessionPool(pool_maxsize=2, host_pool_sizes={"127.0.0.1": 5})
+        local_server.add_route("/page", "<html></html>")
+        pool.session.get(local_server.url("/page"), timeout=5)
+
+        adapter = pool.session.get_adapter(local_server.url("/page"))
+        connection_pool = adapter.poolmanager.connection_from_url(local_server.url("/page"))
+        assert connection_pool.pool.maxsize == 5
+        pool.close()
+
+
+class TestSharedSession:
+    """共有セッションのテスト"""
+
+    def test_clients_share_session(self, monkeypatch):
+        """3つのクライアントが同じセッションを使用すること"""
+        from config.settings import Settings
+        monkeypatch.setattr(Settings, "TAVILY_API_KEY", "test-key")
+
+        shared = get_shared_session()
+        assert WebScraper().session is shared
+        assert GoogleSearcher().session is shared
+        assert SearchAPIClient(provider="tavily").session is shared
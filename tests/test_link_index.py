@@ -0,0 +1,151 @@
+"""link_indexモジュールのテスト
+
+このモジュールは、AnchorIndex（ページのリンクの索引）の作成と、
+SNSのURLの判定、索引を使う抽出処理のテストを提供します。
+"""
+
+import pytest
+from core.document import REGION_FOOTER, REGION_HEADER, REGION_MAIN, DocumentLink, ParsedDocument
+from core.extraction_cache import ExtractionCache
+from core.extractor import InfoExtractor
+from core.link_index import AnchorIndex, classify_sns_url, link_scheme, sns_name_for_host
+
+
+HTML = """
+<html><body>
+<header class="l-header">
+    <a href="/" rel="home">トップ</a>
+    <a href="https://www.instagram.com/region_shop/">Instagram</a>
+</header>
+<main>
+    <p>ブログで紹介した<a href="https://twitter.com/other_user">お客様</a></p>
+    <a href="https://twitter.com/intent/tweet?text=share">ポストする</a>
+    <a href="https://www.facebook.com/sharer/sharer.php?u=https%3A%2F%2Fexample.jp">シェア</a>
+    <a href="javascript:void(0)">メニュー</a>
+    <a href="#top">ページの先頭へ</a>
+</main>
+<div id="site-footer">
+    <a href="https://twitter.com/region_shop" rel="Me noopener">X</a>
+    <a href="TEL:03-1234-5678">電話</a>
+    <a href="mailto:info@region.example.jp">メール</a>
+    <a href="/company/">会社概要</a>
+</div>
+<script>var url = "https://www.facebook.com/script_only";</script>
+</body></html>
+"""
+
+
+@pytest.fixture
+def document():
+    """ParsedDocumentのフィクスチャ"""
+    return ParsedDocument.from_html(HTML)
+
+
+class TestAnchorIndex:
+    """リンクの索引のテスト"""
+
+    def test_link_region_and_rel(self, document):
+        """リンクの位置とrel属性を保持すること"""
+        links = {link.href: link for link in document.links}
+        assert links["/"].region == REGION_HEADER
+        assert links["/"].rel == "home"
+        assert links["https://twitter.com/other_user"].region == REGION_MAIN
+        assert links["https://twitter.com/region_shop"].region == REGION_FOOTER
+        assert links["https://twitter.com/region_shop"].rel == "me noopener"
+
+    def test_build(self, document):
+        """リンクが種類ごとに分類されること"""
+        index = document.anchors
+
+        assert [link.href for link in index.tel] == ["TEL:03-1234-5678"]
+        assert [link.href for link in index.mailto] == ["mailto:info@region.example.jp"]
+        assert set(index.sns) == {"twitter", "instagram"}
+        pages = [link.href for link in index.pages]
+        assert "/company/" in pages and "#top" in pages
+        assert "javascript:void(0)" not in pages
+        assert "TEL:03-1234-5678" not in pages
+
+    def test_built_once(self, document):
+        """索引は最初の参照時に一度だけ作成されること"""
+        assert document.anchor_index is None
+        assert document.anchors is document.anchors
+
+    def test_sns_urls_prefer_header_and_footer(self, document):
+        """ヘッダー・フッター・rel="me"のリンクが本文のリンクより先に並ぶこと"""
+        assert document.anchors.sns_urls() == {
+            "twitter": ["https://twitter.com/region_shop", "https://twitter.com/other_user"],
+            "instagram": ["https://www.instagram.com/region_shop/"],
+        }
+
+    def test_sns_urls_deduplicated(self):
+        """同じURLのリンクは1つにまとめること"""
+        link = DocumentLink(href="https://x.com/shop", text="X")
+        index = AnchorIndex.build([link, DocumentLink(href="https://x.com/shop", text="", region=REGION_FOOTER)])
+        assert len(index.sns["twitter"]) == 2
+        assert index.sns_urls() == {"twitter": ["https://x.com/shop"]}
+
+    @pytest.mark.parametrize("href, expected", [
+        ("tel:03-1234-5678", "tel"),
+        ("MailTo:info@example.jp", "mailto"),
+        ("https://example.jp/", "https"),
+        ("/company/", ""),
+        ("company.html?a=b:c", ""),
+        ("#top", ""),
+    ])
+    def test_link_scheme(self, href, expected):
+        assert link_scheme(href) == expected
+
+
+class TestSnsClassification:
+    """SNSのURLの判定のテスト"""
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://twitter.com/intent/tweet?text=a", None),
+        ("https://twitter.com/share?url=https://example.jp", None),
+        ("https://www.facebook.com/sharer/sharer.php?u=a", None),
+        ("https://www.facebook.com/dialog/share?app_id=1", None),
+        ("https://social-plugins.line.me/lineit/share?url=a", None),
+        ("https://line.me/R/msg/text/?a", None),
+        ("https://line.me/R/ti/p/@shop", "line"),
+        ("https://www.facebook.com/shared.store", "facebook"),
+        ("HTTPS://WWW.INSTAGRAM.COM/Shop", "instagram"),
+        ("https://example.jp/twitter.com/shop", None),
+        ("https://[::1/shop", None),
+    ])
+    def test_classify_sns_url(self, url, expected):
+        assert classify_sns_url(url) == expected
+
+    @pytest.mark.parametrize("host, expected", [
+        ("x.com", "twitter"),
+        ("mobile.twitter.com", "twitter"),
+        ("m.facebook.com", "facebook"),
+        ("fb.com", "facebook"),
+        ("box.com", None),
+        ("notfacebook.com", None),
+        ("com", None),
+        ("", None),
+    ])
+    def test_sns_name_for_host(self, host, expected):
+        assert sns_name_for_host(host) == expected
+
+
+class TestIndexConsumers:
+    """索引を使う抽出処理のテスト"""
+
+    def test_extract_sns_links_uses_anchors(self):
+        """scriptの中のURLと共有ボタンのリンクをSNSリンクとしないこと"""
+        extractor = InfoExtractor(cache=ExtractionCache(max_entries=0))
+        sns_links = extractor.extract_sns_links(HTML)
+
+        assert "facebook" not in sns_links
+        assert sns_links["twitter"][0] == "https://twitter.com/region_shop"
+        assert all("intent" not in url for url in sns_links["twitter"])
+
+    def test_structured_links(self):
+        """tel:/mailto:のリンクが構造化データとして取得されること"""
+        extractor = InfoExtractor(cache=ExtractionCache(max_entries=0))
+        info = extractor.extract_all(HTML)
+
+        assert info.phone == ["03-1234-5678"]
+        assert info.email == ["info@region.example.jp"]
+        assert info.field_sources["phone"] == "link"
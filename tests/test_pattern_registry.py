@@ -0,0 +1,183 @@
+"""pattern_registryモジュールのテスト
+
+このモジュールは、パターンパックの読み込み・検証と、PatternRegistry・
+PatternScannerの統計のテストを提供します。
+"""
+
+import json
+
+import pytest
+from config.settings import Settings
+from core.extraction_cache import ExtractionCache
+from core.extractor import InfoExtractor
+from core.pattern_registry import PatternPack, PatternPackError, PatternRegistry
+from core.scanner import KIND_BUSINESS_HOURS, KIND_CLOSED_DAYS, KIND_PHONE
+
+
+def write_pack(directory, name, patterns, version="1", **extra):
+    """パターンパックのファイルを作成"""
+    data = {"name": name, "version": version, "patterns": patterns, **extra}
+    path = directory / f"{name}.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def registry():
+    """同梱のパターンパックのPatternRegistryのフィクスチャ"""
+    return PatternRegistry()
+
+
+class TestShippedPacks:
+    """同梱のパターンパックのテスト"""
+
+    def test_all_packs_valid(self, registry):
+        """同梱のすべてのパックが検証を通ること"""
+        assert set(Settings.PATTERN_PACKS) <= set(registry.available)
+        assert "medical" in registry.available
+        for name in registry.available:
+            pack = registry.pack(name)
+            assert pack.name == name
+            assert pack.version
+            assert all(spec.pack == name for specs in pack.patterns.values() for spec in specs)
+
+    def test_lazy_loading(self, registry):
+        """パックは使うときに読み込み、既定で使わないパックは読み込まないこと"""
+        assert registry.loaded == []
+
+        scanner = registry.scanner()
+
+        assert registry.loaded == list(Settings.PATTERN_PACKS)
+        assert "medical" not in registry.loaded
+        assert scanner.versions == {name: "1" for name in Settings.PATTERN_PACKS}
+        assert registry.scanner() is scanner
+
+    def test_industry_pack(self, registry):
+        """業種別のパックを加えると、そのパターンでも検出できること"""
+        text = "診療時間：9:00〜18:00。休診日：木曜・日曜。"
+        default = registry.scanner().scan(text)
+        medical = registry.scanner(list(Settings.PATTERN_PACKS) + ["medical"]).scan(text)
+
+        assert default.first(KIND_BUSINESS_HOURS) is None
+        assert medical.first(KIND_BUSINESS_HOURS).value == "9:00〜18:00"
+        assert medical.first(KIND_CLOSED_DAYS).value == "木曜・日曜"
+
+
+class TestPackValidation:
+    """パターンパックの検証のテスト"""
+
+    @pytest.mark.parametrize("patterns, message", [
+        ({"phone": ["[0-9"]}, "Invalid regex"),
+        ({"phone": [r"\d*"]}, "empty string"),
+        ({"phone": [{"pattern": r"\d+", "lable": "typo"}]}, "Unknown keys"),
+        ({"phone": []}, "no phone patterns"),
+        ({"Phone": [r"\d+"]}, "Invalid kind"),
+        ({}, "no patterns"),
+    ])
+    def test_invalid_patterns(self, tmp_path, patterns, message):
+        write_pack(tmp_path, "custom", patterns)
+        with pytest.raises(PatternPackError, match=message):
+            PatternRegistry(tmp_path).pack("custom")
+
+    @pytest.mark.parametrize("patterns", [
+        {"phone": [r"\d{4}", r"(?i)tel[:：]\s*(\d+-\d+-\d+)"]},
+        {"phone": [r"(?P<number>\d{4})", r"(?P<number>\d{3})"]},
+        {"phone": [r"(\d{2})-\d{4}", r"(\d)\1{3}"]},
+    ], ids=["inline_flag", "duplicate_group_name", "backreference"])
+    def test_invalid_combined_patterns(self, tmp_path, patterns):
+        """個別には正しくても、種類ごとにまとめると不正になるパックは読み込まないこと"""
+        write_pack(tmp_path, "custom", patterns)
+        with pytest.raises(PatternPackError, match="Invalid regex in combined phone"):
+            PatternRegistry(tmp_path).pack("custom")
+
+    def test_invalid_header(self, tmp_path):
+        """バージョンがない・ファイル名と名前が異なるパックは読み込まないこと"""
+        write_pack(tmp_path, "no_version", {"phone": [r"\d+"]}, version="")
+        path = write_pack(tmp_path, "renamed", {"phone": [r"\d+"]})
+        path.rename(tmp_path / "other.json")
+
+        registry = PatternRegistry(tmp_path)
+        with pytest.raises(PatternPackError, match="no version"):
+            registry.pack("no_version")
+        with pytest.raises(PatternPackError, match="does not match"):
+            registry.pack("other")
+
+    def test_missing_pack(self, tmp_path):
+        (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+        registry = PatternRegistry(tmp_path)
+
+        with pytest.raises(PatternPackError, match="not found"):
+            registry.pack("missing")
+        with pytest.raises(PatternPackError, match="Failed to load"):
+            registry.pack("broken")
+        with pytest.raises(PatternPackError):
+            registry.scanner(["missing"])
+
+    def test_string_and_object_entries(self):
+        pack = PatternPack.from_dict({
+            "name": "custom", "version": "2",
+            "patterns": {"phone": [r"\d{2}-\d{4}", {"pattern": r"\d{3}", "label": "3桁"}]},
+        })
+        assert [spec.label for spec in pack.patterns["phone"]] == ["", "3桁"]
+        assert all(spec.compile_ms >= 0 for spec in pack.patterns["phone"])
+
+
+class TestRegistry:
+    """パターンのまとめ方のテスト"""
+
+    def test_priority_and_duplicates(self, tmp_path):
+        """先に指定したパックのパターンが優先され、重複するパターンは除かれること"""
+        write_pack(tmp_path, "first", {"phone": [r"\d{2}-\d{4}", r"\d{4}"]})
+        write_pack(tmp_path, "second", {"phone": [r"\d{4}", r"\d{3}"], "code": [r"[A-Z]{3}"]})
+        registry = PatternRegistry(tmp_path, default_packs=["first", "second"])
+
+        patterns = registry.patterns()
+
+        assert [spec.pattern for spec in patterns["phone"]] == [r"\d{2}-\d{4}", r"\d{4}", r"\d{3}"]
+        assert [spec.pack for spec in patterns["phone"]] == ["first", "first", "second"]
+        assert registry.versions() == {"first": "1", "second": "1"}
+        assert registry.scanner().scan("ABC 12-3456").values("code") == ["ABC"]
+
+    def test_invalid_merged_patterns(self, tmp_path):
+        """複数のパックをまとめると不正になる場合はPatternPackErrorになること"""
+        write_pack(tmp_path, "first", {"phone": [r"(?P<number>\d{4})"]})
+        write_pack(tmp_path, "second", {"phone": [r"(\d)\1{3}"]})
+        registry = PatternRegistry(tmp_path, default_packs=["first", "second"])
+
+        assert registry.scanner(["second"]).scan("1111").values("phone") == ["1"]
+        with pytest.raises(PatternPackError, match="Invalid regex in combined phone patterns of packs first, second"):
+            registry.scanner()
+
+    def test_version_in_fingerprint(self, monkeypatch):
+        """パックのバージョンが変わると抽出器のフィンガープリントが変わること"""
+        extractor = InfoExtractor(cache=ExtractionCache(max_entries=0))
+        fingerprint = extractor._fingerprint()
+
+        monkeypatch.setattr(extractor.scanner, "versions", dict(extractor.scanner.versions, jp_phone="2"))
+
+        assert extractor._fingerprint() != fingerprint
+
+
+class TestStatistics:
+    """パターンの統計のテスト"""
+
+    def test_statistics(self, tmp_path):
+        """走査回数・パターンごとの一致件数・コンパイル時間が記録されること"""
+        write_pack(tmp_path, "custom", {"phone": [
+            {"pattern": r"0\d{1,4}-\d{1,4}-\d{4}", "label": "ハイフン区切り"},
+            {"pattern": r"0\d{9,10}", "label": "ハイフンなし"},
+        ]})
+        scanner = PatternRegistry(tmp_path, default_packs=["custom"]).scanner()
+        assert scanner.statistics()[KIND_PHONE].combined_compile_ms is None
+
+        scanner.scan("03-1234-5678 と 0312345679").values(KIND_PHONE)
+        scanner.scan("06-1234-5678").first(KIND_PHONE)
+        stats = scanner.statistics()[KIND_PHONE]
+
+        assert stats.scans == 2
+        assert stats.scan_ms >= 0
+        assert stats.combined_compile_ms is not None
+        assert [(pattern.label, pattern.matches) for pattern in stats.patterns] == [
+            ("ハイフン区切り", 2), ("ハイフンなし", 1)
+        ]
+        assert all(pattern.pack == "custom" and pattern.compile_ms >= 0 for pattern in stats.patterns)
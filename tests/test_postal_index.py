@@ -0,0 +1,114 @@
+"""postal_indexモジュールのテスト
+
+このモジュールは、郵便番号索引の作成と検索のテスト、
+郵便番号索引を使用したInfoExtractor.extract_addressのテストを提供します。
+"""
+
+import pytest
+import core.postal_index as postal_index_module
+from core.extractor import InfoExtractor
+from core.postal_index import PostalIndex, build_postal_index, get_postal_index, normalize_town
+
+RECORDS = [
+    ("1000001", "東京都", "千代田区", "千代田"),
+    ("5300001", "大阪府", "大阪市北区", "梅田"),
+    ("0600000", "北海道", "札幌市中央区", "以下に掲載がない場合"),
+    ("8120011", "福岡県", "福岡市博多区", "博多駅前"),
+    # 同じ郵便番号で町域が異なる行
+    ("9071801", "沖縄県", "八重山郡与那国町", "与那国"),
+    ("9071801", "沖縄県", "八重山郡与那国町", "比川"),
+    ("1006090", "東京都", "千代田区", "霞が関霞が関ビル（地階・階層不明）"),
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    """テスト用の郵便番号索引のフィクスチャ"""
+    path = tmp_path / "postal_index.bin"
+    build_postal_index(RECORDS, path)
+    index = PostalIndex(path)
+    yield index
+    index.close()
+
+
+class TestPostalIndex:
+    """PostalIndexの検索のテスト"""
+
+    def test_lookup(self, index):
+        """郵便番号から都道府県・市区町村・町域を取得できること"""
+        address = index.lookup("530-0001")
+
+        assert (address.postal_code, address.prefecture, address.city, address.town) == \
+            ("530-0001", "大阪府", "大阪市北区", "梅田")
+        assert len(index) == 6
+
+    @pytest.mark.parametrize("postal_code", ["1000001", "100-0001", "〒100-0001", "１００－０００１"])
+    def test_postal_code_notations(self, index, postal_code):
+        """郵便番号の表記によらず検索できること"""
+        assert index.lookup_city(postal_code) == ("東京都", "千代田区")
+
+    @pytest.mark.parametrize("postal_code", ["100-0002", "999-9999", "000-0000", "123", "", None])
+    def test_not_found(self, index, postal_code):
+        """索引にない郵便番号・7桁でない値はNone"""
+        assert index.lookup(postal_code) is None
+        assert index.lookup_city(postal_code) is None
+
+    def test_town_notes(self, index):
+        """町域の注記を除去し、複数の町域にまたがる郵便番号は町域を空にすること"""
+        assert index.lookup("060-0000").town == ""
+        assert index.lookup("907-1801").town == ""
+        assert index.lookup("100-6090").town == "霞が関霞が関ビル"
+        assert normalize_town("琴平町の次に１～４２６番地がくる場合") == ""
+
+    def test_invalid_file(self, tmp_path):
+        """索引ファイルでない場合はValueError"""
+        path = tmp_path / "broken.bin"
+        path.write_bytes(b"not an index")
+
+        with pytest.raises(ValueError):
+            PostalIndex(path)
+
+    def test_missing_file(self, monkeypatch, tmp_path):
+        """索引ファイルがない場合はNone（索引なしで動作する）"""
+        monkeypatch.setattr("config.settings.Settings.POSTAL_INDEX_PATH", tmp_path / "missing.bin")
+        monkeypatch.setattr(postal_index_module, "_postal_index", None)
+        monkeypatch.setattr(postal_index_module, "_postal_index_loaded", False)
+
+        assert get_postal_index() is None
+
+
+class TestExtractAddressWithIndex:
+    """郵便番号索引を使用したextract_addressのテスト"""
+
+    @pytest.fixture
+    def extractor(self, index):
+        """郵便番号索引を使用するInfoExtractorのフィクスチャ"""
+        extractor = InfoExtractor()
+        extractor.postal_index = index
+        return extractor
+
+    def test_fills_prefecture_and_city(self, extractor):
+        """本文に都道府県名がない場合は郵便番号から補完すること"""
+        address = extractor.extract_address("<p>〒100-0001 千代田1-1</p>")
+
+        assert address["prefecture"] == "東京都"
+        assert address["city"] == "千代田区"
+
+    def test_refines_city(self, extractor):
+        """本文の市区町村名より詳しい郵便番号の市区町村名を採用すること"""
+        address = extractor.extract_address("<p>〒060-0000 北海道札幌市北1条西2丁目</p>")
+
+        assert address["city"] == "札幌市中央区"
+
+    def test_prefers_consistent_candidate(self, extractor):
+        """離れた位置の郵便番号と一致する都道府県の住所を優先すること"""
+        html = """
+            <p>本社の郵便番号は〒812-0011です。所在地は次のとおりです。</p>
+            <p>東京支店のご案内：東京都港区芝公園4-2-8</p>
+            <p>本社のご案内：福岡県福岡市博多区博多駅前1-2-3</p>
+        """
+        address = extractor.extract_address(html)
+
+        assert address["postal_code"] == "812-0011"
+        assert address["prefecture"] == "福岡県"
+        assert address["city"] == "福岡市博多区"
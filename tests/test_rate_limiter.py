@@ -0,0 +1,158 @@
+"""rate_limiterモジュールのテスト
+
+このモジュールは、RateLimiterクラスとRetry-Afterの解釈の単体テストを提供します。
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+from core.rate_limiter import RateLimiter, parse_retry_after, get_rate_limit_key
+from core.scraper import WebScraper
+
+URL = "https://example.com/page"
+
+
+@pytest.fixture
+def limiter():
+    """RateLimiterのフィクスチャ"""
+    return RateLimiter(min_rate=0.1, max_rate=10.0, burst=1, increase_step=0.5, decrease_factor=0.5)
+
+
+class TestParseRetryAfter:
+    """Retry-Afterの解釈のテスト"""
+
+    def test_seconds(self):
+        """秒数形式"""
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date(self):
+        """HTTP日付形式"""
+        now = time.time()
+        value = formatdate(now + 30, usegmt=True)
+
+        assert parse_retry_after(value, now) == pytest.approx(30, abs=1)
+
+    def test_invalid(self):
+        """解釈できない値はNone"""
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestTokenBucket:
+    """トークンバケットのテスト"""
+
+    def test_first_request_not_delayed(self, limiter):
+        """初回のリクエストは待機しないこと"""
+        assert limiter.reserve(URL, interval=1.0) == 0
+
+    def test_requests_are_spaced(self, limiter):
+        """同一ドメインへの連続した予約は送信間隔ずつずれること"""
+        waits = [limiter.reserve(URL, interval=1.0) for _ in range(3)]
+
+        assert waits[0] == 0
+        assert waits[1] == pytest.approx(1.0, abs=0.05)
+        assert waits[2] == pytest.approx(2.0, abs=0.05)
+
+    def test_domains_are_independent(self, limiter):
+        """異なるドメインは互いに影響しないこと"""
+        limiter.reserve("https://a.example.com/", interval=1.0)
+
+        assert limiter.reserve("https://b.example.com/", interval=1.0) == 0
+
+    def test_min_interval(self, limiter):
+        """Crawl-delayが送信間隔より長い場合はその間隔になること"""
+        limiter.reserve(URL, interval=0.1, min_interval=2.0)
+
+        assert limiter.reserve(URL, interval=0.1, min_interval=2.0) == pytest.approx(2.0, abs=0.05)
+
+    def test_zero_interval_unlimited(self, limiter):
+        """送信間隔0の場合は待機しないこと"""
+        assert all(limiter.reserve(URL, interval=0) == 0 for _ in range(5))
+
+    def test_key_includes_port(self):
+        """キーはポート番号を含む小文字のドメインであること"""
+        assert get_rate_limit_key("http://Example.com:8080/path") == "example.com:8080"
+
+
+class TestAdaptiveRate:
+    """AIMDによるレート調整のテスト"""
+
+    def test_additive_increase(self, limiter):
+        """正常な応答でレートが加算されること"""
+        limiter.reserve(URL, interval=1.0)
+        limiter.on_response(URL, 200)
+        limiter.on_response(URL, 200)
+
+        assert limiter.get_rate(URL) == pytest.approx(2.0)
+
+    def test_multiplicative_decrease_on_429(self, limiter):
+        """429でレートが半分になること"""
+        limiter.reserve(URL, interval=0.5)
+        limiter.on_response(URL, 429)
+
+        assert limiter.get_rate(URL) == pytest.approx(1.0)
+
+    def test_rate_bounds(self, limiter):
+        """レートが上限・下限を超えないこと"""
+        limiter.reserve(URL, interval=1.0)
+        for _ in range(100):
+            limiter.on_response(URL, 200)
+        assert limiter.get_rate(URL) == pytest.approx(10.0)
+
+        for _ in range(100):
+            limiter.on_response(URL, 503)
+        assert limiter.get_rate(URL) == pytest.approx(0.1)
+
+    def test_latency_spike(self, limiter, monkeypatch):
+        """応答時間の急増でレートが下がること"""
+        monkeypatch.setattr("config.settings.Settings.RATE_LIMIT_MIN_SLOW_LATENCY", 0.0)
+        limiter.reserve(URL, interval=1.0)
+        limiter.on_response(URL, 200, latency=0.1)
+        rate = limiter.get_rate(URL)
+
+        limiter.on_response(URL, 200, latency=5.0)
+
+        assert limiter.get_rate(URL) == pytest.approx(rate * 0.5)
+
+    def test_retry_after_blocks(self, limiter):
+        """Retry-Afterの間は送信が止まること"""
+        limiter.reserve(URL, interval=0.1)
+        limiter.on_response(URL, 429, {"Retry-After": "5"})
+
+        assert limiter.blocked_for(URL) == pytest.approx(5, abs=0.1)
+        assert limiter.reserve(URL, interval=0.1) >= 4.9
+        assert limiter.retry_delay(URL, attempt=1, base_wait=0.1) == pytest.approx(5, abs=0.1)
+
+    def test_zero_interval_throttled_after_429(self, limiter):
+        """送信間隔0でも429を受けた後は間隔を空けること"""
+        limiter.reserve(URL, interval=0)
+        limiter.on_response(URL, 429)
+        limiter.reserve(URL, interval=0)
+
+        assert limiter.reserve(URL, interval=0) > 0
+
+    def test_retry_delay_without_retry_after(self, limiter):
+        """Retry-Afterがない場合は指数バックオフ"""
+        assert limiter.retry_delay(URL, attempt=3, base_wait=1.0) == 4.0
+
+
+class TestScraperIntegration:
+    """WebScraperとの連携のテスト"""
+
+    def test_retry_after_honored(self, local_server):
+        """429のRetry-Afterに従ってリトライを待機すること"""
+        local_server.add_route("/limited", "busy", status=429, headers={"Retry-After": "1"})
+        limiter = RateLimiter()
+        scraper = WebScraper(rate_limiter=limiter)
+        scraper.wait_time = 0.01
+        scraper.max_retries = 2
+
+        start = time.time()
+        page = scraper.fetch_page(local_server.url("/limited"), respect_robots=False)
+        elapsed = time.time() - start
+
+        assert page is None
+        assert local_server.count("/limited") == 2
+        assert elapsed >= 0.9
+        assert limiter.domains[get_rate_limit_key(local_server.base_url)].throttled == 2
@@ -0,0 +1,194 @@
+"""robotsモジュールのテスト
+
+このモジュールは、RobotsCacheの取得・キャッシュ・永続化をテストします。
+"""
+
+import time
+
+import pytest
+from core.http_session import HttpSessionPool
+from core.robots import RobotsCache
+from core.scraper import WebScraper
+
+
+ROBOTS_TXT = "User-agent: *\nDisallow: /private\nCrawl-delay: 5\n"
+
+
+@pytest.fixture
+def session():
+    """HTTPセッションのフィクスチャ"""
+    pool = HttpSessionPool()
+    yield pool.session
+    pool.close()
+
+
+@pytest.fixture
+def robots(session):
+    """RobotsCacheのフィクスチャ（永続化なし）"""
+    return RobotsCache(session=session, timeout=0.5)
+
+
+def add_robots(server, body=ROBOTS_TXT, **kwargs):
+    server.add_route("/robots.txt", body, headers={"Content-Type": "text/plain"}, **kwargs)
+
+
+class TestRobotsCache:
+    """RobotsCacheのテスト"""
+
+    def test_can_fetch(self, robots, local_server):
+        """Disallowの判定"""
+        add_robots(local_server)
+
+        assert robots.can_fetch(local_server.url("/public"))
+        assert not robots.can_fetch(local_server.url("/private/page"))
+        assert local_server.count("/robots.txt") == 1
+
+    def test_crawl_delay(self, robots, local_server):
+        """Crawl-delayの取得（取得済みの場合のみ）"""
+        add_robots(local_server)
+
+        assert robots.crawl_delay(local_server.url("/")) is None
+        robots.can_fetch(local_server.url("/"))
+        assert robots.crawl_delay(local_server.url("/")) == 5.0
+
+    def test_forbidden_disallows_all(self, robots, local_server):
+        """robots.txtが403の場合はすべて拒否"""
+        add_robots(local_server, status=403)
+        assert not robots.can_fetch(local_server.url("/"))
+
+    def test_missing_allows_all(self, robots, local_server):
+        """robots.txtが404の場合はすべて許可"""
+        assert robots.can_fetch(local_server.url("/anything"))
+
+    def test_timeout_is_negatively_cached(self, robots, local_server):
+        """タイムアウトした取得は失敗としてキャッシュされ、再取得されないこと"""
+        add_robots(local_server, delay=1.0)
+
+        start = time.time()
+        assert robots.can_fetch(local_server.url("/a"))
+        assert robots.can_fetch(local_server.url("/b"))
+        elapsed = time.time() - start
+
+        assert elapsed < 1.5
+        assert local_server.count("/robots.txt") == 1
+        assert robots.entries[local_server.base_url].failed
+
+    def test_server_error_is_negatively_cached(self, robots, local_server):
+        """5xxは取得失敗として扱い、アクセスを許可すること"""
+        add_robots(local_server, status=503)
+
+        assert robots.can_fetch(local_server.url("/private"))
+        assert robots.can_fetch(local_server.url("/private"))
+        assert local_server.count("/robots.txt") == 1
+
+    def test_negative_entry_expires(self, session, local_server):
+        """ネガティブキャッシュはnegative_ttl経過後に再取得されること"""
+        robots = RobotsCache(session=session, negative_ttl=0)
+        add_robots(local_server, status=500)
+
+        robots.can_fetch(local_server.url("/"))
+        robots.can_fetch(local_server.url("/"))
+        assert local_server.count("/robots.txt") == 2
+
+    def test_persistence(self, session, local_server, tmp_path):
+        """保存したキャッシュが別インスタンスで読み込まれること"""
+        path = tmp_path / "robots.json"
+        add_robots(local_server)
+
+        robots = RobotsCache(session=session, path=path)
+        robots.can_fetch(local_server.url("/"))
+        robots.save()
+
+        reloaded = RobotsCache(session=session, path=path)
+        assert not reloaded.can_fetch(local_server.url("/private"))
+        assert local_server.count("/robots.txt") == 1
+
+    def test_lazy_entries_persisted(self, session, local_server, tmp_path):
+        """prefetch以外で取得したエントリも、save()を呼ばずに別インスタンスで読み込まれること"""
+        path = tmp_path / "robots.json"
+        add_robots(local_server)
+
+        scraper = WebScraper(session=session, robots=RobotsCache(session=session, path=path))
+        scraper.wait_time = 0
+        local_server.add_route("/page", "<html></html>")
+        assert scraper.fetch_page(local_server.url("/page")) is not None
+
+        reloaded = RobotsCache(session=session, path=path)
+        assert not reloaded.can_fetch(local_server.url("/private"))
+        assert local_server.count("/robots.txt") == 1
+
+    def test_save_interval(self, session, local_server, tmp_path):
+        """保存の間隔内の変更はsave()で保存されること"""
+        path = tmp_path / "robots.json"
+        robots = RobotsCache(session=session, path=path, save_interval=3600)
+
+        robots.store("https://a.example.com", 200, "")
+        robots.store("https://b.example.com", 200, "")
+        assert list(RobotsCache(session=session, path=path).entries) == ["https://a.example.com"]
+
+        robots.save()
+        assert len(RobotsCache(session=session, path=path).entries) == 2
+
+    def test_expired_entries_not_loaded(self, session, local_server, tmp_path):
+        """TTLが切れたエントリは読み込まれないこと"""
+        path = tmp_path / "robots.json"
+        add_robots(local_server)
+
+        robots = RobotsCache(session=session, path=path, ttl=0)
+        robots.can_fetch(local_server.url("/"))
+        robots._dirty = True
+        robots.save()
+
+        reloaded = RobotsCache(session=session, path=path)
+        assert reloaded.entries == {}
+
+    def test_prefetch_concurrent(self, robots, local_server):
+        """複数ドメインのrobots.txtが並列に事前取得されること"""
+        add_robots(local_server, delay=0.3)
+        port = local_server.base_url.rsplit(":", 1)[1]
+        urls = [
+            f"http://127.0.0.1:{port}/a",
+            f"http://127.0.0.1:{port}/b",
+            f"http://localhost:{port}/c",
+        ]
+
+        start = time.time()
+        robots.prefetch(urls)
+        elapsed = time.time() - start
+
+        assert elapsed < 0.55
+        assert local_server.count("/robots.txt") == 2
+        assert len(robots.entries) == 2
+
+
+class TestScraperRobots:
+    """WebScraperとrobots.txtの連携テスト"""
+
+    def test_fetch_many_prefetches_and_respects(self, session, local_server):
+        """fetch_manyがrobots.txtを事前取得し、禁止URLをスキップすること"""
+        add_robots(local_server, body="User-agent: *\nDisallow: /private\n")
+        local_server.add_route("/ok", "<html>ok</html>")
+        local_server.add_route("/private/x", "<html>secret</html>")
+        scraper = WebScraper(session=session)
+        scraper.wait_time = 0
+
+        pages = scraper.fetch_many([local_server.url("/ok"), local_server.url("/private/x")])
+
+        assert pages[0] is not None
+        assert pages[1] is None
+        assert local_server.count("/private/x") == 0
+        assert local_server.count("/robots.txt") == 1
+
+    def test_crawl_delay_applied(self, session, local_server):
+        """Crawl-delayがwait_timeより長い場合はその間隔で待機すること"""
+        add_robots(local_server, body="User-agent: *\nCrawl-delay: 1\n")
+        local_server.add_route("/a", "<html></html>")
+        local_server.add_route("/b", "<html></html>")
+        scraper = WebScraper(session=session)
+        scraper.wait_time = 0
+
+        start = time.time()
+        scraper.fetch_many([local_server.url("/a"), local_server.url("/b")], max_workers=2)
+        elapsed = time.time() - start
+
+        assert elapsed >= 0.9
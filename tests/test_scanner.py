@@ -0,0 +1,84 @@
+"""scannerモジュールのテスト
+
+このモジュールは、PatternScannerクラスの単体テストを提供します。
+"""
+
+import re
+
+import pytest
+from core.scanner import PatternScanner, KIND_PHONE, KIND_FAX, KIND_EMAIL, KIND_POSTAL_CODE, KIND_BUSINESS_HOURS
+
+TEXT = (
+    "株式会社テスト 〒100-0001 東京都千代田区千代田1-1-1 "
+    "TEL: 03-1234-5678 FAX: 03-1234-5679 携帯 090-1234-5678 "
+    "メール info@example.com 営業時間: 9:00〜18:00 定休日: 日曜日"
+)
+
+
+@pytest.fixture
+def scanner():
+    """PatternScannerのフィクスチャ"""
+    return PatternScanner()
+
+
+class TestPatternScanner:
+    """PatternScannerのテスト"""
+
+    def test_typed_matches_with_offsets(self, scanner):
+        """種類と位置付きの一致を返すこと"""
+        result = scanner.scan(TEXT)
+
+        phones = result.get(KIND_PHONE)
+        assert [match.value for match in phones] == ["03-1234-5678", "03-1234-5679", "090-1234-5678"]
+        assert TEXT[phones[0].start:phones[0].end] == "03-1234-5678"
+        assert result.values(KIND_FAX) == ["03-1234-5679"]
+        assert result.values(KIND_EMAIL) == ["info@example.com"]
+
+    def test_matches_sorted_by_offset(self, scanner):
+        """すべての種類の一致が開始位置の順に並ぶこと"""
+        matches = scanner.scan(TEXT).matches
+        starts = [match.start for match in matches]
+
+        assert starts == sorted(starts)
+        assert {match.kind for match in matches} >= {KIND_PHONE, KIND_FAX, KIND_EMAIL, KIND_POSTAL_CODE}
+
+    def test_first_respects_priority(self, scanner):
+        """後ろにあっても優先度の高いパターンの一致を採用すること"""
+        result = scanner.scan("受付時間 10:00〜17:00 営業時間: 9:00〜18:00")
+
+        match = result.first(KIND_BUSINESS_HOURS)
+        assert match.priority == 0
+        assert match.value.startswith("9:00")
+
+    def test_postal_code_prefers_symbol(self, scanner):
+        """〒記号付きの郵便番号を優先すること"""
+        match = scanner.scan("番号 123-4567 住所 〒100-0001").first(KIND_POSTAL_CODE)
+
+        assert match.value == "〒100-0001"
+
+    def test_phone_alternatives_not_duplicated(self, scanner):
+        """重複する電話番号パターンの一致が1件にまとまること"""
+        result = scanner.scan("0120123456 と 09012345678")
+
+        assert result.values(KIND_PHONE) == ["0120123456", "09012345678"]
+
+    def test_same_values_as_pattern_loops(self, scanner):
+        """パターンごとのre.findallと同じ値の集合になること"""
+        result = scanner.scan(TEXT)
+
+        for kind in (KIND_PHONE, KIND_FAX, KIND_EMAIL):
+            expected = {value for pattern in scanner.patterns[kind] for value in re.findall(pattern, TEXT)}
+            assert set(result.values(kind)) == expected, kind
+
+    def test_invalid_pattern_skipped(self):
+        """不正なパターンは除外し、残りのパターンで照合すること"""
+        scanner = PatternScanner({"number": ["[0-9", r"\d+"]})
+
+        assert scanner.scan("abc 123").values("number") == ["123"]
+
+    def test_empty_text(self, scanner):
+        """空のテキストでは一致なし"""
+        result = scanner.scan("")
+
+        assert result.matches == []
+        assert result.first(KIND_POSTAL_CODE) is None
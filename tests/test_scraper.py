@@ -0,0 +1,224 @@
+"""scraperモジュールのテスト
+
+このモジュールは、WebScraperクラスの単体テストを提供します。
+ネットワークにはアクセスせず、HTML取得処理を差し替えてテストします。
+"""
+
+import threading
+import time
+
+import pytest
+from core.scraper import STREAM_CHUNK_SIZE, WebScraper, PageContent
+
+
+def make_page(url, html="<html></html>"):
+    """テスト用のPageContentを作成"""
+    return PageContent(url=url, html=html, status_code=200, content_type="text/html", encoding="utf-8")
+
+
+@pytest.fixture
+def scraper():
+    """WebScraperのフィクスチャ（待機時間を短縮）"""
+    scraper = WebScraper()
+    scraper.wait_time = 0.2
+    return scraper
+
+
+class TestFetchMany:
+    """並列取得のテスト"""
+
+    def test_fetch_many_preserves_order(self, scraper, monkeypatch):
+        """結果が入力順で返されること"""
+        def fake_fetch_content(url, cached=None, max_attempts=None):
+            # 後ろのURLほど早く終わるようにする
+            time.sleep(0.05 if url.endswith("/0") else 0.0)
+            return make_page(url, f"<html>{url}</html>")
+
+        monkeypatch.setattr(scraper, "_fetch_content", fake_fetch_content)
+        urls = [f"https://site{i}.example.com/{i}" for i in range(5)]
+
+        results = scraper.fetch_many(urls, max_workers=5, respect_robots=False)
+
+        assert len(results) == 5
+        assert all(isinstance(result, PageContent) for result in results)
+        assert [result.url for result in results] == urls
+
+    def test_fetch_many_failure_returns_none(self, scraper, monkeypatch):
+        """取得失敗・不正URLの位置にNoneが入ること"""
+        monkeypatch.setattr(scraper, "_fetch_content", lambda url, cached=None, max_attempts=None: None if "fail" in url else make_page(url))
+        urls = ["https://ok.example.com/", "https://fail.example.com/", "not-a-url"]
+
+        results = scraper.fetch_many(urls, respect_robots=False)
+
+        assert results[0] is not None
+        assert results[1] is None
+        assert results[2] is None
+
+    def test_fetch_many_empty(self, scraper):
+        """空のURLリスト"""
+        assert scraper.fetch_many([]) == []
+
+    def test_fetch_many_progress_callback(self, scraper, monkeypatch):
+        """完了ごとに進捗コールバックが呼ばれること"""
+        monkeypatch.setattr(scraper, "_fetch_content", lambda url, cached=None, max_attempts=None: make_page(url))
+        progress = []
+        urls = [f"https://site{i}.example.com/" for i in range(3)]
+
+        scraper.fetch_many(
+            urls,
+            respect_robots=False,
+            progress_callback=lambda done, total, url: progress.append((done, total))
+        )
+
+        assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+
+
+class TestRateLimit:
+    """ドメイン単位のレート制限のテスト"""
+
+    def test_different_domains_do_not_wait(self, scraper, monkeypatch):
+        """異なるドメインへのリクエストは待機しないこと"""
+        monkeypatch.setattr(scraper, "_fetch_content", lambda url, cached=None, max_attempts=None: make_page(url))
+        urls = [f"https://site{i}.example.com/" for i in range(4)]
+
+        start = time.time()
+        scraper.fetch_many(urls, max_workers=4, respect_robots=False)
+        elapsed = time.time() - start
+
+        assert elapsed < scraper.wait_time
+
+    def test_same_domain_is_spaced(self, scraper, monkeypatch):
+        """同一ドメインへのリクエストはwait_time以上の間隔になること"""
+        request_times = []
+        lock = threading.Lock()
+
+        def fake_fetch_content(url, cached=None, max_attempts=None):
+            with lock:
+                request_times.append(time.time())
+            return make_page(url)
+
+        monkeypatch.setattr(scraper, "_fetch_content", fake_fetch_content)
+        urls = [f"https://same.example.com/{i}" for i in range(3)]
+
+        scraper.fetch_many(urls, max_workers=3, respect_robots=False)
+
+        request_times.sort()
+        intervals = [b - a for a, b in zip(request_times, request_times[1:])]
+        assert all(interval >= scraper.wait_time * 0.9 for interval in intervals)
+
+
+class TestStreamingDownload:
+    """ストリーミング受信のテスト"""
+
+    @pytest.fixture
+    def local_scraper(self, scraper):
+        scraper.wait_time = 0
+        return scraper
+
+    def test_non_html_aborted(self, local_scraper, local_server):
+        """HTML以外のContent-Typeは本文を受信しないこと"""
+        local_server.add_route("/file.pdf", b"%PDF" + b"0" * 10000, headers={"Content-Type": "application/pdf"})
+
+        page = local_scraper.fetch_page(local_server.url("/file.pdf"), respect_robots=False)
+
+        assert page.html == ""
+        assert page.abort_reason == "content_type"
+        assert page.bytes_saved == 10004
+
+    def test_max_bytes(self, local_scraper, local_server):
+        """最大バイト数で打ち切ること"""
+        local_server.add_route("/big", "<html><body>" + "あ" * 100000 + "</body></html>")
+        local_scraper.max_page_bytes = 1000
+
+        page = local_scraper.fetch_page(local_server.url("/big"), respect_robots=False)
+
+        assert page.truncated
+        assert page.abort_reason == "max_bytes"
+        assert len(page.html.encode("utf-8")) <= 1000 + 3
+        assert page.bytes_saved > 0
+
+    @pytest.mark.parametrize("extra, truncated", [(0, False), (1, True)])
+    def test_max_bytes_boundary(self, local_scraper, local_server, extra, truncated):
+        """本文がちょうど最大バイト数の場合は打ち切りとせず、1バイトでも超える場合は打ち切ること"""
+        local_scraper.max_page_bytes = 2 * STREAM_CHUNK_SIZE
+        body = b"x" * (local_scraper.max_page_bytes + extra)
+        local_server.add_route("/page", body)
+
+        page = local_scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+
+        assert page.truncated is truncated
+        assert page.abort_reason == ("max_bytes" if truncated else None)
+        assert len(page.html) == local_scraper.max_page_bytes
+
+    def test_stop_at_body_end(self, local_scraper, local_server):
+        """</body>を受信した時点で打ち切ること"""
+        html = "<html><body>本文</body></html>" + "<!-- " + "x" * 200000 + " -->"
+        local_server.add_route("/page", html)
+        local_scraper.stop_at_body_end = True
+
+        page = local_scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+
+        assert page.abort_reason == "body_end"
+        assert "本文</body>" in page.html
+        assert len(page.html) < len(html)
+
+    def test_complete_page(self, local_scraper, local_server):
+        """通常のページは最後まで受信すること"""
+        local_server.add_route("/page", "<html><body>本文</body></html>")
+
+        page = local_scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+
+        assert not page.truncated
+        assert page.abort_reason is None
+        assert page.html == "<html><body>本文</body></html>"
+        assert page.bytes_downloaded == len("<html><body>本文</body></html>".encode("utf-8"))
+
+
+class TestStreamingExtraction:
+    """ストリーミング抽出に切り替えるページのテスト"""
+
+    @pytest.fixture
+    def streaming_scraper(self, scraper):
+        from core.extraction_cache import ExtractionCache
+        from core.extractor import InfoExtractor
+
+        scraper.wait_time = 0
+        scraper.enable_streaming(InfoExtractor(cache=ExtractionCache(max_entries=0)))
+        scraper.streaming_threshold = 10000
+        return scraper
+
+    def test_large_page_streamed(self, streaming_scraper, local_server):
+        """しきい値を超えたページは本文を保持せずに抽出すること"""
+        html = ("<html><body><a href='/contact/'>お問い合わせ</a>" + "<p>本文です。</p>" * 5000
+                + "<p>TEL 03-1234-5678</p></body></html>")
+        local_server.add_route("/big", html)
+
+        page = streaming_scraper.fetch_page(local_server.url("/big"), respect_robots=False)
+
+        assert page.streamed and page.has_content
+        assert page.html == ""
+        assert page.detail.phone == ["03-1234-5678"]
+        assert [link.href for link in page.document.links] == ["/contact/"]
+        assert page.bytes_downloaded == len(html.encode("utf-8"))
+
+    def test_small_page_not_streamed(self, streaming_scraper, local_server):
+        """しきい値以下のページは従来どおり本文を返すこと"""
+        local_server.add_route("/page", "<html><body>TEL 03-1234-5678</body></html>")
+
+        page = streaming_scraper.fetch_page(local_server.url("/page"), respect_robots=False)
+
+        assert not page.streamed
+        assert page.detail is None
+        assert page.html == "<html><body>TEL 03-1234-5678</body></html>"
+
+    def test_streaming_max_bytes(self, streaming_scraper, local_server):
+        """ストリーミング抽出時はstreaming_max_page_bytesで打ち切ること"""
+        local_server.add_route("/big", "<html><body>" + "あ" * 100000 + "</body></html>")
+        streaming_scraper.max_page_bytes = 20000
+        streaming_scraper.streaming_max_page_bytes = 50000
+
+        page = streaming_scraper.fetch_page(local_server.url("/big"), respect_robots=False)
+
+        assert page.streamed
+        assert page.abort_reason == "max_bytes"
+        assert page.bytes_downloaded <= 50000 + 16 * 1024
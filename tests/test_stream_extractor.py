@@ -0,0 +1,195 @@
+"""stream_extractorモジュールのテスト
+
+このモジュールは、StreamingExtractionによるストリーミング抽出が、ページ全体を解析する
+InfoExtractor.extract_allと同じ結果になること、保持するテキストが一定量に収まることのテストを提供します。
+"""
+
+from dataclasses import asdict
+
+import pytest
+from core.extraction_cache import ExtractionCache
+from core.extraction_plan import ExtractionPlan
+from core.extractor import InfoExtractor, DetailedInfo
+from core.html_backend import get_parser_backend
+from core.stream_extractor import StreamingExtraction
+
+PAGES = {
+    "company": """<!DOCTYPE html>
+<html><head>
+<title>株式会社テスト商事 | 東京の商社</title>
+<meta name="description" content="テスト商事のサイト">
+<meta property="og:site_name" content="テスト商事">
+</head><body>
+<h1>株式会社テスト商事</h1>
+<script>var tel = "03-0000-0000";</script>
+<p>電話: 03-1234-5678 <b>FAX</b>: 03-1234-5679</p>
+<p>〒100-0001 東京都千代田区千代田1-1-1 テストビル5F</p>
+<p>メール<!-- 050-0000-0000 -->info@test-shoji.co.jp</p>
+<p>営業時間：平日 9:00〜18:00。定休日：土日祝</p>
+<a href=" /company/ ">会社概要</a>
+<a href="/contact/" title="お問い合わせ"><img src="mail.png" alt="メール"></a>
+<a href="https://twitter.com/test_shoji">Twitter</a>
+<noscript>JavaScriptを有効にしてください 090-0000-0000</noscript>
+</body></html>""",
+    "structured": """<html><head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "LocalBusiness", "name": "サンプル食堂",
+ "telephone": "+81-6-1234-5678", "address": {"@type": "PostalAddress", "postalCode": "530-0001",
+ "addressRegion": "大阪府", "addressLocality": "大阪市北区", "streetAddress": "梅田1-1"}}
+</script></head>
+<body><div itemscope itemtype="https://schema.org/Restaurant">
+<span itemprop="name">サンプル <b>食堂</b></span><meta itemprop="telephone" content="06-1234-5678">
+</div><p>TEL 06-9999-0000</p></body></html>""",
+    "regions": """<html><body>
+<header class="l-header"><a href="/" rel="home">トップ</a></header>
+<main><p>紹介した<a href="https://twitter.com/other">お客様</a></p>
+<a href="https://twitter.com/intent/tweet?text=a">ポストする</a></main>
+<div id="site-footer"><a href="https://twitter.com/shop" rel="Me">X</a>
+<a href="https://www.instagram.com/shop/"><img src="ig.png" alt="Instagram"></a></div>
+<script>var url = "https://www.facebook.com/script_only";</script>
+</body></html>""",
+}
+
+
+@pytest.fixture
+def extractor():
+    """キャッシュを使わないInfoExtractorのフィクスチャ"""
+    return InfoExtractor(cache=ExtractionCache(max_entries=0))
+
+
+def stream(extractor, html, chunk_size=1024, **kwargs):
+    """HTMLをUTF-8のバイト列に変換し、chunk_sizeずつ渡してストリーミング抽出"""
+    extraction = StreamingExtraction(extractor, content_type="text/html; charset=utf-8", **kwargs)
+    body = html.encode("utf-8")
+    for start in range(0, len(body), chunk_size):
+        extraction.feed(body[start:start + chunk_size])
+    return extraction, extraction.close()
+
+
+def comparable(info: DetailedInfo) -> dict:
+    """比較用の辞書"""
+    return asdict(info)
+
+
+def build_large_page(paragraphs: int, contact: str) -> str:
+    """本文の末尾に連絡先を持つ大きなページを作成"""
+    filler = "<p>当社は地域に根ざした事業を展開しています。詳しくはお問い合わせください。</p>\n"
+    return f"<html><body>{filler * paragraphs}<p>{contact}</p></body></html>"
+
+
+class TestStreamingExtraction:
+    """ストリーミング抽出のテスト"""
+
+    @pytest.mark.parametrize("name", list(PAGES))
+    @pytest.mark.parametrize("chunk_size", [1, 7, 100000])
+    def test_same_as_extract_all(self, extractor, name, chunk_size):
+        """チャンクの区切り・窓のサイズによらず、ページ全体の抽出と同じ結果になること"""
+        expected = extractor.extract_all(PAGES[name])
+
+        _, result = stream(extractor, PAGES[name], chunk_size, window_chars=64, overlap_chars=24)
+
+        assert comparable(result) == comparable(expected)
+
+    @pytest.mark.parametrize("name", list(PAGES))
+    def test_document_metadata(self, extractor, name):
+        """リンク・メタデータ・JSON-LD・microdataがLxmlBackendと同じになること"""
+        expected = get_parser_backend("lxml").parse_document(PAGES[name])
+
+        extraction, _ = stream(extractor, PAGES[name], chunk_size=5)
+
+        document = extraction.document
+        assert document.streamed and document.tree is None
+        for name in ("links", "title", "meta", "json_ld", "h1", "microdata"):
+            assert getattr(document, name) == getattr(expected, name)
+
+    def test_matches_across_windows(self, extractor):
+        """窓の境界をまたぐ位置の連絡先も検出すること"""
+        contacts = ["TEL 03-1234-5678", "〒150-0002 東京都渋谷区渋谷2-21-1", "info@example.co.jp",
+                    "FAX: 06-1234-5679", "営業時間：10:00〜19:00"]
+        filler = "<p>お知らせ</p>"
+        html = "<html><body>" + "".join(filler * (index * 13) + f"<p>{contact}</p>"
+                                        for index, contact in enumerate(contacts)) + "</body></html>"
+        expected = extractor.extract_all(html)
+
+        for window_chars in (40, 100, 333):
+            _, result = stream(extractor, html, 64, window_chars=window_chars, overlap_chars=20)
+            assert comparable(result) == comparable(expected)
+
+    def test_distant_postal_code_not_joined(self, extractor):
+        """抜粋をつなげても、離れた郵便番号と住所が近いとみなされないこと"""
+        html = build_large_page(200, "大阪府大阪市北区梅田1-1-1") + "<p>〒100-0001</p>"
+        html = html.replace("<p>大阪府", "<p>〒530-0001</p>" + "<p>本文</p>" * 50 + "<p>大阪府", 1)
+        expected = extractor.extract_all(html)
+
+        _, result = stream(extractor, html, window_chars=256, overlap_chars=64)
+
+        assert result.address == expected.address
+
+    def test_bounded_buffer(self, extractor):
+        """ページのサイズによらず、保持するテキストが窓と持ち越し・抜粋の分に収まること"""
+        for paragraphs in (2000, 20000):
+            html = build_large_page(paragraphs, "TEL 03-1234-5678")
+            extraction, result = stream(extractor, html, 16 * 1024, window_chars=4096, overlap_chars=256)
+            assert result.phone == ["03-1234-5678"]
+            assert len(extraction.document.text) < 1000
+            # 窓2つ分（テキスト・HTML）と持ち越し・1チャンク分を超えない
+            assert extraction.peak_buffer_chars < 2 * 4096 + 256 + 64 + 16 * 1024
+
+    def test_many_address_mentions(self, extractor):
+        """地名が多いページでも、抜粋は住所の候補の上位のみに限られること"""
+        filler = "<p>東京都内の店舗をご紹介します。</p>\n"
+        html = f"<html><body>{filler * 3000}<p>〒530-0001 大阪府大阪市北区梅田1-1-1</p></body></html>"
+        expected = extractor.extract_all(html)
+
+        extraction, result = stream(extractor, html, window_chars=4096, overlap_chars=256)
+
+        assert result.address == expected.address
+        assert result.address["prefecture"] == "大阪府"
+        assert len(extraction.document.text) < 20 * (len(filler) + 2 * 64)
+
+    def test_shift_jis(self, extractor):
+        """metaタグの文字コードで増分デコードすること"""
+        html = ('<html><head><meta charset="Shift_JIS"><title>株式会社テスト</title></head>'
+                '<body><p>〒100-0001 東京都千代田区千代田1-1 TEL 03-1234-5678</p></body></html>')
+        body = html.encode("cp932")
+        extraction = StreamingExtraction(extractor)
+        for index in range(len(body)):
+            extraction.feed(body[index:index + 1])
+
+        result = extraction.close()
+
+        assert extraction.encoding.encoding == "cp932"
+        assert result.company_name == "株式会社テスト"
+        assert result.address["address"] == "東京都千代田区千代田1-1"
+
+    def test_plan(self, extractor):
+        """計画にない項目は走査せず、抜粋も残さないこと"""
+        html = build_large_page(100, "TEL 03-1234-5678").replace(
+            "<body>", "<body><p>info@example.co.jp 東京都千代田区千代田1-1</p>"
+        )
+
+        extraction, result = stream(extractor, html, plan=ExtractionPlan.from_fields(["phone"]))
+
+        assert result.phone == ["03-1234-5678"]
+        assert result.email == [] and result.address is None
+        assert "info@" not in extraction.document.text
+        assert "東京都" not in extraction.document.text
+
+    def test_empty_and_close(self, extractor):
+        """空のページは空の詳細情報を返し、close後のfeedはエラーになること"""
+        extraction = StreamingExtraction(extractor)
+
+        assert extraction.close() == DetailedInfo()
+        assert extraction.close() is extraction.close()
+        with pytest.raises(RuntimeError):
+            extraction.feed(b"<html></html>")
+
+    def test_extract_stream(self, extractor):
+        """InfoExtractor.extract_streamでバイト列のイテラブルから抽出できること"""
+        body = PAGES["company"].encode("utf-8")
+
+        result = extractor.extract_stream(
+            (body[index:index + 100] for index in range(0, len(body), 100)), "text/html; charset=utf-8"
+        )
+
+        assert comparable(result) == comparable(extractor.extract_all(PAGES["company"]))
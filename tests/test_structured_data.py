@@ -0,0 +1,286 @@
+"""structured_dataモジュールのテスト
+
+このモジュールは、構造化データ（JSON-LD・microdata・OpenGraph・tel:/mailto:リンク）の取得と、
+InfoExtractorの構造化データを優先する抽出のテストを提供します。
+"""
+
+import pytest
+from core.document import ParsedDocument
+from core.extraction_cache import ExtractionCache
+from core.extractor import InfoExtractor, DetailedInfo, FieldSourceStats, SOURCE_TEXT
+from core.structured_data import (
+    StructuredAddress, classify_sns_url, extract_structured_data, is_business_type,
+    SOURCE_JSON_LD, SOURCE_MICRODATA, SOURCE_OPEN_GRAPH, SOURCE_LINK
+)
+
+JSON_LD_PAGE = """
+<html><head>
+<title>山田レストラン | トップ</title>
+<script type="application/ld+json">
+{
+    "@context": "https://schema.org",
+    "@graph": [
+        {"@type": "WebSite", "name": "公式サイト"},
+        {
+            "@type": "Restaurant",
+            "name": "山田レストラン",
+            "telephone": "+81-3-1234-5678",
+            "email": "mailto:Info@Yamada.example.jp",
+            "address": {
+                "@type": "PostalAddress",
+                "postalCode": "100-0001",
+                "addressRegion": "東京都",
+                "addressLocality": "千代田区",
+                "streetAddress": "千代田1-1"
+            },
+            "contactPoint": {"@type": "ContactPoint", "faxNumber": "03-1234-5679"},
+            "openingHoursSpecification": [
+                {"dayOfWeek": ["https://schema.org/Monday", "Tuesday"], "opens": "11:00:00", "closes": "22:00"}
+            ],
+            "sameAs": ["https://www.instagram.com/yamada", "https://example.com/about"]
+        }
+    ]
+}
+</script>
+</head>
+<body>
+<p>本店 TEL 06-1111-2222 定休日：水曜日</p>
+<p>〒530-0001 大阪府大阪市北区梅田1-2-3</p>
+</body></html>
+"""
+
+
+def document(html: str) -> ParsedDocument:
+    return ParsedDocument.from_html(html)
+
+
+@pytest.fixture
+def extractor():
+    """キャッシュを使わないInfoExtractorのフィクスチャ"""
+    return InfoExtractor(cache=ExtractionCache(max_entries=0))
+
+
+class TestExtractStructuredData:
+    """構造化データの取得のテスト"""
+
+    def test_json_ld_business_node(self):
+        """@graph内の会社・店舗のノードの値を取得すること（WebSiteのノードは使わない）"""
+        results = extract_structured_data(document(JSON_LD_PAGE))
+
+        assert [values.source for values in results] == [SOURCE_JSON_LD]
+        values = results[0]
+        assert values.names == ["山田レストラン"]
+        assert values.telephones == ["+81-3-1234-5678"]
+        assert values.fax_numbers == ["03-1234-5679"]
+        assert values.emails == ["Info@Yamada.example.jp"]
+        assert values.addresses == [StructuredAddress("100-0001", "東京都", "千代田区", "千代田1-1")]
+        assert values.opening_hours == ["月・火 11:00〜22:00"]
+        assert values.sns_links == {"instagram": ["https://www.instagram.com/yamada"]}
+
+    def test_json_ld_ignores_other_types_and_invalid_json(self):
+        """会社・店舗以外の型と、解析できないJSON-LDは無視すること"""
+        html = """<html><head>
+            <script type="application/ld+json">{"@type": "Person", "name": "山田太郎", "telephone": "090-1234-5678"}</script>
+            <script type="application/ld+json">{"@type": "Organization", "name": </script>
+        </head><body></body></html>"""
+
+        assert extract_structured_data(document(html)) == []
+
+    def test_json_ld_address_string_and_opening_hours(self):
+        """文字列の住所とopeningHoursの略記"""
+        html = """<html><head><script type="application/ld+json">
+            [{"@type": ["https://schema.org/Dentist"], "address": "大阪府大阪市北区梅田1-2-3",
+              "openingHours": ["Mo-Fr 09:00-18:00", "Sa 09:00-12:00"]}]
+        </script></head><body></body></html>"""
+
+        values = extract_structured_data(document(html))[0]
+
+        assert values.addresses == [StructuredAddress(street="大阪府大阪市北区梅田1-2-3")]
+        assert values.opening_hours == ["月-金 09:00-18:00", "土 09:00-12:00"]
+
+    def test_microdata(self):
+        """会社・店舗のアイテムとPostalAddressのアイテムのitempropを取得すること"""
+        html = """<html><body>
+            <div itemscope itemtype="https://schema.org/LocalBusiness">
+                <span itemprop="name">テスト商店</span>
+                <span itemprop="telephone">06-1234-5678</span>
+                <div itemprop="address" itemscope itemtype="https://schema.org/PostalAddress">
+                    <span itemprop="postalCode">530-0001</span>
+                    <span itemprop="addressRegion">大阪府</span><span itemprop="addressLocality">大阪市北区</span>
+                    <span itemprop="streetAddress">梅田1-2-3</span>
+                </div>
+            </div>
+            <div itemscope itemtype="https://schema.org/Person"><span itemprop="name">山田太郎</span></div>
+        </body></html>"""
+
+        values = extract_structured_data(document(html))[0]
+
+        assert values.source == SOURCE_MICRODATA
+        assert values.names == ["テスト商店"]
+        assert values.telephones == ["06-1234-5678"]
+        assert values.addresses == [StructuredAddress("530-0001", "大阪府", "大阪市北区", "梅田1-2-3")]
+
+    def test_open_graph_and_links(self):
+        """OpenGraphのビジネス情報とtel:/mailto:リンク"""
+        html = """<html><head>
+            <meta property="og:phone_number" content="03-1234-5678">
+            <meta property="business:contact_data:postal_code" content="1000001">
+        </head><body>
+            <a href="tel:0120-123-456">電話</a>
+            <a href="mailto:a@example.jp,b@example.jp?subject=%E5%95%8F">メール</a>
+            <a href="/contact/">お問い合わせ</a>
+        </body></html>"""
+
+        results = extract_structured_data(document(html))
+
+        assert [values.source for values in results] == [SOURCE_OPEN_GRAPH, SOURCE_LINK]
+        assert results[0].telephones == ["03-1234-5678"]
+        assert results[0].addresses == [StructuredAddress(postal_code="1000001")]
+        assert results[1].telephones == ["0120-123-456"]
+        assert results[1].emails == ["a@example.jp", "b@example.jp"]
+
+    def test_address_to_text(self):
+        """後ろの項目に含まれる項目は重複させないこと"""
+        address = StructuredAddress("100-0001", "東京都", "千代田区", "東京都千代田区千代田1-1")
+
+        assert address.to_text() == "〒100-0001 東京都千代田区千代田1-1"
+        assert StructuredAddress().to_text() == ""
+
+
+class TestClassification:
+    """SNSのURLと会社・店舗の型の判定のテスト"""
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://twitter.com/example", "twitter"),
+        ("https://x.com/example", "twitter"),
+        ("https://ja-jp.facebook.com/example", "facebook"),
+        ("https://page.line.me/abc", "line"),
+        ("https://www.youtube.com/@example", "youtube"),
+        ("https://www.instagram.com/", None),
+        ("https://notfacebook.com/example", None),
+        ("mailto:info@example.com", None),
+    ])
+    def test_classify_sns_url(self, url, expected):
+        assert classify_sns_url(url) == expected
+
+    def test_is_business_type(self):
+        assert is_business_type(["Organization"])
+        assert is_business_type(["WebPage", "HardwareStore"])
+        assert is_business_type(["NGO", "GovernmentOrganization"])
+        assert not is_business_type(["Person", "WebSite"])
+
+
+class TestStructuredTier:
+    """InfoExtractor.extract_allの構造化データを優先する抽出のテスト"""
+
+    def test_structured_values_win(self, extractor):
+        """構造化データの値を採用し、取得元を記録すること"""
+        result = extractor.extract_all(JSON_LD_PAGE)
+
+        assert result.phone == ["03-1234-5678"]
+        assert result.fax == ["03-1234-5679"]
+        assert result.email == ["info@yamada.example.jp"]
+        assert result.company_name == "山田レストラン"
+        assert result.address == {
+            "postal_code": "100-0001", "prefecture": "東京都", "city": "千代田区", "address": "東京都千代田区千代田1-1"
+        }
+        assert result.business_hours == "月・火 11:00〜22:00"
+        assert result.sns_links == {"instagram": ["https://www.instagram.com/yamada"]}
+        assert result.closed_days.startswith("水曜日")
+        assert result.field_sources == {
+            "phone": SOURCE_JSON_LD, "fax": SOURCE_JSON_LD, "email": SOURCE_JSON_LD,
+            "company_name": SOURCE_JSON_LD, "address": SOURCE_JSON_LD,
+            "business_hours": SOURCE_JSON_LD, "sns_links": SOURCE_JSON_LD,
+            "closed_days": SOURCE_TEXT,
+        }
+
+    def test_text_passes_skipped_for_filled_fields(self, extractor, monkeypatch):
+        """構造化データで埋まった項目は本文を走査しないこと"""
+        called = []
+        for method in ("extract_phone", "extract_email", "extract_address", "extract_closed_days"):
+            original = getattr(extractor, method)
+            monkeypatch.setattr(extractor, method,
+                                lambda html, method=method, original=original: called.append(method) or original(html))
+
+        extractor.extract_all(JSON_LD_PAGE)
+
+        assert called == ["extract_closed_days"]
+
+    def test_structured_data_disabled(self):
+        """構造化データを使わない設定では、従来どおり本文から抽出すること"""
+        extractor = InfoExtractor(cache=ExtractionCache(max_entries=0), use_structured_data=False)
+
+        result = extractor.extract_all(JSON_LD_PAGE)
+
+        assert result.phone == ["06-1111-2222"]
+        assert result.address["prefecture"] == "大阪府"
+        assert set(result.field_sources.values()) == {SOURCE_TEXT}
+        assert extractor.fingerprint != InfoExtractor(cache=ExtractionCache(max_entries=0)).fingerprint
+
+    def test_tel_links_and_text_fallback(self, extractor):
+        """tel:リンクの番号を採用し、構造化データにない項目は本文から抽出すること"""
+        html = """<html><body>
+            <a href="tel:+81312345678">03-1234-5678</a>
+            <p>〒100-0001 東京都千代田区千代田1-1 info@example.jp</p>
+        </body></html>"""
+
+        result = extractor.extract_all(html)
+
+        assert result.phone == ["0312345678"]
+        assert result.email == ["info@example.jp"]
+        assert result.field_sources["phone"] == SOURCE_LINK
+        assert result.field_sources["email"] == SOURCE_TEXT
+        assert result.field_sources["address"] == SOURCE_TEXT
+
+    @pytest.mark.parametrize("phone, expected", [
+        ("+81-3-1234-5678", "03-1234-5678"),
+        ("+81 (0)6 1234 5678", "0612345678"),
+        ("03-1234-5678（代表）", "03-1234-5678"),
+        ("1234", None),
+    ])
+    def test_normalize_structured_phone(self, extractor, phone, expected):
+        assert extractor._normalize_structured_phone(phone) == expected
+
+    def test_unresolvable_address_kept_verbatim(self, extractor):
+        """住所の形式で照合できない構造化データの住所は、郵便番号索引の補完と表記のまま使うこと"""
+        html = """<html><head><script type="application/ld+json">
+            {"@type": "Organization", "address": {"postalCode": "100-0001", "addressRegion": "Tokyo",
+             "streetAddress": "1-1 Chiyoda"}}
+        </script></head><body></body></html>"""
+
+        result = extractor.extract_all(html)
+
+        assert result.address["postal_code"] == "100-0001"
+        assert result.address["address"] == "1-1 Chiyoda, Tokyo"
+        assert result.field_sources["address"] == SOURCE_JSON_LD
+
+
+class TestFieldSourceStats:
+    """取得元の集計と統合のテスト"""
+
+    def test_from_results(self):
+        infos = [
+            DetailedInfo(phone=["03-1234-5678"], field_sources={"phone": SOURCE_JSON_LD}),
+            DetailedInfo(phone=["06-1234-5678"], email=["a@example.jp"],
+                         field_sources={"phone": SOURCE_TEXT, "email": SOURCE_TEXT}),
+            None,
+        ]
+
+        stats = FieldSourceStats.from_results(infos)
+
+        assert stats.pages == 2
+        assert stats.counts == {"phone": {SOURCE_JSON_LD: 1, SOURCE_TEXT: 1}, "email": {SOURCE_TEXT: 1}}
+        assert stats.structured_rate == pytest.approx(1 / 3)
+        assert stats.report() == "pages=2, structured=33.3%; phone(json_ld=1, text=1); email(text=1)"
+
+    def test_merge_keeps_sources(self):
+        """統合後の取得元は自身の値を優先し、住所は採用した方の取得元になること"""
+        base = DetailedInfo(phone=["03-1234-5678"], address={"prefecture": "東京都"},
+                            field_sources={"phone": SOURCE_LINK, "address": SOURCE_TEXT})
+        other = DetailedInfo(phone=["06-1234-5678"], email=["a@example.jp"],
+                             address={"postal_code": "100-0001", "prefecture": "東京都"},
+                             field_sources={"phone": SOURCE_TEXT, "email": SOURCE_TEXT, "address": SOURCE_JSON_LD})
+
+        merged = base.merge(other)
+
+        assert merged.field_sources == {"phone": SOURCE_LINK, "email": SOURCE_TEXT, "address": SOURCE_JSON_LD}
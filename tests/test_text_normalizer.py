@@ -0,0 +1,135 @@
+"""text_normalizerモジュールのテスト
+
+このモジュールは、テキストの正規化（NFKC・数字の間のハイフンの統一・空白の集約）と
+元のテキストとの位置の対応、正規化したテキストに対する抽出のテストを提供します。
+"""
+
+import unicodedata
+
+import pytest
+from core.document import ParsedDocument
+from core.extraction_cache import ExtractionCache
+from core.extractor import InfoExtractor
+from core.text_normalizer import normalize, normalize_text
+
+
+HTML = """
+<html><body>
+<h1>株式会社全角テスト</h1>
+<p>〒１５０－０００１ 東京都渋谷区神宮前１－２－３</p>
+<p>ＴＥＬ：０３－１２３４－５６７８ ＦＡＸ：０３ー１２３４ー５６７９</p>
+<p>営業時間：１０：００～１９：００</p>
+</body></html>
+"""
+
+
+@pytest.fixture
+def extractor():
+    """キャッシュを使用しないInfoExtractorのフィクスチャ"""
+    return InfoExtractor(cache=ExtractionCache(max_entries=0))
+
+
+class TestNormalize:
+    """正規化のテスト"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("ＴＥＬ：０３－１２３４－５６７８", "TEL:03-1234-5678"),
+        ("〒１５０ー０００１", "〒150-0001"),
+        ("03‐1234−5678", "03-1234-5678"),
+        ("ｶﾞｲﾄﾞ", "ガイド"),
+        ("㈱テスト", "(株)テスト"),
+        ("営業時間　１０：００〜", "営業時間 10:00〜"),
+        ("a \n\t b", "a b"),
+        ("", ""),
+    ])
+    def test_normalize(self, text, expected):
+        assert normalize(text) == expected
+
+    def test_dash_only_between_digits(self):
+        """数字に挟まれていない長音記号はそのまま残すこと"""
+        assert normalize("コーヒー 1ー2") == "コーヒー 1-2"
+        assert normalize("ー12ー") == "ー12ー"
+
+    @pytest.mark.parametrize("text", ["Ａ́ｶﾞ", "𝐀́①", "ﾞ先頭", "ｶ　　ﾞ"])
+    def test_same_as_nfkc(self, text):
+        """結合文字や基本多言語面以外の文字を含む場合もNFKCと同じ結果になること"""
+        assert normalize(text) == " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+class TestNormalizedText:
+    """位置の対応のテスト"""
+
+    def test_identity(self):
+        """変換のないテキストは位置が変わらないこと"""
+        normalized = normalize_text("東京都渋谷区 03-1234-5678")
+        assert normalized.is_identity
+        assert normalized.to_original(7) == 7
+
+    def test_same_length_translation(self):
+        """1文字ずつの変換では位置が変わらないこと"""
+        normalized = normalize_text("ＴＥＬ：０３")
+        assert normalized.text == "TEL:03"
+        assert normalized.is_identity
+        assert normalized.original(4, 6) == "０３"
+
+    def test_variable_length(self):
+        """長さが変わる変換の後ろの位置が元のテキストの位置に戻ること"""
+        source = "㈱テスト ＴＥＬ　　０３－１２３４－５６７８"
+        normalized = normalize_text(source)
+        start = normalized.text.index("03")
+
+        assert normalized.text == "(株)テスト TEL 03-1234-5678"
+        assert not normalized.is_identity
+        assert normalized.original(start, len(normalized.text)) == "０３－１２３４－５６７８"
+        assert normalized.original(0, 3) == "㈱"
+        # 長さが変わる変換の途中の位置は、その区間の先頭になる
+        assert normalized.to_original(1) == 0
+        assert normalized.original_span(1, 2) == (0, 1)
+
+    def test_end_positions(self):
+        normalized = normalize_text("ｶﾞｲﾄﾞ")
+        assert normalized.text == "ガイド"
+        assert normalized.to_original(len(normalized.text)) == 5
+        assert normalized.original_span(2, 2) == (3, 3)
+        assert normalized.original(0, 3) == "ｶﾞｲﾄﾞ"
+
+    def test_document_normalized_once(self):
+        """ParsedDocumentの正規化は最初の参照時に一度だけ行うこと"""
+        document = ParsedDocument.from_html(HTML)
+        assert document.normalized_text is None
+        assert document.normalized is document.normalized
+        assert "TEL:03-1234-5678" in document.normalized.text
+
+
+class TestNormalizedExtraction:
+    """全角で書かれた値の抽出のテスト"""
+
+    def test_extract_all(self, extractor):
+        """全角の電話番号・FAX番号・郵便番号が半角の表記で抽出されること"""
+        info = extractor.extract_all(HTML)
+
+        assert info.phone == ["03-1234-5678", "03-1234-5679"]
+        assert info.fax == ["03-1234-5679"]
+        assert info.address["postal_code"] == "150-0001"
+        assert info.address["prefecture"] == "東京都"
+        assert info.address["address"].startswith("東京都渋谷区神宮前1-2-3")
+        assert info.business_hours.startswith("10:00")
+
+    def test_extract_stream(self, extractor):
+        """ストリーミング抽出でも同じ結果になること"""
+        data = HTML.encode("utf-8")
+        chunks = [data[i:i + 64] for i in range(0, len(data), 64)]
+        streamed = extractor.extract_stream(chunks, content_type="text/html; charset=utf-8")
+        expected = extractor.extract_all(HTML)
+
+        assert streamed.phone == expected.phone
+        assert streamed.fax == expected.fax
+        assert streamed.address == expected.address
+
+    def test_structured_phone(self, extractor):
+        """構造化データの全角の電話番号も正規化されること"""
+        html = """<html><head><script type="application/ld+json">
+        {"@context": "https://schema.org", "@type": "LocalBusiness", "name": "テスト",
+         "telephone": "＋８１－３－１２３４－５６７８"}
+        </script></head><body></body></html>"""
+        assert extractor.extract_all(html).phone == ["03-1234-5678"]